@@ -422,8 +422,9 @@ def ingest_batch(input_dir, output, recursive, concurrency, describe_images, ver
 )
 @click.option("--include", multiple=True, help="URL patterns to include (can use multiple times)")
 @click.option("--exclude", multiple=True, help="URL patterns to exclude (can use multiple times)")
+@click.option("--cache/--no-cache", default=True, help="Reuse unchanged pages from the HTTP cache")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
-def ingest_crawl(url, output, max_pages, max_depth, strategy, include, exclude, verbose):
+def ingest_crawl(url, output, max_pages, max_depth, strategy, include, exclude, cache, verbose):
     """Deep crawl a website and convert to markdown.
 
     \b
@@ -453,6 +454,8 @@ def ingest_crawl(url, output, max_pages, max_depth, strategy, include, exclude,
         args.extend(["--include", pattern])
     for pattern in exclude:
         args.extend(["--exclude", pattern])
+    if not cache:
+        args.append("--no-cache")
     if verbose:
         args.append("-v")
     sys.exit(run_module("ingestor", args))
@@ -464,8 +467,10 @@ def ingest_crawl(url, output, max_pages, max_depth, strategy, include, exclude,
 @click.option("--branch", help="Clone specific branch")
 @click.option("--token", envvar="GITHUB_TOKEN", help="Git token for private repos")
 @click.option("--max-files", type=int, default=10000, help="Maximum files to process")
+@click.option("--cache/--no-cache", default=True, help="Reuse a local mirror and re-ingest only changed files")
+@click.option("--full", is_flag=True, help="Rewrite all files even if a previous ingest exists")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
-def ingest_clone(repo, output, branch, token, max_files, verbose):
+def ingest_clone(repo, output, branch, token, max_files, cache, full, verbose):
     """Clone and ingest a git repository.
 
     \b
@@ -481,6 +486,10 @@ def ingest_clone(repo, output, branch, token, max_files, verbose):
         args.extend(["--token", token])
     if max_files:
         args.extend(["--max-files", str(max_files)])
+    if not cache:
+        args.append("--no-cache")
+    if full:
+        args.append("--full")
     if verbose:
         args.append("-v")
     sys.exit(run_module("ingestor", args))
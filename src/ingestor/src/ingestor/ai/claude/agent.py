@@ -1,5 +1,8 @@
 """Claude agent for markdown cleanup and enhancement."""
 
+import asyncio
+import time
+from pathlib import Path
 from typing import Any
 
 from ...postprocess.orphan_images import (
@@ -8,6 +11,20 @@ from ...postprocess.orphan_images import (
     suggest_image_placements,
 )
 from ...types import ExtractionResult
+from .cache import CleanupCache
+from .sections import split_windows
+
+
+def _strip_code_fence(response: str) -> str:
+    """Remove a markdown code block wrapped around a response."""
+    cleaned = response.strip()
+    if cleaned.startswith("```markdown"):
+        cleaned = cleaned[11:]
+    elif cleaned.startswith("```"):
+        cleaned = cleaned[3:]
+    if cleaned.endswith("```"):
+        cleaned = cleaned[:-3]
+    return cleaned.strip()
 
 
 class ClaudeAgent:
@@ -15,8 +32,17 @@ class ClaudeAgent:
 
     Uses the Claude Code SDK to process markdown output with
     intelligent cleanup, formatting, and restructuring.
+
+    Documents longer than ``window_chars`` are split on headings into
+    windows that are cleaned concurrently (bounded by ``concurrency``, with
+    request starts at least ``min_interval`` apart) and reassembled. With
+    ``cache_dir`` set, cleaned windows are persisted by content hash and
+    prompt version, so only changed sections are sent again.
     """
 
+    # Bump when the cleanup prompts change, to invalidate cached windows
+    PROMPT_VERSION = "1"
+
     DEFAULT_SYSTEM_PROMPT = """You are a markdown content editor. Your task is to clean up and enhance extracted markdown content while preserving all important information.
 
 Guidelines:
@@ -31,14 +57,30 @@ Guidelines:
     def __init__(
         self,
         system_prompt: str | None = None,
+        window_chars: int = 24_000,
+        concurrency: int = 4,
+        min_interval: float = 0.0,
+        cache_dir: str | Path | None = None,
     ):
         """Initialize Claude agent.
 
         Args:
             system_prompt: Custom system prompt for the agent
+            window_chars: Split documents longer than this many characters
+                into heading-aligned windows (0 sends the whole document)
+            concurrency: Maximum windows cleaned at once
+            min_interval: Minimum seconds between cleanup requests
+            cache_dir: Directory for the cleaned-window cache (None disables it)
         """
         self.system_prompt = system_prompt or self.DEFAULT_SYSTEM_PROMPT
+        self.window_chars = window_chars
+        self.concurrency = max(1, concurrency)
+        self.min_interval = min_interval
+        self.cache = CleanupCache(cache_dir) if cache_dir is not None else None
+        self.requests = 0  # Cleanup requests actually sent to Claude
+        self.cache_hits = 0  # Windows served from cache
         self._sdk: Any = None
+        self._next_request = 0.0
 
     def _get_sdk(self) -> Any:
         """Get or create Claude SDK client."""
@@ -67,32 +109,69 @@ Guidelines:
         Returns:
             Cleaned markdown content
         """
+        if self.window_chars <= 0 or len(content) <= self.window_chars:
+            return await self._cleanup_window(content, context, excerpt=False)
+
+        windows = split_windows(content, self.window_chars)
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def clean(window: str) -> str:
+            async with slots:
+                return await self._cleanup_window(window, context, excerpt=True)
+
+        cleaned = await asyncio.gather(*(clean(window) for window in windows))
+        return "\n\n".join(part for part in cleaned if part)
+
+    async def _cleanup_window(self, content: str, context: str | None, excerpt: bool) -> str:
+        """Clean one window (or a whole document), using the cache if set."""
+        if not content.strip():
+            return ""
+
+        key = None
+        if self.cache is not None:
+            key = CleanupCache.key(content, self.PROMPT_VERSION, self.system_prompt, context)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+
         sdk = self._get_sdk()
 
         prompt = "Clean up the following extracted markdown content:\n\n"
+        if excerpt:
+            prompt = (
+                "Clean up the following excerpt of a longer extracted markdown document. "
+                "Other sections are cleaned separately: keep its headings and do not "
+                "add an introduction or conclusion.\n\n"
+            )
         if context:
             prompt += f"Context: {context}\n\n"
         prompt += f"```markdown\n{content}\n```\n\n"
         prompt += "Return only the cleaned markdown, no explanations."
 
+        await self._pace()
+        self.requests += 1
         response = await sdk.query(
             prompt=prompt,
             system=self.system_prompt,
         )
 
         # Extract markdown from response
-        cleaned = response.strip()
-
-        # Remove markdown code block if present
-        if cleaned.startswith("```markdown"):
-            cleaned = cleaned[11:]
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-
-        return cleaned.strip()
+        cleaned = _strip_code_fence(response)
+
+        if self.cache is not None and key is not None and cleaned:
+            self.cache.put(key, cleaned)
+        return cleaned
+
+    async def _pace(self) -> None:
+        """Wait so request starts are at least ``min_interval`` apart."""
+        if self.min_interval <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next_request)
+        self._next_request = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
     async def cleanup_result(
         self,
@@ -254,15 +333,7 @@ Use format: ![Descriptive Alt Text](./img/filename.ext)"""
         response = await sdk.query(prompt=prompt, system=system)
 
         # Extract markdown from response
-        cleaned = response.strip()
-        if cleaned.startswith("```markdown"):
-            cleaned = cleaned[11:]
-        elif cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-
-        return cleaned.strip()
+        return _strip_code_fence(response)
 
     async def cleanup_result_with_images(
         self,
@@ -0,0 +1,62 @@
+"""Persistent cache of cleaned markdown windows.
+
+Windows are keyed by their content hash together with the prompt version,
+system prompt and context, so re-running cleanup on a lightly edited
+document only sends the sections that changed.
+
+Layout::
+
+    cache_dir/
+    └── ab/abcdef....md   # Cleaned window
+"""
+
+from pathlib import Path
+
+from ...core.cache import content_hash
+
+
+class CleanupCache:
+    """On-disk cache of cleaned markdown."""
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cleaned windows in
+        """
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(window: str, prompt_version: str, system_prompt: str, context: str | None) -> str:
+        """Build the cache key for a window under a prompt."""
+        return content_hash(f"{prompt_version}\0{system_prompt}\0{context or ''}\0{window}")
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.md"
+
+    def get(self, key: str) -> str | None:
+        """Look up a cleaned window.
+
+        Args:
+            key: Cache key from :meth:`key`
+
+        Returns:
+            Cleaned markdown, or None
+        """
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put(self, key: str, cleaned: str) -> None:
+        """Store a cleaned window.
+
+        Args:
+            key: Cache key from :meth:`key`
+            cleaned: Cleaned markdown
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(cleaned, encoding="utf-8")
+        tmp_path.replace(path)
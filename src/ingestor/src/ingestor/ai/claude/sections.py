@@ -0,0 +1,96 @@
+"""Split markdown into heading-aligned windows for piecewise cleanup.
+
+Windows are contiguous slices of the document: joined back together they
+reproduce it exactly. Each window starts at a heading where possible, so
+the model sees whole sections, and consecutive small sections are packed
+into one window up to the size limit. A section larger than the limit is
+split between paragraphs; code fences are never split.
+"""
+
+import re
+
+_HEADING_RE = re.compile(r"^#{1,6}\s")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+def _blocks(markdown: str) -> list[tuple[str, bool]]:
+    """Split markdown into paragraphs, keeping code fences whole.
+
+    Returns:
+        List of (text, starts_with_heading); texts include their trailing
+        newlines, so they concatenate back to the input
+    """
+    blocks: list[tuple[str, bool]] = []
+    current: list[str] = []
+    fence: str | None = None
+
+    def flush() -> None:
+        if current:
+            text = "".join(current)
+            blocks.append((text, bool(_HEADING_RE.match(text))))
+            current.clear()
+
+    for line in markdown.splitlines(keepends=True):
+        match = _FENCE_RE.match(line)
+        if fence is not None:
+            current.append(line)
+            if match and match.group(1) == fence:
+                fence = None
+            continue
+        if match:
+            fence = match.group(1)
+        elif _HEADING_RE.match(line):
+            flush()
+        current.append(line)
+        if fence is None and not line.strip():
+            # A blank line ends the paragraph
+            flush()
+    flush()
+    return blocks
+
+
+def split_windows(markdown: str, max_chars: int) -> list[str]:
+    """Split markdown into windows of at most ``max_chars`` characters.
+
+    A single paragraph or code block longer than ``max_chars`` becomes a
+    window of its own.
+
+    Args:
+        markdown: Document to split
+        max_chars: Target window size
+
+    Returns:
+        Windows whose concatenation is ``markdown``
+    """
+    if len(markdown) <= max_chars:
+        return [markdown] if markdown else []
+
+    # Group paragraphs into sections, each starting at a heading
+    sections: list[list[str]] = []
+    for text, heading in _blocks(markdown):
+        if heading or not sections:
+            sections.append([])
+        sections[-1].append(text)
+
+    windows: list[str] = []
+    window = ""
+    for section in sections:
+        section_text = "".join(section)
+        if len(window) + len(section_text) <= max_chars:
+            window += section_text
+            continue
+        if window:
+            windows.append(window)
+            window = ""
+        if len(section_text) <= max_chars:
+            window = section_text
+            continue
+        # Oversized section: split between paragraphs
+        for block in section:
+            if window and len(window) + len(block) > max_chars:
+                windows.append(window)
+                window = ""
+            window += block
+    if window:
+        windows.append(window)
+    return windows
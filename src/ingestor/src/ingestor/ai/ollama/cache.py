@@ -0,0 +1,165 @@
+"""Persistent cache of VLM image descriptions.
+
+Descriptions are keyed by the image content hash together with the VLM model
+and prompt, so the same logo or diagram is only described once across
+documents and runs. An optional perceptual hash index allows near-duplicate
+images (re-encoded or slightly resized copies) to reuse a description too.
+
+Layout::
+
+    cache_dir/
+    ├── ab/abcdef....json   # {"description", "model", "image_hash", "phash"}
+    └── phashes.jsonl       # {"variant", "phash", "key"} per cached description
+"""
+
+import json
+from io import BytesIO
+from pathlib import Path
+
+from ...core.cache import content_hash
+
+
+def perceptual_hash(data: bytes) -> int | None:
+    """Compute a 64-bit difference hash (dHash) of an image.
+
+    Args:
+        data: Encoded image bytes
+
+    Returns:
+        Hash as an integer, or None if the image cannot be decoded
+    """
+    try:
+        from PIL import Image
+
+        with Image.open(BytesIO(data)) as img:
+            small = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+            pixels = small.tobytes()
+    except Exception:
+        return None
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count differing bits between two perceptual hashes."""
+    return (a ^ b).bit_count()
+
+
+class DescriptionCache:
+    """On-disk cache of image descriptions."""
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store descriptions in
+        """
+        self.cache_dir = Path(cache_dir)
+        self._phash_index: dict[str, list[tuple[int, str]]] | None = None
+
+    @staticmethod
+    def variant(model: str, prompt: str) -> str:
+        """Identify a model/prompt combination."""
+        return content_hash(f"{model}\0{prompt}")[:16]
+
+    @staticmethod
+    def key(image_hash: str, variant: str) -> str:
+        """Build the cache key for an image under a model/prompt variant."""
+        return content_hash(f"{variant}\0{image_hash}")
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached description.
+
+        Args:
+            key: Cache key from :meth:`key`
+
+        Returns:
+            Cached description, or None
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))["description"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def find_similar(self, phash: int, variant: str, max_distance: int) -> str | None:
+        """Find a cached description for a perceptually similar image.
+
+        Args:
+            phash: Perceptual hash of the image
+            variant: Model/prompt variant
+            max_distance: Maximum Hamming distance to accept
+
+        Returns:
+            Cached description of the closest match, or None
+        """
+        best: tuple[int, str] | None = None
+        for other, key in self._load_phash_index().get(variant, []):
+            distance = hamming_distance(phash, other)
+            if distance <= max_distance and (best is None or distance < best[0]):
+                best = (distance, key)
+        return self.get(best[1]) if best else None
+
+    def put(
+        self,
+        key: str,
+        description: str,
+        model: str,
+        image_hash: str,
+        variant: str,
+        phash: int | None = None,
+    ) -> None:
+        """Store a description.
+
+        Args:
+            key: Cache key from :meth:`key`
+            description: Generated description
+            model: VLM model that produced it
+            image_hash: Content hash of the original image
+            variant: Model/prompt variant
+            phash: Perceptual hash of the image, if computed
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "description": description,
+            "model": model,
+            "image_hash": image_hash,
+            "phash": phash,
+        }
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+        if phash is not None:
+            index = self._load_phash_index()
+            index.setdefault(variant, []).append((phash, key))
+            with open(self.cache_dir / "phashes.jsonl", "a", encoding="utf-8") as f:
+                f.write(json.dumps({"variant": variant, "phash": phash, "key": key}) + "\n")
+
+    def _load_phash_index(self) -> dict[str, list[tuple[int, str]]]:
+        """Load the perceptual hash index (once per cache instance)."""
+        if self._phash_index is None:
+            self._phash_index = {}
+            path = self.cache_dir / "phashes.jsonl"
+            if path.exists():
+                for line in path.read_text(encoding="utf-8").splitlines():
+                    try:
+                        row = json.loads(line)
+                        self._phash_index.setdefault(row["variant"], []).append(
+                            (int(row["phash"]), row["key"])
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        return self._phash_index
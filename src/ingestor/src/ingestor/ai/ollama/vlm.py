@@ -1,10 +1,14 @@
 """Ollama VLM for generating image descriptions."""
 
+import asyncio
 import base64
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+from ...core.cache import content_hash
 from ...types import ExtractedImage
+from .cache import DescriptionCache, hamming_distance, perceptual_hash
 
 
 class OllamaVLM:
@@ -12,23 +16,53 @@ class OllamaVLM:
 
     Generates natural language descriptions of images using
     models like LLaVA, Moondream, or other vision models.
+
+    Batches are described concurrently (bounded by ``concurrency``), identical
+    images are only sent once, and with ``cache_dir`` set descriptions are
+    persisted by image content hash, model and prompt.
     """
 
     DEFAULT_MODEL = "llava"
 
+    DEFAULT_PROMPT = (
+        "Describe this image in detail. Include information about: "
+        "1) Main subject or content, "
+        "2) Visual elements (colors, composition, style), "
+        "3) Any text visible in the image, "
+        "4) Context or setting if apparent. "
+        "Be concise but thorough."
+    )
+
     def __init__(
         self,
         model: str = DEFAULT_MODEL,
         host: str = "http://localhost:11434",
+        concurrency: int = 4,
+        cache_dir: str | Path | None = None,
+        max_image_size: int | None = 1024,
+        near_duplicate_distance: int | None = None,
     ):
         """Initialize Ollama VLM client.
 
         Args:
             model: Ollama vision model name (llava, moondream, etc.)
             host: Ollama server URL
+            concurrency: Maximum concurrent requests in describe_batch
+            cache_dir: Directory for the description cache (None disables it)
+            max_image_size: Downscale images whose longest side exceeds this
+                many pixels before sending them (None sends originals)
+            near_duplicate_distance: Reuse descriptions of images whose
+                perceptual hash differs by at most this many bits
+                (None disables near-duplicate matching)
         """
         self.model = model
         self.host = host
+        self.concurrency = concurrency
+        self.max_image_size = max_image_size
+        self.near_duplicate_distance = near_duplicate_distance
+        self.cache = DescriptionCache(cache_dir) if cache_dir is not None else None
+        self.requests = 0  # Descriptions actually requested from the model
+        self.cache_hits = 0  # Descriptions served from cache or deduplicated
         self._client: Any = None
 
     def _get_client(self) -> Any:
@@ -60,29 +94,68 @@ class OllamaVLM:
         else:
             img_bytes = image
 
-        # Encode to base64
-        img_b64 = base64.b64encode(img_bytes).decode("utf-8")
-
-        # Default prompt
         if prompt is None:
-            prompt = (
-                "Describe this image in detail. Include information about: "
-                "1) Main subject or content, "
-                "2) Visual elements (colors, composition, style), "
-                "3) Any text visible in the image, "
-                "4) Context or setting if apparent. "
-                "Be concise but thorough."
-            )
+            prompt = self.DEFAULT_PROMPT
+
+        image_hash = content_hash(img_bytes)
+        variant = DescriptionCache.variant(self.model, prompt)
+        key = DescriptionCache.key(image_hash, variant)
+        phash = None
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is None and self.near_duplicate_distance is not None:
+                phash = await asyncio.to_thread(perceptual_hash, img_bytes)
+                if phash is not None:
+                    cached = self.cache.find_similar(phash, variant, self.near_duplicate_distance)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+
+        # Downscale and encode off the event loop
+        img_b64 = await asyncio.to_thread(self._encode_image, img_bytes)
 
         client = self._get_client()
 
-        response = client.generate(
+        self.requests += 1
+        response = await asyncio.to_thread(
+            client.generate,
             model=self.model,
             prompt=prompt,
             images=[img_b64],
         )
 
-        return response.get("response", "").strip()
+        description = response.get("response", "").strip()
+
+        if self.cache is not None and description:
+            self.cache.put(key, description, self.model, image_hash, variant, phash)
+
+        return description
+
+    def _encode_image(self, img_bytes: bytes) -> str:
+        """Downscale an image if needed and encode it to base64.
+
+        Args:
+            img_bytes: Encoded image bytes
+
+        Returns:
+            Base64 string of the (possibly downscaled) image
+        """
+        if self.max_image_size:
+            try:
+                from PIL import Image
+
+                with Image.open(BytesIO(img_bytes)) as opened:
+                    if max(opened.size) > self.max_image_size:
+                        opened.thumbnail((self.max_image_size, self.max_image_size))
+                        img = opened if opened.mode in ("RGB", "RGBA", "L") else opened.convert("RGBA")
+                        output = BytesIO()
+                        img.save(output, format="PNG")
+                        img_bytes = output.getvalue()
+            except Exception:
+                pass  # Send the original if PIL can't handle it
+
+        return base64.b64encode(img_bytes).decode("utf-8")
 
     async def describe_file(
         self,
@@ -107,6 +180,9 @@ class OllamaVLM:
     ) -> list[ExtractedImage]:
         """Generate descriptions for multiple images.
 
+        Identical images (and near-duplicates, if enabled) are described once
+        and up to ``concurrency`` requests run at the same time.
+
         Args:
             images: List of images to describe
             prompt: Custom prompt for descriptions
@@ -114,15 +190,55 @@ class OllamaVLM:
         Returns:
             Images with descriptions added
         """
-        for image in images:
-            try:
-                description = await self.describe(image, prompt)
+        groups = await asyncio.to_thread(self._group_duplicates, images)
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def describe_group(group: list[ExtractedImage]) -> None:
+            async with semaphore:
+                try:
+                    description: str | None = await self.describe(group[0], prompt)
+                except Exception:
+                    description = None
+            for image in group:
                 image.description = description
-            except Exception:
-                image.description = None
+            self.cache_hits += len(group) - 1
+
+        await asyncio.gather(*(describe_group(group) for group in groups))
 
         return images
 
+    def _group_duplicates(self, images: list[ExtractedImage]) -> list[list[ExtractedImage]]:
+        """Group identical (and optionally near-duplicate) images.
+
+        Args:
+            images: Images to group
+
+        Returns:
+            Groups of images sharing one description, in first-seen order
+        """
+        by_hash: dict[str, list[ExtractedImage]] = {}
+        for image in images:
+            by_hash.setdefault(content_hash(image.data), []).append(image)
+        groups = list(by_hash.values())
+
+        if self.near_duplicate_distance is None:
+            return groups
+
+        merged: list[tuple[int | None, list[ExtractedImage]]] = []
+        for group in groups:
+            phash = perceptual_hash(group[0].data)
+            for other_phash, other_group in merged:
+                if (
+                    phash is not None
+                    and other_phash is not None
+                    and hamming_distance(phash, other_phash) <= self.near_duplicate_distance
+                ):
+                    other_group.extend(group)
+                    break
+            else:
+                merged.append((phash, group))
+        return [group for _, group in merged]
+
     async def is_available(self) -> bool:
         """Check if Ollama is available and model is loaded.
 
@@ -155,6 +271,8 @@ async def describe_images(
     images: list[ExtractedImage],
     model: str = OllamaVLM.DEFAULT_MODEL,
     host: str = "http://localhost:11434",
+    concurrency: int = 4,
+    cache_dir: str | Path | None = None,
 ) -> list[ExtractedImage]:
     """Convenience function to describe multiple images.
 
@@ -162,11 +280,13 @@ async def describe_images(
         images: Images to describe
         model: Ollama model to use
         host: Ollama server URL
+        concurrency: Maximum concurrent requests
+        cache_dir: Directory for the description cache (None disables it)
 
     Returns:
         Images with descriptions
     """
-    vlm = OllamaVLM(model=model, host=host)
+    vlm = OllamaVLM(model=model, host=host, concurrency=concurrency, cache_dir=cache_dir)
     return await vlm.describe_batch(images)
 
 
@@ -34,9 +34,20 @@ def create_config(ctx: click.Context) -> IngestConfig:
         crawl_max_pages=params.get("max_pages", 50),
         youtube_captions=params.get("captions", "auto"),
         youtube_playlist=params.get("playlist", False),
+        youtube_concurrency=params.get("youtube_concurrency", 4),
+        youtube_cache=params.get("youtube_cache", True),
         whisper_model=params.get("whisper_model", "turbo"),
+        whisper_backend=params.get("whisper_backend", "whisper"),
+        whisper_workers=params.get("whisper_workers", 1),
         ollama_host=params.get("ollama_host", "http://localhost:11434"),
         vlm_model=params.get("vlm_model", "llava:7b"),
+        vlm_concurrency=params.get("vlm_concurrency", 4),
+        clone_concurrency=params.get("clone_concurrency", 4),
+        process_concurrency=params.get("process_concurrency"),
+        image_workers=params.get("image_workers", 4),
+        table_mode=params.get("table_mode", "auto"),
+        table_max_rows=params.get("max_rows", 10_000),
+        table_max_cols=params.get("max_cols", 50),
     )
 
 
@@ -57,8 +68,21 @@ def main():
 @click.option("--describe", is_flag=True, help="Generate VLM descriptions for images (requires Ollama)")
 @click.option("--agent", is_flag=True, help="Run Claude agent for cleanup (requires Claude Code)")
 @click.option("--whisper-model", type=str, default="turbo", help="Whisper model for audio (default: turbo)")
+@click.option("--whisper-backend", type=click.Choice(["whisper", "faster-whisper"]), default="whisper", help="Transcription backend (faster-whisper for CPU-only hosts)")
+@click.option("--whisper-workers", type=int, default=1, help="Parallel transcription processes for long audio")
 @click.option("--ollama-host", type=str, default="http://localhost:11434", help="Ollama server URL")
 @click.option("--vlm-model", type=str, default="llava:7b", help="VLM model for image descriptions")
+@click.option("--vlm-concurrency", type=int, default=4, help="Concurrent VLM requests (default: 4)")
+@click.option("--clone-concurrency", type=int, default=4, help="Concurrent clones for .download_git lists")
+@click.option("--process-concurrency", type=int, help="Repositories processed at once for .download_git lists (default: CPU count, up to 4)")
+@click.option("--table-mode", type=click.Choice(["auto", "full", "summary"]), default="auto", help="Spreadsheet/CSV tables: verbatim, summary, or summary when over --max-rows")
+@click.option("--max-rows", type=int, default=10_000, help="Table rows rendered verbatim (0 = no limit)")
+@click.option("--max-cols", type=int, default=50, help="Table columns rendered (0 = no limit)")
+@click.option("--image-workers", type=int, default=4, help="Processes converting images (1 = no process pool)")
+@click.option("--playlist", is_flag=True, help="Ingest every video of a YouTube playlist or channel")
+@click.option("--captions", type=click.Choice(["auto", "manual"]), default="auto", help="YouTube caption preference")
+@click.option("--youtube-concurrency", type=int, default=4, help="Concurrent videos for playlists/channels")
+@click.option("--youtube-cache/--no-youtube-cache", default=True, help="Reuse cached YouTube metadata and transcripts (by video ID)")
 @click.pass_context
 def ingest(ctx: click.Context, input: str, **kwargs):
     """Ingest a single file or URL.
@@ -72,7 +96,7 @@ def ingest(ctx: click.Context, input: str, **kwargs):
         from .output.writer import OutputWriter
 
         # Initialize registry with available extractors
-        registry = _create_registry()
+        registry = _create_registry(config)
         router = Router(registry, config)
         writer = OutputWriter(config)
 
@@ -92,6 +116,11 @@ def ingest(ctx: click.Context, input: str, **kwargs):
             console=console,
         ) as progress:
             task = progress.add_task(f"Processing {input}...", total=None)
+            _report_repo_progress(
+                registry,
+                lambda description: progress.update(task, description=description),
+                progress.console.print,
+            )
 
             try:
                 result = await router.process(input)
@@ -102,6 +131,17 @@ def ingest(ctx: click.Context, input: str, **kwargs):
                 console.print(f"\n[green]Success![/green] Output written to: {output_path}")
                 if result.has_images:
                     console.print(f"  Images: {result.image_count}")
+                if result.metadata.get("repos_total"):
+                    console.print(
+                        f"  Repositories: {result.metadata['repos_total']} "
+                        f"({result.metadata['repos_failed']} failed)"
+                    )
+                if result.metadata.get("videos_total"):
+                    console.print(
+                        f"  Videos: {result.metadata['videos_total']} "
+                        f"({result.metadata['videos_cached']} cached, "
+                        f"{result.metadata['videos_failed']} failed)"
+                    )
 
             except Exception as e:
                 progress.stop()
@@ -109,6 +149,9 @@ def ingest(ctx: click.Context, input: str, **kwargs):
                 if config.verbose:
                     console.print_exception()
                 raise SystemExit(1) from e
+            finally:
+                writer.close()
+                registry.close()
 
     asyncio.run(run())
 
@@ -124,6 +167,15 @@ def ingest(ctx: click.Context, input: str, **kwargs):
 @click.option("--agent", is_flag=True, help="Run Claude agent for cleanup")
 @click.option("--recursive/--no-recursive", default=True, help="Process subdirectories")
 @click.option("--concurrency", type=int, default=5, help="Max concurrent extractions")
+@click.option("--clone-concurrency", type=int, default=4, help="Concurrent clones for .download_git lists")
+@click.option("--process-concurrency", type=int, help="Repositories processed at once for .download_git lists (default: CPU count, up to 4)")
+@click.option("--whisper-model", type=str, default="turbo", help="Whisper model for audio (default: turbo)")
+@click.option("--whisper-backend", type=click.Choice(["whisper", "faster-whisper"]), default="whisper", help="Transcription backend (faster-whisper for CPU-only hosts)")
+@click.option("--whisper-workers", type=int, default=1, help="Parallel transcription processes for long audio")
+@click.option("--table-mode", type=click.Choice(["auto", "full", "summary"]), default="auto", help="Spreadsheet/CSV tables: verbatim, summary, or summary when over --max-rows")
+@click.option("--max-rows", type=int, default=10_000, help="Table rows rendered verbatim (0 = no limit)")
+@click.option("--max-cols", type=int, default=50, help="Table columns rendered (0 = no limit)")
+@click.option("--image-workers", type=int, default=4, help="Processes converting images (1 = no process pool)")
 @click.pass_context
 def batch(ctx: click.Context, folder: str, recursive: bool, concurrency: int, **kwargs):
     """Process all supported files in a folder.
@@ -136,24 +188,29 @@ def batch(ctx: click.Context, folder: str, recursive: bool, concurrency: int, **
         from .core import Router
         from .output.writer import OutputWriter
 
-        registry = _create_registry()
+        registry = _create_registry(config)
         router = Router(registry, config)
         writer = OutputWriter(config)
 
         console.print(f"Processing folder: {folder}")
         console.print(f"Recursive: {recursive}, Concurrency: {concurrency}")
+        _report_repo_progress(registry, None, console.print)
 
         count = 0
         errors = 0
 
-        async for result in router.process_directory(folder, recursive, concurrency):
-            try:
-                output_path = await writer.write(result)
-                count += 1
-                console.print(f"  [green]OK[/green] {result.source} -> {output_path}")
-            except Exception as e:
-                errors += 1
-                console.print(f"  [red]ERROR[/red] {result.source}: {e}")
+        try:
+            async for result in router.process_directory(folder, recursive, concurrency):
+                try:
+                    output_path = await writer.write(result)
+                    count += 1
+                    console.print(f"  [green]OK[/green] {result.source} -> {output_path}")
+                except Exception as e:
+                    errors += 1
+                    console.print(f"  [red]ERROR[/red] {result.source}: {e}")
+        finally:
+            writer.close()
+            registry.close()
 
         console.print(f"\nCompleted: {count} files, {errors} errors")
 
@@ -170,6 +227,8 @@ def batch(ctx: click.Context, folder: str, recursive: bool, concurrency: int, **
 @click.option("--exclude", type=str, multiple=True, help="URL patterns to exclude")
 @click.option("--domain", type=str, help="Restrict to domain")
 @click.option("--extract-pdfs/--no-extract-pdfs", default=True, help="Download and extract PDFs during crawl")
+@click.option("--cache/--no-cache", default=True, help="Reuse unchanged pages from the HTTP cache")
+@click.option("--cache-dir", type=click.Path(path_type=Path), help="HTTP cache directory (default: ~/.cache/ingestor/http)")
 @click.option("--metadata", is_flag=True, help="Generate JSON metadata")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
 @click.pass_context
@@ -186,54 +245,76 @@ def crawl(ctx: click.Context, url: str, **kwargs):
         registry = _create_registry()
         writer = OutputWriter(config)
 
-        # Get web extractor
-        from .types import MediaType
-        extractor = registry.get(MediaType.WEB)
-        if extractor is None:
-            console.print("[red]Error:[/red] Web extractor not available")
-            console.print("Install with: uv sync --extra web")
-            console.print("  # or: pip install ingestor[web]")
-            raise SystemExit(1)
-
-        console.print(f"Crawling: {url}")
-        console.print(f"Strategy: {config.crawl_strategy}, Max depth: {config.crawl_max_depth}")
-
-        # Configure extractor with crawl settings
-        extractor.strategy = config.crawl_strategy
-        extractor.max_depth = config.crawl_max_depth
-        extractor.max_pages = config.crawl_max_pages
-        extractor.extract_pdfs = kwargs.get("extract_pdfs", True)
+        try:
+            # Get web extractor
+            from .types import MediaType
+            extractor = registry.get(MediaType.WEB)
+            if extractor is None:
+                console.print("[red]Error:[/red] Web extractor not available")
+                console.print("Install with: uv sync --extra web")
+                console.print("  # or: pip install ingestor[web]")
+                raise SystemExit(1)
+
+            console.print(f"Crawling: {url}")
+            console.print(f"Strategy: {config.crawl_strategy}, Max depth: {config.crawl_max_depth}")
+
+            # Configure extractor with crawl settings
+            extractor.strategy = config.crawl_strategy
+            extractor.max_depth = config.crawl_max_depth
+            extractor.max_pages = config.crawl_max_pages
+            extractor.extract_pdfs = kwargs.get("extract_pdfs", True)
+            if kwargs.get("cache", True):
+                from .core.cache import default_cache_dir
+                extractor.cache_dir = kwargs.get("cache_dir") or default_cache_dir("http")
+            else:
+                extractor.cache_dir = None
         
-        # Apply URL filters
-        if kwargs.get("include"):
-            extractor.include_patterns = list(kwargs["include"])
-            console.print(f"[yellow]Include filter:[/yellow] {extractor.include_patterns}")
-        if kwargs.get("exclude"):
-            extractor.exclude_patterns = list(kwargs["exclude"])
-            console.print(f"[yellow]Exclude filter:[/yellow] {extractor.exclude_patterns}")
-        if kwargs.get("domain"):
-            extractor.same_domain = True
-            console.print(f"[yellow]Domain filter:[/yellow] {kwargs['domain']}")
-
-        count = 0
-        results = await extractor.crawl_deep(url)
+            # Apply URL filters
+            if kwargs.get("include"):
+                extractor.include_patterns = list(kwargs["include"])
+                console.print(f"[yellow]Include filter:[/yellow] {extractor.include_patterns}")
+            if kwargs.get("exclude"):
+                extractor.exclude_patterns = list(kwargs["exclude"])
+                console.print(f"[yellow]Exclude filter:[/yellow] {extractor.exclude_patterns}")
+            if kwargs.get("domain"):
+                extractor.same_domain = True
+                console.print(f"[yellow]Domain filter:[/yellow] {kwargs['domain']}")
+
+            count = 0
+            results = await extractor.crawl_deep(url)
         
-        # Filter results if include patterns specified
-        if kwargs.get("include"):
-            filtered_results = [r for r in results if any(p in r.source for p in extractor.include_patterns)]
-            console.print(f"[yellow]Filtered {len(results)} pages down to {len(filtered_results)} matching pages[/yellow]")
-            results = filtered_results
+            # Filter results if include patterns specified
+            if kwargs.get("include"):
+                filtered_results = [r for r in results if any(p in r.source for p in extractor.include_patterns)]
+                console.print(f"[yellow]Filtered {len(results)} pages down to {len(filtered_results)} matching pages[/yellow]")
+                results = filtered_results
         
-        for result in results:
-            try:
-                await writer.write(result)
-                count += 1
-                depth = result.metadata.get("depth", 0)
-                console.print(f"  [green]OK[/green] [depth={depth}] {result.source}")
-            except Exception as e:
-                console.print(f"  [red]ERROR[/red] {result.source}: {e}")
-
-        console.print(f"\nCrawled {count} pages")
+            unchanged = 0
+            for result in results:
+                # Unchanged page already on disk: skip rewriting it
+                if (
+                    result.metadata.get("cache_status") in ("unchanged", "not_modified")
+                    and writer.markdown_path(result).exists()
+                ):
+                    unchanged += 1
+                    count += 1
+                    if config.verbose:
+                        console.print(f"  [dim]UNCHANGED[/dim] {result.source}")
+                    continue
+                try:
+                    await writer.write(result)
+                    count += 1
+                    depth = result.metadata.get("depth", 0)
+                    console.print(f"  [green]OK[/green] [depth={depth}] {result.source}")
+                except Exception as e:
+                    console.print(f"  [red]ERROR[/red] {result.source}: {e}")
+
+            console.print(f"\nCrawled {count} pages ({unchanged} unchanged)")
+            if extractor.cache_dir is not None:
+                console.print(f"HTTP cache: {extractor.cache_stats.summary()}")
+        finally:
+            writer.close()
+            registry.close()
 
     asyncio.run(run())
 
@@ -244,6 +325,12 @@ def crawl(ctx: click.Context, url: str, **kwargs):
 @click.option("--branch", type=str, help="Clone specific branch")
 @click.option("--token", type=str, envvar="GITHUB_TOKEN", help="Git token for private repos")
 @click.option("--max-files", type=int, default=10000, help="Maximum files to process")
+@click.option("--cache/--no-cache", default=True,
+              help="Keep a mirror clone and re-extract only files changed since the last ingest")
+@click.option("--cache-dir", type=click.Path(path_type=Path), help="Mirror cache directory")
+@click.option("--full", is_flag=True, help="Re-extract every file even if a previous ingest exists")
+@click.option("--clone-concurrency", type=int, default=4, help="Concurrent clones for .download_git lists")
+@click.option("--process-concurrency", type=int, help="Repositories processed at once for .download_git lists (default: CPU count, up to 4)")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
 @click.pass_context
 def clone(ctx: click.Context, repo: str, **kwargs):
@@ -255,146 +342,112 @@ def clone(ctx: click.Context, repo: str, **kwargs):
     - Local path: /path/to/local/repo
     - .download_git file: repos.download_git
 
+    With the cache enabled (default), the repository is kept as a bare mirror
+    and updated with `git fetch`; re-running the command only rewrites files
+    changed since the last ingested commit and deletes outputs for removed
+    files. Repositories listed in a .download_git file are cloned
+    concurrently, and a failing repository does not stop the others.
+
     Examples:
         ingestor clone https://github.com/pallets/flask
         ingestor clone git@github.com:user/private-repo.git --token $TOKEN
-        ingestor clone ./repos.download_git --max-files 200
+        ingestor clone ./repos.download_git --clone-concurrency 8 --process-concurrency 2
     """
-    config = create_config(ctx)
+    import os
 
-    async def run():
-        import shutil
-        import subprocess
-        import tempfile
-        from pathlib import Path
+    from .core.cache import default_cache_dir
+    from .extractors.git.export import RepoExporter
+    from .extractors.git.git_extractor import parse_download_git_file
+    from .extractors.git.mirror import MirrorCache
+
+    config = create_config(ctx)
+    branch = kwargs.get("branch")
+    mirrors = MirrorCache(
+        kwargs.get("cache_dir") or default_cache_dir("git"),
+        token=kwargs.get("token"),
+    )
+    exporter = RepoExporter(
+        Path(config.output_dir),
+        mirrors,
+        branch=branch,
+        use_cache=bool(kwargs.get("cache")),
+        full=bool(kwargs.get("full")),
+    )
 
+    if not repo.endswith(".download_git"):
         console.print(f"Cloning repository: {repo}")
-        if kwargs.get("branch"):
-            console.print(f"  Branch: {kwargs.get('branch')}")
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            clone_path = Path(tmpdir) / "repo"
-            
-            # Build git clone command with progress and shallow clone for faster downloads
-            cmd = ["git", "clone", "--progress", "--depth", "1"]
-            if kwargs.get("branch"):
-                cmd.extend(["--branch", kwargs.get("branch")])
-            cmd.extend([repo, str(clone_path)])
-            
-            # Clone the repository with visible progress
-            console.print(f"[cyan]Starting shallow clone (latest commit only)...[/cyan]")
-            try:
-                # Let git output go directly to terminal for real-time progress
-                result = subprocess.run(cmd, check=True, text=True)
-            except subprocess.CalledProcessError as e:
-                console.print(f"[red]Error cloning repository:[/red] {e}")
-                raise SystemExit(1) from e
-                raise SystemExit(1) from e
-            
-            # Determine output path
-            repo_name = repo.rstrip("/").split("/")[-1].replace(".git", "")
-            output_dir = Path(config.output_dir) / repo_name
-            
-            # Remove if exists
-            if output_dir.exists():
-                shutil.rmtree(output_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Excluded directories - only infrastructure/cache/dependencies, not content
-            exclude_dirs = {".git", ".github", ".gitlab", ".circleci", "__pycache__", 
-                           ".pytest_cache", ".mypy_cache", ".tox", "node_modules", "vendor", 
-                           "dist", "target", ".venv", "venv", ".coverage", "htmlcov",
-                           ".vscode", ".idea", ".claude", "coverage", ".nyc_output",
-                           ".eggs", ".ruff_cache", ".hypothesis",
-                           "logs", "log", ".logs", "docker", ".travis", ".azure",
-                           "bower_components", "jspm_packages"}
-            
-            # Excluded files
-            exclude_files = {
-                ".gitignore", ".gitattributes", ".gitmodules",
-                "requirements.txt", "requirements-dev.txt", "dev-requirements.txt",
-                "pyproject.toml", "setup.py", "setup.cfg", "MANIFEST.in",
-                "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
-                "Pipfile", "Pipfile.lock", "poetry.lock",
-                "Cargo.toml", "Cargo.lock", "go.mod", "go.sum",
-                "Dockerfile", "docker-compose.yml", "docker-compose.yaml", ".dockerignore",
-                "Dockerfile.dev", "Dockerfile.prod", "Dockerfile.test",
-                "Makefile", "CMakeLists.txt",
-                "LICENSE", "LICENSE.txt", "LICENSE.md", "LICENCE", "LICENCE.txt", "LICENCE.md",
-                "COPYING", "COPYRIGHT", "AUTHORS", "CONTRIBUTORS",
-                "CHANGELOG", "CHANGELOG.md", "HISTORY.md", "CHANGES",
-                "CODE_OF_CONDUCT.md", "CONTRIBUTING.md", "SECURITY.md",
-                ".editorconfig", ".prettierrc", ".eslintrc", ".eslintrc.js", ".eslintrc.json",
-                ".pylintrc", ".flake8", ".pre-commit-config.yaml", "pylintrc",
-                ".coveragerc", "coverage.xml", ".coverage",
-                "tox.ini", "pytest.ini", ".pytest.ini",
-                "__init__.py", "CLAUDE.md", "logg.txt",
-                "config.yaml", "config.yml", "config.json",
-                "meta.yaml", "build.sh", "pr.sh", "lcov.info",
-                "None", "none", "NONE",
-                ".clang-format", ".clang-tidy", ".shellcheck_exclude_paths", "CODEOWNERS",
-            }
-            
-            # Excluded file patterns (extensions)
-            exclude_extensions = {
-                ".log", ".lock", ".rst", ".bat", ".info",
-                ".sh", ".slurm",
-                ".pyc", ".pyo", ".pyd", ".so", ".dll", ".exe", ".o", ".a",
-                ".class", ".jar", ".war",
-                ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg",
-                ".zip", ".tar", ".gz", ".bz2",
-                ".yaml", ".yml", ".xml", ".conf", ".param",
-                ".cmake", ".in", ".txt", ".bin", ".dox", ".ops",
-                ".tex", ".supp", ".m4", ".fig", ".pl", ".out", ".dockerfile",
-                ".pdf",
-                ".eps", ".0", ".session", ".idx", ".gui", ".y", ".l",
-                ".h5", ".bp", ".hdf5",
-                ".ddl", ".tst", ".ls", ".err", ".exp", ".dat", ".sample", ".8", ".onion",
-                ".properties", ".orig", ".html", ".htm", ".css", ".am",
-            }
-            
-            # Copy entire repo structure, excluding specified directories and files
-            def should_exclude(path: Path) -> bool:
-                # Check if any parent directory is in exclude list
-                if any(part in exclude_dirs for part in path.parts):
-                    return True
-                # Check if filename is in exclude list (case-insensitive)
-                if path.name in exclude_files or path.name.lower() in {f.lower() for f in exclude_files}:
-                    return True
-                # Check if file extension is in exclude list
-                if path.suffix in exclude_extensions:
-                    return True
-                return False
-            
-            for item in clone_path.rglob("*"):
-                if should_exclude(item):
-                    continue
-                    
-                rel_path = item.relative_to(clone_path)
-                dest = output_dir / rel_path
-                
-                try:
-                    if item.is_file():
-                        dest.parent.mkdir(parents=True, exist_ok=True)
-                        shutil.copy2(item, dest)
-                except Exception:
-                    pass
-            
-            # Count files
-            file_count = sum(1 for _ in output_dir.rglob("*") if _.is_file())
-            
-            console.print(f"\n[green]Success![/green] Repository cloned to: {output_dir}")
-            console.print(f"  Files: {file_count}")
+        if branch:
+            console.print(f"  Branch: {branch}")
+        exporter.log = lambda message: console.print(f"[cyan]{message}[/cyan]")
+        exporter.show_git_output = True
+        try:
+            summary = exporter.clone(repo)
+        except RuntimeError as e:
+            console.print(f"[red]Error cloning repository:[/red] {e}")
+            raise SystemExit(1) from e
 
-    asyncio.run(run())
+        if summary.up_to_date:
+            console.print(f"\n[green]Up to date[/green] at {summary.commit[:12]}: {summary.output_dir}")
+            return
+        console.print(f"\n[green]Success![/green] Repository cloned to: {summary.output_dir}")
+        console.print(f"  Commit: {summary.commit[:12]}")
+        console.print(
+            f"  Files: {summary.file_count} "
+            f"({summary.written} written, {summary.removed} removed)"
+        )
+        return
+
+    # Repository list: clone concurrently, report each repository as it finishes
+    repos = list(dict.fromkeys(parse_download_git_file(Path(repo))))
+    if not repos:
+        console.print(f"[red]Error:[/red] No repository URLs found in {repo}")
+        raise SystemExit(1)
+
+    # Fetching is network-bound and exporting disk-bound: separate limits
+    clone_workers = max(1, kwargs.get("clone_concurrency") or 1)
+    process_workers = max(1, kwargs.get("process_concurrency") or min(4, os.cpu_count() or 1))
+    console.print(
+        f"Cloning {len(repos)} repositories "
+        f"({clone_workers} fetching, {process_workers} exporting at a time)"
+    )
+
+    async def run() -> int:
+        failed = 0
+        done = 0
+        async for outcome in exporter.export_all(repos, clone_workers, process_workers):
+            done += 1
+            counter = f"[{done}/{len(repos)}]"
+            summary = outcome.result
+            if outcome.error is not None:
+                failed += 1
+                reason = outcome.error.strip().splitlines()
+                console.print(
+                    f"  [red]FAILED[/red] {counter} {outcome.url}: "
+                    f"{reason[-1] if reason else outcome.error}"
+                )
+            elif summary.up_to_date:
+                console.print(f"  [dim]UNCHANGED[/dim] {counter} {outcome.url} at {summary.commit[:12]}")
+            else:
+                console.print(
+                    f"  [green]OK[/green] {counter} {outcome.url} -> {summary.output_dir} "
+                    f"({summary.written} written, {summary.removed} removed)"
+                )
+        return failed
+
+    failed = asyncio.run(run())
+    console.print(f"\nCompleted: {len(repos) - failed} repositories, {failed} failed")
+    if failed:
+        raise SystemExit(1)
 
 
 @main.command()
 @click.argument("input", type=click.Path(exists=True))
 @click.option("--vlm-model", type=str, default="llava:7b", help="VLM model")
 @click.option("--ollama-host", type=str, default="http://localhost:11434", help="Ollama server")
+@click.option("--concurrency", type=int, default=4, help="Concurrent VLM requests")
+@click.option("--cache/--no-cache", default=True, help="Reuse cached descriptions (keyed by image hash)")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
-def describe(input: str, vlm_model: str, ollama_host: str, verbose: bool):
+def describe(input: str, vlm_model: str, ollama_host: str, concurrency: int, cache: bool, verbose: bool):
     """Generate VLM descriptions for images.
 
     INPUT can be an image file or folder of images.
@@ -408,7 +461,15 @@ def describe(input: str, vlm_model: str, ollama_host: str, verbose: bool):
             console.print("  # or: pip install ingestor[vlm]")
             raise SystemExit(1) from e
 
-        describer = VLMDescriber(host=ollama_host, model=vlm_model)
+        from .core.cache import default_cache_dir
+        from .types import ExtractedImage
+
+        describer = VLMDescriber(
+            host=ollama_host,
+            model=vlm_model,
+            concurrency=concurrency,
+            cache_dir=default_cache_dir("vlm") if cache else None,
+        )
         input_path = Path(input)
 
         if input_path.is_file():
@@ -419,20 +480,64 @@ def describe(input: str, vlm_model: str, ollama_host: str, verbose: bool):
 
         console.print(f"Describing {len(images)} image(s)...")
 
-        for img_path in images:
-            try:
-                description = await describer.describe_file(img_path)
-                console.print(f"\n[bold]{img_path.name}[/bold]")
-                console.print(description)
-            except Exception as e:
-                console.print(f"[red]Error[/red] {img_path.name}: {e}")
+        extracted = [
+            ExtractedImage(
+                filename=img_path.name,
+                data=img_path.read_bytes(),
+                format=img_path.suffix.lstrip(".").lower(),
+            )
+            for img_path in images
+        ]
+        await describer.describe_batch(extracted)
+
+        for img_path, image in zip(images, extracted, strict=True):
+            if image.description is None:
+                console.print(f"[red]Error[/red] {img_path.name}: description failed")
+                continue
+            console.print(f"\n[bold]{img_path.name}[/bold]")
+            console.print(image.description)
+
+        if verbose:
+            console.print(
+                f"\nVLM requests: {describer.requests}, reused: {describer.cache_hits}"
+            )
 
     asyncio.run(run())
 
-def _create_registry():
+def _report_repo_progress(registry, update, log) -> None:
+    """Stream per-repository progress for .download_git lists.
+
+    Args:
+        registry: Registry holding the git extractor
+        update: Called with a one-line status while repositories are in
+            flight (None to skip intermediate updates)
+        log: Called with a line for each finished repository
+    """
+    from .types import MediaType
+
+    git_extractor = registry.get(MediaType.GIT)
+    if git_extractor is None or not hasattr(git_extractor, "progress"):
+        return
+
+    def on_progress(event) -> None:
+        counter = f"[{event.completed}/{event.total}]"
+        if event.stage == "done":
+            log(f"  [green]OK[/green] {counter} {event.url}")
+        elif event.stage == "failed":
+            reason = event.detail.strip().splitlines()
+            log(f"  [red]FAILED[/red] {counter} {event.url}: {reason[-1] if reason else 'unknown error'}")
+        elif update is not None:
+            update(f"{counter} {event.stage} {event.url} {event.detail}".rstrip())
+
+    git_extractor.progress = on_progress
+
+
+def _create_registry(config: IngestConfig | None = None):
     """Create and populate the extractor registry."""
     from .core import ExtractorRegistry
+    from .extractors.data.tables import TableConfig
 
+    config = config or IngestConfig()
     registry = ExtractorRegistry()
 
     # Try to import and register each extractor
@@ -468,9 +573,15 @@ def _create_registry():
     except ImportError:
         pass
 
+    table_config = TableConfig(
+        mode=config.table_mode,
+        max_rows=config.table_max_rows,
+        max_cols=config.table_max_cols,
+    )
+
     try:
         from .extractors.excel.xlsx_extractor import XlsxExtractor
-        registry.register(XlsxExtractor())
+        registry.register(XlsxExtractor(config=table_config))
     except ImportError:
         pass
 
@@ -482,7 +593,7 @@ def _create_registry():
 
     try:
         from .extractors.data.csv_extractor import CsvExtractor
-        registry.register(CsvExtractor())
+        registry.register(CsvExtractor(config=table_config))
     except ImportError:
         pass
 
@@ -505,15 +616,27 @@ def _create_registry():
         pass
 
     try:
+        from .core.cache import default_cache_dir
         from .extractors.youtube.youtube_extractor import YouTubeExtractor
-        registry.register(YouTubeExtractor())
+        registry.register(YouTubeExtractor(
+            caption_type=config.youtube_captions,
+            include_playlist=config.youtube_playlist,
+            concurrency=config.youtube_concurrency,
+            cache_dir=default_cache_dir("youtube") if config.youtube_cache else None,
+        ))
     except ImportError:
         pass
 
     try:
-        from .extractors.git.git_extractor import GitExtractor
+        from .extractors.git.git_extractor import GitExtractor, GitRepoConfig
         from .types import MediaType
-        git_extractor = GitExtractor(registry=registry)
+        git_config = GitRepoConfig(clone_concurrency=config.clone_concurrency)
+        if config.process_concurrency:
+            git_config.process_concurrency = config.process_concurrency
+        git_extractor = GitExtractor(
+            config=git_config,
+            registry=registry,
+        )
         registry.register(git_extractor)
         # Also register for GITHUB type since unified extractor handles both
         registry._extractors[MediaType.GITHUB] = git_extractor
@@ -522,7 +645,11 @@ def _create_registry():
 
     try:
         from .extractors.audio.audio_extractor import AudioExtractor
-        registry.register(AudioExtractor())
+        registry.register(AudioExtractor(
+            model=config.whisper_model,
+            backend=config.whisper_backend,
+            workers=config.whisper_workers,
+        ))
     except ImportError:
         pass
 
@@ -549,6 +676,8 @@ def _create_registry():
 @click.option("--detect-toc", is_flag=True, help="Enable TIER 3 TOC detection (for documentation sites)")
 @click.option("--remove", is_flag=True, help="Remove low-quality files")
 @click.option("--report", type=click.Path(path_type=Path), help="Save report to file")
+@click.option("--workers", type=int, default=None, help="Processes used to analyze files (default: CPU count)")
+@click.option("--cache/--no-cache", default=True, help="Reuse cached per-file metrics for unchanged files")
 def filter(
     directory: Path,
     min_lines: int,
@@ -557,6 +686,8 @@ def filter(
     detect_toc: bool,
     remove: bool,
     report: Path | None,
+    workers: int | None,
+    cache: bool,
 ):
     """Filter low-quality pages from crawled documentation.
     
@@ -576,7 +707,8 @@ def filter(
         # Custom thresholds
         uv run ingestor filter ./output --min-lines 50 --min-words 200 --remove
     """
-    from .filters import UniversalFilter
+    from .core.cache import default_cache_dir
+    from .filters import FilterReport, UniversalFilter
 
     console.print(f"[cyan]Filtering files in:[/cyan] {directory}")
     console.print(f"[cyan]Thresholds:[/cyan] min_lines={min_lines}, min_words={min_words}, max_link_ratio={max_link_ratio}")
@@ -589,38 +721,48 @@ def filter(
         min_words=min_words,
         max_link_ratio=max_link_ratio,
         detect_toc=detect_toc,
+        workers=workers,
+        cache_dir=default_cache_dir("filter") if cache else None,
     )
     
+    # Results are streamed into the report; only paths to remove are kept
+    filter_report = FilterReport()
+    to_remove: list[Path] = []
     with Progress(
         SpinnerColumn(spinner_name=_SPINNER),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
         task = progress.add_task("Analyzing files...", total=None)
-        results = universal_filter.filter_directory(directory)
+        for result in universal_filter.iter_directory(directory):
+            filter_report.add(result)
+            if not result.keep:
+                to_remove.append(Path(result.filepath))
+            progress.update(task, description=f"Analyzing files... {filter_report.total}")
         progress.update(task, completed=True)
     
     # Remove low-quality files if requested
     removed_count = 0
     if remove:
         import shutil
-        for filepath, result in results.items():
-            if not result.keep:
-                path = Path(filepath)
-                # Remove the parent directory (the page folder)
-                parent_dir = path.parent
-                if parent_dir.exists() and parent_dir != directory:
-                    shutil.rmtree(parent_dir)
-                    removed_count += 1
+        for path in to_remove:
+            # Remove the parent directory (the page folder)
+            parent_dir = path.parent
+            if parent_dir.exists() and parent_dir != directory:
+                shutil.rmtree(parent_dir)
+                removed_count += 1
     
-    report_text = universal_filter.generate_report(results)
+    report_text = filter_report.render()
     console.print(report_text)
+    console.print(
+        f"Metrics: {universal_filter.cache_hits} cached, {universal_filter.analyzed} analyzed"
+    )
     
     if report:
         report.write_text(report_text)
         console.print(f"\n[green]Report saved to:[/green] {report}")
     
-    kept_count = sum(1 for r in results.values() if r.keep)
+    kept_count = filter_report.kept
     if remove:
         console.print(f"\n[green]✓ Kept {kept_count} quality pages, removed {removed_count} low-quality pages[/green]")
     else:
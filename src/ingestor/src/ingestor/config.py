@@ -36,6 +36,10 @@ class AudioConfig(BaseModel):
     """Audio transcription configuration."""
 
     whisper_model: str = Field(default="turbo", description="Whisper model size")
+    whisper_backend: str = Field(
+        default="whisper", description="Transcription backend (whisper, faster-whisper)"
+    )
+    whisper_workers: int = Field(default=1, description="Transcription worker processes")
 
 
 class AIConfig(BaseModel):
@@ -1,5 +1,6 @@
 """Core infrastructure for the ingestor package."""
 
+from .cache import content_hash, default_cache_dir
 from .charset import CharsetHandler
 from .detector import FileDetector
 from .registry import ExtractorRegistry, create_default_registry
@@ -11,4 +12,6 @@ __all__ = [
     "ExtractorRegistry",
     "create_default_registry",
     "Router",
+    "default_cache_dir",
+    "content_hash",
 ]
@@ -0,0 +1,34 @@
+"""Shared helpers for the on-disk caches used by extractors."""
+
+import hashlib
+import os
+from pathlib import Path
+
+
+def default_cache_dir(*parts: str) -> Path:
+    """Return the ingestor cache directory.
+
+    Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+
+    Args:
+        *parts: Optional sub-directory components (e.g. ``"http"``)
+
+    Returns:
+        Path to ``<cache_home>/ingestor/<parts...>`` (not created)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base, "ingestor", *parts)
+
+
+def content_hash(data: bytes | str) -> str:
+    """Compute a stable content hash used as a cache key.
+
+    Args:
+        data: Raw bytes or text (text is UTF-8 encoded)
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
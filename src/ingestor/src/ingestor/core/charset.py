@@ -1,19 +1,104 @@
-"""Charset detection and handling using charset_normalizer."""
+"""Charset detection and handling using charset_normalizer.
 
+Detection never needs the whole file. It runs in stages, stopping at the
+first that answers:
+
+1. Byte order mark.
+2. UTF-8 validity of a bounded sample (head, middle and tail of the file).
+3. ``charset_normalizer`` over that same sample.
+
+Files are then decoded incrementally in fixed-size chunks, so the raw
+bytes of a large file are never held alongside its text. If a chunk turns
+out not to decode (the sample missed something), the file is detected in
+full as before.
+"""
+
+import codecs
+import contextlib
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 
 from charset_normalizer import from_bytes, from_path
 
+# Bytes read from each of the head, middle and tail of a file
+SAMPLE_BYTES = 64 * 1024
+
+# Bytes decoded at a time when reading a file
+DECODE_CHUNK = 1024 * 1024
+
+# Detected encodings remembered per (path, size, mtime)
+CACHE_SIZE = 1024
+
+# Longest BOM first: the UTF-32 LE BOM starts with the UTF-16 LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf_32"),
+    (codecs.BOM_UTF32_BE, "utf_32"),
+    (codecs.BOM_UTF8, "utf_8_sig"),
+    (codecs.BOM_UTF16_LE, "utf_16"),
+    (codecs.BOM_UTF16_BE, "utf_16"),
+)
+
+
+def _bom_encoding(head: bytes) -> str | None:
+    """Return the encoding announced by a byte order mark, if any."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return None
+
+
+def _is_utf8(data: bytes, starts_mid: bool = False, ends_mid: bool = False) -> bool:
+    """Check whether a slice of a file is valid UTF-8.
+
+    Args:
+        data: Bytes to check
+        starts_mid: The slice may begin inside a multi-byte character
+        ends_mid: The slice may end inside a multi-byte character
+    """
+    if starts_mid:
+        # Skip continuation bytes (10xxxxxx) of a character cut at the start
+        skip = 0
+        while skip < min(3, len(data)) and 0x80 <= data[skip] <= 0xBF:
+            skip += 1
+        data = data[skip:]
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        decoder.decode(data, final=not ends_mid)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _line_aligned(data: bytes, start: bool, end: bool) -> bytes:
+    """Trim a sample to whole lines so regions join cleanly."""
+    if start and b"\n" in data:
+        data = data[data.index(b"\n") + 1 :]
+    if end and b"\n" in data:
+        data = data[: data.rindex(b"\n") + 1]
+    return data
+
 
 class CharsetHandler:
     """Handle charset detection and text decoding for non-UTF8 content.
 
     Uses charset_normalizer for accurate encoding detection across
-    various languages and character sets.
+    various languages and character sets, on a bounded sample of each file.
     """
 
     DEFAULT_ENCODING = "utf-8"
 
+    def __init__(self, sample_bytes: int = SAMPLE_BYTES, chunk_size: int = DECODE_CHUNK):
+        """Initialize the handler.
+
+        Args:
+            sample_bytes: Bytes sampled from each of the head, middle and tail
+            chunk_size: Bytes decoded at a time when reading files
+        """
+        self.sample_bytes = sample_bytes
+        self.chunk_size = chunk_size
+        self._encodings: OrderedDict[tuple[str, int, int], str | None] = OrderedDict()
+
     def read_text(self, path: str | Path) -> tuple[str, str]:
         """Read text from a file with automatic charset detection.
 
@@ -25,10 +110,25 @@ class CharsetHandler:
         """
         path = Path(path)
 
+        encoding = self.detect_encoding_from_file(path)
+        if encoding is not None:
+            try:
+                parts = []
+                ascii_only = encoding == "utf_8"
+                for part in self.iter_text(path, encoding):
+                    parts.append(part)
+                    ascii_only = ascii_only and part.isascii()
+                return "".join(parts), "ascii" if ascii_only else encoding
+            except (UnicodeDecodeError, LookupError):
+                pass
+
+        # The sample was not representative: detect over the whole file
         try:
             result = from_path(path).best()
             if result is not None:
-                return str(result), result.encoding or self.DEFAULT_ENCODING
+                encoding = result.encoding or self.DEFAULT_ENCODING
+                self._remember(path, encoding)
+                return str(result), encoding
         except Exception:
             pass
 
@@ -41,6 +141,31 @@ class CharsetHandler:
             text = path.read_text(encoding="latin-1")
             return text, "latin-1"
 
+    def iter_text(self, path: str | Path, encoding: str | None = None) -> Iterator[str]:
+        """Decode a file incrementally.
+
+        Args:
+            path: Path to the file
+            encoding: Encoding to use (detected if omitted)
+
+        Yields:
+            Decoded text, one chunk at a time
+
+        Raises:
+            UnicodeDecodeError: If the file does not decode with the encoding
+        """
+        path = Path(path)
+        encoding = encoding or self.detect_encoding_from_file(path) or self.DEFAULT_ENCODING
+        decoder = codecs.getincrementaldecoder(encoding)()
+        with open(path, "rb") as f:
+            while chunk := f.read(self.chunk_size):
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
     def decode_bytes(self, data: bytes) -> tuple[str, str]:
         """Decode bytes with automatic charset detection.
 
@@ -50,12 +175,12 @@ class CharsetHandler:
         Returns:
             Tuple of (decoded_text, detected_encoding)
         """
-        try:
-            result = from_bytes(data).best()
-            if result is not None:
-                return str(result), result.encoding or self.DEFAULT_ENCODING
-        except Exception:
-            pass
+        encoding = self.detect_encoding(data)
+        if encoding is not None:
+            try:
+                return codecs.decode(data, encoding), encoding
+            except (UnicodeDecodeError, LookupError):
+                pass
 
         # Fallback to UTF-8
         try:
@@ -73,17 +198,18 @@ class CharsetHandler:
         Returns:
             Detected encoding name or None
         """
-        try:
-            result = from_bytes(data).best()
-            if result is not None:
-                return result.encoding
-        except Exception:
-            pass
-        return None
+        size = len(data)
+        n = self.sample_bytes
+        if size <= 3 * n:
+            return self._detect_sample(data, data, whole=True)
+        middle = (size - n) // 2
+        return self._detect_sample(data[:4], data[:n], data[middle : middle + n], data[-n:])
 
     def detect_encoding_from_file(self, path: str | Path) -> str | None:
         """Detect the encoding of a file without reading it fully.
 
+        Results are cached per (path, size, mtime).
+
         Args:
             path: Path to the file
 
@@ -92,9 +218,85 @@ class CharsetHandler:
         """
         path = Path(path)
         try:
-            result = from_path(path).best()
+            key = self._cache_key(path)
+        except OSError:
+            return None
+        if key in self._encodings:
+            self._encodings.move_to_end(key)
+            return self._encodings[key]
+
+        size = key[1]
+        n = self.sample_bytes
+        try:
+            with open(path, "rb") as f:
+                if size <= 3 * n:
+                    data = f.read()
+                    encoding = self._detect_sample(data, data, whole=True)
+                else:
+                    head = f.read(n)
+                    f.seek((size - n) // 2)
+                    middle = f.read(n)
+                    f.seek(size - n)
+                    tail = f.read(n)
+                    encoding = self._detect_sample(head, head, middle, tail)
+        except OSError:
+            return None
+
+        self._store(key, encoding)
+        return encoding
+
+    def _detect_sample(self, head: bytes, *regions: bytes, whole: bool = False) -> str | None:
+        """Run the detection stages over a file's head and sample regions.
+
+        Args:
+            head: Start of the file (for the BOM check)
+            regions: The whole content, or its head, middle and tail
+            whole: ``regions`` is the complete content
+        """
+        bom = _bom_encoding(head)
+        if bom:
+            return bom
+
+        # NUL bytes are valid UTF-8 but point to UTF-16/32 without a BOM
+        plain = not any(b"\0" in region for region in regions)
+        if whole:
+            data = regions[0]
+            if not data:
+                return self.DEFAULT_ENCODING
+            if plain and data.isascii():
+                return "ascii"
+            if plain and _is_utf8(data):
+                return "utf_8"
+        elif plain and all(
+            _is_utf8(region, starts_mid=i > 0, ends_mid=i < len(regions) - 1)
+            for i, region in enumerate(regions)
+        ):
+            return "utf_8"
+
+        if not whole:
+            last = len(regions) - 1
+            data = b"\n".join(
+                _line_aligned(region, start=i > 0, end=i < last)
+                for i, region in enumerate(regions)
+            )
+        try:
+            result = from_bytes(data).best()
             if result is not None:
                 return result.encoding
         except Exception:
             pass
         return None
+
+    def _cache_key(self, path: Path) -> tuple[str, int, int]:
+        stat = path.stat()
+        return (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+    def _store(self, key: tuple[str, int, int], encoding: str | None) -> None:
+        self._encodings[key] = encoding
+        self._encodings.move_to_end(key)
+        while len(self._encodings) > CACHE_SIZE:
+            self._encodings.popitem(last=False)
+
+    def _remember(self, path: Path, encoding: str) -> None:
+        with contextlib.suppress(OSError):
+            self._store(self._cache_key(path), encoding)
@@ -95,6 +95,7 @@ class FileDetector:
         r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
         r"(?:https?://)?(?:www\.)?youtu\.be/[\w-]+",
         r"(?:https?://)?(?:www\.)?youtube\.com/playlist\?list=[\w-]+",
+        r"(?:https?://)?(?:www\.)?youtube\.com/(?:@[\w.-]+|channel/[\w-]+|c/[\w.-]+|user/[\w.-]+)",
     ]
 
     GITHUB_PATTERNS = [
@@ -178,6 +179,19 @@ class FileDetector:
         label = result.output.label.lower()
         return self.MAGIKA_TO_MEDIA_TYPE.get(label, MediaType.UNKNOWN)
 
+    def detect_name(self, name: str) -> MediaType:
+        """Detect media type from a file name alone, without touching disk.
+
+        Used for archive members, which are classified before being written.
+
+        Args:
+            name: File name or archive member path
+
+        Returns:
+            Detected MediaType (UNKNOWN if the extension is not recognised)
+        """
+        return self._detect_by_extension(Path(name))
+
     def _detect_file(self, path: Path) -> MediaType:
         """Detect file type using Magika with extension-based fallback."""
         try:
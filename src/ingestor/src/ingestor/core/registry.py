@@ -97,6 +97,15 @@ class ExtractorRegistry:
         """
         return list(self._extractors.values())
 
+    def close(self) -> None:
+        """Release resources held by extractors (e.g. worker process pools)."""
+        closed: set[int] = set()
+        for extractor in self._extractors.values():
+            close = getattr(extractor, "close", None)
+            if close is not None and id(extractor) not in closed:
+                closed.add(id(extractor))
+                close()
+
     @property
     def detector(self) -> FileDetector:
         """Get the file detector instance."""
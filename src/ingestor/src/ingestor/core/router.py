@@ -1,6 +1,7 @@
 """Router for directing inputs to the appropriate extractors."""
 
 import asyncio
+import time
 from collections.abc import AsyncIterator
 from pathlib import Path
 
@@ -46,7 +47,10 @@ class Router:
                 f"No extractor available for {source} (detected type: {media_type.value})"
             )
 
-        return await extractor.extract(source)
+        start = time.perf_counter()
+        result = await extractor.extract(source)
+        result.timings["extract"] = time.perf_counter() - start
+        return result
 
     async def process_batch(
         self, sources: list[str | Path], concurrency: int = 5
@@ -93,23 +97,40 @@ class Router:
 
         # Collect all files
         sources: list[str | Path] = []
+        git_sources: list[str] = []
         pattern = "**/*" if recursive else "*"
 
         for path in directory.glob(pattern):
             if path.is_file():
+                # Handle .download_git files specially: one result per repository
+                if path.suffix.lower() == ".download_git":
+                    git_sources.extend(self._parse_download_git_file(path))
                 # Check if we have an extractor for this file
-                if self.registry.get_for_source(path) is not None:
+                elif self.registry.get_for_source(path) is not None:
                     sources.append(path)
                 # Handle .url files specially
                 elif path.suffix.lower() == ".url":
                     sources.extend(self._parse_url_file(path))
-                # Handle .download_git files specially
-                elif path.suffix.lower() == ".download_git":
-                    sources.extend(self._parse_download_git_file(path))
 
-        async for result in self.process_batch(sources, concurrency):
+        # Repository lists get their own scheduler (separate clone and
+        # processing limits) and run alongside the file batch
+        git_extractor = self.registry.get(MediaType.GIT)
+        if git_sources and not hasattr(git_extractor, "extract_repos"):
+            sources.extend(git_sources)
+            git_sources = []
+
+        streams = [self.process_batch(sources, concurrency)]
+        if git_sources:
+            streams.append(self._process_repos(git_extractor, git_sources))
+
+        async for result in _merge(streams):
             yield result
 
+    async def _process_repos(self, extractor, urls: list[str]) -> AsyncIterator[ExtractionResult]:
+        """Clone and extract repositories with the git extractor's scheduler."""
+        async for outcome in extractor.extract_repos(urls):
+            yield outcome.result
+
     def _parse_url_file(self, path: Path) -> list[str]:
         """Parse a .url file containing URLs to crawl.
 
@@ -177,3 +198,36 @@ class Router:
             True if an extractor is available
         """
         return self.registry.get_for_source(source) is not None
+
+
+async def _merge(streams: list[AsyncIterator[ExtractionResult]]) -> AsyncIterator[ExtractionResult]:
+    """Yield items from several async iterators as each produces them."""
+    if len(streams) == 1:
+        async for item in streams[0]:
+            yield item
+        return
+
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def drain(stream: AsyncIterator[ExtractionResult]) -> None:
+        try:
+            async for item in stream:
+                await queue.put(item)
+        finally:
+            await queue.put(done)
+
+    tasks = [asyncio.create_task(drain(stream)) for stream in streams]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            item = await queue.get()
+            if item is done:
+                remaining -= 1
+            else:
+                yield item
+        for task in tasks:
+            task.result()  # Re-raise errors from the streams
+    finally:
+        for task in tasks:
+            task.cancel()
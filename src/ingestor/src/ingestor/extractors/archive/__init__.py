@@ -1,5 +1,5 @@
 """Archive extractors."""
 
-from .zip_extractor import ZipExtractor
+from .zip_extractor import ArchiveLimits, ZipExtractor
 
-__all__ = ["ZipExtractor"]
+__all__ = ["ArchiveLimits", "ZipExtractor"]
@@ -1,9 +1,26 @@
-"""ZIP archive extractor with recursive content processing."""
-
+"""Streaming archive extractor (ZIP and TAR) with recursive content processing.
+
+Members are read one at a time straight from the archive. Each member is
+classified by its name (or, failing that, its first bytes) before anything is
+written, so members no registered extractor supports are skipped without
+touching disk. Supported members are spooled to a private scratch file only
+while their extractor runs, and only ``concurrency`` members are in flight at
+once, so scratch space stays bounded regardless of the archive size.
+
+Size, member-count and compression-ratio limits (:class:`ArchiveLimits`)
+protect against archive bombs.
+"""
+
+import asyncio
+import gzip
+import shutil
+import tarfile
 import tempfile
 import zipfile
-from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Callable, Generator, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, Optional, cast
 
 from ...types import ExtractedImage, ExtractionResult, MediaType
 from ..base import BaseExtractor
@@ -11,23 +28,103 @@ from ..base import BaseExtractor
 if TYPE_CHECKING:
     from ...core.registry import ExtractorRegistry
 
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ARCHIVE_SUFFIXES = (".zip", *TAR_SUFFIXES, ".gz")
+
+SNIFF_BYTES = 4096  # Bytes read to detect members with an unknown extension
+COPY_CHUNK = 1024 * 1024
+
+
+@dataclass
+class ArchiveLimits:
+    """Safety limits applied while reading an archive."""
+
+    max_members: int = 10_000  # Entries examined before reading stops
+    max_member_size: int = 256 * 1024 * 1024  # Uncompressed bytes per member
+    max_total_size: int = 2 * 1024 * 1024 * 1024  # Uncompressed bytes across the archive
+    max_compression_ratio: float = 100.0  # Members compressed better than this are skipped
+
+
+class ArchiveLimitError(Exception):
+    """Raised when a member exceeds its uncompressed size budget."""
+
+
+@dataclass
+class _Member:
+    """An archive entry that has not been read yet."""
+
+    name: str
+    size: int | None  # Declared uncompressed size
+    compressed_size: int | None
+    open: Callable[[], IO[bytes]]
+
+
+def _zip_opener(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> Callable[[], IO[bytes]]:
+    """Open a zip member when called."""
+
+    def open_member() -> IO[bytes]:
+        return zf.open(info)
+
+    return open_member
+
+
+def _tar_opener(tf: tarfile.TarFile, info: tarfile.TarInfo) -> Callable[[], IO[bytes]]:
+    """Open a tar member when called (only valid while it is the current member)."""
+
+    def open_member() -> IO[bytes]:
+        fobj = tf.extractfile(info)
+        if fobj is None:
+            raise OSError(f"{info.name}: not a regular file")
+        return fobj
+
+    return open_member
+
+
+def _gzip_opener(path: Path) -> Callable[[], IO[bytes]]:
+    """Open a plain gzip file's decompressed content when called."""
+
+    def open_member() -> IO[bytes]:
+        return cast(IO[bytes], gzip.open(path, "rb"))
+
+    return open_member
+
+
+@dataclass
+class _ReadStats:
+    """Counters collected while streaming an archive."""
+
+    file_count: int = 0
+    total_bytes: int = 0
+    skipped: list[str] = field(default_factory=list)
+    limit_exceeded: str | None = None
+    error: str | None = None
+
 
 class ZipExtractor(BaseExtractor):
-    """Extract and process contents from ZIP archives.
+    """Extract and process contents from ZIP and TAR archives.
 
-    Recursively processes all files in the archive using appropriate
-    extractors for each file type.
+    Recursively processes all supported files in the archive using the
+    appropriate extractor for each file type.
     """
 
     media_type = MediaType.ZIP
 
-    def __init__(self, registry: Optional["ExtractorRegistry"] = None):
-        """Initialize ZIP extractor.
+    def __init__(
+        self,
+        registry: Optional["ExtractorRegistry"] = None,
+        concurrency: int = 4,
+        limits: ArchiveLimits | None = None,
+    ):
+        """Initialize archive extractor.
 
         Args:
             registry: Extractor registry for processing contents
+            concurrency: Maximum number of members extracted at once
+            limits: Safety limits (defaults to :class:`ArchiveLimits`)
         """
         self._registry = registry
+        self.concurrency = max(1, concurrency)
+        self.limits = limits or ArchiveLimits()
 
     def set_registry(self, registry: "ExtractorRegistry"):
         """Set the extractor registry.
@@ -38,69 +135,65 @@ class ZipExtractor(BaseExtractor):
         self._registry = registry
 
     async def extract(self, source: str | Path) -> ExtractionResult:
-        """Extract content from a ZIP file.
+        """Extract content from a ZIP or TAR archive.
 
         Args:
-            source: Path to the ZIP file
+            source: Path to the archive
 
         Returns:
             Extraction result with combined markdown from all files
         """
         path = Path(source)
+        kind = self._archive_kind(path)
 
-        if not zipfile.is_zipfile(path):
+        if kind is None:
+            label = "ZIP" if path.suffix.lower() == ".zip" else "archive"
             return ExtractionResult(
-                markdown=f"# Error\n\nNot a valid ZIP file: {path.name}",
+                markdown=f"# Error\n\nNot a valid {label} file: {path.name}",
                 title="Error",
                 source=str(path),
                 media_type=MediaType.ZIP,
                 images=[],
-                metadata={"error": "Invalid ZIP file"},
+                metadata={"error": f"Invalid {label} file"},
             )
 
+        stats = _ReadStats()
+        with tempfile.TemporaryDirectory(prefix="ingestor-archive-") as tmpdir:
+            outcomes = await self._extract_members(path, kind, Path(tmpdir), stats)
+
         results = []
         all_images: list[ExtractedImage] = []
-        file_count = 0
-        processed_count = 0
-
-        with zipfile.ZipFile(path, "r") as zf:
-            # Get list of files
-            file_list = [name for name in zf.namelist() if not name.endswith("/")]
-            file_count = len(file_list)
-
-            with tempfile.TemporaryDirectory() as tmpdir:
-                # Extract all files
-                zf.extractall(tmpdir)
-                tmpdir_path = Path(tmpdir)
-
-                # Process each file
-                for file_name in file_list:
-                    file_path = tmpdir_path / file_name
-
-                    if not file_path.exists() or not file_path.is_file():
-                        continue
+        for _, file_name, result in sorted(outcomes, key=lambda o: o[0]):
+            if result is None or not result.markdown.strip():
+                continue
+            results.append({"name": file_name, "markdown": result.markdown})
+            # Prefix image filenames with archive path
+            for img in result.images:
+                img.filename = f"{Path(file_name).stem}_{img.filename}"
+                all_images.append(img)
+        processed_count = len(results)
+
+        markdown = self._build_markdown(
+            path,
+            results,
+            stats.file_count,
+            processed_count,
+            skipped_count=len(stats.skipped),
+            note=stats.limit_exceeded or stats.error,
+        )
 
-                    # Try to extract with registry
-                    if self._registry:
-                        extractor = self._registry.get_for_source(file_path)
-                        if extractor:
-                            try:
-                                result = await extractor.extract(file_path)
-                                if result.markdown.strip():
-                                    results.append({
-                                        "name": file_name,
-                                        "markdown": result.markdown,
-                                    })
-                                    # Prefix image filenames with archive path
-                                    for img in result.images:
-                                        img.filename = f"{Path(file_name).stem}_{img.filename}"
-                                        all_images.append(img)
-                                    processed_count += 1
-                            except Exception:
-                                pass
-
-        # Build combined markdown
-        markdown = self._build_markdown(path, results, file_count, processed_count)
+        metadata = {
+            "archive_format": kind,
+            "file_count": stats.file_count,
+            "processed_count": processed_count,
+            "skipped_count": len(stats.skipped),
+            "bytes_extracted": stats.total_bytes,
+            "image_count": len(all_images),
+        }
+        if stats.limit_exceeded:
+            metadata["limit_exceeded"] = stats.limit_exceeded
+        if stats.error:
+            metadata["error"] = stats.error
 
         return ExtractionResult(
             markdown=markdown,
@@ -108,19 +201,226 @@ class ZipExtractor(BaseExtractor):
             source=str(path),
             media_type=MediaType.ZIP,
             images=all_images,
-            metadata={
-                "file_count": file_count,
-                "processed_count": processed_count,
-                "image_count": len(all_images),
-            },
+            metadata=metadata,
         )
 
+    async def _extract_members(
+        self,
+        path: Path,
+        kind: str,
+        scratch: Path,
+        stats: _ReadStats,
+    ) -> list[tuple[int, str, ExtractionResult | None]]:
+        """Stream members and extract them with bounded concurrency.
+
+        A slot is taken before the next member is read, so at most
+        ``concurrency`` members are spooled to scratch space at any time.
+
+        Returns:
+            ``(index, member name, result)`` for every staged member
+        """
+        staged = self._stage_members(path, kind, scratch, stats)
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks = []
+
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await asyncio.to_thread(next, staged, None)
+                except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+                    # Truncated or corrupt archive: keep what was read so far
+                    stats.error = f"Archive read failed: {e}"
+                    item = None
+                if item is None:
+                    slots.release()
+                    break
+                tasks.append(asyncio.create_task(self._extract_member(item, slots)))
+        finally:
+            staged.close()
+
+        return await asyncio.gather(*tasks)
+
+    async def _extract_member(
+        self,
+        item: tuple[int, str, Path, BaseExtractor],
+        slots: asyncio.Semaphore,
+    ) -> tuple[int, str, ExtractionResult | None]:
+        """Run the extractor for one staged member and free its scratch file."""
+        index, name, file_path, extractor = item
+        try:
+            result = await extractor.extract(file_path)
+        except Exception:
+            result = None
+        finally:
+            shutil.rmtree(file_path.parent, ignore_errors=True)
+            slots.release()
+        return index, name, result
+
+    def _stage_members(
+        self,
+        path: Path,
+        kind: str,
+        scratch: Path,
+        stats: _ReadStats,
+    ) -> Generator[tuple[int, str, Path, BaseExtractor], None, None]:
+        """Read members in archive order and spool the supported ones.
+
+        Runs in a worker thread, one member per ``next()`` call.
+
+        Yields:
+            ``(index, member name, scratch path, extractor)``
+        """
+        limits = self.limits
+
+        for member in self._iter_archive(path, kind):
+            if stats.file_count >= limits.max_members:
+                stats.limit_exceeded = f"Archive has more than {limits.max_members} members"
+                return
+            index = stats.file_count
+            stats.file_count += 1
+
+            if member.size is not None and member.size > limits.max_member_size:
+                stats.skipped.append(f"{member.name}: larger than {limits.max_member_size} bytes")
+                continue
+            if (
+                member.size
+                and member.compressed_size
+                and member.size / member.compressed_size > limits.max_compression_ratio
+            ):
+                stats.skipped.append(f"{member.name}: suspicious compression ratio")
+                continue
+
+            remaining = limits.max_total_size - stats.total_bytes
+            budget = min(limits.max_member_size, remaining)
+
+            with member.open() as fobj:
+                head = b""
+                extractor = None
+                if self._registry:
+                    media_type = self._registry.detector.detect_name(member.name)
+                    if media_type == MediaType.UNKNOWN:
+                        head = fobj.read(SNIFF_BYTES)
+                        media_type = self._detect_bytes(head)
+                    extractor = self._registry.get(media_type)
+                if extractor is None:
+                    stats.skipped.append(f"{member.name}: unsupported")
+                    continue
+
+                dest_dir = scratch / str(index)
+                dest_dir.mkdir()
+                dest = dest_dir / (PurePosixPath(member.name).name or f"member_{index}")
+                try:
+                    written = self._spool(fobj, head, dest, budget)
+                except ArchiveLimitError:
+                    shutil.rmtree(dest_dir, ignore_errors=True)
+                    if budget == remaining:
+                        stats.limit_exceeded = (
+                            f"Archive expands to more than {limits.max_total_size} bytes"
+                        )
+                        return
+                    stats.skipped.append(
+                        f"{member.name}: larger than {limits.max_member_size} bytes"
+                    )
+                    continue
+
+            stats.total_bytes += written
+            yield index, member.name, dest, extractor
+
+    def _iter_archive(self, path: Path, kind: str) -> Iterator[_Member]:
+        """Iterate over the regular-file members of an archive without reading them."""
+        if kind == "zip":
+            with zipfile.ZipFile(path, "r") as zf:
+                for zinfo in zf.infolist():
+                    if zinfo.is_dir():
+                        continue
+                    yield _Member(
+                        name=zinfo.filename,
+                        size=zinfo.file_size,
+                        compressed_size=zinfo.compress_size,
+                        open=_zip_opener(zf, zinfo),
+                    )
+        elif kind == "tar":
+            # Stream mode: the archive is decompressed once, front to back
+            with tarfile.open(path, mode="r|*") as tf:
+                for tinfo in tf:
+                    if not tinfo.isfile():
+                        continue
+                    yield _Member(
+                        name=tinfo.name,
+                        size=tinfo.size,
+                        compressed_size=None,
+                        open=_tar_opener(tf, tinfo),
+                    )
+        else:
+            # Plain gzip: a single compressed file named after the archive
+            yield _Member(
+                name=path.stem,
+                size=None,
+                compressed_size=None,
+                open=_gzip_opener(path),
+            )
+
+    def _spool(self, fobj: IO[bytes], head: bytes, dest: Path, budget: int) -> int:
+        """Copy a member to scratch space, enforcing its size budget.
+
+        The actual decompressed size is counted, so lying headers cannot
+        bypass the limit.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            ArchiveLimitError: If the member is larger than ``budget``
+        """
+        written = len(head)
+        if written > budget:
+            raise ArchiveLimitError(dest.name)
+        with open(dest, "wb") as out:
+            out.write(head)
+            while chunk := fobj.read(COPY_CHUNK):
+                written += len(chunk)
+                if written > budget:
+                    raise ArchiveLimitError(dest.name)
+                out.write(chunk)
+        return written
+
+    def _detect_bytes(self, head: bytes) -> MediaType:
+        """Detect the media type of a member from its first bytes."""
+        if not head or self._registry is None:
+            return MediaType.UNKNOWN
+        try:
+            return self._registry.detector.detect_bytes(head)
+        except Exception:
+            return MediaType.UNKNOWN
+
+    @staticmethod
+    def _archive_kind(path: Path) -> str | None:
+        """Identify the archive container format.
+
+        Returns:
+            ``"zip"``, ``"tar"``, ``"gzip"`` or None if not a supported archive
+        """
+        try:
+            if zipfile.is_zipfile(path):
+                return "zip"
+            if tarfile.is_tarfile(path):
+                return "tar"
+            with open(path, "rb") as f:
+                if f.read(2) == b"\x1f\x8b":
+                    return "gzip"
+        except OSError:
+            pass
+        return None
+
     def _build_markdown(
         self,
         path: Path,
         results: list[dict],
         file_count: int,
         processed_count: int,
+        skipped_count: int = 0,
+        note: str | None = None,
     ) -> str:
         """Build combined markdown from extracted files.
 
@@ -129,6 +429,8 @@ class ZipExtractor(BaseExtractor):
             results: List of extraction results with name and markdown
             file_count: Total files in archive
             processed_count: Number of files successfully processed
+            skipped_count: Number of files skipped (unsupported or over a limit)
+            note: Reason the archive was only partially read, if any
 
         Returns:
             Combined markdown content
@@ -138,8 +440,13 @@ class ZipExtractor(BaseExtractor):
             "",
             f"**Total Files:** {file_count}",
             f"**Processed:** {processed_count}",
-            "",
         ]
+        if skipped_count:
+            lines.append(f"**Skipped:** {skipped_count}")
+        lines.append("")
+        if note:
+            lines.append(f"> **Warning:** {note}; remaining members were not processed.")
+            lines.append("")
 
         if not results:
             lines.append("*No extractable content found in archive.*")
@@ -164,6 +471,6 @@ class ZipExtractor(BaseExtractor):
             source: Path to check
 
         Returns:
-            True if this is a ZIP file
+            True if this is a ZIP, TAR or gzip file
         """
-        return str(source).lower().endswith(".zip")
+        return str(source).lower().endswith(ARCHIVE_SUFFIXES)
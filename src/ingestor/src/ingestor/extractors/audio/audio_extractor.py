@@ -1,9 +1,18 @@
 """Audio extractor using OpenAI Whisper for transcription."""
 
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from ...types import ExtractionResult, MediaType
 from ..base import BaseExtractor
+from .transcription import (
+    create_pool,
+    load_audio,
+    merge_transcripts,
+    split_on_silence,
+    transcribe_samples,
+)
 
 
 class AudioExtractor(BaseExtractor):
@@ -11,6 +20,11 @@ class AudioExtractor(BaseExtractor):
 
     Supports various audio formats including MP3, WAV, FLAC, M4A, etc.
     Uses local Whisper models for transcription.
+
+    Transcription runs in a process pool (model loaded once per worker) so
+    the event loop stays responsive. Recordings longer than
+    ``chunk_seconds`` are split at silences and the chunks are transcribed
+    in parallel across ``workers`` processes.
     """
 
     media_type = MediaType.AUDIO
@@ -21,21 +35,38 @@ class AudioExtractor(BaseExtractor):
         ".wma", ".aac", ".aiff", ".webm",
     }
 
-    def __init__(self, model: str = "turbo"):
+    def __init__(
+        self,
+        model: str = "turbo",
+        backend: str = "whisper",
+        workers: int = 1,
+        chunk_seconds: float = 600.0,
+    ):
         """Initialize audio extractor.
 
         Args:
             model: Whisper model to use (tiny, base, small, medium, large, turbo)
+            backend: Transcription backend (whisper, faster-whisper)
+            workers: Number of transcription worker processes
+            chunk_seconds: Split recordings longer than this into chunks
         """
         self.model_name = model
-        self._model = None
-
-    def _load_model(self):
-        """Lazy load the Whisper model."""
-        if self._model is None:
-            import whisper
-            self._model = whisper.load_model(self.model_name)
-        return self._model
+        self.backend = backend
+        self.workers = workers
+        self.chunk_seconds = chunk_seconds
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the transcription process pool."""
+        if self._pool is None:
+            self._pool = create_pool(self.backend, self.model_name, self.workers)
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the transcription worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
 
     async def extract(self, source: str | Path) -> ExtractionResult:
         """Extract transcription from an audio file.
@@ -47,15 +78,25 @@ class AudioExtractor(BaseExtractor):
             Extraction result with transcribed text
         """
         path = Path(source)
+        loop = asyncio.get_running_loop()
+
+        # Decode and split off the event loop, then fan chunks out to workers
+        samples = await asyncio.to_thread(load_audio, path)
+        chunks = await asyncio.to_thread(split_on_silence, samples, self.chunk_seconds)
 
-        # Load model and transcribe
-        model = self._load_model()
-        result = model.transcribe(str(path))
+        pool = self._get_pool()
+        chunk_results = await asyncio.gather(*(
+            loop.run_in_executor(pool, transcribe_samples, chunk.samples)
+            for chunk in chunks
+        ))
+        transcript = merge_transcripts([
+            (chunk.start, result) for chunk, result in zip(chunks, chunk_results, strict=True)
+        ])
 
         # Get transcription details
-        text = result.get("text", "").strip()
-        language = result.get("language", "unknown")
-        segments = result.get("segments", [])
+        text = transcript.text
+        language = transcript.language
+        segments = transcript.segments
 
         # Build markdown with timestamps
         markdown = self._build_markdown(path, text, language, segments)
@@ -76,6 +117,8 @@ class AudioExtractor(BaseExtractor):
                 "duration": duration,
                 "segment_count": len(segments),
                 "model": self.model_name,
+                "backend": self.backend,
+                "chunk_count": transcript.chunk_count,
             },
         )
 
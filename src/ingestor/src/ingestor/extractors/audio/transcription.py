@@ -0,0 +1,228 @@
+"""Off-loop, chunked Whisper transcription.
+
+Transcription runs in a dedicated process pool so the event loop never blocks
+on a multi-hour recording. Each worker process loads its model once and keeps
+it for every chunk it receives. Long recordings are split at silences
+(energy-based voice activity detection) into chunks that are transcribed in
+parallel and merged back with their original timestamps.
+
+Backends:
+- ``whisper``: openai-whisper (PyTorch, uses the GPU when available)
+- ``faster-whisper``: CTranslate2 with int8 quantization, fast on CPU-only hosts
+"""
+
+import multiprocessing
+import shutil
+import subprocess
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+SAMPLE_RATE = 16000
+
+BACKENDS = ("whisper", "faster-whisper")
+
+
+@dataclass
+class AudioChunk:
+    """A slice of decoded audio and its offset in the recording."""
+
+    start: float  # Seconds from the start of the recording
+    samples: Any  # float32 numpy array at SAMPLE_RATE
+
+
+@dataclass
+class Transcript:
+    """Merged transcription of a recording."""
+
+    text: str
+    language: str
+    segments: list[dict[str, Any]] = field(default_factory=list)
+    chunk_count: int = 1
+
+
+def load_audio(path: str | Path, sample_rate: int = SAMPLE_RATE) -> Any:
+    """Decode an audio file to mono float32 samples with ffmpeg.
+
+    Args:
+        path: Audio file
+        sample_rate: Target sample rate
+
+    Returns:
+        1-D numpy float32 array in [-1, 1]
+
+    Raises:
+        RuntimeError: If ffmpeg is missing or fails to decode the file
+    """
+    import numpy as np
+
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg is required for audio transcription")
+
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", str(path),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sample_rate), "-",
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio: {e.stderr.decode(errors='ignore')}") from e
+
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def split_on_silence(
+    samples: Any,
+    chunk_seconds: float = 600.0,
+    sample_rate: int = SAMPLE_RATE,
+    frame_ms: int = 30,
+    search_seconds: float = 30.0,
+) -> list[AudioChunk]:
+    """Split audio into chunks of roughly ``chunk_seconds`` at quiet points.
+
+    Frame energy is used as a simple voice activity signal: each cut is placed
+    at the quietest frame within ``search_seconds`` before the target
+    boundary, so words are not split across chunks.
+
+    Args:
+        samples: Mono float32 samples
+        chunk_seconds: Target chunk length
+        sample_rate: Sample rate of ``samples``
+        frame_ms: Frame length for the energy computation
+        search_seconds: Window before each boundary searched for silence
+
+    Returns:
+        Chunks covering the whole recording in order
+    """
+    import numpy as np
+
+    total = len(samples)
+    chunk_len = int(chunk_seconds * sample_rate)
+    if total <= chunk_len:
+        return [AudioChunk(start=0.0, samples=samples)]
+
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    n_frames = total // frame_len
+    frames = samples[: n_frames * frame_len].reshape(n_frames, frame_len)
+    energy = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1))
+
+    search_frames = max(1, int(search_seconds * sample_rate / frame_len))
+    chunks = []
+    start = 0
+    while total - start > chunk_len:
+        target_frame = (start + chunk_len) // frame_len
+        lo = max(start // frame_len + 1, target_frame - search_frames)
+        quietest = lo + int(np.argmin(energy[lo : target_frame + 1]))
+        cut = quietest * frame_len + frame_len // 2
+        chunks.append(AudioChunk(start=start / sample_rate, samples=samples[start:cut]))
+        start = cut
+    chunks.append(AudioChunk(start=start / sample_rate, samples=samples[start:]))
+    return chunks
+
+
+def merge_transcripts(results: list[tuple[float, dict[str, Any]]]) -> Transcript:
+    """Merge per-chunk transcriptions into one transcript.
+
+    Args:
+        results: ``(chunk_start, transcription)`` pairs
+
+    Returns:
+        Transcript with segment timestamps relative to the whole recording
+    """
+    texts = []
+    segments = []
+    languages: Counter[str] = Counter()
+
+    for offset, result in sorted(results, key=lambda item: item[0]):
+        text = result.get("text", "").strip()
+        if text:
+            texts.append(text)
+        if result.get("language"):
+            languages[result["language"]] += 1
+        for segment in result.get("segments", []):
+            segments.append({
+                **segment,
+                "start": segment.get("start", 0) + offset,
+                "end": segment.get("end", 0) + offset,
+            })
+
+    language = languages.most_common(1)[0][0] if languages else "unknown"
+    return Transcript(
+        text=" ".join(texts),
+        language=language,
+        segments=segments,
+        chunk_count=len(results),
+    )
+
+
+# Per-process model, loaded once by the pool initializer
+_worker_model: Any = None
+_worker_backend: str = "whisper"
+
+
+def _init_worker(backend: str, model_name: str) -> None:
+    """Load the transcription model in a worker process."""
+    global _worker_model, _worker_backend
+    _worker_backend = backend
+    if backend == "faster-whisper":
+        from faster_whisper import WhisperModel
+
+        _worker_model = WhisperModel(model_name, device="cpu", compute_type="int8")
+    else:
+        import whisper
+
+        _worker_model = whisper.load_model(model_name)
+
+
+def transcribe_samples(samples: Any, language: str | None = None) -> dict[str, Any]:
+    """Transcribe a chunk in a worker process.
+
+    Returns:
+        Dict with ``text``, ``language`` and ``segments`` (chunk-relative times)
+    """
+    if _worker_backend == "faster-whisper":
+        segments_iter, info = _worker_model.transcribe(samples, language=language, vad_filter=True)
+        segments = [
+            {"start": s.start, "end": s.end, "text": s.text} for s in segments_iter
+        ]
+        return {
+            "text": "".join(s["text"] for s in segments).strip(),
+            "language": info.language,
+            "segments": segments,
+        }
+
+    result = _worker_model.transcribe(samples, language=language)
+    return {
+        "text": result.get("text", ""),
+        "language": result.get("language"),
+        "segments": [
+            {"start": s.get("start", 0), "end": s.get("end", 0), "text": s.get("text", "")}
+            for s in result.get("segments", [])
+        ],
+    }
+
+
+def create_pool(backend: str, model_name: str, workers: int) -> ProcessPoolExecutor:
+    """Create a transcription process pool.
+
+    Workers are spawned (not forked) so no CUDA or thread state is inherited
+    from the parent, and each one loads the model exactly once.
+
+    Args:
+        backend: ``whisper`` or ``faster-whisper``
+        model_name: Model to load in every worker
+        workers: Number of worker processes
+
+    Returns:
+        Process pool ready for :func:`transcribe_samples` jobs
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown transcription backend: {backend} (choose from {BACKENDS})")
+    return ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(backend, model_name),
+    )
@@ -1,20 +1,36 @@
 """CSV extractor using pandas."""
 
+import asyncio
+import csv
 from pathlib import Path
 
 from ...types import ExtractionResult, MediaType
 from ..base import BaseExtractor
+from .tables import TableConfig, TableRenderer
+
+# Bytes read to detect the delimiter
+SNIFF_BYTES = 64 * 1024
 
 
 class CsvExtractor(BaseExtractor):
     """Extract content from CSV files.
 
-    Uses pandas for reading with automatic delimiter detection.
-    Converts to a markdown table.
+    Uses pandas for reading with automatic delimiter detection. The file is
+    read in chunks and rendered as it streams, so large files never have to
+    fit in memory; tables larger than the configured limits are capped or
+    summarized (see :mod:`.tables`).
     """
 
     media_type = MediaType.CSV
 
+    def __init__(self, config: TableConfig | None = None):
+        """Initialize the extractor.
+
+        Args:
+            config: Table rendering limits
+        """
+        self.config = config or TableConfig()
+
     async def extract(self, source: str | Path) -> ExtractionResult:
         """Extract content from a CSV file.
 
@@ -24,65 +40,74 @@ class CsvExtractor(BaseExtractor):
         Returns:
             Extraction result with markdown table
         """
-        import pandas as pd
-
         path = Path(source)
+        return await asyncio.to_thread(self._extract_sync, path)
 
-        # Try to read with automatic delimiter detection
-        try:
-            df = pd.read_csv(path, sep=None, engine="python")
-        except Exception:
-            # Fallback to comma delimiter
-            df = pd.read_csv(path)
+    def _extract_sync(self, path: Path) -> ExtractionResult:
+        import pandas as pd
 
-        # Convert to markdown table
-        markdown = self._df_to_markdown(df)
+        # Try the detected delimiter, falling back to comma
+        delimiter = self._sniff_delimiter(path)
+        try:
+            renderer = self._render(path, delimiter)
+        except pd.errors.ParserError:
+            if delimiter == ",":
+                raise
+            renderer = self._render(path, ",")
 
         return ExtractionResult(
-            markdown=markdown,
+            markdown=renderer.render(),
             title=path.stem,
             source=str(path),
             media_type=MediaType.CSV,
             images=[],
             metadata={
-                "row_count": len(df),
-                "column_count": len(df.columns),
-                "columns": list(df.columns),
+                **renderer.metadata(),
+                "columns": renderer.columns,
             },
         )
 
-    def _df_to_markdown(self, df) -> str:
-        """Convert a DataFrame to a markdown table.
-
-        Args:
-            df: pandas DataFrame
+    def _render(self, path: Path, delimiter: str) -> TableRenderer:
+        """Stream the file through a table renderer.
 
-        Returns:
-            Markdown table string
+        Values are read as strings, so every chunk renders the same way no
+        matter which types pandas would infer from that chunk alone.
         """
         import pandas as pd
 
-        if df.empty:
-            return ""
-
-        # Get column headers
-        headers = list(df.columns)
-        header_row = "| " + " | ".join(str(h) for h in headers) + " |"
-        separator = "| " + " | ".join("---" for _ in headers) + " |"
-
-        # Build data rows
-        rows = [header_row, separator]
-        for _, row in df.iterrows():
-            cells = []
-            for val in row:
-                # Handle NaN and escape pipes
-                if pd.isna(val):
-                    cells.append("")
-                else:
-                    cells.append(str(val).replace("|", "\\|").replace("\n", " "))
-            rows.append("| " + " | ".join(cells) + " |")
-
-        return "\n".join(rows)
+        reader = pd.read_csv(
+            path,
+            sep=delimiter,
+            dtype=str,
+            keep_default_na=False,
+            chunksize=max(1, self.config.window),
+        )
+        renderer = None
+        with reader:
+            for chunk in reader:
+                if renderer is None:
+                    renderer = TableRenderer(list(chunk.columns), self.config)
+                renderer.add_rows(chunk.itertuples(index=False, name=None))
+        if renderer is None:
+            # Header only
+            renderer = TableRenderer(
+                list(pd.read_csv(path, sep=delimiter, nrows=0).columns), self.config
+            )
+        return renderer
+
+    def _sniff_delimiter(self, path: Path) -> str:
+        """Detect the delimiter from the start of the file."""
+        with open(path, encoding="utf-8", errors="replace", newline="") as f:
+            sample = f.read(SNIFF_BYTES)
+        if not sample:
+            return ","
+        # Only complete lines (a cut-off quoted field confuses the sniffer)
+        if len(sample) == SNIFF_BYTES and "\n" in sample:
+            sample = sample[: sample.rindex("\n")]
+        try:
+            return csv.Sniffer().sniff(sample).delimiter
+        except csv.Error:
+            return ","
 
     def supports(self, source: str | Path) -> bool:
         """Check if this extractor handles the source.
@@ -0,0 +1,280 @@
+"""Streaming markdown rendering for tabular data (CSV, XLSX).
+
+Rows are fed in one at a time, so memory is bounded by the rows actually
+shown rather than by the size of the table:
+
+- ``full``: rows are rendered as markdown tables of ``window`` rows each
+  (header repeated, so every block stands on its own), up to ``max_rows``;
+  the remaining rows are counted but not shown.
+- ``summary``: schema, inferred types, per-column statistics and a few
+  sample rows. Statistics are updated incrementally as rows stream past.
+- ``auto``: ``full`` while the table fits in ``max_rows``, ``summary`` once
+  it does not.
+
+Columns beyond ``max_cols`` are left out of the rendered tables (the summary
+schema still lists them all).
+"""
+
+import math
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Any
+
+TABLE_MODES = ("auto", "full", "summary")
+
+# Distinct values tracked per column before reporting "N+"
+DISTINCT_LIMIT = 1000
+
+
+@dataclass
+class TableConfig:
+    """Limits for rendering large tables."""
+
+    mode: str = "auto"  # auto, full or summary
+    max_rows: int = 10_000  # Rows rendered verbatim (0 = no limit)
+    max_cols: int = 50  # Columns rendered (0 = no limit)
+    window: int = 1_000  # Rows per markdown table block
+    sample_rows: int = 5  # Sample rows shown in summary mode
+
+    def __post_init__(self):
+        if self.mode not in TABLE_MODES:
+            raise ValueError(f"Unknown table mode: {self.mode} (expected one of {TABLE_MODES})")
+
+
+def format_cell(value: Any) -> str:
+    """Format a cell value for a markdown table.
+
+    Empty values (None, NaN) become empty cells; pipes are escaped and
+    newlines flattened so the row stays on one line.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float) and math.isnan(value):
+        return ""
+    return str(value).replace("|", "\\|").replace("\n", " ")
+
+
+def _table_row(cells: Sequence[Any]) -> str:
+    return "| " + " | ".join(format_cell(c) for c in cells) + " |"
+
+
+def _classify(value: Any) -> tuple[str, float | None]:
+    """Infer the type of a value and its numeric value, if any."""
+    if isinstance(value, bool):
+        return "boolean", None
+    if isinstance(value, int):
+        return "integer", float(value)
+    if isinstance(value, float):
+        return "float", value
+    if isinstance(value, (datetime, date, time)):
+        return "datetime", None
+    text = str(value).strip()
+    try:
+        return "integer", float(int(text))
+    except ValueError:
+        pass
+    try:
+        number = float(text)
+    except ValueError:
+        return "text", None
+    return ("float", number) if math.isfinite(number) else ("text", None)
+
+
+def _format_number(number: float | None) -> str:
+    if number is None:
+        return ""
+    if number.is_integer() and abs(number) < 1e15:
+        return str(int(number))
+    return f"{number:.6g}"
+
+
+@dataclass
+class ColumnStats:
+    """Statistics for one column, updated one value at a time."""
+
+    name: str
+    count: int = 0  # Non-empty values
+    nulls: int = 0
+    numeric: int = 0
+    total: float = 0.0
+    minimum: float | None = None
+    maximum: float | None = None
+    kinds: Counter = field(default_factory=Counter)
+    distinct: set[str] = field(default_factory=set)
+    distinct_overflow: bool = False
+
+    def add(self, value: Any) -> None:
+        """Account for one value."""
+        if value is None or value == "" or (isinstance(value, float) and math.isnan(value)):
+            self.nulls += 1
+            return
+
+        self.count += 1
+        kind, number = _classify(value)
+        self.kinds[kind] += 1
+        if number is not None:
+            self.numeric += 1
+            self.total += number
+            if self.minimum is None or number < self.minimum:
+                self.minimum = number
+            if self.maximum is None or number > self.maximum:
+                self.maximum = number
+
+        if not self.distinct_overflow:
+            key = str(value)
+            if key not in self.distinct:
+                if len(self.distinct) >= DISTINCT_LIMIT:
+                    self.distinct_overflow = True
+                else:
+                    self.distinct.add(key)
+
+    @property
+    def dtype(self) -> str:
+        """Inferred column type."""
+        if not self.kinds:
+            return "empty"
+        if len(self.kinds) == 1:
+            return next(iter(self.kinds))
+        if set(self.kinds) == {"integer", "float"}:
+            return "float"
+        return "mixed"
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the numeric values, if any."""
+        return self.total / self.numeric if self.numeric else None
+
+    def as_row(self) -> list[str]:
+        """Return the column's line in the summary table."""
+        numeric = self.dtype in ("integer", "float")
+        distinct = f"{DISTINCT_LIMIT}+" if self.distinct_overflow else str(len(self.distinct))
+        return [
+            self.name,
+            self.dtype,
+            str(self.count),
+            str(self.nulls),
+            distinct,
+            _format_number(self.minimum) if numeric else "",
+            _format_number(self.maximum) if numeric else "",
+            _format_number(self.mean) if numeric else "",
+        ]
+
+
+class TableRenderer:
+    """Build the markdown for one table from a stream of rows."""
+
+    def __init__(self, columns: Sequence[Any], config: TableConfig | None = None):
+        """Initialize the renderer.
+
+        Args:
+            columns: Column headers
+            config: Rendering limits
+        """
+        self.config = config or TableConfig()
+        self.columns = [format_cell(c) for c in columns]
+        max_cols = self.config.max_cols
+        self.shown = len(self.columns) if max_cols <= 0 else min(max_cols, len(self.columns))
+        self.row_count = 0
+
+        mode = self.config.mode
+        self._verbatim = mode != "summary"
+        self._stats = [ColumnStats(name) for name in self.columns] if mode != "full" else None
+        self._samples: list[Sequence[Any]] = []
+        self._blocks: list[str] = []
+        self._window: list[str] = []
+
+    @property
+    def summarized(self) -> bool:
+        """Whether the table is rendered as a summary."""
+        mode = self.config.mode
+        return mode == "summary" or (mode == "auto" and self._over_limit)
+
+    @property
+    def truncated(self) -> bool:
+        """Whether rows or columns were left out of the output."""
+        return self.summarized or self._over_limit or self.shown < len(self.columns)
+
+    @property
+    def _over_limit(self) -> bool:
+        return 0 < self.config.max_rows < self.row_count
+
+    def add(self, row: Sequence[Any]) -> None:
+        """Add one data row (one value per column)."""
+        self.row_count += 1
+
+        if self._stats is not None:
+            for stats, value in zip(self._stats, row, strict=False):
+                stats.add(value)
+            if len(self._samples) < self.config.sample_rows:
+                self._samples.append(row)
+
+        if not self._verbatim:
+            return
+        if self._over_limit:
+            if self.config.mode == "auto":
+                # Too large to show verbatim: drop what was rendered, keep stats
+                self._verbatim = False
+                self._blocks.clear()
+                self._window.clear()
+            return
+
+        self._window.append(_table_row(row[: self.shown]))
+        if len(self._window) >= self.config.window:
+            self._flush()
+
+    def add_rows(self, rows) -> None:
+        """Add many data rows."""
+        for row in rows:
+            self.add(row)
+
+    def _header(self) -> list[str]:
+        header = self.columns[: self.shown]
+        return [_table_row(header), "| " + " | ".join("---" for _ in header) + " |"]
+
+    def _flush(self) -> None:
+        if self._window:
+            self._blocks.append("\n".join(self._header() + self._window))
+            self._window = []
+
+    def render(self) -> str:
+        """Return the markdown for the table (empty if there are no rows)."""
+        if self.row_count == 0:
+            return ""
+        if self.summarized:
+            return self._render_summary()
+
+        self._flush()
+        parts = list(self._blocks)
+        notes = []
+        if self._over_limit:
+            notes.append(f"first {self.config.max_rows:,} of {self.row_count:,} rows")
+        if self.shown < len(self.columns):
+            notes.append(f"{self.shown} of {len(self.columns)} columns")
+        if notes:
+            parts.append(f"*Showing {', '.join(notes)}.*")
+        return "\n\n".join(parts)
+
+    def _render_summary(self) -> str:
+        lines = [
+            f"*Summary of {self.row_count:,} rows × {len(self.columns)} columns.*",
+            "",
+            _table_row(["Column", "Type", "Non-null", "Null", "Distinct", "Min", "Max", "Mean"]),
+            "| " + " | ".join("---" for _ in range(8)) + " |",
+        ]
+        lines.extend(_table_row(stats.as_row()) for stats in self._stats or [])
+
+        if self._samples:
+            lines += ["", "**Sample rows:**", "", *self._header()]
+            lines.extend(_table_row(row[: self.shown]) for row in self._samples)
+        return "\n".join(lines)
+
+    def metadata(self) -> dict[str, Any]:
+        """Return row/column counts and how the table was rendered."""
+        return {
+            "row_count": self.row_count,
+            "column_count": len(self.columns),
+            "table_mode": "summary" if self.summarized else "full",
+            "truncated": self.truncated,
+        }
@@ -1,20 +1,32 @@
-"""Modern Excel (XLSX) extractor using pandas and openpyxl."""
+"""Modern Excel (XLSX) extractor using openpyxl in read-only mode."""
 
+import asyncio
 from pathlib import Path
 
 from ...types import ExtractionResult, MediaType
 from ..base import BaseExtractor
+from ..data.tables import TableConfig, TableRenderer
 
 
 class XlsxExtractor(BaseExtractor):
     """Extract content from modern Excel files (XLSX).
 
-    Uses pandas with openpyxl backend for reading.
-    Converts each sheet to a markdown table.
+    Uses openpyxl's read-only mode, which streams rows from the sheet XML
+    instead of loading every cell, and renders each sheet as it is read.
+    Sheets larger than the configured limits are capped or summarized
+    (see :mod:`..data.tables`).
     """
 
     media_type = MediaType.XLSX
 
+    def __init__(self, config: TableConfig | None = None):
+        """Initialize the extractor.
+
+        Args:
+            config: Table rendering limits
+        """
+        self.config = config or TableConfig()
+
     async def extract(self, source: str | Path) -> ExtractionResult:
         """Extract content from an XLSX file.
 
@@ -24,29 +36,30 @@ class XlsxExtractor(BaseExtractor):
         Returns:
             Extraction result with markdown tables
         """
-        import pandas as pd
-
         path = Path(source)
+        return await asyncio.to_thread(self._extract_sync, path)
 
-        # Read all sheets
-        xlsx = pd.ExcelFile(path, engine="openpyxl")
-        sheets_md = []
-
-        for sheet_name in xlsx.sheet_names:
-            df = pd.read_excel(xlsx, sheet_name=sheet_name)
+    def _extract_sync(self, path: Path) -> ExtractionResult:
+        from openpyxl import load_workbook
 
-            # Skip empty sheets
-            if df.empty:
-                continue
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheet_names = list(workbook.sheetnames)
+            sheets_md = []
+            sheet_info = {}
 
-            # Build markdown for this sheet
-            sheet_lines = [f"## {sheet_name}", ""]
+            for sheet_name in sheet_names:
+                renderer = self._render_sheet(workbook[sheet_name])
 
-            # Convert DataFrame to markdown table
-            table_md = self._df_to_markdown(df)
-            sheet_lines.append(table_md)
+                # Skip empty sheets
+                if renderer is None or renderer.row_count == 0:
+                    continue
 
-            sheets_md.append("\n".join(sheet_lines))
+                # Build markdown for this sheet
+                sheets_md.append(f"## {sheet_name}\n\n{renderer.render()}")
+                sheet_info[sheet_name] = renderer.metadata()
+        finally:
+            workbook.close()
 
         markdown = "\n\n---\n\n".join(sheets_md)
 
@@ -57,43 +70,43 @@ class XlsxExtractor(BaseExtractor):
             media_type=MediaType.XLSX,
             images=[],  # Excel doesn't extract images in this implementation
             metadata={
-                "sheet_count": len(xlsx.sheet_names),
-                "sheets": xlsx.sheet_names,
+                "sheet_count": len(sheet_names),
+                "sheets": sheet_names,
+                "sheet_tables": sheet_info,
             },
         )
 
-    def _df_to_markdown(self, df) -> str:
-        """Convert a DataFrame to a markdown table.
+    def _render_sheet(self, worksheet) -> TableRenderer | None:
+        """Stream one worksheet through a table renderer.
 
-        Args:
-            df: pandas DataFrame
+        The first non-empty row is the header. Blank rows are skipped, and
+        cells beyond the width of the header and first window of rows are
+        ignored.
 
         Returns:
-            Markdown table string
+            The renderer, or None if the sheet has no cells
         """
-        import pandas as pd
-
-        if df.empty:
-            return ""
-
-        # Get column headers
-        headers = list(df.columns)
-        header_row = "| " + " | ".join(str(h) for h in headers) + " |"
-        separator = "| " + " | ".join("---" for _ in headers) + " |"
-
-        # Build data rows
-        rows = [header_row, separator]
-        for _, row in df.iterrows():
-            cells = []
-            for val in row:
-                # Handle NaN and escape pipes
-                if pd.isna(val):
-                    cells.append("")
-                else:
-                    cells.append(str(val).replace("|", "\\|"))
-            rows.append("| " + " | ".join(cells) + " |")
-
-        return "\n".join(rows)
+        rows = (row for row in worksheet.iter_rows(values_only=True) if _has_value(row))
+        header = next(rows, None)
+        if header is None:
+            return None
+
+        # Read one window ahead to settle the table width
+        window = []
+        for row in rows:
+            window.append(row)
+            if len(window) >= max(1, self.config.window):
+                break
+        width = max(_trimmed_length(r) for r in [header, *window])
+
+        columns = [
+            value if value is not None else f"Unnamed: {i}"
+            for i, value in enumerate(_fit(header, width))
+        ]
+        renderer = TableRenderer(columns, self.config)
+        renderer.add_rows(_fit(row, width) for row in window)
+        renderer.add_rows(_fit(row, width) for row in rows)
+        return renderer
 
     def supports(self, source: str | Path) -> bool:
         """Check if this extractor handles the source.
@@ -105,3 +118,22 @@ class XlsxExtractor(BaseExtractor):
             True if this is an XLSX file
         """
         return str(source).lower().endswith(".xlsx")
+
+
+def _has_value(row: tuple) -> bool:
+    return any(value is not None for value in row)
+
+
+def _trimmed_length(row: tuple) -> int:
+    """Length of a row without trailing empty cells."""
+    length = len(row)
+    while length and row[length - 1] is None:
+        length -= 1
+    return length
+
+
+def _fit(row: tuple, width: int) -> tuple:
+    """Pad or cut a row to the table width."""
+    if len(row) >= width:
+        return row[:width]
+    return row + (None,) * (width - len(row))
@@ -0,0 +1,361 @@
+"""Incremental export of repositories into plain folders (``ingestor clone``).
+
+Each repository is fetched into the :class:`MirrorCache` (or shallow-cloned
+when the cache is off) and its files are exported into
+``output_root/<name>``. A state file next to the exported files records the
+ingested commit, so a re-run rewrites only the files changed since then and
+deletes the outputs of removed files. Repository lists run on the shared
+:class:`RepoScheduler`, with separate fetch and export limits.
+"""
+
+import asyncio
+import json
+import re
+import shutil
+import subprocess
+import tempfile
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path, PurePosixPath
+
+from .mirror import MirrorCache
+from .scheduler import RepoOutcome, RepoProgress, RepoScheduler, RepoStages
+
+# Excluded directories - only infrastructure/cache/dependencies, not content
+EXCLUDE_DIRS = {
+    ".git", ".github", ".gitlab", ".circleci", "__pycache__",
+    ".pytest_cache", ".mypy_cache", ".tox", "node_modules", "vendor",
+    "dist", "target", ".venv", "venv", ".coverage", "htmlcov",
+    ".vscode", ".idea", ".claude", "coverage", ".nyc_output",
+    ".eggs", ".ruff_cache", ".hypothesis",
+    "logs", "log", ".logs", "docker", ".travis", ".azure",
+    "bower_components", "jspm_packages",
+}
+
+# Excluded files
+EXCLUDE_FILES = {
+    ".gitignore", ".gitattributes", ".gitmodules",
+    "requirements.txt", "requirements-dev.txt", "dev-requirements.txt",
+    "pyproject.toml", "setup.py", "setup.cfg", "MANIFEST.in",
+    "package.json", "package-lock.json", "yarn.lock", "pnpm-lock.yaml",
+    "Pipfile", "Pipfile.lock", "poetry.lock",
+    "Cargo.toml", "Cargo.lock", "go.mod", "go.sum",
+    "Dockerfile", "docker-compose.yml", "docker-compose.yaml", ".dockerignore",
+    "Dockerfile.dev", "Dockerfile.prod", "Dockerfile.test",
+    "Makefile", "CMakeLists.txt",
+    "LICENSE", "LICENSE.txt", "LICENSE.md", "LICENCE", "LICENCE.txt", "LICENCE.md",
+    "COPYING", "COPYRIGHT", "AUTHORS", "CONTRIBUTORS",
+    "CHANGELOG", "CHANGELOG.md", "HISTORY.md", "CHANGES",
+    "CODE_OF_CONDUCT.md", "CONTRIBUTING.md", "SECURITY.md",
+    ".editorconfig", ".prettierrc", ".eslintrc", ".eslintrc.js", ".eslintrc.json",
+    ".pylintrc", ".flake8", ".pre-commit-config.yaml", "pylintrc",
+    ".coveragerc", "coverage.xml", ".coverage",
+    "tox.ini", "pytest.ini", ".pytest.ini",
+    "__init__.py", "CLAUDE.md", "logg.txt",
+    "config.yaml", "config.yml", "config.json",
+    "meta.yaml", "build.sh", "pr.sh", "lcov.info",
+    "None", "none", "NONE",
+    ".clang-format", ".clang-tidy", ".shellcheck_exclude_paths", "CODEOWNERS",
+}
+
+# Excluded file patterns (extensions)
+EXCLUDE_EXTENSIONS = {
+    ".log", ".lock", ".rst", ".bat", ".info",
+    ".sh", ".slurm",
+    ".pyc", ".pyo", ".pyd", ".so", ".dll", ".exe", ".o", ".a",
+    ".class", ".jar", ".war",
+    ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg",
+    ".zip", ".tar", ".gz", ".bz2",
+    ".yaml", ".yml", ".xml", ".conf", ".param",
+    ".cmake", ".in", ".txt", ".bin", ".dox", ".ops",
+    ".tex", ".supp", ".m4", ".fig", ".pl", ".out", ".dockerfile",
+    ".pdf",
+    ".eps", ".0", ".session", ".idx", ".gui", ".y", ".l",
+    ".h5", ".bp", ".hdf5",
+    ".ddl", ".tst", ".ls", ".err", ".exp", ".dat", ".sample", ".8", ".onion",
+    ".properties", ".orig", ".html", ".htm", ".css", ".am",
+}
+
+EXCLUDE_FILES_LOWER = {f.lower() for f in EXCLUDE_FILES}
+
+# Written next to the cloned files; records what was ingested (hidden, so
+# downstream processing ignores it)
+CLONE_STATE_FILE = ".ingestor_clone.json"
+
+
+def should_exclude(rel_path: str) -> bool:
+    """Check whether a repository file is left out of ``clone`` output.
+
+    Args:
+        rel_path: Path relative to the repository root (POSIX separators)
+    """
+    path = PurePosixPath(rel_path)
+    # Check if any parent directory is in exclude list
+    if any(part in EXCLUDE_DIRS for part in path.parts):
+        return True
+    # Check if filename is in exclude list (case-insensitive)
+    if path.name in EXCLUDE_FILES or path.name.lower() in EXCLUDE_FILES_LOWER:
+        return True
+    # Check if file extension is in exclude list
+    return path.suffix in EXCLUDE_EXTENSIONS
+
+
+def output_name(repo: str) -> str:
+    """Output folder name of a repository (its basename)."""
+    return repo.rstrip("/").split("/")[-1].replace(".git", "")
+
+
+def output_names(repos: list[str]) -> dict[str, str]:
+    """Output folder names for a repository list, unique within the list.
+
+    Repositories keep their basename unless another one in the list shares
+    it (``a/utils`` and ``b/utils``); those are qualified by their owner, so
+    concurrent exports never write to the same folder or state file.
+    """
+    counts = Counter(output_name(repo) for repo in repos)
+    names: dict[str, str] = {}
+    taken: set[str] = set()
+    for repo in repos:
+        name = output_name(repo)
+        if counts[name] > 1:
+            parts = [p for p in re.split(r"[/:]", repo.rstrip("/")) if p]
+            if len(parts) >= 2:
+                name = f"{parts[-2]}_{name}"
+        base, index = name, 2
+        while name in taken:
+            name = f"{base}_{index}"
+            index += 1
+        taken.add(name)
+        names[repo] = name
+    return names
+
+
+@dataclass
+class ExportSummary:
+    """What exporting one repository did."""
+
+    repo: str
+    output_dir: Path
+    commit: str = ""
+    file_count: int = 0
+    written: int = 0
+    removed: int = 0
+    up_to_date: bool = False
+    error: str | None = None
+
+
+@dataclass
+class FetchedRepo:
+    """A repository fetched by the network stage, ready to export."""
+
+    git_dir: Path
+    ref: str | None  # Ref to export (None: HEAD)
+    tmpdir: tempfile.TemporaryDirectory[str] | None = None  # Shallow clone, if any
+
+    def cleanup(self) -> None:
+        """Remove the shallow clone, if any."""
+        if self.tmpdir is not None:
+            self.tmpdir.cleanup()
+
+
+class RepoExporter:
+    """Fetch repositories and export their files into ``output_root/<name>``.
+
+    Implements :class:`~.scheduler.RepoPipeline`, so :meth:`export_all` runs
+    repository lists on the same scheduler as extraction.
+    """
+
+    def __init__(
+        self,
+        output_root: Path,
+        mirrors: MirrorCache,
+        branch: str | None = None,
+        use_cache: bool = True,
+        full: bool = False,
+        log: Callable[[str], None] | None = None,
+        show_git_output: bool = False,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            output_root: Directory receiving one folder per repository
+            mirrors: Cache holding the bare mirrors
+            branch: Branch to ingest (None for the default branch)
+            use_cache: Use the mirror cache (False: one-off shallow clone)
+            full: Rewrite every file even if a previous ingest exists
+            log: Called with progress messages
+            show_git_output: Let ``git clone`` print to the terminal
+        """
+        self.output_root = output_root
+        self.mirrors = mirrors
+        self.branch = branch
+        self.use_cache = use_cache
+        self.full = full
+        self.log = log or (lambda _: None)
+        self.show_git_output = show_git_output
+        self.names: dict[str, str] = {}
+
+    def output_dir(self, repo: str) -> Path:
+        """Folder the repository is exported to."""
+        return self.output_root / self.names.get(repo, output_name(repo))
+
+    def fetch(self, repo: str, progress: Callable[[str], None] | None = None) -> FetchedRepo:
+        """Network stage: update the mirror or shallow-clone the repository.
+
+        Raises:
+            RuntimeError: If fetching fails
+        """
+        if self.use_cache:
+            self.log("Updating mirror clone...")
+            return FetchedRepo(self.mirrors.update(repo), self.branch)
+
+        # Build git clone command with progress and shallow clone for faster downloads
+        tmpdir = tempfile.TemporaryDirectory()
+        clone_path = Path(tmpdir.name) / "repo"
+        cmd = ["git", "clone", "--depth", "1"]
+        if self.show_git_output:
+            cmd.append("--progress")
+        if self.branch:
+            cmd.extend(["--branch", self.branch])
+        cmd.extend([repo, str(clone_path)])
+
+        self.log("Starting shallow clone (latest commit only)...")
+        try:
+            # Let git output go directly to terminal for real-time progress
+            subprocess.run(cmd, check=True, text=True, capture_output=not self.show_git_output)
+        except subprocess.CalledProcessError as e:
+            tmpdir.cleanup()
+            raise RuntimeError(f"Git clone failed: {e.stderr or e}") from e
+        # The shallow clone's HEAD is already the branch
+        return FetchedRepo(clone_path / ".git", None, tmpdir)
+
+    def export(self, repo: str, fetched: FetchedRepo) -> ExportSummary:
+        """Disk stage: write the files changed since the last ingest.
+
+        Raises:
+            RuntimeError: If resolving or exporting fails
+        """
+        mirrors = self.mirrors
+        git_dir = fetched.git_dir
+        output_dir = self.output_dir(repo)
+        state_path = output_dir / CLONE_STATE_FILE
+        commit = mirrors.resolve(git_dir, fetched.ref)
+
+        previous = None
+        if state_path.exists() and not self.full:
+            try:
+                previous = json.loads(state_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                previous = None
+            if previous and (previous.get("repo") != repo or previous.get("branch") != self.branch):
+                previous = None
+
+        last_commit = previous.get("commit") if previous else None
+        if previous and last_commit == commit:
+            return ExportSummary(
+                repo, output_dir, commit, previous.get("file_count", 0), up_to_date=True
+            )
+
+        removed = 0
+        if last_commit and mirrors.has_commit(git_dir, last_commit):
+            # Incremental: only files changed since the last ingested commit
+            changes = mirrors.diff(git_dir, last_commit, commit)
+            to_write = [c.path for c in changes if c.status != "D" and not should_exclude(c.path)]
+            for change in changes:
+                if change.status != "D":
+                    continue
+                target = output_dir / change.path
+                if target.is_file():
+                    target.unlink()
+                    removed += 1
+                    # Drop directories left empty by the deletion
+                    parent = target.parent
+                    while parent != output_dir and not any(parent.iterdir()):
+                        parent.rmdir()
+                        parent = parent.parent
+            self.log(
+                f"Incremental update {last_commit[:12]}..{commit[:12]}: "
+                f"{len(changes)} changed files"
+            )
+        else:
+            # Remove if exists
+            if output_dir.exists():
+                shutil.rmtree(output_dir)
+            to_write = [p for p in mirrors.list_files(git_dir, commit) if not should_exclude(p)]
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        written = mirrors.export(git_dir, commit, to_write, output_dir)
+
+        # Count files
+        file_count = sum(
+            1 for p in output_dir.rglob("*") if p.is_file() and p.name != CLONE_STATE_FILE
+        )
+
+        state_path.write_text(json.dumps({
+            "repo": repo,
+            "branch": self.branch,
+            "commit": commit,
+            "previous_commit": last_commit,
+            "ingested_at": datetime.now(UTC).isoformat(),
+            "file_count": file_count,
+        }, indent=2), encoding="utf-8")
+
+        return ExportSummary(repo, output_dir, commit, file_count, written, removed)
+
+    def clone(self, repo: str) -> ExportSummary:
+        """Fetch and export one repository.
+
+        Raises:
+            RuntimeError: If cloning, resolving or exporting fails
+        """
+        fetched = self.fetch(repo)
+        try:
+            return self.export(repo, fetched)
+        finally:
+            fetched.cleanup()
+
+    async def run(self, url: str, stages: RepoStages) -> ExportSummary:
+        """Fetch and export one repository in the scheduler's stage slots."""
+        async with stages.cloning():
+            fetched = await asyncio.to_thread(self.fetch, url)
+        try:
+            async with stages.processing():
+                return await asyncio.to_thread(self.export, url, fetched)
+        finally:
+            fetched.cleanup()
+
+    def failed(self, url: str, error: Exception) -> ExportSummary:
+        """Summary for a repository that could not be fetched or exported."""
+        return ExportSummary(url, self.output_dir(url), error=str(error) or type(error).__name__)
+
+    def error_of(self, result: ExportSummary) -> str | None:
+        """Error recorded in the summary."""
+        return result.error
+
+    async def export_all(
+        self,
+        repos: list[str],
+        clone_concurrency: int = 4,
+        process_concurrency: int = 2,
+        on_progress: Callable[[RepoProgress], None] | None = None,
+    ) -> AsyncIterator[RepoOutcome[ExportSummary]]:
+        """Fetch and export many repositories concurrently.
+
+        Repositories sharing a basename get owner-qualified folders (see
+        :func:`output_names`).
+
+        Args:
+            repos: Repository URLs or paths (without duplicates)
+            clone_concurrency: Maximum fetches in flight
+            process_concurrency: Maximum repositories exported at once
+            on_progress: Called for every progress event
+
+        Yields:
+            One outcome per repository, as they complete
+        """
+        self.names = output_names(repos)
+        scheduler = RepoScheduler(self, clone_concurrency, process_concurrency, on_progress)
+        async for outcome in scheduler.run(repos):
+            yield outcome
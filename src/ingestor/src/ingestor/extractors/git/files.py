@@ -0,0 +1,247 @@
+"""Repository file walking and concurrent reading.
+
+- :class:`ExcludeMatcher` compiles the exclude patterns once (set lookups for
+  plain names, one regex for all globs).
+- :func:`walk_files` walks with ``os.scandir`` and prunes excluded directories,
+  so ``.git``, ``node_modules`` and friends are never entered.
+- :func:`bounded_map` reads files on a thread pool, in order, with a bounded
+  number of reads in flight.
+- :class:`SourceFileStream` hands source files to the output writer one at a
+  time instead of holding the whole repository in memory (``async for``
+  reads them off the event loop).
+"""
+
+import asyncio
+import fnmatch
+import os
+import re
+import shutil
+import weakref
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Generator, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+from ...types import SourceFile
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ExcludeMatcher:
+    """Exclude patterns compiled for fast matching.
+
+    Pattern forms (same semantics as ``GitRepoConfig.exclude_patterns``):
+
+    - ``name/``: directory (or file) with this exact name, anywhere
+    - ``*.ext`` / ``*.egg-info/``: glob on the file name or relative path
+    - ``name``: file with this exact name
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Compile the patterns.
+
+        Args:
+            patterns: Exclude patterns
+        """
+        dir_names = {".git"}
+        dir_globs = []
+        names = set()
+        file_globs = []
+
+        for pattern in patterns:
+            if pattern.endswith("/"):
+                name = pattern.rstrip("/")
+                if "*" in name:
+                    dir_globs.append(name)
+                else:
+                    dir_names.add(name)
+            elif "*" in pattern:
+                file_globs.append(pattern)
+            else:
+                names.add(pattern)
+
+        self._dir_names = frozenset(dir_names)
+        self._names = frozenset(names | dir_names)
+        self._dir_re = self._compile(dir_globs)
+        self._file_re = self._compile(file_globs)
+
+    @staticmethod
+    def _compile(globs: list[str]) -> re.Pattern | None:
+        if not globs:
+            return None
+        return re.compile("|".join(f"(?:{fnmatch.translate(g)})" for g in globs))
+
+    def excludes_dir(self, name: str) -> bool:
+        """Check whether a directory (and everything below it) is excluded."""
+        return name in self._dir_names or bool(self._dir_re and self._dir_re.match(name))
+
+    def excludes_file(self, name: str, rel_path: str) -> bool:
+        """Check whether a file is excluded.
+
+        Args:
+            name: File name
+            rel_path: Path relative to the repository root
+        """
+        if name in self._names:
+            return True
+        return bool(self._file_re and (self._file_re.match(name) or self._file_re.match(rel_path)))
+
+
+def walk_files(root: Path, matcher: ExcludeMatcher) -> Iterator[tuple[Path, str]]:
+    """Yield the non-excluded files below ``root``.
+
+    Excluded directories are pruned, and symlinked directories are not
+    followed.
+
+    Args:
+        root: Directory to walk
+        matcher: Compiled exclude patterns
+
+    Yields:
+        ``(path, path relative to root)``
+    """
+    stack = [(str(root), "")]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel_path = rel_prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not matcher.excludes_dir(entry.name):
+                            stack.append((entry.path, rel_path + os.sep))
+                    elif entry.is_file() and not matcher.excludes_file(entry.name, rel_path):
+                        yield Path(entry.path), rel_path
+                except OSError:
+                    continue
+
+
+def bounded_map(
+    pool: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[R]:
+    """Map ``fn`` over ``items`` on ``pool``, yielding results in order.
+
+    At most ``window`` calls are in flight, so memory stays bounded and the
+    consumer can stop early without reading everything.
+    """
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class SourceFileStream:
+    """Source files read lazily from disk, in order, on a thread pool.
+
+    Used as ``ExtractionResult.source_files`` so the output writer can flush
+    each file as soon as it is read. If the stream owns a temporary checkout,
+    it is removed once the stream has been consumed (or garbage collected);
+    such a stream can be iterated only once. Callbacks registered with
+    :meth:`add_cleanup_callback` run after the checkout is removed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        entries: list[tuple[str, str | None, int]],
+        workers: int = 8,
+        cleanup: Path | None = None,
+    ):
+        """Initialize the stream.
+
+        Args:
+            root: Directory the relative paths are resolved against
+            entries: ``(relative path, language, size)`` per file, in output order
+            workers: Reader threads
+            cleanup: Temporary directory to delete when the stream is done
+        """
+        self.root = root
+        self.entries = entries
+        self.workers = max(1, workers)
+        self._callbacks: list[Callable[[], None]] = []
+        self._finalizer = (
+            weakref.finalize(self, _remove_checkout, cleanup, self._callbacks)
+            if cleanup is not None
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Generator[SourceFile, None, None]:
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for source_file in bounded_map(pool, self._read, self.entries, self.workers * 4):
+                    if source_file is not None:
+                        yield source_file
+        finally:
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[SourceFile]:
+        """Iterate without blocking the event loop.
+
+        Each file is awaited from a worker thread, so other results (image
+        conversion, other writes) progress while source files are read.
+        """
+        it = iter(self)
+        try:
+            while (source_file := await asyncio.to_thread(next, it, None)) is not None:
+                yield source_file
+        finally:
+            try:
+                await asyncio.to_thread(it.close)
+            except ValueError:
+                # Cancelled while a read is still running in its thread
+                self.close()
+
+    def _read(self, entry: tuple[str, str | None, int]) -> SourceFile | None:
+        rel_path, language, size = entry
+        try:
+            content = (self.root / rel_path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+        return SourceFile(path=rel_path, content=content, language=language, size_bytes=size)
+
+    def add_cleanup_callback(self, callback: Callable[[], None]) -> bool:
+        """Call ``callback`` once the temporary checkout has been removed.
+
+        It may run on whichever thread consumes, closes or collects the stream.
+
+        Returns:
+            False (and the callback is not registered) if there is no
+            checkout left to remove
+        """
+        if self._finalizer is None or not self._finalizer.alive:
+            return False
+        self._callbacks.append(callback)
+        return True
+
+    def close(self) -> None:
+        """Release the temporary checkout, if the stream owns one."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+
+def _remove_checkout(path: Path, callbacks: list[Callable[[], None]]) -> None:
+    # Module-level so the finalizer holds no reference to the stream
+    try:
+        shutil.rmtree(path, ignore_errors=True)
+    finally:
+        for callback in callbacks:
+            callback()
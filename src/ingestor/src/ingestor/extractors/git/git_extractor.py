@@ -11,11 +11,14 @@ Handles:
 
 import asyncio
 import base64
-import fnmatch
 import os
 import re
+import shutil
 import subprocess
 import tempfile
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +26,9 @@ from typing import Any
 
 from ...types import ExtractedImage, ExtractionResult, MediaType
 from ..base import BaseExtractor
+from .files import ExcludeMatcher, SourceFileStream, bounded_map, walk_files
+from .github_fetch import FETCH_STRATEGIES, BlobCache, FetchStats, GitHubFetcher
+from .scheduler import ExtractPipeline, RepoOutcome, RepoProgress, RepoScheduler, repo_report
 
 
 @dataclass
@@ -31,7 +37,11 @@ class GitRepoConfig:
 
     # Clone options
     shallow: bool = False  # Always use full clone
+    depth: int = 1  # History depth when shallow
     branch: str | None = None  # Specific branch to clone
+    tag: str | None = None  # Specific tag to clone
+    commit: str | None = None  # Specific commit to check out
+    include_submodules: bool = False  # Clone submodules recursively
 
     # File filtering
     include_extensions: set[str] = field(default_factory=lambda: {
@@ -79,6 +89,18 @@ class GitRepoConfig:
     # Processing options
     max_file_size: int = 500_000  # 500KB max per file
     max_total_files: int = 10_000  # Maximum files to process
+    include_binary_metadata: bool = False  # List binary files (path, size) without content
+    read_workers: int = 8  # Threads reading file contents
+
+    # GitHub directory URLs (see github_fetch.py)
+    github_fetch: str = "tree"  # "tree", "tarball" or "contents" (one API call per file)
+    github_concurrency: int = 8  # Raw downloads in flight
+    use_blob_cache: bool = True  # Cache downloaded files by blob SHA
+    blob_cache_dir: str | None = None  # Defaults to <cache>/ingestor/git/blobs
+
+    # Repository lists (.download_git)
+    clone_concurrency: int = 4  # Clones in flight (network-bound)
+    process_concurrency: int = field(default_factory=lambda: min(4, os.cpu_count() or 1))
 
     # Important files to always include
     important_files: set[str] = field(default_factory=lambda: {
@@ -130,6 +152,10 @@ class GitExtractor(BaseExtractor):
         "raw": r"^https?://(?:www\.)?github\.com/([^/]+)/([^/]+)/raw/([^/]+)/(.+)$",
     }
 
+    # GitHub endpoints (overridable, e.g. for GitHub Enterprise)
+    GITHUB_API = "https://api.github.com"
+    GITHUB_RAW = "https://raw.githubusercontent.com"
+
     # Binary file extensions to skip content extraction
     BINARY_EXTENSIONS = {
         ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".webp", ".bmp", ".tiff",
@@ -142,6 +168,18 @@ class GitExtractor(BaseExtractor):
         ".db", ".sqlite", ".sqlite3",
     }
 
+    # Documentation files: content is included in the markdown
+    DOC_EXTENSIONS = {".md", ".rst", ".txt", ".markdown", ".adoc", ".asciidoc"}
+    DOC_NAMES = {"readme", "license", "changelog", "contributing", "code_of_conduct", "security"}
+
+    # Code and config files: content goes to source_files, not markdown
+    CODE_EXTENSIONS = {
+        ".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".c", ".cpp", ".h", ".hpp",
+        ".go", ".rs", ".rb", ".php", ".swift", ".kt", ".scala",
+        ".sh", ".bash", ".zsh", ".html", ".css", ".scss", ".json", ".yaml", ".yml",
+        ".xml", ".toml", ".sql", ".graphql",
+    }
+
     def __init__(
         self,
         config: GitRepoConfig | None = None,
@@ -161,6 +199,8 @@ class GitExtractor(BaseExtractor):
         self.token = token or os.environ.get("GITHUB_TOKEN") or os.environ.get("GIT_TOKEN")
         self._registry = registry
         self.use_api_for_github = use_api_for_github
+        # Progress callback for repository lists (see RepoScheduler)
+        self.progress: Callable[[RepoProgress], None] | None = None
 
     def set_registry(self, registry: Any):
         """Set the extractor registry."""
@@ -336,7 +376,7 @@ class GitExtractor(BaseExtractor):
         """
         from ...types import SourceFile
         
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
+        api_url = f"{self.GITHUB_API}/repos/{owner}/{repo}/contents/{path}?ref={branch}"
         data = await self._api_request(api_url)
 
         content = "*File content could not be retrieved*"
@@ -390,15 +430,145 @@ class GitExtractor(BaseExtractor):
     async def _extract_github_directory(
         self, owner: str, repo: str, branch: str, path: str, url: str
     ) -> ExtractionResult:
-        """Extract a directory via GitHub API.
-        
+        """Extract a directory (and everything below it) from GitHub.
+
+        Uses the fetch strategy from ``config.github_fetch``: ``tree`` (one
+        Trees API call, then concurrent raw downloads), ``tarball`` (one
+        streamed archive) or ``contents`` (one API call per file, top level
+        only). A truncated tree listing falls back to the tarball.
+
         Code files are kept in source_files, not converted to markdown.
         """
+        import httpx
+
         from ...types import SourceFile
-        
-        api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
-        contents = await self._api_request(api_url)
 
+        strategy = self.config.github_fetch
+        if strategy not in FETCH_STRATEGIES:
+            raise ValueError(f"Unknown GitHub fetch strategy: {strategy}")
+        if strategy == "contents":
+            return await self._extract_github_directory_contents(owner, repo, branch, path, url)
+
+        stats = FetchStats(strategy=strategy)
+        fetcher = GitHubFetcher(
+            owner,
+            repo,
+            branch,
+            self._get_api_headers(),
+            concurrency=self.config.github_concurrency,
+            cache=self._blob_cache(),
+            api_base=self.GITHUB_API,
+            raw_base=self.GITHUB_RAW,
+        )
+        path = path.strip("/")
+        prefix = f"{path}/" if path else ""
+        want = self._github_file_filter(prefix)
+
+        contents: dict[str, bytes] = {}
+        if strategy == "tree":
+            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+                entries, dir_paths, truncated = await fetcher.list_tree(client, stats)
+                if truncated:
+                    stats.fallback = "tarball"
+                else:
+                    selected = [e for e in entries if want(e.path, e.size)]
+                    contents = await fetcher.fetch_blobs(client, selected, stats)
+        if strategy == "tarball" or stats.fallback:
+            contents, entries, dir_paths = await asyncio.to_thread(fetcher.fetch_tarball, want, stats)
+        stats.files = len(contents)
+        stats.finish()
+
+        # Immediate children of the requested directory, for the listing
+        def is_child(p: str) -> bool:
+            return p.startswith(prefix) and "/" not in p[len(prefix):]
+
+        files = [e for e in entries if is_child(e.path)]
+        dirs = [d for d in dir_paths if is_child(d)]
+        if path and not files and not dirs:
+            raise FileNotFoundError(f"Path '{path}' not found in {owner}/{repo}@{branch}")
+
+        source_files = []
+        for entry in entries:
+            data = contents.get(entry.path)
+            if data is None:
+                continue
+            source_files.append(SourceFile(
+                path=entry.path,
+                content=data.decode("utf-8", errors="replace"),
+                language=self._detect_language(Path(entry.path)),
+                size_bytes=entry.size,
+            ))
+
+        markdown = self._build_github_directory_markdown(
+            owner, repo, branch, path, url,
+            [d.rsplit("/", 1)[-1] for d in dirs],
+            [(e.path.rsplit("/", 1)[-1], e.size) for e in files],
+        )
+
+        return ExtractionResult(
+            markdown=markdown,
+            title=path or repo,
+            source=url,
+            media_type=MediaType.GIT,
+            images=[],
+            metadata={
+                "owner": owner,
+                "repo": repo,
+                "branch": branch,
+                "path": path,
+                "file_count": len(files),
+                "dir_count": len(dirs),
+                "extraction_method": "github_api",
+                "fetch_stats": stats.as_dict(),
+            },
+            source_files=source_files,
+        )
+
+    def _blob_cache(self) -> BlobCache | None:
+        """Return the blob cache for GitHub fetches, if enabled."""
+        if not self.config.use_blob_cache:
+            return None
+        from ...core.cache import default_cache_dir
+
+        return BlobCache(self.config.blob_cache_dir or default_cache_dir("git", "blobs"))
+
+    def _github_file_filter(self, prefix: str):
+        """Build the ``want(path, size)`` predicate for a GitHub directory fetch.
+
+        Keeps code and important files below ``prefix`` that are not excluded
+        and not too large, up to ``config.max_total_files``.
+        """
+        matcher = ExcludeMatcher(self.config.exclude_patterns)
+        selected = 0
+
+        def want(file_path: str, size: int) -> bool:
+            nonlocal selected
+            if not file_path.startswith(prefix) or selected >= self.config.max_total_files:
+                return False
+            rel_path = file_path[len(prefix):]
+            *parents, name = rel_path.split("/")
+            if any(matcher.excludes_dir(p) for p in parents) or matcher.excludes_file(name, rel_path):
+                return False
+            is_important = name.lower() in self.config.important_files
+            is_code = Path(name).suffix.lower() in self.config.include_extensions
+            if not (is_important or is_code) or size > self.config.max_file_size:
+                return False
+            selected += 1
+            return True
+
+        return want
+
+    def _build_github_directory_markdown(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        path: str,
+        url: str,
+        dirs: list[str],
+        files: list[tuple[str, int]],
+    ) -> str:
+        """Build the listing markdown for a GitHub directory."""
         markdown_parts = [
             f"# {path or repo}",
             "",
@@ -411,30 +581,44 @@ class GitExtractor(BaseExtractor):
             "",
         ]
 
-        dirs = [item for item in contents if item.get("type") == "dir"]
-        files = [item for item in contents if item.get("type") == "file"]
-
         if dirs:
             markdown_parts.append("### Directories")
             markdown_parts.append("")
-            for d in dirs:
-                markdown_parts.append(f"- 📁 {d.get('name', '')}/")
+            for name in dirs:
+                markdown_parts.append(f"- 📁 {name}/")
             markdown_parts.append("")
 
         if files:
             markdown_parts.append("### Files")
             markdown_parts.append("")
-            for f in files:
-                size = f.get("size", 0)
+            for name, size in files:
                 size_str = f"{size:,} bytes" if size < 1024 else f"{size/1024:.1f} KB"
-                markdown_parts.append(f"- 📄 {f.get('name', '')} ({size_str})")
+                markdown_parts.append(f"- 📄 {name} ({size_str})")
             markdown_parts.append("")
 
-        # Extract file contents to source_files (not markdown)
+        # File contents go to source_files (not markdown)
         markdown_parts.append("## File Contents")
         markdown_parts.append("")
         markdown_parts.append("Source code files are processed separately by the processor.")
         markdown_parts.append("")
+        return "\n".join(markdown_parts)
+
+    async def _extract_github_directory_contents(
+        self, owner: str, repo: str, branch: str, path: str, url: str
+    ) -> ExtractionResult:
+        """Extract a directory with one contents API call per file.
+
+        Only the top level of the directory is fetched.
+        """
+        from ...types import SourceFile
+
+        stats = FetchStats(strategy="contents")
+        api_url = f"{self.GITHUB_API}/repos/{owner}/{repo}/contents/{path}?ref={branch}"
+        contents = await self._api_request(api_url)
+        stats.api_requests += 1
+
+        dirs = [item for item in contents if item.get("type") == "dir"]
+        files = [item for item in contents if item.get("type") == "file"]
 
         source_files = []
         extracted_count = 0
@@ -452,25 +636,35 @@ class GitExtractor(BaseExtractor):
 
             if (is_important or is_code) and size <= self.config.max_file_size:
                 try:
-                    file_api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}?ref={branch}"
+                    file_api_url = f"{self.GITHUB_API}/repos/{owner}/{repo}/contents/{file_path}?ref={branch}"
+                    stats.api_requests += 1
                     file_data = await self._api_request(file_api_url)
                     if file_data.get("content"):
-                        content = base64.b64decode(file_data["content"]).decode("utf-8", errors="replace")
+                        data = base64.b64decode(file_data["content"])
+                        stats.bytes_fetched += len(data)
                         lang = self._detect_language(Path(name))
-                        
+
                         # Add to source_files instead of markdown
                         source_files.append(SourceFile(
                             path=file_path,
-                            content=content,
+                            content=data.decode("utf-8", errors="replace"),
                             language=lang,
                             size_bytes=size,
                         ))
                         extracted_count += 1
                 except Exception:
                     pass
+        stats.downloads = stats.files = extracted_count
+        stats.finish()
+
+        markdown = self._build_github_directory_markdown(
+            owner, repo, branch, path, url,
+            [d.get("name", "") for d in dirs],
+            [(f.get("name", ""), f.get("size", 0)) for f in files],
+        )
 
         return ExtractionResult(
-            markdown="\n".join(markdown_parts),
+            markdown=markdown,
             title=path or repo,
             source=url,
             media_type=MediaType.GIT,
@@ -483,6 +677,7 @@ class GitExtractor(BaseExtractor):
                 "file_count": len(files),
                 "dir_count": len(dirs),
                 "extraction_method": "github_api",
+                "fetch_stats": stats.as_dict(),
             },
             source_files=source_files,
         )
@@ -491,69 +686,76 @@ class GitExtractor(BaseExtractor):
         self, parsed: dict[str, Any], url: str
     ) -> ExtractionResult:
         """Extract GitHub repo using clone + API for metadata."""
-        owner = parsed["owner"]
-        repo = parsed["repo"]
+        # The clone stage fetches the GitHub metadata alongside the clone
+        return await self._extract_from_remote_repo(url)
 
-        # Get GitHub-specific metadata via API
-        github_metadata = {}
+    async def _fetch_github_metadata(self, owner: str, repo: str) -> dict[str, Any]:
+        """Get GitHub-specific repository metadata (empty if unavailable)."""
         try:
-            api_url = f"https://api.github.com/repos/{owner}/{repo}"
+            api_url = f"{self.GITHUB_API}/repos/{owner}/{repo}"
             repo_data = await self._api_request(api_url)
-            github_metadata = {
-                "stars": repo_data.get("stargazers_count", 0),
-                "forks": repo_data.get("forks_count", 0),
-                "watchers": repo_data.get("watchers_count", 0),
-                "language": repo_data.get("language"),
-                "topics": repo_data.get("topics", []),
-                "description": repo_data.get("description"),
-                "license": repo_data.get("license", {}).get("name") if repo_data.get("license") else None,
-                "open_issues": repo_data.get("open_issues_count", 0),
-                "created_at": repo_data.get("created_at"),
-                "updated_at": repo_data.get("updated_at"),
-            }
         except Exception:
-            pass
+            return {}
+        return {
+            "stars": repo_data.get("stargazers_count", 0),
+            "forks": repo_data.get("forks_count", 0),
+            "watchers": repo_data.get("watchers_count", 0),
+            "language": repo_data.get("language"),
+            "topics": repo_data.get("topics", []),
+            "description": repo_data.get("description"),
+            "license": repo_data.get("license", {}).get("name") if repo_data.get("license") else None,
+            "open_issues": repo_data.get("open_issues_count", 0),
+            "created_at": repo_data.get("created_at"),
+            "updated_at": repo_data.get("updated_at"),
+        }
+
+    def _merge_github_metadata(
+        self, result: ExtractionResult, github_metadata: dict[str, Any]
+    ) -> ExtractionResult:
+        """Add GitHub metadata to a cloned repository's result and markdown."""
+        if not github_metadata:
+            return result
+
+        result.metadata.update(github_metadata)
+
+        # Add GitHub stats to markdown
+        if result.markdown and "## Repository Info" in result.markdown:
+            stats_lines = []
+            if github_metadata.get("stars"):
+                stats_lines.append(f"- **Stars:** {github_metadata['stars']:,}")
+            if github_metadata.get("forks"):
+                stats_lines.append(f"- **Forks:** {github_metadata['forks']:,}")
+            if github_metadata.get("language"):
+                stats_lines.append(f"- **Language:** {github_metadata['language']}")
+            if github_metadata.get("license"):
+                stats_lines.append(f"- **License:** {github_metadata['license']}")
+            if github_metadata.get("topics"):
+                stats_lines.append(f"- **Topics:** {', '.join(github_metadata['topics'])}")
+            if github_metadata.get("description"):
+                # Add description after title
+                result.markdown = result.markdown.replace(
+                    "\n\n## Repository Info",
+                    f"\n\n> {github_metadata['description']}\n\n## Repository Info"
+                )
 
-        # Clone the repository
-        result = await self._extract_from_remote_repo(url)
-
-        # Merge GitHub metadata into result
-        if github_metadata:
-            result.metadata.update(github_metadata)
-
-            # Add GitHub stats to markdown
-            if result.markdown and "## Repository Info" in result.markdown:
-                stats_lines = []
-                if github_metadata.get("stars"):
-                    stats_lines.append(f"- **Stars:** {github_metadata['stars']:,}")
-                if github_metadata.get("forks"):
-                    stats_lines.append(f"- **Forks:** {github_metadata['forks']:,}")
-                if github_metadata.get("language"):
-                    stats_lines.append(f"- **Language:** {github_metadata['language']}")
-                if github_metadata.get("license"):
-                    stats_lines.append(f"- **License:** {github_metadata['license']}")
-                if github_metadata.get("topics"):
-                    stats_lines.append(f"- **Topics:** {', '.join(github_metadata['topics'])}")
-                if github_metadata.get("description"):
-                    # Add description after title
-                    result.markdown = result.markdown.replace(
-                        "\n\n## Repository Info",
-                        f"\n\n> {github_metadata['description']}\n\n## Repository Info"
-                    )
-
-                if stats_lines:
-                    stats_text = "\n".join(stats_lines)
-                    result.markdown = result.markdown.replace(
-                        "## Repository Info\n\n",
-                        f"## Repository Info\n\n{stats_text}\n"
-                    )
+            if stats_lines:
+                stats_text = "\n".join(stats_lines)
+                result.markdown = result.markdown.replace(
+                    "## Repository Info\n\n",
+                    f"## Repository Info\n\n{stats_text}\n"
+                )
 
         return result
 
     # ==================== Git Clone Methods ====================
 
     async def _process_download_git_file(self, file_path: Path) -> ExtractionResult:
-        """Process a .download_git file containing repository URLs."""
+        """Process a .download_git file containing repository URLs.
+
+        Repositories are cloned and extracted concurrently (see
+        :class:`RepoScheduler`); a failing repository is reported in the
+        result instead of aborting the others.
+        """
         repos: list[str] = []
 
         try:
@@ -582,52 +784,75 @@ class GitExtractor(BaseExtractor):
                 metadata={"error": "Empty file"},
             )
 
-        # Process each repository
-        results: list[ExtractionResult] = []
-        for repo_url in repos:
-            try:
-                result = await self.extract(repo_url)
-                results.append(result)
-            except Exception as e:
-                results.append(ExtractionResult(
-                    markdown=f"# Error\n\nFailed to process {repo_url}: {e}",
-                    title="Error",
-                    source=repo_url,
-                    media_type=MediaType.GIT,
-                    images=[],
-                    metadata={"error": str(e)},
-                ))
+        outcomes: list[RepoOutcome[ExtractionResult]] = []
+        async for outcome in self.extract_repos(repos):
+            # The combined result carries markdown only; release each clone now
+            # rather than keeping every checkout on disk until the end
+            close = getattr(outcome.result.source_files, "close", None)
+            if close is not None:
+                close()
+            outcomes.append(outcome)
+
+        # Report in file order, not completion order
+        order = {url: i for i, url in enumerate(repos)}
+        outcomes.sort(key=lambda o: order.get(o.url, len(order)))
+        return self._combine_results(outcomes, file_path)
+
+    async def extract_repos(self, urls: list[str]) -> AsyncIterator[RepoOutcome[ExtractionResult]]:
+        """Clone and extract many repositories concurrently.
+
+        Uses ``config.clone_concurrency`` and ``config.process_concurrency``
+        as the stage limits and reports to ``self.progress``, if set.
 
-        return self._combine_results(results, file_path)
+        Args:
+            urls: Repository URLs or local paths
+
+        Yields:
+            One outcome per repository, as they complete
+        """
+        scheduler = RepoScheduler(
+            ExtractPipeline(self),
+            clone_concurrency=self.config.clone_concurrency,
+            process_concurrency=self.config.process_concurrency,
+            on_progress=self.progress,
+        )
+        async for outcome in scheduler.run(urls):
+            yield outcome
 
     def _combine_results(
-        self, results: list[ExtractionResult], source_file: Path
+        self, outcomes: list[RepoOutcome[ExtractionResult]], source_file: Path
     ) -> ExtractionResult:
-        """Combine multiple extraction results into one."""
+        """Combine per-repository outcomes into one result."""
         all_markdown = [
             "# Bulk Git Repository Extraction",
             "",
             f"**Source:** `{source_file.name}`",
-            f"**Repositories:** {len(results)}",
+            f"**Repositories:** {len(outcomes)}",
             f"**Processed:** {datetime.now().isoformat()}",
             "",
-            "---",
-            "",
         ]
 
+        failures = [o for o in outcomes if not o.ok]
+        if failures:
+            all_markdown.extend([f"## Failed Repositories ({len(failures)})", ""])
+            for outcome in failures:
+                reason = (outcome.error or "").strip().splitlines()
+                all_markdown.append(f"- `{outcome.url}`: {reason[-1] if reason else 'unknown error'}")
+            all_markdown.append("")
+
+        all_markdown.extend(["---", ""])
+
         all_images: list[ExtractedImage] = []
         total_files = 0
-        failed = 0
 
-        for result in results:
+        for outcome in outcomes:
+            result = outcome.result
             all_markdown.append(result.markdown)
             all_markdown.append("")
             all_markdown.append("---")
             all_markdown.append("")
             all_images.extend(result.images)
             total_files += result.metadata.get("file_count", 0)
-            if "error" in result.metadata:
-                failed += 1
 
         return ExtractionResult(
             markdown="\n".join(all_markdown),
@@ -636,35 +861,93 @@ class GitExtractor(BaseExtractor):
             media_type=MediaType.GIT,
             images=all_images,
             metadata={
-                "repos_total": len(results),
-                "repos_failed": failed,
+                "repos_total": len(outcomes),
+                "repos_failed": len(failures),
                 "total_files": total_files,
+                "repos": repo_report(outcomes),
             },
         )
 
+    def _error_result(self, url: str, error: Exception) -> ExtractionResult:
+        """Build the result reported for a repository that could not be cloned."""
+        return ExtractionResult(
+            markdown=f"# Error\n\nFailed to clone repository: {url}\n\n```\n{error}\n```",
+            title=f"Error: {self._parse_repo_name(url)}",
+            source=url,
+            media_type=MediaType.GIT,
+            images=[],
+            metadata={"error": str(error), "url": url},
+        )
+
     async def _extract_from_remote_repo(self, url: str) -> ExtractionResult:
-        """Clone and extract from a remote repository."""
-        repo_name = self._parse_repo_name(url)
+        """Clone and extract from a remote repository.
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            clone_path = Path(tmpdir) / repo_name
+        The clone lives until the result's source files have been streamed
+        to the writer; the source file stream removes it afterwards.
+        """
+        try:
+            tmpdir, clone_path, github_metadata = await self._clone_to_temp(url)
+            return await self._extract_cloned_repo(url, tmpdir, clone_path, github_metadata)
+        except Exception as e:
+            return self._error_result(url, e)
 
-            try:
-                await self._clone_repo(url, clone_path)
-            except Exception as e:
-                return ExtractionResult(
-                    markdown=f"# Error\n\nFailed to clone repository: {url}\n\n```\n{e}\n```",
-                    title=f"Error: {repo_name}",
-                    source=url,
-                    media_type=MediaType.GIT,
-                    images=[],
-                    metadata={"error": str(e), "url": url},
+    async def _clone_to_temp(
+        self, url: str, progress: Callable[[str], None] | None = None
+    ) -> tuple[Path, Path, dict[str, Any]]:
+        """Clone a repository into a new temporary directory (network stage).
+
+        For github.com repositories the API metadata is fetched alongside
+        the clone.
+
+        Args:
+            url: Repository URL
+            progress: Called with each git progress line
+
+        Returns:
+            ``(temporary directory, checkout path, GitHub metadata)``
+        """
+        tmpdir = Path(tempfile.mkdtemp(prefix="ingestor-git-"))
+        clone_path = tmpdir / self._parse_repo_name(url)
+
+        github_parsed = self._parse_github_url(url)
+        try:
+            if github_parsed and self.use_api_for_github:
+                _, github_metadata = await asyncio.gather(
+                    self._clone_repo(url, clone_path, progress),
+                    self._fetch_github_metadata(github_parsed["owner"], github_parsed["repo"]),
                 )
+            else:
+                await self._clone_repo(url, clone_path, progress)
+                github_metadata = {}
+        except BaseException:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            raise
+        return tmpdir, clone_path, github_metadata
+
+    async def _extract_cloned_repo(
+        self, url: str, tmpdir: Path, clone_path: Path, github_metadata: dict[str, Any]
+    ) -> ExtractionResult:
+        """Extract a repository cloned by :meth:`_clone_to_temp` (processing stage)."""
+        try:
+            result = await self._extract_from_local_repo(clone_path, url, cleanup=tmpdir)
+        except BaseException:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            raise
+        return self._merge_github_metadata(result, github_metadata)
+
+    async def _clone_repo(
+        self, url: str, target_path: Path, progress: Callable[[str], None] | None = None
+    ) -> None:
+        """Clone a git repository.
 
-            return await self._extract_from_local_repo(clone_path, url)
+        Git's stderr is read as it is produced (not buffered until exit), so
+        progress lines can be forwarded while the clone runs.
 
-    async def _clone_repo(self, url: str, target_path: Path) -> None:
-        """Clone a git repository."""
+        Args:
+            url: Repository URL
+            target_path: Checkout directory
+            progress: Called with each progress line (enables ``--progress``)
+        """
         cmd = ["git", "clone"]
 
         # Add authentication for HTTPS URLs if token is available
@@ -691,17 +974,38 @@ class GitExtractor(BaseExtractor):
         if self.config.include_submodules:
             cmd.append("--recurse-submodules")
 
+        if progress is not None:
+            cmd.append("--progress")
+
         cmd.extend([clone_url, str(target_path)])
 
         process = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
-        stdout, stderr = await process.communicate()
+        assert process.stderr is not None
+
+        # Git rewrites progress lines in place with "\r"; keep the tail for errors
+        tail: deque[str] = deque(maxlen=20)
+        pending = b""
+        while chunk := await process.stderr.read(4096):
+            *lines, pending = re.split(rb"[\r\n]", pending + chunk)
+            for raw in lines:
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line:
+                    continue
+                if self.token:
+                    line = line.replace(self.token, "[TOKEN]")
+                tail.append(line)
+                if progress is not None:
+                    progress(line)
+        if pending.strip():
+            tail.append(pending.decode("utf-8", errors="replace").strip())
+        await process.wait()
 
         if process.returncode != 0:
-            error_msg = stderr.decode("utf-8", errors="replace")
+            error_msg = "\n".join(line for line in tail if not self._is_progress_line(line))
             if self.token:
                 error_msg = error_msg.replace(self.token, "[TOKEN]")
             raise Exception(f"Git clone failed: {error_msg}")
@@ -723,19 +1027,28 @@ class GitExtractor(BaseExtractor):
                     f"Git checkout failed for commit '{self.config.commit}': {error_msg}"
                 )
 
+    @staticmethod
+    def _is_progress_line(line: str) -> bool:
+        """Check whether a git stderr line is a transfer progress update."""
+        return bool(re.match(r"^(remote: )?[A-Za-z ]+:\s+\d+% ", line))
+
     async def _extract_from_local_repo(
-        self, repo_path: Path, source: str
+        self, repo_path: Path, source: str, cleanup: Path | None = None
     ) -> ExtractionResult:
-        """Extract content from a local git repository."""
-        from ...types import SourceFile
+        """Extract content from a local git repository.
 
+        Args:
+            repo_path: Repository checkout
+            source: Original source (path or URL)
+            cleanup: Temporary directory to remove once source files are consumed
+        """
         repo_name = repo_path.name
 
         metadata = await self._get_repo_metadata(repo_path)
         metadata["source"] = source
 
         structure = self._build_directory_tree(repo_path)
-        files_content, images = await self._process_files(repo_path)
+        files_content, images = await asyncio.to_thread(self._process_files_sync, repo_path)
 
         markdown = self._build_markdown(
             repo_name=repo_name,
@@ -745,27 +1058,22 @@ class GitExtractor(BaseExtractor):
             source=source,
         )
 
-        # Build source_files list with all code files
-        # Code files are kept separate and NOT converted to markdown
-        source_files = []
-        code_extensions = {
-            ".py", ".js", ".ts", ".jsx", ".tsx", ".java", ".c", ".cpp", ".h", ".hpp",
-            ".go", ".rs", ".rb", ".php", ".swift", ".kt", ".scala",
-            ".sh", ".bash", ".zsh", ".html", ".css", ".scss", ".json", ".yaml", ".yml",
-            ".xml", ".toml", ".sql", ".graphql",
-        }
-        for file_info in files_content:
-            if file_info.get("type") == "text" and file_info.get("content"):
-                path = file_info["path"]
-                ext = Path(path).suffix.lower()
-                # Include all code and config files in source_files
-                if ext in code_extensions:
-                    source_files.append(SourceFile(
-                        path=path,
-                        content=file_info["content"],
-                        language=file_info.get("language"),
-                        size_bytes=file_info.get("size", 0),
-                    ))
+        # Code files are kept separate and NOT converted to markdown. They are
+        # streamed from disk to the writer rather than loaded here.
+        source_files = SourceFileStream(
+            repo_path,
+            [
+                (f["path"], f.get("language"), f.get("size", 0))
+                for f in files_content
+                if f.get("type") == "text"
+                and f.get("size")
+                and Path(f["path"]).suffix.lower() in self.CODE_EXTENSIONS
+            ],
+            workers=self.config.read_workers,
+            cleanup=cleanup,
+        )
+        if not len(source_files):
+            source_files.close()
 
         return ExtractionResult(
             markdown=markdown,
@@ -882,57 +1190,40 @@ class GitExtractor(BaseExtractor):
         self, repo_path: Path
     ) -> tuple[list[dict[str, Any]], list[ExtractedImage]]:
         """Process all files in the repository."""
-        files_content: list[dict[str, Any]] = []
-        images: list[ExtractedImage] = []
-        processed_count = 0
+        return await asyncio.to_thread(self._process_files_sync, repo_path)
 
-        all_files: list[Path] = []
-        for file_path in repo_path.rglob("*"):
-            if not file_path.is_file():
-                continue
+    def _is_doc_file(self, path: Path) -> bool:
+        """Check whether a file's content belongs in the markdown."""
+        return path.suffix.lower() in self.DOC_EXTENSIONS or path.name.lower() in self.DOC_NAMES
 
-            if ".git" in file_path.parts:
-                continue
-
-            rel_path = file_path.relative_to(repo_path)
-            rel_path_str = str(rel_path)
-
-            skip = False
-            for pattern in self.config.exclude_patterns:
-                if pattern.endswith("/"):
-                    if pattern.rstrip("/") in rel_path.parts:
-                        skip = True
-                        break
-                elif "*" in pattern:
-                    if fnmatch.fnmatch(rel_path_str, pattern):
-                        skip = True
-                        break
-                    if fnmatch.fnmatch(file_path.name, pattern):
-                        skip = True
-                        break
-                else:
-                    if file_path.name == pattern:
-                        skip = True
-                        break
+    def _process_files_sync(
+        self, repo_path: Path
+    ) -> tuple[list[dict[str, Any]], list[ExtractedImage]]:
+        """Classify repository files and read documentation files.
 
-            if skip:
-                continue
+        Only documentation files are read here (concurrently); code files are
+        recorded with their size and read later by :class:`SourceFileStream`.
+        """
+        files_content: list[dict[str, Any]] = []
+        images: list[ExtractedImage] = []
+        processed_count = 0
 
-            all_files.append(file_path)
+        matcher = ExcludeMatcher(self.config.exclude_patterns)
+        all_files = list(walk_files(repo_path, matcher))
 
-        def file_sort_key(f: Path) -> tuple:
-            name_lower = f.name.lower()
+        def file_sort_key(item: tuple[Path, str]) -> tuple:
+            name_lower = item[0].name.lower()
             is_important = name_lower in self.config.important_files
             is_readme = name_lower.startswith("readme")
-            return (not is_readme, not is_important, str(f.relative_to(repo_path)))
+            return (not is_readme, not is_important, item[1])
 
         all_files.sort(key=file_sort_key)
 
-        for file_path in all_files:
+        docs_to_read: list[tuple[dict[str, Any], Path]] = []
+        for file_path, rel_path in all_files:
             if processed_count >= self.config.max_total_files:
                 break
 
-            rel_path = file_path.relative_to(repo_path)
             ext = file_path.suffix.lower()
             name_lower = file_path.name.lower()
 
@@ -945,7 +1236,7 @@ class GitExtractor(BaseExtractor):
             if not (is_important or is_included_ext or is_no_ext_text):
                 if self.config.include_binary_metadata and ext in self.BINARY_EXTENSIONS:
                     files_content.append({
-                        "path": str(rel_path),
+                        "path": rel_path,
                         "type": "binary",
                         "size": file_path.stat().st_size,
                         "extension": ext,
@@ -956,7 +1247,7 @@ class GitExtractor(BaseExtractor):
                 file_size = file_path.stat().st_size
                 if file_size > self.config.max_file_size:
                     files_content.append({
-                        "path": str(rel_path),
+                        "path": rel_path,
                         "type": "skipped",
                         "reason": f"File too large ({file_size:,} bytes)",
                         "size": file_size,
@@ -965,24 +1256,29 @@ class GitExtractor(BaseExtractor):
             except Exception:
                 continue
 
+            file_info = {
+                "path": rel_path,
+                "type": "text",
+                "language": self._detect_language(file_path),
+                "size": file_size,
+            }
+            files_content.append(file_info)
+            if self._is_doc_file(file_path):
+                docs_to_read.append((file_info, file_path))
+            processed_count += 1
+
+        def read_doc(item: tuple[dict[str, Any], Path]) -> None:
+            file_info, file_path = item
             try:
-                content = file_path.read_text(encoding="utf-8", errors="replace")
-                lang = self._detect_language(file_path)
-
-                files_content.append({
-                    "path": str(rel_path),
-                    "type": "text",
-                    "language": lang,
-                    "content": content,
-                    "size": file_size,
-                })
-                processed_count += 1
+                file_info["content"] = file_path.read_text(encoding="utf-8", errors="replace")
             except Exception as e:
-                files_content.append({
-                    "path": str(rel_path),
-                    "type": "error",
-                    "error": str(e),
-                })
+                file_info["type"] = "error"
+                file_info["error"] = str(e)
+
+        workers = max(1, self.config.read_workers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in bounded_map(pool, read_doc, docs_to_read, workers * 4):
+                pass
 
         return files_content, images
 
@@ -1069,25 +1365,12 @@ class GitExtractor(BaseExtractor):
         lines.extend(["", ""])
 
         # Include ALL documentation files with their content
-        # Documentation extensions that should be included in markdown
-        doc_extensions = {".md", ".rst", ".txt", ".markdown", ".adoc", ".asciidoc"}
-        
         # Separate documentation files from source code files
         doc_files = []
         code_files = []
         
         for f in text_files:
-            file_path = Path(f["path"])
-            ext = file_path.suffix.lower()
-            name_lower = file_path.name.lower()
-            
-            # Check if it's a documentation file
-            is_doc_file = (
-                ext in doc_extensions or 
-                name_lower in {"readme", "license", "changelog", "contributing", "code_of_conduct", "security"}
-            )
-            
-            if is_doc_file:
+            if self._is_doc_file(Path(f["path"])):
                 doc_files.append(f)
             else:
                 code_files.append(f)
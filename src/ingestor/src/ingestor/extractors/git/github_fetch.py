@@ -0,0 +1,298 @@
+"""Bulk file fetching for GitHub directory URLs.
+
+The contents API costs one request per file. The fetchers here cost at most
+one API request per directory:
+
+- ``tree``: one recursive Git Trees API call lists every blob (path, size,
+  SHA); blobs are then downloaded concurrently from
+  ``raw.githubusercontent.com``, which does not count against the API budget.
+- ``tarball``: one tarball request, streamed and filtered member by member,
+  so nothing outside the requested directory is kept.
+
+Blob contents are cached on disk by Git blob SHA. A blob SHA names exact
+content, so cache entries never go stale and unchanged files are never
+downloaded twice, across branches and repositories alike.
+"""
+
+import asyncio
+import hashlib
+import io
+import tarfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+API_BASE = "https://api.github.com"
+RAW_BASE = "https://raw.githubusercontent.com"
+
+FETCH_STRATEGIES = ("tree", "tarball", "contents")
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Compute the Git blob SHA-1 of some content (as ``git hash-object``)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+@dataclass
+class TreeEntry:
+    """A file in a repository tree."""
+
+    path: str  # Path relative to the repository root
+    size: int
+    sha: str | None = None  # Blob SHA (unknown until read for tarballs)
+
+
+@dataclass
+class FetchStats:
+    """Request and throughput counters for one directory fetch."""
+
+    strategy: str
+    api_requests: int = 0
+    downloads: int = 0
+    cache_hits: int = 0
+    files: int = 0
+    bytes_fetched: int = 0
+    seconds: float = 0.0
+    fallback: str | None = None  # Set when another strategy had to take over
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def finish(self) -> None:
+        """Stop the clock."""
+        self.seconds = time.perf_counter() - self._started
+
+    @property
+    def files_per_second(self) -> float:
+        """Files fetched per second (0 if nothing was timed)."""
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats for result metadata."""
+        data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+        data["seconds"] = round(self.seconds, 3)
+        data["files_per_second"] = round(self.files_per_second, 1)
+        return data
+
+
+class BlobCache:
+    """Content-addressed blob store keyed by Git blob SHA.
+
+    Layout: ``cache_dir/<sha[:2]>/<sha>``.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store blobs in
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, sha: str) -> Path:
+        return self.cache_dir / sha[:2] / sha
+
+    def get(self, sha: str) -> bytes | None:
+        """Return cached content for a blob SHA, if present."""
+        try:
+            return self._path(sha).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, data: bytes) -> str:
+        """Store content under its blob SHA.
+
+        Returns:
+            The blob SHA
+        """
+        sha = git_blob_sha(data)
+        path = self._path(sha)
+        if not path.exists():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_bytes(data)
+                tmp_path.replace(path)
+            except OSError:
+                pass
+        return sha
+
+
+class _StreamReader(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+class GitHubFetcher:
+    """Fetch the files below a path of a GitHub repository."""
+
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        headers: dict[str, str],
+        concurrency: int = 8,
+        cache: BlobCache | None = None,
+        api_base: str = API_BASE,
+        raw_base: str = RAW_BASE,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag or commit
+            headers: API headers (including authorization, if any)
+            concurrency: Maximum raw downloads in flight
+            cache: Blob cache (None disables caching)
+            api_base: GitHub API base URL
+            raw_base: Raw content base URL
+        """
+        self.owner = owner
+        self.repo = repo
+        self.ref = ref
+        self.headers = headers
+        self.concurrency = max(1, concurrency)
+        self.cache = cache
+        self.api_base = api_base.rstrip("/")
+        self.raw_base = raw_base.rstrip("/")
+
+    async def list_tree(self, client: Any, stats: FetchStats) -> tuple[list[TreeEntry], list[str], bool]:
+        """List the whole repository with one recursive Trees API call.
+
+        Args:
+            client: ``httpx.AsyncClient``
+            stats: Counters to update
+
+        Returns:
+            ``(files, directories, truncated)``; ``truncated`` is True when
+            GitHub cut the listing short (very large repositories)
+        """
+        url = f"{self.api_base}/repos/{self.owner}/{self.repo}/git/trees/{quote(self.ref)}"
+        response = await client.get(url, params={"recursive": "1"}, headers=self.headers)
+        stats.api_requests += 1
+        response.raise_for_status()
+        data = response.json()
+
+        files, dirs = [], []
+        for item in data.get("tree", []):
+            if item.get("type") == "blob":
+                files.append(TreeEntry(path=item["path"], size=item.get("size", 0), sha=item.get("sha")))
+            elif item.get("type") == "tree":
+                dirs.append(item["path"])
+        return files, dirs, bool(data.get("truncated"))
+
+    async def fetch_blobs(
+        self, client: Any, entries: list[TreeEntry], stats: FetchStats
+    ) -> dict[str, bytes]:
+        """Download files concurrently, serving cached blobs from disk.
+
+        Files that fail to download are left out of the result.
+
+        Args:
+            client: ``httpx.AsyncClient``
+            entries: Files to fetch
+            stats: Counters to update
+
+        Returns:
+            Mapping of path to content, in ``entries`` order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        ref = quote(self.ref)
+
+        async def fetch(entry: TreeEntry) -> bytes | None:
+            if self.cache and entry.sha:
+                cached = await asyncio.to_thread(self.cache.get, entry.sha)
+                if cached is not None:
+                    stats.cache_hits += 1
+                    return cached
+            url = f"{self.raw_base}/{self.owner}/{self.repo}/{ref}/{quote(entry.path)}"
+            async with semaphore:
+                try:
+                    response = await client.get(url, headers=self.headers)
+                    response.raise_for_status()
+                except Exception:
+                    return None
+            data = response.content
+            stats.downloads += 1
+            stats.bytes_fetched += len(data)
+            if self.cache:
+                await asyncio.to_thread(self.cache.put, data)
+            return data
+
+        contents = await asyncio.gather(*(fetch(entry) for entry in entries))
+        return {entry.path: data for entry, data in zip(entries, contents, strict=True) if data is not None}
+
+    def fetch_tarball(
+        self, want: Callable[[str, int], bool], stats: FetchStats
+    ) -> tuple[dict[str, bytes], list[TreeEntry], list[str]]:
+        """Stream the repository tarball, keeping only the wanted files.
+
+        Blocking; run it in a worker thread.
+
+        Args:
+            want: ``want(path, size)`` decides whether a file's content is kept
+            stats: Counters to update
+
+        Returns:
+            ``(contents, files, directories)`` where ``files`` and
+            ``directories`` list everything in the archive
+        """
+        import httpx
+
+        url = f"{self.api_base}/repos/{self.owner}/{self.repo}/tarball/{quote(self.ref)}"
+        contents: dict[str, bytes] = {}
+        files: list[TreeEntry] = []
+        dirs: list[str] = []
+
+        with (
+            httpx.Client(headers=self.headers, follow_redirects=True, timeout=60.0) as client,
+            client.stream("GET", url) as response,
+        ):
+            stats.api_requests += 1
+            response.raise_for_status()
+            reader = io.BufferedReader(_StreamReader(response.iter_bytes()), buffer_size=1 << 16)
+            with tarfile.open(fileobj=reader, mode="r|gz") as tf:
+                for member in tf:
+                    # Members are prefixed with "<owner>-<repo>-<sha>/"
+                    _, _, path = member.name.partition("/")
+                    if not path:
+                        continue
+                    if member.isdir():
+                        dirs.append(path.rstrip("/"))
+                        continue
+                    if not member.isfile():
+                        continue
+                    entry = TreeEntry(path=path, size=member.size)
+                    files.append(entry)
+                    if not want(path, member.size):
+                        continue
+                    fobj = tf.extractfile(member)
+                    if fobj is None:
+                        continue
+                    with fobj as f:
+                        data = f.read()
+                    stats.bytes_fetched += len(data)
+                    entry.sha = self.cache.put(data) if self.cache else git_blob_sha(data)
+                    contents[path] = data
+        stats.downloads += 1
+        return contents, files, dirs
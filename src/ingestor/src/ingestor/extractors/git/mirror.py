@@ -0,0 +1,213 @@
+"""Persistent bare-mirror clone cache for incremental repository ingestion.
+
+Each remote is mirrored once (``git clone --mirror``) and refreshed with
+``git fetch``, so repeated ingests only download new objects. Files are
+exported straight from the object database with ``git archive`` - no working
+tree is checked out - and ``git diff --name-status`` between the previously
+ingested commit and the new one tells which outputs to rewrite or delete.
+
+Layout::
+
+    cache_dir/
+    └── <repo>-<hash>.git/   # bare mirror per remote URL
+"""
+
+import base64
+import re
+import shutil
+import subprocess
+import tarfile
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import IO
+
+from ...core.cache import content_hash
+
+# Pathspecs passed to one ``git archive`` call (keeps command lines short)
+ARCHIVE_BATCH = 500
+
+
+@dataclass
+class FileChange:
+    """A file added, modified or deleted between two commits."""
+
+    status: str  # "A", "M" or "D" (type changes are reported as "M")
+    path: str  # Path relative to the repository root (POSIX separators)
+
+
+class MirrorCache:
+    """Bare mirrors of remote repositories, updated in place."""
+
+    def __init__(self, cache_dir: str | Path, token: str | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the mirrors
+            token: Token for private HTTPS remotes (sent as a header, never
+                stored in the mirror's config)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.token = token
+
+    def path_for(self, url: str) -> Path:
+        """Return the mirror directory for a remote URL."""
+        name = url.rstrip("/").split("/")[-1].split(":")[-1]
+        name = re.sub(r"\.git$", "", name)
+        name = re.sub(r"[^A-Za-z0-9._-]", "_", name) or "repo"
+        return self.cache_dir / f"{name}-{content_hash(url)[:12]}.git"
+
+    def update(self, url: str) -> Path:
+        """Create or refresh the mirror of a remote.
+
+        Args:
+            url: Remote URL (or local repository path)
+
+        Returns:
+            Path to the bare mirror
+
+        Raises:
+            RuntimeError: If cloning or fetching fails
+        """
+        mirror = self.path_for(url)
+        if (mirror / "HEAD").exists():
+            self._git(mirror, "fetch", "--prune", "--quiet", "origin", auth=True)
+        else:
+            mirror.parent.mkdir(parents=True, exist_ok=True)
+            tmp = mirror.with_suffix(".tmp")
+            shutil.rmtree(tmp, ignore_errors=True)
+            self._run(["clone", "--mirror", "--quiet", url, str(tmp)], auth=True)
+            tmp.replace(mirror)
+        return mirror
+
+    def resolve(self, git_dir: Path, ref: str | None = None) -> str:
+        """Resolve a branch, tag or HEAD to a commit SHA."""
+        return self._git(git_dir, "rev-parse", f"{ref or 'HEAD'}^{{commit}}").strip()
+
+    def has_commit(self, git_dir: Path, commit: str) -> bool:
+        """Check whether a commit exists in the repository."""
+        result = subprocess.run(
+            ["git", f"--git-dir={git_dir}", "cat-file", "-e", f"{commit}^{{commit}}"],
+            capture_output=True,
+        )
+        return result.returncode == 0
+
+    def list_files(self, git_dir: Path, commit: str) -> list[str]:
+        """List regular files (blobs) in a commit."""
+        out = self._git(git_dir, "ls-tree", "-r", "-z", commit)
+        paths = []
+        for record in out.split("\0"):
+            if not record:
+                continue
+            info, path = record.split("\t", 1)
+            if info.split()[1] == "blob":
+                paths.append(path)
+        return paths
+
+    def diff(self, git_dir: Path, old: str, new: str) -> list[FileChange]:
+        """List files changed between two commits.
+
+        Renames are reported as a deletion plus an addition.
+        """
+        out = self._git(git_dir, "diff", "--name-status", "--no-renames", "-z", old, new)
+        fields = [f for f in out.split("\0") if f]
+        changes = []
+        for status, path in zip(fields[::2], fields[1::2], strict=True):
+            kind = status[0]
+            if kind not in ("A", "D"):
+                kind = "M"
+            changes.append(FileChange(status=kind, path=path))
+        return changes
+
+    def export(self, git_dir: Path, commit: str, paths: list[str], dest: Path) -> int:
+        """Write files from a commit into a directory, without a checkout.
+
+        Args:
+            git_dir: Repository (bare mirror or ``.git`` directory)
+            commit: Commit to export from
+            paths: Repository-relative file paths to export
+            dest: Output directory
+
+        Returns:
+            Number of files written
+        """
+        dest_root = dest.resolve()
+        written = 0
+        for start in range(0, len(paths), ARCHIVE_BATCH):
+            batch = paths[start : start + ARCHIVE_BATCH]
+            # stderr goes to a file: a pipe could fill up while stdout is read
+            with tempfile.TemporaryFile() as errors:
+                process = subprocess.Popen(
+                    [
+                        "git", "--literal-pathspecs", f"--git-dir={git_dir}",
+                        "archive", "--format=tar", commit, "--", *batch,
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=errors,
+                )
+                assert process.stdout is not None
+                try:
+                    written += _extract_tar(process.stdout, dest_root)
+                    # Drain the padding after the end-of-archive marker so git can exit
+                    process.stdout.read()
+                except tarfile.ReadError:
+                    # No archive at all: report git's error below
+                    if process.wait() == 0:
+                        raise
+                except BaseException:
+                    process.kill()
+                    raise
+                finally:
+                    process.stdout.close()
+                    process.wait()
+                if process.returncode != 0:
+                    errors.seek(0)
+                    stderr = errors.read().decode("utf-8", errors="replace")
+                    raise RuntimeError(f"Git archive failed: {stderr}")
+        return written
+
+    def _auth_args(self) -> list[str]:
+        if not self.token:
+            return []
+        credentials = base64.b64encode(f"x-access-token:{self.token}".encode()).decode()
+        return ["-c", f"http.extraHeader=Authorization: Basic {credentials}"]
+
+    def _git(self, git_dir: Path, *args: str, auth: bool = False) -> str:
+        return self._run([f"--git-dir={git_dir}", *args], auth=auth)
+
+    def _run(self, args: list[str], auth: bool = False) -> str:
+        cmd = ["git", *(self._auth_args() if auth else []), *args]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            error_msg = result.stderr
+            if self.token:
+                error_msg = error_msg.replace(self.token, "[TOKEN]")
+            subcommand = next(a for a in args if not a.startswith("-"))
+            raise RuntimeError(f"Git {subcommand} failed: {error_msg}")
+        return result.stdout
+
+
+def _extract_tar(stream: IO[bytes], dest_root: Path) -> int:
+    """Write the regular files of a tar stream under ``dest_root``.
+
+    Members resolving outside ``dest_root`` are skipped.
+
+    Returns:
+        Number of files written
+    """
+    written = 0
+    with tarfile.open(fileobj=stream, mode="r|") as tf:
+        for member in tf:
+            if not member.isfile():
+                continue
+            target = (dest_root / PurePosixPath(member.name)).resolve()
+            if not target.is_relative_to(dest_root):
+                continue
+            src = tf.extractfile(member)
+            if src is None:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with src, open(target, "wb") as out:
+                shutil.copyfileobj(src, out)
+            written += 1
+    return written
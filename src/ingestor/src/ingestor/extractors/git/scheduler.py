@@ -0,0 +1,267 @@
+"""Concurrent clone/process scheduling for lists of repositories.
+
+Cloning is network-bound and processing is disk/CPU-bound, so each stage has
+its own limit: while some repositories are downloading, others that are
+already on disk are being processed. A third limit bounds how many clones
+may sit on disk at once, so a fast network cannot fill the disk ahead of
+processing. When a result carries a streamed ``source_files`` checkout, its
+slot is only freed once the stream has been consumed (or closed): consumers
+must write or close each outcome's ``source_files`` for the remaining
+repositories to proceed.
+
+What happens to a repository is up to a :class:`RepoPipeline`: extraction
+(:class:`ExtractPipeline`, used by :class:`GitExtractor` and the router) and
+the incremental ``clone`` export (:class:`RepoExporter`) share this scheduler.
+Every repository yields its own :class:`RepoOutcome`, so one failure never
+aborts the list, and progress is reported through a callback as each
+repository moves through the stages.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Generic, Protocol, TypeVar
+
+from ...types import ExtractionResult
+from .files import SourceFileStream
+
+if TYPE_CHECKING:
+    from .git_extractor import GitExtractor
+
+T = TypeVar("T")
+
+
+@dataclass
+class RepoProgress:
+    """A progress event for one repository."""
+
+    url: str
+    stage: str  # "cloning", "processing", "done" or "failed"
+    completed: int  # Repositories finished so far (including failures)
+    total: int
+    detail: str = ""  # Git progress line or error message
+
+
+@dataclass
+class RepoOutcome(Generic[T]):
+    """Result of cloning and processing one repository."""
+
+    url: str
+    result: T
+    clone_seconds: float = 0.0
+    process_seconds: float = 0.0
+    error: str | None = None  # Error message, if the repository failed
+
+    @property
+    def ok(self) -> bool:
+        """Whether the repository was processed without error."""
+        return self.error is None
+
+
+class RepoStages:
+    """Stage slots for one repository, handed to :meth:`RepoPipeline.run`.
+
+    Entering :meth:`cloning` or :meth:`processing` waits for a slot of that
+    stage, reports progress and times the stage.
+    """
+
+    def __init__(self, scheduler: "RepoScheduler", url: str):
+        self._scheduler = scheduler
+        self.url = url
+        self.clone_seconds = 0.0
+        self.process_seconds = 0.0
+
+    @contextlib.asynccontextmanager
+    async def cloning(self) -> AsyncIterator[None]:
+        """Hold a clone slot (network stage)."""
+        async with self._scheduler._clone_slots:
+            self._scheduler._emit(self.url, "cloning")
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.clone_seconds += time.perf_counter() - start
+
+    @contextlib.asynccontextmanager
+    async def processing(self) -> AsyncIterator[None]:
+        """Hold a process slot (disk/CPU stage)."""
+        async with self._scheduler._process_slots:
+            self._scheduler._emit(self.url, "processing")
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.process_seconds += time.perf_counter() - start
+
+    def progress(self, detail: str) -> None:
+        """Report a progress line (e.g. git output) for the clone stage."""
+        self._scheduler._emit(self.url, "cloning", detail)
+
+
+class RepoPipeline(Protocol[T]):
+    """The work a :class:`RepoScheduler` runs for each repository."""
+
+    async def run(self, url: str, stages: RepoStages) -> T:
+        """Fetch and process one repository inside ``stages``' slots."""
+        ...
+
+    def failed(self, url: str, error: Exception) -> T:
+        """Build the result for a repository whose run raised ``error``."""
+        ...
+
+    def error_of(self, result: T) -> str | None:
+        """Error message carried by ``result``, if the repository failed."""
+        ...
+
+
+class RepoScheduler(Generic[T]):
+    """Run a pipeline over many repositories with separate stage limits."""
+
+    def __init__(
+        self,
+        pipeline: RepoPipeline[T],
+        clone_concurrency: int = 4,
+        process_concurrency: int = 2,
+        on_progress: Callable[[RepoProgress], None] | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            pipeline: Clone and processing stages for one repository
+            clone_concurrency: Maximum clones (and API fetches) in flight
+            process_concurrency: Maximum repositories processed at once
+            on_progress: Called for every progress event
+        """
+        self.pipeline = pipeline
+        self.clone_concurrency = max(1, clone_concurrency)
+        self.process_concurrency = max(1, process_concurrency)
+        self.on_progress = on_progress
+        self._completed = 0
+        self._total = 0
+        self._clone_slots = asyncio.Semaphore(self.clone_concurrency)
+        self._process_slots = asyncio.Semaphore(self.process_concurrency)
+
+    def _emit(self, url: str, stage: str, detail: str = "") -> None:
+        if self.on_progress is not None:
+            self.on_progress(RepoProgress(url, stage, self._completed, self._total, detail))
+
+    async def run(self, urls: list[str]) -> AsyncIterator[RepoOutcome[T]]:
+        """Process repositories concurrently.
+
+        Args:
+            urls: Repository URLs or local paths
+
+        Yields:
+            One outcome per repository, as they complete
+        """
+        self._completed = 0
+        self._total = len(urls)
+        self._clone_slots = asyncio.Semaphore(self.clone_concurrency)
+        self._process_slots = asyncio.Semaphore(self.process_concurrency)
+        on_disk = asyncio.Semaphore(self.clone_concurrency + self.process_concurrency)
+
+        async def run_one(url: str) -> RepoOutcome[T]:
+            await on_disk.acquire()
+            stages = RepoStages(self, url)
+            try:
+                result = await self.pipeline.run(url, stages)
+            except Exception as e:
+                result = self.pipeline.failed(url, e)
+            except BaseException:
+                on_disk.release()
+                raise
+            _release_after_cleanup(result, on_disk)
+            outcome = RepoOutcome(
+                url,
+                result,
+                stages.clone_seconds,
+                stages.process_seconds,
+                self.pipeline.error_of(result),
+            )
+            self._completed += 1
+            self._emit(url, "done" if outcome.ok else "failed", outcome.error or "")
+            return outcome
+
+        tasks = [asyncio.create_task(run_one(url)) for url in urls]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class ExtractPipeline:
+    """Clone and extract repositories with a :class:`GitExtractor`."""
+
+    def __init__(self, extractor: "GitExtractor"):
+        self.extractor = extractor
+
+    async def run(self, url: str, stages: RepoStages) -> ExtractionResult:
+        """Clone ``url`` and extract it (see :class:`RepoPipeline`)."""
+        extractor = self.extractor
+
+        # Local checkouts need no network stage
+        if Path(url).exists() and (Path(url) / ".git").exists():
+            async with stages.processing():
+                return await extractor.extract(url)
+
+        # GitHub files and directories are fetched over the API, nothing to process locally
+        parsed = extractor._parse_github_url(url)
+        if parsed and extractor.use_api_for_github and parsed["url_type"] != "repo":
+            async with stages.cloning():
+                return await extractor.extract(url)
+
+        async with stages.cloning():
+            tmpdir, clone_path, github_metadata = await extractor._clone_to_temp(
+                url, progress=stages.progress
+            )
+
+        async with stages.processing():
+            try:
+                return await extractor._extract_cloned_repo(
+                    url, tmpdir, clone_path, github_metadata
+                )
+            except Exception as e:
+                return extractor._error_result(url, e)
+
+    def failed(self, url: str, error: Exception) -> ExtractionResult:
+        """Error result for a repository that could not be cloned."""
+        return self.extractor._error_result(url, error)
+
+    def error_of(self, result: ExtractionResult) -> str | None:
+        """Error recorded in the result's metadata."""
+        return result.metadata.get("error")
+
+
+def _release_after_cleanup(result: object, slot: asyncio.Semaphore) -> None:
+    """Release ``slot`` once the result's temporary checkout is removed."""
+    loop = asyncio.get_running_loop()
+
+    def release() -> None:
+        # Runs on the thread that consumed or collected the stream; the
+        # event loop may already be closed
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(slot.release)
+
+    stream = getattr(result, "source_files", None)
+    if not (isinstance(stream, SourceFileStream) and stream.add_cleanup_callback(release)):
+        slot.release()
+
+
+def repo_report(outcomes: list[RepoOutcome[ExtractionResult]]) -> list[dict]:
+    """Summarize outcomes for result metadata (one entry per repository)."""
+    return [
+        {
+            "url": o.url,
+            "status": "ok" if o.ok else "failed",
+            "error": o.error,
+            "files": o.result.metadata.get("file_count", 0),
+            "clone_seconds": round(o.clone_seconds, 2),
+            "process_seconds": round(o.process_seconds, 2),
+        }
+        for o in outcomes
+    ]
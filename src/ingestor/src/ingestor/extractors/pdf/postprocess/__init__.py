@@ -3,6 +3,8 @@
 Ported from paper-to-md project for academic paper processing.
 """
 
+import time
+
 from .bibliography import process_bibliography
 from .citations import process_citations
 from .cleanup import cleanup_text
@@ -11,24 +13,36 @@ from .figures import process_figures
 from .sections import process_sections
 
 
-def process_markdown(content: str, images: list[str] | None = None) -> str:
+def process_markdown(
+    content: str,
+    images: list[str] | None = None,
+    timings: dict[str, float] | None = None,
+) -> str:
     """
     Apply all deterministic post-processing steps to markdown content.
 
     Args:
         content: Raw markdown content from extraction
         images: List of available image filenames (e.g., ["figure1.png", "figure2.png"])
+        timings: If given, filled with the seconds spent in each pass
 
     Returns:
         Processed markdown content
     """
     # Order matters: sections first, then citations, then equations, then figures, then bibliography
-    content = process_sections(content)
-    content = process_citations(content)
-    content = process_equations(content)
-    content = process_figures(content, images or [])
-    content = process_bibliography(content)
-    content = cleanup_text(content)
+    passes = [
+        ("sections", process_sections),
+        ("citations", process_citations),
+        ("equations", process_equations),
+        ("figures", lambda text: process_figures(text, images or [])),
+        ("bibliography", process_bibliography),
+        ("cleanup", cleanup_text),
+    ]
+    for name, step in passes:
+        start = time.perf_counter()
+        content = step(content)
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
     return content
 
 
@@ -7,6 +7,38 @@ from __future__ import annotations
 
 import re
 
+# Headings that open the references section, in order of preference
+REFERENCES_HEADINGS = tuple(
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"^## References\s*$",
+        r"^## REFERENCES\s*$",
+        r"^# References\s*$",
+        r"^References\s*$",
+    )
+)
+
+# Start of a reference entry: [N], <a...></a>[N], or - [N]
+_REFERENCE_START_RE = re.compile(r"^\s*(?:<a[^>]*></a>)?(?:-\s*)?\[(\d{1,3})\]")
+_REFERENCE_COUNT_RE = re.compile(r"^\s*(?:<a[^>]*></a>)?\[(\d+)\]", re.MULTILINE)
+
+
+def find_references_heading(content: str) -> re.Match[str] | None:
+    """
+    Find the heading that opens the references section.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        Match for the first heading style found, or None
+    """
+    for pattern in REFERENCES_HEADINGS:
+        match = pattern.search(content)
+        if match:
+            return match
+    return None
+
 
 def process_bibliography(content: str) -> str:
     """
@@ -22,23 +54,13 @@ def process_bibliography(content: str) -> str:
     Returns:
         Content with formatted bibliography
     """
-    # Find the references section
-    references_patterns = [
-        r"^## References\s*$",
-        r"^## REFERENCES\s*$",
-        r"^# References\s*$",
-        r"^References\s*$",
-    ]
+    match = find_references_heading(content)
+    if not match:
+        return content
 
-    for pattern in references_patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            before = content[: match.end()]
-            after = content[match.end() :]
-            after = _format_reference_entries(after)
-            return before + after
-
-    return content
+    before = content[: match.end()]
+    after = content[match.end() :]
+    return before + _format_reference_entries(after)
 
 
 def _format_reference_entries(references_text: str) -> str:
@@ -54,10 +76,7 @@ def _format_reference_entries(references_text: str) -> str:
 
     for line in lines:
         # Check if this line starts a new reference entry
-        # Match: [N], <a...></a>[N], or - [N]
-        is_reference_start = bool(
-            re.match(r"^\s*(?:<a[^>]*></a>)?(?:-\s*)?\[(\d{1,3})\]", line)
-        )
+        is_reference_start = bool(_REFERENCE_START_RE.match(line))
 
         # Add blank line before new reference if previous line wasn't blank
         if is_reference_start and prev_was_reference and result and result[-1].strip() != "":
@@ -81,5 +100,4 @@ def extract_reference_count(content: str) -> int:
     Returns:
         Number of reference entries found
     """
-    matches = re.findall(r"^\s*(?:<a[^>]*></a>)?\[(\d+)\]", content, re.MULTILINE)
-    return len(matches)
+    return len(_REFERENCE_COUNT_RE.findall(content))
@@ -7,6 +7,17 @@ from __future__ import annotations
 
 import re
 
+from .bibliography import find_references_heading
+
+# [N]-[M] citation range
+_RANGE_RE = re.compile(r"\[(\d+)\]\s*[-–—]\s*\[(\d+)\]")
+
+# [N] where N is 1-3 digits, not preceded by ] (already linked) or followed by (
+_CITATION_RE = re.compile(r"(?<!\])\[(\d{1,3})\](?!\()")
+
+# [N] at start of line (reference entry)
+_REFERENCE_ENTRY_RE = re.compile(r"^\[(\d{1,3})\]", re.MULTILINE)
+
 
 def process_citations(content: str) -> str:
     """
@@ -26,22 +37,13 @@ def process_citations(content: str) -> str:
         Content with linked citations
     """
     # Split content into main body and references section
-    references_patterns = [
-        r"^## References\s*$",
-        r"^## REFERENCES\s*$",
-        r"^# References\s*$",
-        r"^References\s*$",
-    ]
-
     main_body = content
     references_section = ""
 
-    for pattern in references_patterns:
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            main_body = content[: match.start()]
-            references_section = content[match.start() :]
-            break
+    match = find_references_heading(content)
+    if match:
+        main_body = content[: match.start()]
+        references_section = content[match.start() :]
 
     # Process main body only
     main_body = _expand_citation_ranges(main_body)
@@ -69,9 +71,7 @@ def _expand_citation_ranges(content: str) -> str:
         citations = [f"[{i}]" for i in range(start, end + 1)]
         return ", ".join(citations)
 
-    # Match [N]-[M] pattern
-    pattern = r"\[(\d+)\]\s*[-–—]\s*\[(\d+)\]"
-    return re.sub(pattern, expand_range, content)
+    return _RANGE_RE.sub(expand_range, content)
 
 
 def _link_single_citations(content: str) -> str:
@@ -90,10 +90,7 @@ def _link_single_citations(content: str) -> str:
         num = match.group(1)
         return f"[[{num}]](#ref-{num})"
 
-    # Match [N] where N is 1-3 digits, not preceded by ] or !
-    # Negative lookbehind to avoid matching inside links
-    pattern = r"(?<!\])\[(\d{1,3})\](?!\()"
-    return re.sub(pattern, link_citation, content)
+    return _CITATION_RE.sub(link_citation, content)
 
 
 def _add_reference_anchors(references: str) -> str:
@@ -107,6 +104,4 @@ def _add_reference_anchors(references: str) -> str:
         num = match.group(1)
         return f'<a id="ref-{num}"></a>[{num}]'
 
-    # Match [N] at start of line (reference entry)
-    pattern = r"^\[(\d{1,3})\]"
-    return re.sub(pattern, add_anchor, references, flags=re.MULTILINE)
+    return _REFERENCE_ENTRY_RE.sub(add_anchor, references)
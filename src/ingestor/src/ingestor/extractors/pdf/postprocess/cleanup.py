@@ -7,6 +7,52 @@ from __future__ import annotations
 
 import re
 
+# Ligatures and dash variants (str.replace beats str.translate for a handful
+# of characters, most of which are absent from any given document)
+_LIGATURES = (
+    ("ﬁ", "fi"),
+    ("ﬂ", "fl"),
+    ("ﬀ", "ff"),
+    ("ﬃ", "ffi"),
+    ("ﬄ", "ffl"),
+    ("ﬅ", "ft"),
+    ("ﬆ", "st"),
+    # Common dash variants
+    ("–", "-"),  # en-dash to hyphen (keep em-dash for intentional use)
+)
+
+# Map of glyph names to Unicode characters
+_GLYPH_MAP = {
+    "epsilon1": "ε",
+    "epsilon": "ε",
+    "alpha": "α",
+    "beta": "β",
+    "gamma": "γ",
+    "delta": "δ",
+    "theta": "θ",
+    "lambda": "λ",
+    "mu": "μ",
+    "sigma": "σ",
+    "phi": "φ",
+    "psi": "ψ",
+    "omega": "ω",
+    "pi": "π",
+    "rho": "ρ",
+    "tau": "τ",
+    "eta": "η",
+    "zeta": "ζ",
+    "xi": "ξ",
+    "nu": "ν",
+    "kappa": "κ",
+    "iota": "ι",
+    "chi": "χ",
+    "upsilon": "υ",
+}
+
+_GLYPH_RE = re.compile(r"glyph\[(\w+)\]", re.IGNORECASE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+_HYPHENATED_RE = re.compile(r"(\w+)-\n(\s*)([a-z]\w*)")
+
 
 def cleanup_text(content: str) -> str:
     """
@@ -35,21 +81,9 @@ def _fix_ligatures(content: str) -> str:
     """
     Replace common ligature characters with their ASCII equivalents.
     """
-    ligatures = {
-        "ﬁ": "fi",
-        "ﬂ": "fl",
-        "ﬀ": "ff",
-        "ﬃ": "ffi",
-        "ﬄ": "ffl",
-        "ﬅ": "ft",
-        "ﬆ": "st",
-        # Common dash variants
-        "–": "-",  # en-dash to hyphen (keep em-dash for intentional use)
-    }
-
-    for ligature, replacement in ligatures.items():
-        content = content.replace(ligature, replacement)
-
+    for ligature, replacement in _LIGATURES:
+        if ligature in content:
+            content = content.replace(ligature, replacement)
     return content
 
 
@@ -57,7 +91,9 @@ def _fix_excessive_blank_lines(content: str) -> str:
     """
     Reduce multiple consecutive blank lines to maximum of 2.
     """
-    return re.sub(r"\n{3,}", "\n\n", content)
+    if "\n\n\n" not in content:
+        return content
+    return _BLANK_LINES_RE.sub("\n\n", content)
 
 
 def _fix_glyph_artifacts(content: str) -> str:
@@ -68,42 +104,11 @@ def _fix_glyph_artifacts(content: str) -> str:
     - glyph[epsilon1] -> ε
     - glyph[alpha] -> α
     """
-    # Map of glyph names to Unicode characters
-    glyph_map = {
-        "epsilon1": "ε",
-        "epsilon": "ε",
-        "alpha": "α",
-        "beta": "β",
-        "gamma": "γ",
-        "delta": "δ",
-        "theta": "θ",
-        "lambda": "λ",
-        "mu": "μ",
-        "sigma": "σ",
-        "phi": "φ",
-        "psi": "ψ",
-        "omega": "ω",
-        "pi": "π",
-        "rho": "ρ",
-        "tau": "τ",
-        "eta": "η",
-        "zeta": "ζ",
-        "xi": "ξ",
-        "nu": "ν",
-        "kappa": "κ",
-        "iota": "ι",
-        "chi": "χ",
-        "upsilon": "υ",
-    }
-
     def replace_glyph(match: re.Match[str]) -> str:
         glyph_name = match.group(1).lower()
-        return glyph_map.get(glyph_name, match.group(0))
-
-    # Match glyph[name] pattern
-    content = re.sub(r"glyph\[(\w+)\]", replace_glyph, content, flags=re.IGNORECASE)
+        return _GLYPH_MAP.get(glyph_name, match.group(0))
 
-    return content
+    return _GLYPH_RE.sub(replace_glyph, content)
 
 
 def _fix_trailing_whitespace(content: str) -> str:
@@ -123,14 +128,12 @@ def fix_hyphenated_words(content: str) -> str:
 
     Example: "docu-\\nment" → "document"
     """
-    pattern = r"(\w+)-\n(\s*)([a-z]\w*)"
-
     def fix_hyphen(match: re.Match[str]) -> str:
         word1 = match.group(1)
         word2 = match.group(3)
         return f"{word1}{word2}"
 
-    return re.sub(pattern, fix_hyphen, content)
+    return _HYPHENATED_RE.sub(fix_hyphen, content)
 
 
 def normalize_unicode(content: str) -> str:
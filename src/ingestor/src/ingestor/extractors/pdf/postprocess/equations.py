@@ -1,11 +1,208 @@
 """Equation processing: clean up LaTeX equations and fix OCR artifacts.
 
 Handles LaTeX equations extracted by Docling's formula enrichment.
+
+All patterns are compiled once at import. The per-equation fixes run as
+stages over each ``$$...$$`` body in a single scan of the document instead of
+one scan per stage.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
+
+_DISPLAY_MATH_RE = re.compile(r"\$\$(.*?)\$\$", re.DOTALL)
+
+_FORMULA_PLACEHOLDER_RE = re.compile(r"<!--\s*formula-not-decoded\s*-->", re.IGNORECASE)
+
+# Blank lines around display equations
+_BEFORE_EQUATION_RE = re.compile(r"([^\n])\n(\$\$)")
+_AFTER_EQUATION_RE = re.compile(r"(\$\$)\n([^\n])")
+
+# === Docling spacing ===
+
+_TEXT_SPACING_RE = re.compile(r"\\text\s*\{\s*([^}]*?)\s*\}")
+
+# Spaced-out words that are NOT already inside \text{}
+# These patterns are for OCR artifacts like "M u l t i H e a d"
+_SPACED_OCR_WORDS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in [
+        # Match various spacings in MultiHead
+        (r"M\s*u\s*l?\s*t\s*i\s*\{?\s*H\s*e\s*a\s*d\s*\}?", "\\\\text{MultiHead}"),
+        (r"(?<!\\text\{)F\s+F\s+N(?!\})", "\\\\text{FFN}"),
+        (r"h\s+e\s+a\s+d\s+_", "head_"),  # "h e a d _" -> "head_"
+    ]
+]
+
+# Spaced variable names (not function names that should be in \text{})
+_SPACED_VARS = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in [
+        (r"h\s+e\s+a\s+d\b", "head"),
+        (r"p\s+o\s+s\b", "pos"),
+        (r"m\s+o\s+d\s+e\s+l\b", "model"),
+        (r"s\s+t\s+e\s+p\b", "step"),
+        (r"n\s+u\s+m\b", "num"),
+        (r"w\s+a\s+r\s+m\s+u\s+p\b", "warmup"),
+        (r"s\s+t\s+e\s+p\s+s\b", "steps"),
+        (r"l\s+r\s+a\s+t\s+e\b", "lrate"),
+        (r"d\s+r\s+o\s+p\s+o\s+u\s+t\b", "dropout"),
+        # Fix partial splits like "step s" -> "steps"
+        (r"\bstep\s+s\b", "steps"),
+        # Fix common OCR spaced words
+        (r"F\s+l\s+o\s+a\s+t\s+i\s+n\s+g\b", "Floating"),
+        (r"B\s+a\s+n\s+d\s+w\s+i\s+d\s+t\s+h\b", "Bandwidth"),
+        (r"I\s+O\s+P\s+S\b", "IOPS"),
+        (r"M\s+e\s+m\s+o\s+r\s+y\b", "Memory"),
+        (r"P\s+e\s+r\s+f\s+o\s+r\s+m\s+a\s+n\s+c\s+e\b", "Performance"),
+        (r"T\s+h\s+r\s+o\s+u\s+g\s+h\s+p\s+u\s+t\b", "Throughput"),
+        (r"L\s+a\s+t\s+e\s+n\s+c\s+y\b", "Latency"),
+    ]
+]
+
+_UPPERCASE_ACRONYM_RE = re.compile(r"\b([A-Z](?:\s+[A-Z])+)\b")
+_SPACED_NUMBER_RE = re.compile(r"\b(\d(?:\s+\d)+)\b")
+_SPACED_DECIMAL_RE = re.compile(r"(\d)\s*\.\s*(\d)")
+_SUBSCRIPT_OPEN_RE = re.compile(r"\s*_\s*\{\s*")
+_SUPERSCRIPT_OPEN_RE = re.compile(r"\s*\^\s*\{\s*")
+_BRACE_CLOSE_RE = re.compile(r"\s*\}")
+_SCRIPT_BRACE_RE = re.compile(r"(\^|_)\{([^}]+)\}")
+_BRACE_MINUS_RE = re.compile(r"\s*-\s*")
+_BRACE_PLUS_RE = re.compile(r"\s*\+\s*")
+_HYPHEN_SUBSCRIPT_RE = re.compile(r"_\{\s*-\s*\}\s*(\w+)")
+_PLUS_RE = re.compile(r"\s*\+\s*")
+_MINUS_RE = re.compile(r"(?<!\^)\s*-\s*(?!\d)")  # Don't touch negative numbers or exponents
+_EQUALS_RE = re.compile(r"\s*=\s*")
+_CDOT_RE = re.compile(r"\s*\\cdot\s*")
+_MULTI_SPACE_RE = re.compile(r"  +")
+_PAREN_OPEN_RE = re.compile(r"\(\s+")
+_PAREN_CLOSE_RE = re.compile(r"\s+\)")
+_COMMA_RE = re.compile(r"\s+,")
+_DOUBLE_TEXT_RE = re.compile(r"\\text\s*\{\s*\\text\s*\{([^}]*)\}\s*\}")
+_DOUBLE_BACKSLASH_RE = re.compile(r"\\\\(max|min|sin|cos|tan|log|exp|sqrt|frac|text|cdot)")
+
+# === LaTeX spacing ===
+
+_BACKSLASH_SPACE_RE = re.compile(r"\\\s+([a-zA-Z])")
+
+# Spacing in common LaTeX commands (replacements must not double backslashes)
+_COMMAND_SPACING = [
+    (re.compile(pattern), replacement)
+    for pattern, replacement in [
+        (r"\\text\s+\{", r"\\text{"),
+        (r"\\frac\s+\{", r"\\frac{"),
+        (r"\\sqrt\s+\{", r"\\sqrt{"),
+        (r"\\min\s+\(", r"\\min("),
+        (r"\\max\s+\(", r"\\max("),
+        (r"\\sin\s+\(", r"\\sin("),
+        (r"\\cos\s+\(", r"\\cos("),
+        (r"\\log\s+\(", r"\\log("),
+        (r"\\exp\s+\(", r"\\exp("),
+        # Spaced-out trig/math function names: "s i n" -> "\sin"
+        (r"\bs\s+i\s+n\b", r"\\sin"),
+        (r"\bc\s+o\s+s\b", r"\\cos"),
+        (r"\bt\s+a\s+n\b", r"\\tan"),
+        (r"\bl\s+o\s+g\b", r"\\log"),
+        (r"\be\s+x\s+p\b", r"\\exp"),
+        (r"\bm\s+i\s+n\b", r"\\min"),
+        (r"\bm\s+a\s+x\b", r"\\max"),
+    ]
+]
+
+_WHITESPACE_RUN_RE = re.compile(r"\s{2,}")
+
+# === OCR artifacts ===
+
+# Common OCR misreads, fixed with plain string replacement
+_OCR_MISREADS = [
+    ("Floting", "Floating"),
+    ("rerferred", "transferred"),
+    ("Mermoy", "Memory"),
+]
+
+_OCR_FIXES = [
+    (re.compile(pattern, flags), replacement)
+    for pattern, replacement, flags in [
+        # Spaced OCR artifacts that appear at end of equations
+        (r"\\?\s*e\s+r\s+r\s+o\s+w\s*", "", re.IGNORECASE),  # "\e r r o w" -> remove
+        (r"\\?\s*a\s+r\s+r\s+o\s+w\s*", r"\\rightarrow ", re.IGNORECASE),
+        (r"\\?\s*n\s+a\s+r\s+r\s+o\s+w\s*", r"\\rightarrow ", re.IGNORECASE),
+        # === GAN-specific OCR fixes ===
+        # Corrupted distribution names: p_{\} p a -> p_{\text{data}}
+        (r"p_\{\\?\}\s*p\s*a\b", r"p_{\\text{data}}", 0),
+        (r"P_\{\\?\}\s*p\s*a\b", r"p_{\\text{data}}", 0),
+        # p_{D} -> p_{\text{data}} in GAN context
+        (r"p_\{D\}\s*\(x\)", r"p_{\\text{data}}(x)", 0),
+        # p_{d a t a} with spaces
+        (r"p_\{d\s*a\s*t\s*a\}", r"p_{\\text{data}}", 0),
+        (r"p_\{d\s*a\s*t\s*i\}", r"p_{\\text{data}}", 0),
+        # \min_{G \D} \max_{D} -> \min_G \max_D (GAN minimax - remove duplicate \max_{D})
+        (r"\\min_\{G\s*\\D\}\s*\\max_\{D\}", r"\\min_G \\max_D", 0),
+        (r"p_\{d\s*o\s*t\s*a\}", r"p_{\\text{data}}", 0),
+        # \min_{G \D} -> \min_G \max_D (GAN minimax)
+        (r"\\min_\{G\s*\\D\}", r"\\min_G \\max_D", 0),
+        # Double subscripts like p_{_{G}} -> p_G
+        (r"p_\{_\{([A-Za-z])\}\}", r"p_{\1}", 0),
+        (r"p_\{_\{([a-z])\}\}", r"p_{\1}", 0),
+        # \theta_s -> \theta_g (generator parameter), only in generator gradient context
+        (r"\\theta_\{?s\}?(?=.*\\log.*D.*G)", r"\\theta_g", 0),
+        # Mismatched parentheses: \left) -> \right)
+        (r"\\left\)", r"\\right)", 0),
+        # Spacing around \mathcal and similar commands
+        (r"\\mathcal\s*\{\s*(\w)\s*\}", r"\\mathcal{\1}", 0),
+        (r"\\mathbb\s*\{\s*(\w)\s*\}", r"\\mathbb{\1}", 0),
+        (r"\\mathbf\s*\{\s*(\w+)\s*\}", r"\\mathbf{\1}", 0),
+        # Spacing inside set notation: \{ W _ { i } \} -> \{W_i\}
+        (r"\\\{\s*", r"\\{", 0),
+        (r"\s*\\\}", r"\\}", 0),
+        # Equation number at end: "  (2)  " → " \quad (2)"
+        (r"\s*\(\s*(\d+)\s*\)\s*$", r" \\quad (\1)", 0),
+        # Multiple \quad
+        (r"(\\quad\s*)+", r"\\quad ", 0),
+    ]
+]
+
+# === Bare newlines ===
+
+# LaTeX commands that start with \\ but are NOT newlines
+_LATEX_COMMANDS = frozenset([
+    "begin", "end", "text", "frac", "sqrt", "sum", "prod", "int",
+    "lim", "sin", "cos", "tan", "log", "exp", "min", "max", "sup", "inf",
+    "left", "right", "big", "Big", "bigg", "Bigg", "cdot", "cdots", "ldots",
+    "alpha", "beta", "gamma", "delta", "epsilon", "varepsilon", "zeta", "eta",
+    "theta", "vartheta", "iota", "kappa", "lambda", "mu", "nu", "xi", "pi",
+    "rho", "sigma", "tau", "upsilon", "phi", "varphi", "chi", "psi", "omega",
+    "Gamma", "Delta", "Theta", "Lambda", "Xi", "Pi", "Sigma", "Upsilon", "Phi",
+    "Psi", "Omega", "partial", "nabla", "infty", "forall", "exists", "neg",
+    "in", "notin", "subset", "supset", "cap", "cup", "wedge", "vee", "times",
+    "div", "pm", "mp", "leq", "geq", "neq", "approx", "equiv", "sim", "simeq",
+    "propto", "perp", "parallel", "angle", "triangle", "square", "circ",
+    "quad", "qquad", "hspace", "vspace", "mathbb", "mathbf", "mathcal", "mathrm",
+    "mathit", "mathsf", "mathtt", "boldsymbol", "overline", "underline", "hat",
+    "bar", "vec", "dot", "ddot", "tilde", "widetilde", "widehat", "overbrace",
+    "underbrace", "stackrel", "overset", "underset", "displaystyle", "scriptstyle",
+    "not", "to", "rightarrow", "leftarrow", "Rightarrow", "Leftarrow",
+    "longrightarrow", "longleftarrow", "mapsto", "iff", "implies",
+])
+
+# Environments in which \\ is a legitimate line break
+_MULTILINE_ENVS = [
+    (
+        re.compile(rf"\\begin\s*\{{\s*{env}\s*\}}"),
+        re.compile(rf"\\end\s*\{{\s*{env}\s*\}}"),
+    )
+    for env in [
+        "array", "aligned", "align", "cases", "matrix", "pmatrix",
+        "bmatrix", "vmatrix", "Vmatrix", "gather", "gathered",
+        "split", "multline", "eqnarray",
+    ]
+]
+
+# Every position where "\\" starts (overlapping, so "\\\" yields two)
+_DOUBLE_BACKSLASH_POS_RE = re.compile(r"(?=\\\\)")
+_WORD_RE = re.compile(r"[a-zA-Z]+")
 
 
 def process_equations(content: str) -> str:
@@ -27,279 +224,194 @@ def process_equations(content: str) -> str:
         Content with cleaned equations
     """
     content = _fix_formula_placeholders(content)
-    content = _fix_docling_spacing(content)
-    content = _clean_latex_spacing(content)
-    content = _fix_common_ocr_artifacts(content)
-    content = _fix_bare_newlines_in_display_math(content)
+    content = _fix_display_math(content)
     content = _normalize_equation_delimiters(content)
     return content
 
 
-def _fix_docling_spacing(content: str) -> str:
+def _fix_display_math(content: str) -> str:
     """
-    Fix spacing issues introduced by Docling's LaTeX extraction.
+    Run every per-equation stage over each ``$$...$$`` body in one scan.
 
-    Docling often extracts equations with spaces between characters,
-    e.g., "M u l t i H e a d" instead of "MultiHead"
+    Running the stages one after another re-scans the document for ``$$``
+    pairs each time. The pairing can only shift when an equation body
+    contains a ``$``, so that rare case falls back to one scan per stage,
+    which keeps the output identical.
     """
+    fallback = False
+
     def fix_equation(match: re.Match[str]) -> str:
+        nonlocal fallback
         eq = match.group(1)
+        for stage in _EQUATION_STAGES:
+            if "$" in eq:
+                fallback = True
+                return match.group(0)
+            eq = stage(eq)
+        return f"$${eq}$$"
+
+    fixed = _DISPLAY_MATH_RE.sub(fix_equation, content)
+    if not fallback:
+        return fixed
 
-        # FIRST: Fix spacing in \text { X } -> \text{X}
-        # This must happen before other replacements
-        def fix_text_spacing(m: re.Match[str]) -> str:
-            inner = m.group(1).strip()
-            # Also fix "mode" -> "model" inside \text{}
-            if inner == "mode":
-                inner = "model"
-            return f"\\text{{{inner}}}"
-        eq = re.sub(r"\\text\s*\{\s*([^}]*?)\s*\}", fix_text_spacing, eq)
-
-        # Fix spaced-out words that are NOT already inside \text{}
-        # These patterns are for OCR artifacts like "M u l t i H e a d"
-        spaced_ocr_words = [
-            # Match various spacings in MultiHead
-            (r"M\s*u\s*l?\s*t\s*i\s*\{?\s*H\s*e\s*a\s*d\s*\}?", "\\\\text{MultiHead}"),
-            (r"(?<!\\text\{)F\s+F\s+N(?!\})", "\\\\text{FFN}"),
-            (r"h\s+e\s+a\s+d\s+_", "head_"),  # "h e a d _" -> "head_"
-        ]
-
-        for pattern, replacement in spaced_ocr_words:
-            eq = re.sub(pattern, replacement, eq)
-
-        # Fix spaced variable names (not function names that should be in \text{})
-        spaced_vars = [
-            (r"h\s+e\s+a\s+d\b", "head"),
-            (r"p\s+o\s+s\b", "pos"),
-            (r"m\s+o\s+d\s+e\s+l\b", "model"),
-            (r"s\s+t\s+e\s+p\b", "step"),
-            (r"n\s+u\s+m\b", "num"),
-            (r"w\s+a\s+r\s+m\s+u\s+p\b", "warmup"),
-            (r"s\s+t\s+e\s+p\s+s\b", "steps"),
-            (r"l\s+r\s+a\s+t\s+e\b", "lrate"),
-            (r"d\s+r\s+o\s+p\s+o\s+u\s+t\b", "dropout"),
-            # Fix partial splits like "step s" -> "steps"
-            (r"\bstep\s+s\b", "steps"),
-            # Fix common OCR spaced words
-            (r"F\s+l\s+o\s+a\s+t\s+i\s+n\s+g\b", "Floating"),
-            (r"B\s+a\s+n\s+d\s+w\s+i\s+d\s+t\s+h\b", "Bandwidth"),
-            (r"I\s+O\s+P\s+S\b", "IOPS"),
-            (r"M\s+e\s+m\s+o\s+r\s+y\b", "Memory"),
-            (r"P\s+e\s+r\s+f\s+o\s+r\s+m\s+a\s+n\s+c\s+e\b", "Performance"),
-            (r"T\s+h\s+r\s+o\s+u\s+g\s+h\s+p\s+u\s+t\b", "Throughput"),
-            (r"L\s+a\s+t\s+e\s+n\s+c\s+y\b", "Latency"),
-        ]
-
-        for pattern, replacement in spaced_vars:
-            eq = re.sub(pattern, replacement, eq)
-
-        # Generic fix: sequences of single uppercase letters with spaces -> joined
-        # e.g., "I O P S" -> "IOPS", "G P U" -> "GPU"
-        def fix_uppercase_acronym(m: re.Match[str]) -> str:
-            return m.group(0).replace(" ", "")
-        eq = re.sub(r"\b([A-Z](?:\s+[A-Z])+)\b", fix_uppercase_acronym, eq)
-
-        # Fix spaced numbers like "1 0 0 0 0" -> "10000"
-        def fix_spaced_number(m: re.Match[str]) -> str:
-            return m.group(0).replace(" ", "")
-
-        eq = re.sub(r"\b(\d(?:\s+\d)+)\b", fix_spaced_number, eq)
-
-        # Fix decimal numbers with spaces like "0 . 5" -> "0.5"
-        eq = re.sub(r"(\d)\s*\.\s*(\d)", r"\1.\2", eq)
-
-        # Fix spaced subscripts/superscripts like "d _ { k }" -> "d_{k}"
-        # This must happen BEFORE the {-} fix
-        eq = re.sub(r"\s*_\s*\{\s*", r"_{", eq)
-        eq = re.sub(r"\s*\^\s*\{\s*", r"^{", eq)
-        eq = re.sub(r"\s*\}", r"}", eq)
-
-        # Fix spaces inside braces: ^{ - 0.5} -> ^{-0.5}
-        def clean_brace_content(m: re.Match[str]) -> str:
-            prefix = m.group(1)  # ^ or _
-            content = m.group(2).strip()
-            # Remove spaces around operators inside braces
-            content = re.sub(r"\s*-\s*", "-", content)
-            content = re.sub(r"\s*\+\s*", "+", content)
-            return f"{prefix}{{{content}}}"
-        eq = re.sub(r"(\^|_)\{([^}]+)\}", clean_brace_content, eq)
-
-        # NOW fix subscript patterns like "step_{-}num" or "step_{-} num" -> "step_num"
-        # (hyphen inside subscript braces indicates OCR artifact, e.g. step_num became step_{-}num)
-        eq = re.sub(r"_\{\s*-\s*\}\s*(\w+)", r"_\1", eq)
-
-        # Fix spacing around operators but preserve alignment
-        eq = re.sub(r"\s*\+\s*", " + ", eq)
-        eq = re.sub(r"(?<!\^)\s*-\s*(?!\d)", " - ", eq)  # Don't touch negative numbers or exponents
-        eq = re.sub(r"\s*=\s*", " = ", eq)
-        eq = re.sub(r"\s*\\cdot\s*", r" \\cdot ", eq)
-
-        # Clean up multiple spaces
-        eq = re.sub(r"  +", " ", eq)
-
-        # Fix spaces inside parentheses: "( Q , K , V )" -> "(Q, K, V)"
-        eq = re.sub(r"\(\s+", "(", eq)
-        eq = re.sub(r"\s+\)", ")", eq)
-
-        # Fix spaces around commas: ", " is good, " , " has extra space
-        eq = re.sub(r"\s+,", ",", eq)
-
-        # Fix double \text{} wrapping: \text{\text{X}} -> \text{X}
-        # Handle spaces: \text { \text { X } } or \text{\text{X}}
-        eq = re.sub(r"\\text\s*\{\s*\\text\s*\{([^}]*)\}\s*\}", "\\\\text{\\1}", eq)
-
-        # Fix double backslashes: \\max -> \max (common Docling issue)
-        eq = re.sub(r"\\\\(max|min|sin|cos|tan|log|exp|sqrt|frac|text|cdot)", r"\\\1", eq)
-
-        return f"$${eq.strip()}$$"
-
-    content = re.sub(r"\$\$(.*?)\$\$", fix_equation, content, flags=re.DOTALL)
+    for stage in _EQUATION_STAGES:
 
+        def apply(m: re.Match[str], stage: Callable[[str], str] = stage) -> str:
+            return f"$${stage(m.group(1))}$$"
+
+        content = _DISPLAY_MATH_RE.sub(apply, content)
     return content
 
 
-def _fix_formula_placeholders(content: str) -> str:
-    """
-    Convert formula placeholder comments to a cleaner format.
+def _fix_text_spacing(m: re.Match[str]) -> str:
+    inner = m.group(1).strip()
+    # Also fix "mode" -> "model" inside \text{}
+    if inner == "mode":
+        inner = "model"
+    return f"\\text{{{inner}}}"
 
-    <!-- formula-not-decoded --> → [Formula not decoded]
-    """
-    content = re.sub(
-        r"<!--\s*formula-not-decoded\s*-->",
-        r"*[Formula - see original PDF]*",
-        content,
-        flags=re.IGNORECASE,
-    )
-    return content
 
+def _remove_spaces(m: re.Match[str]) -> str:
+    return m.group(0).replace(" ", "")
 
-def _clean_latex_spacing(content: str) -> str:
+
+def _clean_brace_content(m: re.Match[str]) -> str:
+    # Fix spaces inside braces: ^{ - 0.5} -> ^{-0.5}
+    prefix = m.group(1)  # ^ or _
+    content = m.group(2).strip()
+    # Remove spaces around operators inside braces
+    content = _BRACE_MINUS_RE.sub("-", content)
+    content = _BRACE_PLUS_RE.sub("+", content)
+    return f"{prefix}{{{content}}}"
+
+
+def _fix_docling_spacing(eq: str) -> str:
     """
-    Fix spacing issues in LaTeX equations from OCR.
+    Fix spacing issues introduced by Docling's LaTeX extraction.
 
-    Handles patterns like:
-    - Extra spaces around operators
-    - Spaces in LaTeX commands
+    Docling often extracts equations with spaces between characters,
+    e.g., "M u l t i H e a d" instead of "MultiHead"
+
+    Args:
+        eq: Equation body (without the ``$$`` delimiters)
+
+    Returns:
+        Fixed equation body
     """
-    def clean_equation(match: re.Match[str]) -> str:
-        eq = match.group(1)
+    # FIRST: Fix spacing in \text { X } -> \text{X}
+    # This must happen before other replacements
+    eq = _TEXT_SPACING_RE.sub(_fix_text_spacing, eq)
 
-        # Fix space after backslash before command: "\ frac" -> "\frac"
-        # Use a callback to preserve the backslash correctly
-        def fix_backslash_space(m: re.Match[str]) -> str:
-            return "\\" + m.group(1)
-        eq = re.sub(r"\\\s+([a-zA-Z])", fix_backslash_space, eq)
-
-        # Fix spacing in common LaTeX commands (don't double backslashes!)
-        eq = re.sub(r"\\text\s+\{", r"\\text{", eq)
-        eq = re.sub(r"\\frac\s+\{", r"\\frac{", eq)
-        eq = re.sub(r"\\sqrt\s+\{", r"\\sqrt{", eq)
-        eq = re.sub(r"\\min\s+\(", r"\\min(", eq)
-        eq = re.sub(r"\\max\s+\(", r"\\max(", eq)
-        eq = re.sub(r"\\sin\s+\(", r"\\sin(", eq)
-        eq = re.sub(r"\\cos\s+\(", r"\\cos(", eq)
-        eq = re.sub(r"\\log\s+\(", r"\\log(", eq)
-        eq = re.sub(r"\\exp\s+\(", r"\\exp(", eq)
-
-        # Fix spaced-out trig/math function names: "s i n" -> "\sin"
-        eq = re.sub(r"\bs\s+i\s+n\b", r"\\sin", eq)
-        eq = re.sub(r"\bc\s+o\s+s\b", r"\\cos", eq)
-        eq = re.sub(r"\bt\s+a\s+n\b", r"\\tan", eq)
-        eq = re.sub(r"\bl\s+o\s+g\b", r"\\log", eq)
-        eq = re.sub(r"\be\s+x\s+p\b", r"\\exp", eq)
-        eq = re.sub(r"\bm\s+i\s+n\b", r"\\min", eq)
-        eq = re.sub(r"\bm\s+a\s+x\b", r"\\max", eq)
-
-        # Clean up multiple spaces
-        eq = re.sub(r"\s{2,}", " ", eq)
+    for pattern, replacement in _SPACED_OCR_WORDS:
+        eq = pattern.sub(replacement, eq)
 
-        return f"$${eq}$$"
+    for pattern, replacement in _SPACED_VARS:
+        eq = pattern.sub(replacement, eq)
 
-    # Process display math ($$...$$)
-    content = re.sub(r"\$\$(.*?)\$\$", clean_equation, content, flags=re.DOTALL)
+    # Generic fix: sequences of single uppercase letters with spaces -> joined
+    # e.g., "I O P S" -> "IOPS", "G P U" -> "GPU"
+    eq = _UPPERCASE_ACRONYM_RE.sub(_remove_spaces, eq)
 
-    return content
+    # Fix spaced numbers like "1 0 0 0 0" -> "10000"
+    eq = _SPACED_NUMBER_RE.sub(_remove_spaces, eq)
 
+    # Fix decimal numbers with spaces like "0 . 5" -> "0.5"
+    eq = _SPACED_DECIMAL_RE.sub(r"\1.\2", eq)
 
-def _fix_common_ocr_artifacts(content: str) -> str:
-    """
-    Fix common OCR artifacts in equations.
-    """
-    def fix_equation(match: re.Match[str]) -> str:
-        eq = match.group(1)
+    # Fix spaced subscripts/superscripts like "d _ { k }" -> "d_{k}"
+    # This must happen BEFORE the {-} fix
+    eq = _SUBSCRIPT_OPEN_RE.sub(r"_{", eq)
+    eq = _SUPERSCRIPT_OPEN_RE.sub(r"^{", eq)
+    eq = _BRACE_CLOSE_RE.sub(r"}", eq)
 
-        # Fix common OCR misreads using simple string replace (not regex)
-        simple_replacements = [
-            ("Floting", "Floating"),
-            ("rerferred", "transferred"),
-            ("Mermoy", "Memory"),
-        ]
+    eq = _SCRIPT_BRACE_RE.sub(_clean_brace_content, eq)
 
-        for old, new in simple_replacements:
-            eq = eq.replace(old, new)
+    # NOW fix subscript patterns like "step_{-}num" or "step_{-} num" -> "step_num"
+    # (hyphen inside subscript braces indicates OCR artifact, e.g. step_num became step_{-}num)
+    eq = _HYPHEN_SUBSCRIPT_RE.sub(r"_\1", eq)
 
-        # Fix spaced OCR artifacts that appear at end of equations
-        # e.g., "\e r r o w" -> "" (remove), "\a r r o w" -> "\arrow"
-        ocr_noise_patterns = [
-            (r"\\?\s*e\s+r\s+r\s+o\s+w\s*", ""),  # "\e r r o w" -> remove
-            (r"\\?\s*a\s+r\s+r\s+o\s+w\s*", r"\\rightarrow "),  # "a r r o w" -> \rightarrow
-            (r"\\?\s*n\s+a\s+r\s+r\s+o\s+w\s*", r"\\rightarrow "),  # "n a r r o w" -> \rightarrow
-        ]
+    # Fix spacing around operators but preserve alignment
+    eq = _PLUS_RE.sub(" + ", eq)
+    eq = _MINUS_RE.sub(" - ", eq)
+    eq = _EQUALS_RE.sub(" = ", eq)
+    eq = _CDOT_RE.sub(r" \\cdot ", eq)
 
-        for pattern, replacement in ocr_noise_patterns:
-            eq = re.sub(pattern, replacement, eq, flags=re.IGNORECASE)
+    # Clean up multiple spaces
+    eq = _MULTI_SPACE_RE.sub(" ", eq)
 
-        # === GAN-specific OCR fixes ===
-        # Fix corrupted distribution names: p_{\} p a -> p_{\text{data}}
-        eq = re.sub(r"p_\{\\?\}\s*p\s*a\b", r"p_{\\text{data}}", eq)
-        eq = re.sub(r"P_\{\\?\}\s*p\s*a\b", r"p_{\\text{data}}", eq)
-        # Fix p_{D} -> p_{\text{data}} in GAN context
-        eq = re.sub(r"p_\{D\}\s*\(x\)", r"p_{\\text{data}}(x)", eq)
-        # Fix p_{d a t a} with spaces
-        eq = re.sub(r"p_\{d\s*a\s*t\s*a\}", r"p_{\\text{data}}", eq)
-        eq = re.sub(r"p_\{d\s*a\s*t\s*i\}", r"p_{\\text{data}}", eq)
+    # Fix spaces inside parentheses: "( Q , K , V )" -> "(Q, K, V)"
+    eq = _PAREN_OPEN_RE.sub("(", eq)
+    eq = _PAREN_CLOSE_RE.sub(")", eq)
 
-        # Fix \min_{G \D} \max_{D} -> \min_G \max_D (GAN minimax - remove duplicate \max_{D})
-        eq = re.sub(r"\\min_\{G\s*\\D\}\s*\\max_\{D\}", r"\\min_G \\max_D", eq)
-        eq = re.sub(r"p_\{d\s*o\s*t\s*a\}", r"p_{\\text{data}}", eq)
+    # Fix spaces around commas: ", " is good, " , " has extra space
+    eq = _COMMA_RE.sub(",", eq)
 
-        # Fix \min_{G \D} -> \min_G \max_D (GAN minimax)
-        eq = re.sub(r"\\min_\{G\s*\\D\}", r"\\min_G \\max_D", eq)
+    # Fix double \text{} wrapping: \text{\text{X}} -> \text{X}
+    # Handle spaces: \text { \text { X } } or \text{\text{X}}
+    eq = _DOUBLE_TEXT_RE.sub("\\\\text{\\1}", eq)
 
-        # Fix double subscripts like p_{_{G}} -> p_G
-        eq = re.sub(r"p_\{_\{([A-Za-z])\}\}", r"p_{\1}", eq)
-        eq = re.sub(r"p_\{_\{([a-z])\}\}", r"p_{\1}", eq)
+    # Fix double backslashes: \\max -> \max (common Docling issue)
+    eq = _DOUBLE_BACKSLASH_RE.sub(r"\\\1", eq)
 
-        # Fix \theta_s -> \theta_g (generator parameter in GAN)
-        # Only in generator gradient context
-        eq = re.sub(r"\\theta_\{?s\}?(?=.*\\log.*D.*G)", r"\\theta_g", eq)
+    return eq.strip()
 
-        # Fix mismatched parentheses: \left) -> \right)
-        eq = re.sub(r"\\left\)", r"\\right)", eq)
 
-        # Fix spacing around \mathcal and similar commands
-        eq = re.sub(r"\\mathcal\s*\{\s*(\w)\s*\}", r"\\mathcal{\1}", eq)
-        eq = re.sub(r"\\mathbb\s*\{\s*(\w)\s*\}", r"\\mathbb{\1}", eq)
-        eq = re.sub(r"\\mathbf\s*\{\s*(\w+)\s*\}", r"\\mathbf{\1}", eq)
+def _fix_formula_placeholders(content: str) -> str:
+    """
+    Convert formula placeholder comments to a cleaner format.
 
-        # Fix spacing inside set notation: \{ W _ { i } \} -> \{W_i\}
-        eq = re.sub(r"\\\{\s*", r"\\{", eq)
-        eq = re.sub(r"\s*\\\}", r"\\}", eq)
+    <!-- formula-not-decoded --> → [Formula not decoded]
+    """
+    return _FORMULA_PLACEHOLDER_RE.sub(r"*[Formula - see original PDF]*", content)
 
-        # Fix equation number at end: "  (2)  " → " \quad (2)"
-        eq = re.sub(r"\s*\(\s*(\d+)\s*\)\s*$", r" \\quad (\1)", eq)
 
-        # Clean up multiple \quad
-        eq = re.sub(r"(\\quad\s*)+", r"\\quad ", eq)
+def _fix_backslash_space(m: re.Match[str]) -> str:
+    # Use a callback to preserve the backslash correctly
+    return "\\" + m.group(1)
 
-        # Clean up trailing whitespace before $$
-        eq = eq.rstrip()
 
-        return f"$${eq}$$"
+def _clean_latex_spacing(eq: str) -> str:
+    """
+    Fix spacing issues in LaTeX equations from OCR.
 
-    content = re.sub(r"\$\$(.*?)\$\$", fix_equation, content, flags=re.DOTALL)
+    Handles patterns like:
+    - Extra spaces around operators
+    - Spaces in LaTeX commands
 
-    return content
+    Args:
+        eq: Equation body (without the ``$$`` delimiters)
+
+    Returns:
+        Fixed equation body
+    """
+    # Fix space after backslash before command: "\ frac" -> "\frac"
+    eq = _BACKSLASH_SPACE_RE.sub(_fix_backslash_space, eq)
+
+    for pattern, replacement in _COMMAND_SPACING:
+        eq = pattern.sub(replacement, eq)
+
+    # Clean up multiple spaces
+    return _WHITESPACE_RUN_RE.sub(" ", eq)
+
+
+def _fix_common_ocr_artifacts(eq: str) -> str:
+    """
+    Fix common OCR artifacts in equations.
+
+    Args:
+        eq: Equation body (without the ``$$`` delimiters)
+
+    Returns:
+        Fixed equation body
+    """
+    for old, new in _OCR_MISREADS:
+        eq = eq.replace(old, new)
+
+    for pattern, replacement in _OCR_FIXES:
+        eq = pattern.sub(replacement, eq)
+
+    # Clean up trailing whitespace before $$
+    return eq.rstrip()
 
 
 def _normalize_equation_delimiters(content: str) -> str:
@@ -309,15 +421,15 @@ def _normalize_equation_delimiters(content: str) -> str:
     Ensures proper spacing around display equations.
     """
     # Ensure blank line before display equations
-    content = re.sub(r"([^\n])\n(\$\$)", r"\1\n\n\2", content)
+    content = _BEFORE_EQUATION_RE.sub(r"\1\n\n\2", content)
 
     # Ensure blank line after display equations
-    content = re.sub(r"(\$\$)\n([^\n])", r"\1\n\n\2", content)
+    content = _AFTER_EQUATION_RE.sub(r"\1\n\n\2", content)
 
     return content
 
 
-def _fix_bare_newlines_in_display_math(content: str) -> str:
+def _fix_bare_newlines_in_display_math(eq: str) -> str:
     """
     Fix \\\\ used inside $$...$$ without an array/aligned/cases environment.
 
@@ -328,97 +440,62 @@ def _fix_bare_newlines_in_display_math(content: str) -> str:
     - \\begin{matrix}...\\end{matrix}
 
     If \\\\ appears outside these environments, wrap in aligned.
+
+    Args:
+        eq: Equation body (without the ``$$`` delimiters)
+
+    Returns:
+        Fixed equation body
     """
-    # LaTeX commands that start with \\ but are NOT newlines
-    latex_commands = [
-        "begin", "end", "text", "frac", "sqrt", "sum", "prod", "int",
-        "lim", "sin", "cos", "tan", "log", "exp", "min", "max", "sup", "inf",
-        "left", "right", "big", "Big", "bigg", "Bigg", "cdot", "cdots", "ldots",
-        "alpha", "beta", "gamma", "delta", "epsilon", "varepsilon", "zeta", "eta",
-        "theta", "vartheta", "iota", "kappa", "lambda", "mu", "nu", "xi", "pi",
-        "rho", "sigma", "tau", "upsilon", "phi", "varphi", "chi", "psi", "omega",
-        "Gamma", "Delta", "Theta", "Lambda", "Xi", "Pi", "Sigma", "Upsilon", "Phi",
-        "Psi", "Omega", "partial", "nabla", "infty", "forall", "exists", "neg",
-        "in", "notin", "subset", "supset", "cap", "cup", "wedge", "vee", "times",
-        "div", "pm", "mp", "leq", "geq", "neq", "approx", "equiv", "sim", "simeq",
-        "propto", "perp", "parallel", "angle", "triangle", "square", "circ",
-        "quad", "qquad", "hspace", "vspace", "mathbb", "mathbf", "mathcal", "mathrm",
-        "mathit", "mathsf", "mathtt", "boldsymbol", "overline", "underline", "hat",
-        "bar", "vec", "dot", "ddot", "tilde", "widetilde", "widehat", "overbrace",
-        "underbrace", "stackrel", "overset", "underset", "displaystyle", "scriptstyle",
-        "not", "to", "rightarrow", "leftarrow", "Rightarrow", "Leftarrow",
-        "longrightarrow", "longleftarrow", "mapsto", "iff", "implies",
-    ]
+    eq = eq.strip()
+
+    # Find all \\ that are newlines (not LaTeX commands)
+    # Pattern: \\ followed by space, digit, {, or end, OR followed by letter not in commands list
+    newline_positions: list[int] = []
+
+    for match in _DOUBLE_BACKSLASH_POS_RE.finditer(eq):
+        i = match.start()
+        if i + 2 == len(eq):
+            # \\ at end - it's a newline
+            newline_positions.append(i)
+        elif eq[i + 2] in " \t\n{[0-9":
+            # \\ followed by space, brace, or digit - it's a newline
+            newline_positions.append(i)
+        elif eq[i + 2].isalpha():
+            # Check if it's a known LaTeX command
+            word_match = _WORD_RE.match(eq, i + 2)
+            if word_match and word_match.group(0) not in _LATEX_COMMANDS:
+                # Not a known command, so \\ is likely a newline
+                newline_positions.append(i)
+
+    if not newline_positions:
+        return eq
+
+    # Find all environment ranges
+    env_ranges: list[tuple[int, int]] = []
+    for begin_pattern, end_pattern in _MULTILINE_ENVS:
+        for begin_match in begin_pattern.finditer(eq):
+            end_match = end_pattern.search(eq, begin_match.start())
+            if end_match:
+                env_ranges.append((begin_match.start(), end_match.end()))
+
+    # Check if any newline is outside all environment ranges
+    has_bare_newline = any(
+        not any(start <= pos < end for start, end in env_ranges)
+        for pos in newline_positions
+    )
 
-    def fix_equation(match: re.Match[str]) -> str:
-        eq = match.group(1).strip()
-
-        # Find all \\ that are newlines (not LaTeX commands)
-        # Pattern: \\ followed by space, digit, {, or end, OR followed by letter not in commands list
-        newline_positions: list[int] = []
-
-        i = 0
-        while i < len(eq) - 1:
-            if eq[i:i+2] == "\\\\":
-                # Check what follows
-                rest = eq[i+2:]
-                if not rest:
-                    # \\ at end - it's a newline
-                    newline_positions.append(i)
-                elif rest[0] in " \t\n{[0-9":
-                    # \\ followed by space, brace, or digit - it's a newline
-                    newline_positions.append(i)
-                elif rest[0].isalpha():
-                    # Check if it's a known LaTeX command
-                    # Extract the word
-                    word_match = re.match(r"([a-zA-Z]+)", rest)
-                    if word_match:
-                        word = word_match.group(1)
-                        if word not in latex_commands:
-                            # Not a known command, so \\ is likely a newline
-                            newline_positions.append(i)
-                i += 1
-            else:
-                i += 1
-
-        if not newline_positions:
-            return f"$${eq}$$"
-
-        # Find all environment ranges
-        multiline_envs = [
-            "array", "aligned", "align", "cases", "matrix", "pmatrix",
-            "bmatrix", "vmatrix", "Vmatrix", "gather", "gathered",
-            "split", "multline", "eqnarray"
-        ]
-
-        env_ranges: list[tuple[int, int]] = []
-        for env in multiline_envs:
-            begin_pattern = rf"\\begin\s*\{{\s*{env}\s*\}}"
-            end_pattern = rf"\\end\s*\{{\s*{env}\s*\}}"
-
-            for begin_match in re.finditer(begin_pattern, eq):
-                begin_pos = begin_match.start()
-                end_match = re.search(end_pattern, eq[begin_pos:])
-                if end_match:
-                    end_pos = begin_pos + end_match.end()
-                    env_ranges.append((begin_pos, end_pos))
-
-        # Check if any newline is outside all environment ranges
-        has_bare_newline = False
-        for pos in newline_positions:
-            inside_env = any(start <= pos < end for start, end in env_ranges)
-            if not inside_env:
-                has_bare_newline = True
-                break
-
-        if not has_bare_newline:
-            return f"$${eq}$$"
-
-        # There's a bare \\ - wrap the entire equation in aligned environment
-        wrapped = f"\\begin{{aligned}}\n{eq}\n\\end{{aligned}}"
-
-        return f"$${wrapped}$$"
-
-    content = re.sub(r"\$\$(.*?)\$\$", fix_equation, content, flags=re.DOTALL)
+    if not has_bare_newline:
+        return eq
 
-    return content
+    # There's a bare \\ - wrap the entire equation in aligned environment
+    return f"\\begin{{aligned}}\n{eq}\n\\end{{aligned}}"
+
+
+# Per-equation stages, in the order they are applied
+_EQUATION_STAGES: tuple[Callable[[str], str], ...] = (
+    _fix_docling_spacing,
+    _clean_latex_spacing,
+    _fix_common_ocr_artifacts,
+    _fix_bare_newlines_in_display_math,
+)
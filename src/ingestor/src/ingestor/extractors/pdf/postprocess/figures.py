@@ -10,6 +10,13 @@ from __future__ import annotations
 
 import re
 
+_FIGURE_FILE_RE = re.compile(r"(?:figure|fig)[_-]?(\d+)", re.IGNORECASE)
+_IMG_FILE_RE = re.compile(r"_img_(\d+)", re.IGNORECASE)
+
+# "Fig." or "Figure" followed by number
+_CAPTION_RE = re.compile(r"(?:^|\s)(Fig(?:ure)?\.?\s*(\d+))[.:\s]", re.IGNORECASE)
+_EMBEDDED_RE = re.compile(r"!\[Figure (\d+)\]")
+
 
 def process_figures(content: str, image_files: list[str]) -> str:
     """
@@ -55,14 +62,14 @@ def _build_figure_map(image_files: list[str]) -> dict[int, str]:
     for filename in image_files:
         # Extract number from filename
         # Try figure/fig pattern first
-        match = re.search(r"(?:figure|fig)[_-]?(\d+)", filename, re.IGNORECASE)
+        match = _FIGURE_FILE_RE.search(filename)
         if match:
             num = int(match.group(1))
             figure_map[num] = filename
             continue
 
         # Try _img_XXX pattern (standard ingestor naming)
-        match = re.search(r"_img_(\d+)", filename, re.IGNORECASE)
+        match = _IMG_FILE_RE.search(filename)
         if match:
             num = int(match.group(1))
             figure_map[num] = filename
@@ -83,14 +90,9 @@ def _embed_figures_at_captions(content: str, figure_map: dict[int, str]) -> str:
     result = []
     embedded_figures: set[int] = set()
 
-    for _i, line in enumerate(lines):
+    for line in lines:
         # Check if this line contains a figure caption
-        # Pattern: "Fig." or "Figure" followed by number
-        caption_match = re.search(
-            r"(?:^|\s)(Fig(?:ure)?\.?\s*(\d+))[.:\s]",
-            line,
-            re.IGNORECASE,
-        )
+        caption_match = _CAPTION_RE.search(line)
 
         if caption_match:
             fig_num = int(caption_match.group(2))
@@ -125,7 +127,7 @@ def get_unembedded_figures(content: str, image_files: list[str]) -> list[str]:
     embedded: set[int] = set()
 
     # Find which figures were already embedded
-    for match in re.finditer(r"!\[Figure (\d+)\]", content):
+    for match in _EMBEDDED_RE.finditer(content):
         embedded.add(int(match.group(1)))
 
     # Return filenames of unembedded figures
@@ -16,6 +16,19 @@ import re
 # Maximum title length for a section header (longer text is likely a paragraph)
 MAX_TITLE_LENGTH = 120
 
+_ABSTRACT_RE = re.compile(r"^(#+\s*)?Abstract\s*[-–—]\s*", re.MULTILINE | re.IGNORECASE)
+_INDEX_TERMS_RE = re.compile(r"^(#+\s*)?Index Terms\s*[-–—]\s*", re.MULTILINE | re.IGNORECASE)
+
+# Numbered sections: "N." or "N.N" or "N.N.N" at start of line, followed by
+# space and title text (starts with capital after number)
+_SECTION_RE = re.compile(r"^(\d+(?:\.\d+)*\.?)\s+([A-Z].*?)$", re.IGNORECASE)
+
+# Roman numeral pattern for top-level sections
+_ROMAN_RE = re.compile(r"^(I{1,3}|IV|VI{0,3}|IX|X{1,3})\.?\s+([A-Z].*?)$", re.IGNORECASE)
+
+# Bullet (-, *, •) followed by number and parenthesis
+_BULLET_SECTION_RE = re.compile(r"^[-*•]\s*(\d+)\)\s+(.+?)[:.]?\s*$")
+
 
 def process_sections(content: str) -> str:
     """
@@ -35,9 +48,18 @@ def process_sections(content: str) -> str:
     """
     content = _fix_abstract_header(content)
     content = _fix_index_terms_header(content)
-    content = _fix_hierarchical_sections(content)
-    content = _fix_numbered_bullet_subsections(content)
-    return content
+
+    # Header and bullet-subsection fixes share one pass over the lines. A line
+    # turned into a header can no longer look like a bullet, and a bullet line
+    # never looks like a numbered section, so this matches running them in turn.
+    lines = content.split("\n")
+    result = []
+    for i, line in enumerate(lines):
+        fixed = _fix_section_line(line, lines[i + 1 : i + 2])
+        if fixed is None:
+            fixed = _fix_bullet_line(line)
+        result.append(line if fixed is None else fixed)
+    return "\n".join(result)
 
 
 def _fix_abstract_header(content: str) -> str:
@@ -47,9 +69,7 @@ def _fix_abstract_header(content: str) -> str:
     "Abstract -Modern HPC..." → "## Abstract\\n\\nModern HPC..."
     "Abstract-Modern HPC..." → "## Abstract\\n\\nModern HPC..."
     """
-    pattern = r"^(#+\s*)?Abstract\s*[-–—]\s*"
-    replacement = "## Abstract\n\n"
-    return re.sub(pattern, replacement, content, count=1, flags=re.MULTILINE | re.IGNORECASE)
+    return _ABSTRACT_RE.sub("## Abstract\n\n", content, count=1)
 
 
 def _fix_index_terms_header(content: str) -> str:
@@ -58,9 +78,7 @@ def _fix_index_terms_header(content: str) -> str:
 
     "Index Terms -keywords" → "## Index Terms\\n\\nkeywords"
     """
-    pattern = r"^(#+\s*)?Index Terms\s*[-–—]\s*"
-    replacement = "## Index Terms\n\n"
-    return re.sub(pattern, replacement, content, count=1, flags=re.MULTILINE | re.IGNORECASE)
+    return _INDEX_TERMS_RE.sub("## Index Terms\n\n", content, count=1)
 
 
 def _determine_header_level(numbering: str) -> int:
@@ -122,94 +140,59 @@ def _is_section_title(title: str, following_lines: list[str]) -> bool:
     return bool(words and (words[0][0].isupper() or title.isupper()))
 
 
-def _fix_hierarchical_sections(content: str) -> str:
-    """
-    Fix hierarchical numbered sections (1., 1.1, 1.1.1, etc.).
-
-    Converts lines like:
-    - "1. INTRODUCTION" → "## 1. INTRODUCTION"
-    - "3.1 Background" → "### 3.1 Background"
-    - "3.1.1 Design overview" → "#### 3.1.1 Design overview"
+def _fix_section_line(line: str, following: list[str]) -> str | None:
     """
-    lines = content.split("\n")
-    result = []
+    Turn a numbered or Roman-numeral section line into a header.
 
-    # Pattern for numbered sections: "N." or "N.N" or "N.N.N" at start of line
-    # Followed by space and title text
-    section_pattern = re.compile(
-        r"^(\d+(?:\.\d+)*\.?)\s+([A-Z].*?)$",  # Starts with capital after number
-        re.IGNORECASE,
-    )
+    Args:
+        line: The line to check
+        following: The next line, if any (a one-element list)
 
-    # Roman numeral pattern for top-level sections
-    roman_pattern = re.compile(
-        r"^(I{1,3}|IV|VI{0,3}|IX|X{1,3})\.?\s+([A-Z].*?)$",
-        re.IGNORECASE,
-    )
+    Returns:
+        The header line, or None if the line is not a section title
+    """
+    stripped = line.strip()
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # Skip lines that are already headers
-        if stripped.startswith("#"):
-            result.append(line)
-            continue
-
-        # Check for numbered section
-        match = section_pattern.match(stripped)
-        if match:
-            numbering = match.group(1).rstrip(".")
-            title = match.group(2)
-            following = lines[i + 1 :] if i + 1 < len(lines) else []
-
-            if _is_section_title(title, following):
-                level = _determine_header_level(numbering)
-                hashes = "#" * level
-                result.append(f"{hashes} {numbering}. {title}")
-                continue
-
-        # Check for Roman numeral section
-        roman_match = roman_pattern.match(stripped)
-        if roman_match:
-            numeral = roman_match.group(1).upper()
-            title = roman_match.group(2)
-            following = lines[i + 1 :] if i + 1 < len(lines) else []
-
-            if _is_section_title(title, following):
-                result.append(f"## {numeral}. {title}")
-                continue
-
-        result.append(line)
+    # Skip lines that are already headers
+    if stripped.startswith("#"):
+        return None
 
-    return "\n".join(result)
+    # Check for numbered section
+    match = _SECTION_RE.match(stripped)
+    if match:
+        numbering = match.group(1).rstrip(".")
+        title = match.group(2)
 
+        if _is_section_title(title, following):
+            level = _determine_header_level(numbering)
+            hashes = "#" * level
+            return f"{hashes} {numbering}. {title}"
 
-def _fix_numbered_bullet_subsections(content: str) -> str:
-    """
-    Convert numbered bullet items that are actually subsections.
+    # Check for Roman numeral section
+    roman_match = _ROMAN_RE.match(stripped)
+    if roman_match:
+        numeral = roman_match.group(1).upper()
+        title = roman_match.group(2)
 
-    "- 1) Title:" or "• 1) Title" → "### 1) Title"
-    """
-    lines = content.split("\n")
-    result = []
+        if _is_section_title(title, following):
+            return f"## {numeral}. {title}"
 
-    # Pattern: bullet (-, *, •) followed by number and parenthesis
-    bullet_section_pattern = re.compile(
-        r"^[-*•]\s*(\d+)\)\s+(.+?)[:.]?\s*$"
-    )
+    return None
 
-    for line in lines:
-        stripped = line.strip()
 
-        match = bullet_section_pattern.match(stripped)
-        if match:
-            num = match.group(1)
-            title = match.group(2)
-            # Only convert if title looks like a heading (short, capitalized)
-            if len(title) < 80 and title[0].isupper():
-                result.append(f"### {num}) {title}")
-                continue
+def _fix_bullet_line(line: str) -> str | None:
+    """
+    Turn a numbered bullet that is actually a subsection into a header.
 
-        result.append(line)
+    Returns:
+        The header line, or None if the line is not a bullet subsection
+    """
+    match = _BULLET_SECTION_RE.match(line.strip())
+    if match:
+        num = match.group(1)
+        title = match.group(2)
+        # Only convert if title looks like a heading (short, capitalized)
+        if len(title) < 80 and title[0].isupper():
+            return f"### {num}) {title}"
+    return None
 
-    return "\n".join(result)
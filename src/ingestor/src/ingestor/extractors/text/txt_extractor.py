@@ -1,5 +1,6 @@
 """Plain text file extractor with charset detection."""
 
+import asyncio
 from pathlib import Path
 
 from ...core.charset import CharsetHandler
@@ -34,8 +35,8 @@ class TxtExtractor(BaseExtractor):
         """
         path = Path(source)
 
-        # Read with charset detection
-        text, encoding = self.charset_handler.read_text(path)
+        # Read with charset detection (off the event loop: files can be large)
+        text, encoding = await asyncio.to_thread(self.charset_handler.read_text, path)
 
         # For markdown files, return as-is
         # For other text files, wrap in code block if it looks like code
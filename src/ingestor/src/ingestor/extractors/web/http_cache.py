@@ -0,0 +1,264 @@
+"""On-disk HTTP cache for web crawls and the PDF downloads they trigger.
+
+Layout::
+
+    cache_dir/
+    ├── entries/
+    │   └── ab/abcdef.../          # sha256 of the URL
+    │       ├── entry.json         # validators, hashes, markdown, metadata
+    │       └── web_image_1.png    # cached extracted images
+    └── crawls/
+        └── <crawl_key>.json       # URLs produced by the last complete crawl
+
+Entries keep the HTTP validators (ETag / Last-Modified) used for conditional
+GETs plus two hashes:
+
+- ``body_hash``: hash of the raw HTTP body (from revalidation or PDF downloads)
+- ``content_hash``: hash of the HTML rendered by the crawler
+
+A page whose hash is unchanged reuses the cached markdown instead of being
+converted again.
+"""
+
+import json
+import shutil
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from ...core.cache import content_hash
+from ...types import ExtractedImage, ExtractionResult, MediaType
+
+
+@dataclass
+class CacheStats:
+    """Counters reported in the crawl summary."""
+
+    not_modified: int = 0  # 304 responses
+    unchanged: int = 0  # 200 responses whose body hash matched the cache
+    misses: int = 0  # new or changed content that had to be converted
+    errors: int = 0  # revalidation requests that failed
+
+    @property
+    def hits(self) -> int:
+        """Number of results served from the cache."""
+        return self.not_modified + self.unchanged
+
+    @property
+    def total(self) -> int:
+        """Number of cache lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 - 1.0)."""
+        return self.hits / self.total if self.total else 0.0
+
+    def summary(self) -> str:
+        """Return a one-line human readable summary."""
+        return (
+            f"{self.hits}/{self.total} cached ({self.hit_rate:.0%}): "
+            f"{self.not_modified} not modified, {self.unchanged} unchanged, "
+            f"{self.misses} fetched"
+        )
+
+
+@dataclass
+class CacheEntry:
+    """Cached state for a single URL."""
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: str | None = None
+    content_hash: str | None = None
+    title: str | None = None
+    markdown: str | None = None
+    media_type: str = MediaType.WEB.value
+    metadata: dict[str, Any] = field(default_factory=dict)
+    images: list[dict[str, Any]] = field(default_factory=list)
+    fetched_at: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build request headers for a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def update_validators(self, headers: Any) -> None:
+        """Record ETag / Last-Modified from response headers.
+
+        Args:
+            headers: Mapping of response headers (case-insensitive or lower-case)
+        """
+        if not headers:
+            return
+        lowered = {str(k).lower(): v for k, v in dict(headers).items()}
+        if lowered.get("etag"):
+            self.etag = lowered["etag"]
+        if lowered.get("last-modified"):
+            self.last_modified = lowered["last-modified"]
+
+    @property
+    def has_result(self) -> bool:
+        """Whether this entry holds a reusable extraction result."""
+        return self.markdown is not None
+
+
+class HttpCache:
+    """Persistent cache of HTTP validators and extraction results."""
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache entries in
+        """
+        self.cache_dir = Path(cache_dir)
+        self.entries_dir = self.cache_dir / "entries"
+        self.crawls_dir = self.cache_dir / "crawls"
+
+    def _entry_dir(self, url: str) -> Path:
+        key = content_hash(url)
+        return self.entries_dir / key[:2] / key
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Load the cache entry for a URL.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            Cached entry, or None if missing or unreadable
+        """
+        path = self._entry_dir(url) / "entry.json"
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return CacheEntry(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def put(self, entry: CacheEntry, images: list[ExtractedImage] | None = None) -> None:
+        """Store a cache entry, optionally replacing its cached images.
+
+        Args:
+            entry: Entry to store
+            images: Extracted images to cache alongside the entry
+        """
+        entry_dir = self._entry_dir(entry.url)
+        if images is not None:
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir)
+            entry.images = []
+            for image in images:
+                entry.images.append({
+                    "filename": image.filename,
+                    "format": image.format,
+                    "page": image.page,
+                    "caption": image.caption,
+                    "context": image.context,
+                })
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        if images:
+            for image in images:
+                (entry_dir / image.filename).write_bytes(image.data)
+
+        entry.fetched_at = datetime.now(UTC).isoformat()
+        tmp_path = entry_dir / "entry.json.tmp"
+        tmp_path.write_text(json.dumps(asdict(entry), ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(entry_dir / "entry.json")
+
+    def store_result(
+        self,
+        url: str,
+        result: ExtractionResult,
+        headers: Any = None,
+        body_hash: str | None = None,
+        html_hash: str | None = None,
+    ) -> CacheEntry:
+        """Cache an extraction result for a URL.
+
+        Args:
+            url: URL the result was produced from
+            result: Extraction result to cache
+            headers: Response headers carrying validators
+            body_hash: Hash of the raw HTTP body, if known
+            html_hash: Hash of the crawler-rendered HTML, if known
+
+        Returns:
+            The stored entry
+        """
+        entry = self.get(url) or CacheEntry(url=url)
+        entry.update_validators(headers)
+        if body_hash is not None:
+            entry.body_hash = body_hash
+        if html_hash is not None:
+            entry.content_hash = html_hash
+        entry.title = result.title
+        entry.markdown = result.markdown
+        entry.media_type = (result.media_type or MediaType.WEB).value
+        entry.metadata = {
+            k: v for k, v in result.metadata.items() if k != "cache_status"
+        }
+        self.put(entry, images=result.images)
+        return entry
+
+    def load_result(self, entry: CacheEntry, cache_status: str) -> ExtractionResult:
+        """Rebuild an extraction result from a cache entry.
+
+        Args:
+            entry: Entry holding the cached result
+            cache_status: Value recorded in ``metadata["cache_status"]``
+
+        Returns:
+            Extraction result equivalent to the one originally cached
+        """
+        entry_dir = self._entry_dir(entry.url)
+        images = []
+        for info in entry.images:
+            image_path = entry_dir / info["filename"]
+            if image_path.exists():
+                images.append(ExtractedImage(data=image_path.read_bytes(), **info))
+
+        return ExtractionResult(
+            markdown=entry.markdown or "",
+            title=entry.title,
+            source=entry.url,
+            media_type=MediaType(entry.media_type),
+            images=images,
+            metadata={**entry.metadata, "cache_status": cache_status},
+        )
+
+    def load_manifest(self, crawl_key: str) -> list[str] | None:
+        """Load the URLs produced by the last complete crawl.
+
+        Args:
+            crawl_key: Key identifying the crawl configuration
+
+        Returns:
+            List of URLs, or None if no previous crawl was recorded
+        """
+        path = self.crawls_dir / f"{crawl_key}.json"
+        if not path.exists():
+            return None
+        try:
+            return list(json.loads(path.read_text(encoding="utf-8"))["urls"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save_manifest(self, crawl_key: str, urls: list[str]) -> None:
+        """Record the URLs produced by a complete crawl.
+
+        Args:
+            crawl_key: Key identifying the crawl configuration
+            urls: Page and PDF URLs in result order
+        """
+        self.crawls_dir.mkdir(parents=True, exist_ok=True)
+        data = {"urls": urls, "crawled_at": datetime.now(UTC).isoformat()}
+        (self.crawls_dir / f"{crawl_key}.json").write_text(json.dumps(data), encoding="utf-8")
@@ -1,11 +1,15 @@
 """Web content extractor using Crawl4AI."""
 
+import asyncio
+import json
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+from ...core.cache import content_hash
 from ...types import ExtractedImage, ExtractionResult, MediaType
 from ..base import BaseExtractor
+from .http_cache import CacheEntry, CacheStats, HttpCache
 
 
 class WebExtractor(BaseExtractor):
@@ -16,10 +20,14 @@ class WebExtractor(BaseExtractor):
     - Deep crawling with BFS/DFS/BestFirst strategies
     - Domain restriction
     - URL pattern filtering
+    - Persistent HTTP cache with conditional revalidation (``cache_dir``)
     """
 
     media_type = MediaType.WEB
 
+    # Concurrent conditional GETs when revalidating a cached crawl
+    REVALIDATE_CONCURRENCY = 8
+
     def __init__(
         self,
         strategy: str = "bfs",
@@ -29,6 +37,7 @@ class WebExtractor(BaseExtractor):
         exclude_patterns: list[str] | None = None,
         same_domain: bool = True,
         extract_pdfs: bool = True,
+        cache_dir: str | Path | None = None,
     ):
         """Initialize web extractor.
 
@@ -40,6 +49,7 @@ class WebExtractor(BaseExtractor):
             exclude_patterns: URL patterns to exclude
             same_domain: Restrict to same domain
             extract_pdfs: Download and extract PDF files after crawl
+            cache_dir: Directory for the HTTP cache (None disables caching)
         """
         self.strategy = strategy
         self.max_depth = max_depth
@@ -48,7 +58,16 @@ class WebExtractor(BaseExtractor):
         self.exclude_patterns = exclude_patterns or []
         self.same_domain = same_domain
         self.extract_pdfs = extract_pdfs
+        self.cache_dir = cache_dir
         self.pdf_urls: list[str] = []
+        self.cache_stats = CacheStats()
+
+    @property
+    def cache(self) -> HttpCache | None:
+        """HTTP cache for the configured ``cache_dir`` (None when disabled)."""
+        if self.cache_dir is None:
+            return None
+        return HttpCache(self.cache_dir)
 
     async def extract(self, source: str | Path) -> ExtractionResult:
         """Extract content from a URL.
@@ -132,6 +151,16 @@ class WebExtractor(BaseExtractor):
         if str(source).endswith(".url"):
             url = self._read_url_file(Path(source))
 
+        self.cache_stats = CacheStats()
+        cache = self.cache
+        crawl_key = self._crawl_key(url)
+
+        # Nothing changed since the last crawl: serve it without a browser
+        if cache is not None:
+            cached_results = await self._revalidate_crawl(cache, crawl_key)
+            if cached_results is not None:
+                return cached_results
+
         # Select strategy
         if self.strategy == "dfs":
             strategy = DFSDeepCrawlStrategy(
@@ -176,6 +205,19 @@ class WebExtractor(BaseExtractor):
                     continue
 
                 if result.success:
+                    # Rendered page identical to the cached one: reuse its markdown
+                    html_hash = content_hash(result.html or "")
+                    entry = cache.get(result.url) if cache is not None else None
+                    if (
+                        cache is not None
+                        and entry is not None
+                        and entry.has_result
+                        and entry.content_hash == html_hash
+                    ):
+                        self.cache_stats.unchanged += 1
+                        results.append(cache.load_result(entry, cache_status="unchanged"))
+                        continue
+
                     markdown = result.markdown or ""
                     title = result.metadata.get("title", "") if result.metadata else ""
                     images, image_url_map = self._extract_images(result)
@@ -184,18 +226,27 @@ class WebExtractor(BaseExtractor):
                     if image_url_map:
                         markdown = self._rewrite_image_paths(markdown, image_url_map)
 
-                    results.append(ExtractionResult(
+                    page_result = ExtractionResult(
                         markdown=markdown,
                         title=title,
                         source=result.url,
                         media_type=MediaType.WEB,
                         images=images,
                         metadata={"url": result.url},
-                    ))
+                    )
+                    if cache is not None:
+                        self.cache_stats.misses += 1
+                        cache.store_result(
+                            result.url,
+                            page_result,
+                            headers=result.response_headers,
+                            html_hash=html_hash,
+                        )
+                        page_result.metadata["cache_status"] = "miss"
+                    results.append(page_result)
 
         # Extract PDFs in parallel after web crawl completes
         if self.extract_pdfs and self.pdf_urls:
-            import asyncio
             pdf_tasks = [self._extract_pdf(pdf_url) for pdf_url in self.pdf_urls]
             pdf_results = await asyncio.gather(*pdf_tasks, return_exceptions=True)
             
@@ -203,8 +254,124 @@ class WebExtractor(BaseExtractor):
                 if isinstance(pdf_result, ExtractionResult):
                     results.append(pdf_result)
 
+        if cache is not None:
+            cache.save_manifest(crawl_key, [r.source for r in results if r.source])
+
+        return results
+
+    def _crawl_key(self, url: str) -> str:
+        """Build the cache key identifying a crawl configuration.
+
+        Args:
+            url: Starting URL
+
+        Returns:
+            Hash of the URL and every setting that affects the crawled set
+        """
+        settings = {
+            "url": url,
+            "strategy": self.strategy,
+            "max_depth": self.max_depth,
+            "max_pages": self.max_pages,
+            "include": sorted(self.include_patterns),
+            "exclude": sorted(self.exclude_patterns),
+            "same_domain": self.same_domain,
+            "extract_pdfs": self.extract_pdfs,
+        }
+        return content_hash(json.dumps(settings, sort_keys=True))[:32]
+
+    async def _revalidate_crawl(
+        self, cache: HttpCache, crawl_key: str
+    ) -> list[ExtractionResult] | None:
+        """Revalidate every URL of the previous crawl with conditional GETs.
+
+        The set of crawled pages is derived from the pages' own links, so if
+        no page changed the previous crawl is still exact and the browser
+        crawl can be skipped altogether.
+
+        Args:
+            cache: HTTP cache holding the previous crawl
+            crawl_key: Key identifying the crawl configuration
+
+        Returns:
+            Cached results if every page is unchanged, otherwise None
+        """
+        import httpx
+
+        urls = cache.load_manifest(crawl_key)
+        if not urls:
+            return None
+        entries: list[CacheEntry] = []
+        for url in urls:
+            entry = cache.get(url)
+            if entry is None or not entry.has_result:
+                return None
+            entries.append(entry)
+
+        semaphore = asyncio.Semaphore(self.REVALIDATE_CONCURRENCY)
+
+        async def check(entry: CacheEntry) -> str:
+            async with semaphore:
+                status, _ = await self._conditional_get(client, cache, entry)
+                return status
+
+        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+            statuses = await asyncio.gather(*(check(entry) for entry in entries))
+
+        if any(status not in ("not_modified", "unchanged") for status in statuses):
+            # Something changed; hashes recorded above let the re-crawl
+            # reuse the markdown of the pages that did not.
+            return None
+
+        results = []
+        for entry, status in zip(entries, statuses, strict=True):
+            if status == "not_modified":
+                self.cache_stats.not_modified += 1
+            else:
+                self.cache_stats.unchanged += 1
+            results.append(cache.load_result(entry, cache_status=status))
         return results
 
+    async def _conditional_get(
+        self, client: Any, cache: HttpCache, entry: Any
+    ) -> tuple[str, Any]:
+        """Issue a conditional GET for a cached URL and update its validators.
+
+        Args:
+            client: httpx.AsyncClient to use
+            cache: HTTP cache holding the entry
+            entry: Cache entry for the URL
+
+        Returns:
+            Tuple of (status, response) where status is one of
+            ``not_modified``, ``unchanged``, ``changed`` or ``error``
+        """
+        try:
+            response = await client.get(entry.url, headers=entry.conditional_headers())
+        except Exception:
+            self.cache_stats.errors += 1
+            return "error", None
+
+        if response.status_code == 304:
+            return "not_modified", response
+        if response.status_code != 200:
+            self.cache_stats.errors += 1
+            return "error", response
+
+        body_hash = content_hash(response.content)
+        if entry.body_hash == body_hash:
+            status = "unchanged"
+        else:
+            status = "changed"
+            if entry.body_hash is not None:
+                # Drop the stale result so it can never be served for the new body
+                entry.markdown = None
+                entry.content_hash = None
+        entry.update_validators(response.headers)
+        entry.body_hash = body_hash
+        cache.put(entry)
+        return status, response
+
     def _read_url_file(self, path: Path) -> str:
         """Read URL from a .url file.
 
@@ -268,6 +435,9 @@ class WebExtractor(BaseExtractor):
     async def _extract_pdf(self, url: str) -> ExtractionResult | None:
         """Download and extract a PDF file.
 
+        With a cache configured, the download is a conditional GET and an
+        unchanged PDF reuses its cached extraction instead of being parsed again.
+
         Args:
             url: PDF URL
 
@@ -275,36 +445,60 @@ class WebExtractor(BaseExtractor):
             Extraction result for the PDF, or None if extraction fails
         """
         try:
-            from ..pdf import PDFExtractor
-            import aiohttp
             import tempfile
-            
+
+            import httpx
+
+            from ..pdf import PdfExtractor
+
+            cache = self.cache
+            entry = cache.get(url) if cache is not None else None
+
             # Download PDF
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return None
-                    
-                    pdf_data = await response.read()
-                    
-                    # Skip if it's too small (likely an error page)
-                    if len(pdf_data) < 1000:
-                        return None
-                    
-                    # Save to temporary file and extract
-                    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                        tmp.write(pdf_data)
-                        tmp_path = Path(tmp.name)
-                    
-                    try:
-                        extractor = PDFExtractor()
-                        result = await extractor.extract(tmp_path)
-                        result.source = url  # Override source to be the URL
-                        result.metadata = result.metadata or {}
-                        result.metadata["pdf_url"] = url
-                        return result
-                    finally:
-                        tmp_path.unlink(missing_ok=True)
+            async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
+                if cache is not None and entry is not None and entry.has_result:
+                    status, response = await self._conditional_get(client, cache, entry)
+                    if status in ("not_modified", "unchanged"):
+                        if status == "not_modified":
+                            self.cache_stats.not_modified += 1
+                        else:
+                            self.cache_stats.unchanged += 1
+                        return cache.load_result(entry, cache_status=status)
+                else:
+                    response = await client.get(url)
+
+            if response is None or response.status_code != 200:
+                return None
+
+            pdf_data = response.content
+
+            # Skip if it's too small (likely an error page)
+            if len(pdf_data) < 1000:
+                return None
+
+            # Save to temporary file and extract
+            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
+                tmp.write(pdf_data)
+                tmp_path = Path(tmp.name)
+
+            try:
+                extractor = PdfExtractor()
+                result = await extractor.extract(tmp_path)
+                result.source = url  # Override source to be the URL
+                result.metadata = result.metadata or {}
+                result.metadata["pdf_url"] = url
+                if cache is not None:
+                    self.cache_stats.misses += 1
+                    cache.store_result(
+                        url,
+                        result,
+                        headers=response.headers,
+                        body_hash=content_hash(pdf_data),
+                    )
+                    result.metadata["cache_status"] = "miss"
+                return result
+            finally:
+                tmp_path.unlink(missing_ok=True)
         except Exception as e:
             # Log but don't fail the entire crawl
             print(f"Failed to extract PDF {url}: {e}")
@@ -0,0 +1,97 @@
+"""Persistent cache of YouTube video metadata and transcripts.
+
+Entries are keyed by video ID, so re-ingesting a playlist or channel only
+goes to the network for videos that have not been seen before. Transcripts
+are stored per caption preference (caption type and languages), since the
+same video can yield a different transcript under another preference.
+
+Layout::
+
+    cache_dir/
+    └── dQ/dQw4w9WgXcQ.json   # {"metadata": {...}, "transcripts": {variant: text}}
+
+Failed lookups (metadata carrying an ``error``, empty transcripts) are not
+cached: captions are often added to a video after it is published.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+class VideoCache:
+    """On-disk cache of video metadata and transcripts."""
+
+    def __init__(self, cache_dir: str | Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store entries in
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def variant(caption_type: str, languages: list[str]) -> str:
+        """Identify a caption preference."""
+        return f"{caption_type}:{','.join(languages)}"
+
+    def _path(self, video_id: str) -> Path:
+        return self.cache_dir / video_id[:2] / f"{video_id}.json"
+
+    def _load(self, video_id: str) -> dict[str, Any]:
+        path = self._path(video_id)
+        if not path.exists():
+            return {}
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return entry if isinstance(entry, dict) else {}
+
+    def _save(self, video_id: str, entry: dict[str, Any]) -> None:
+        path = self._path(video_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+
+    def get_metadata(self, video_id: str) -> dict[str, Any] | None:
+        """Look up cached metadata for a video."""
+        metadata = self._load(video_id).get("metadata")
+        self._count(metadata is not None)
+        return metadata
+
+    def put_metadata(self, video_id: str, metadata: dict[str, Any]) -> None:
+        """Store metadata for a video (failed lookups are ignored)."""
+        if "error" in metadata:
+            return
+        entry = self._load(video_id)
+        entry["metadata"] = metadata
+        self._save(video_id, entry)
+
+    def get_transcript(self, video_id: str, variant: str) -> str | None:
+        """Look up a cached transcript for a video and caption preference."""
+        transcript = self._load(video_id).get("transcripts", {}).get(variant)
+        self._count(transcript is not None)
+        return transcript
+
+    def put_transcript(self, video_id: str, variant: str, transcript: str) -> None:
+        """Store a transcript (empty transcripts are ignored)."""
+        if not transcript:
+            return
+        entry = self._load(video_id)
+        entry.setdefault("transcripts", {})[variant] = transcript
+        self._save(video_id, entry)
+
+    def has(self, video_id: str, variant: str) -> bool:
+        """Whether both metadata and a transcript are cached for a video."""
+        entry = self._load(video_id)
+        return "metadata" in entry and variant in entry.get("transcripts", {})
+
+    def _count(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
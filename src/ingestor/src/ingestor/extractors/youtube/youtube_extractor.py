@@ -1,12 +1,58 @@
-"""YouTube extractor using yt-dlp and youtube-transcript-api."""
+"""YouTube extractor using yt-dlp and youtube-transcript-api.
 
+Both libraries are blocking, so every lookup runs in a worker thread.
+Playlists and channels are processed with bounded concurrency, and
+requests to YouTube are paced so that a long playlist does not hammer the
+site. With a cache directory set, metadata and transcripts are remembered
+per video ID and a refresh only fetches videos that are new.
+"""
+
+import asyncio
 import re
+import time
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 from ...types import ExtractionResult, MediaType
 from ..base import BaseExtractor
+from .cache import VideoCache
+
+# Host that both yt-dlp and the transcript API talk to
+YOUTUBE_HOST = "www.youtube.com"
+
+# Channel URLs: /@handle, /channel/<id>, /c/<name>, /user/<name>
+_CHANNEL_RE = re.compile(
+    r"youtube\.com/(?:@[\w.-]+|channel/[\w-]+|c/[\w.-]+|user/[\w.-]+)(?P<tab>/[\w]+)?/?(?:[?#]|$)"
+)
+
+
+class HostPacer:
+    """Space out request starts per host.
+
+    Reservations are made synchronously on the event loop, so concurrent
+    callers queue up behind each other without holding any lock while
+    they sleep.
+    """
+
+    def __init__(self, min_interval: float):
+        """Initialize the pacer.
+
+        Args:
+            min_interval: Minimum seconds between request starts to one host
+        """
+        self.min_interval = min_interval
+        self._next: dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        """Wait for the next request slot for a host."""
+        if self.min_interval <= 0:
+            return
+        now = time.monotonic()
+        start = max(now, self._next.get(host, now))
+        self._next[host] = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
 
 class YouTubeExtractor(BaseExtractor):
@@ -24,6 +70,9 @@ class YouTubeExtractor(BaseExtractor):
         caption_type: str = "auto",
         include_playlist: bool = False,
         languages: list[str] | None = None,
+        concurrency: int = 4,
+        min_interval: float = 0.5,
+        cache_dir: str | Path | None = None,
     ):
         """Initialize YouTube extractor.
 
@@ -31,10 +80,16 @@ class YouTubeExtractor(BaseExtractor):
             caption_type: Caption preference (auto, manual)
             include_playlist: Process entire playlist if URL is playlist
             languages: Preferred languages for transcripts
+            concurrency: Videos processed at once for playlists and channels
+            min_interval: Minimum seconds between requests to YouTube
+            cache_dir: Directory for the metadata/transcript cache (None disables it)
         """
         self.caption_type = caption_type
         self.include_playlist = include_playlist
         self.languages = languages or ["en"]
+        self.concurrency = max(1, concurrency)
+        self.pacer = HostPacer(min_interval)
+        self.cache = VideoCache(cache_dir) if cache_dir is not None else None
 
     async def extract(self, source: str | Path) -> ExtractionResult:
         """Extract content from a YouTube video.
@@ -47,6 +102,9 @@ class YouTubeExtractor(BaseExtractor):
         """
         url = str(source)
 
+        if self.include_playlist and self.is_collection(url):
+            return await self._extract_collection(url)
+
         # Extract video ID
         video_id = self._extract_video_id(url)
         if not video_id:
@@ -77,19 +135,93 @@ class YouTubeExtractor(BaseExtractor):
             metadata=metadata,
         )
 
-    async def extract_playlist(self, source: str | Path) -> list[ExtractionResult]:
-        """Extract content from all videos in a playlist.
+    async def extract_playlist(
+        self,
+        source: str | Path,
+        skip_ids: set[str] | None = None,
+    ) -> list[ExtractionResult]:
+        """Extract content from all videos in a playlist or channel.
 
         Args:
-            source: YouTube playlist URL
+            source: YouTube playlist or channel URL
+            skip_ids: Video IDs already ingested (not fetched or returned)
 
         Returns:
-            List of extraction results for each video
+            List of extraction results for each video, in playlist order
         """
-        import yt_dlp
+        _, video_ids = await self._list_videos(str(source))
+        return await self.extract_videos(video_ids, skip_ids)
 
-        url = str(source)
-        results: list[ExtractionResult] = []
+    async def extract_videos(
+        self,
+        video_ids: list[str],
+        skip_ids: set[str] | None = None,
+    ) -> list[ExtractionResult]:
+        """Extract many videos concurrently.
+
+        Args:
+            video_ids: YouTube video IDs
+            skip_ids: Video IDs to leave out
+
+        Returns:
+            List of extraction results, in the order of ``video_ids``
+        """
+        skip_ids = skip_ids or set()
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def extract_one(video_id: str) -> ExtractionResult:
+            async with slots:
+                return await self.extract(f"https://{YOUTUBE_HOST}/watch?v={video_id}")
+
+        return list(await asyncio.gather(
+            *(extract_one(video_id) for video_id in video_ids if video_id not in skip_ids)
+        ))
+
+    async def _extract_collection(self, url: str) -> ExtractionResult:
+        """Extract a playlist or channel into a single result."""
+        title, video_ids = await self._list_videos(url)
+        cached = sum(
+            1 for video_id in video_ids
+            if self.cache is not None and self.cache.has(video_id, self._variant)
+        )
+        results = await self.extract_videos(video_ids)
+
+        lines = [f"# {title}", "", f"**Videos:** {len(results)}", f"**URL:** {url}", "", "---", ""]
+        for result in results:
+            lines.extend([result.markdown, "", "---", ""])
+
+        return ExtractionResult(
+            markdown="\n".join(lines),
+            title=title,
+            source=url,
+            media_type=MediaType.YOUTUBE,
+            images=[],
+            metadata={
+                "playlist_title": title,
+                "video_ids": video_ids,
+                "videos_total": len(results),
+                "videos_cached": cached,
+                "videos_failed": sum(1 for r in results if "error" in r.metadata),
+            },
+        )
+
+    async def _list_videos(self, url: str) -> tuple[str, list[str]]:
+        """List the videos of a playlist or channel without fetching them.
+
+        Returns:
+            Tuple of (playlist title, video IDs in playlist order)
+        """
+        # A bare channel URL lists its tabs, not its videos
+        match = _CHANNEL_RE.search(url)
+        if match and not match.group("tab"):
+            parsed = urlparse(url)
+            url = parsed._replace(path=parsed.path.rstrip("/") + "/videos").geturl()
+
+        await self.pacer.wait(YOUTUBE_HOST)
+        return await asyncio.to_thread(self._list_videos_sync, url)
+
+    def _list_videos_sync(self, url: str) -> tuple[str, list[str]]:
+        import yt_dlp
 
         ydl_opts: dict[str, Any] = {
             "quiet": True,
@@ -101,17 +233,20 @@ class YouTubeExtractor(BaseExtractor):
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
 
-            if not info:
-                return results
+        if not info:
+            return url, []
 
-            entries = info.get("entries", [])
-            for entry in entries:
-                if entry and entry.get("id"):
-                    video_url = f"https://www.youtube.com/watch?v={entry['id']}"
-                    result = await self.extract(video_url)
-                    results.append(result)
+        video_ids: list[str] = []
+        seen: set[str] = set()
+        for entry in info.get("entries") or []:
+            if entry and entry.get("id") and entry["id"] not in seen:
+                seen.add(entry["id"])
+                video_ids.append(entry["id"])
+        return info.get("title") or url, video_ids
 
-        return results
+    @property
+    def _variant(self) -> str:
+        return VideoCache.variant(self.caption_type, self.languages)
 
     async def _get_metadata(self, video_id: str) -> dict:
         """Get video metadata using yt-dlp.
@@ -122,6 +257,18 @@ class YouTubeExtractor(BaseExtractor):
         Returns:
             Metadata dictionary
         """
+        if self.cache is not None:
+            cached = self.cache.get_metadata(video_id)
+            if cached is not None:
+                return cached
+
+        await self.pacer.wait(YOUTUBE_HOST)
+        metadata = await asyncio.to_thread(self._fetch_metadata, video_id)
+        if self.cache is not None:
+            self.cache.put_metadata(video_id, metadata)
+        return metadata
+
+    def _fetch_metadata(self, video_id: str) -> dict:
         import yt_dlp
 
         url = f"https://www.youtube.com/watch?v={video_id}"
@@ -165,6 +312,18 @@ class YouTubeExtractor(BaseExtractor):
         Returns:
             Transcript text
         """
+        if self.cache is not None:
+            cached = self.cache.get_transcript(video_id, self._variant)
+            if cached is not None:
+                return cached
+
+        await self.pacer.wait(YOUTUBE_HOST)
+        transcript = await asyncio.to_thread(self._fetch_transcript, video_id)
+        if self.cache is not None:
+            self.cache.put_transcript(video_id, self._variant, transcript)
+        return transcript
+
+    def _fetch_transcript(self, video_id: str) -> str:
         from youtube_transcript_api import YouTubeTranscriptApi
         from youtube_transcript_api._errors import (
             NoTranscriptFound,
@@ -336,4 +495,18 @@ class YouTubeExtractor(BaseExtractor):
             r"youtube\.com/playlist",
         ]
 
-        return any(re.search(pattern, source_str) for pattern in youtube_patterns)
+        return (
+            any(re.search(pattern, source_str) for pattern in youtube_patterns)
+            or _CHANNEL_RE.search(source_str) is not None
+        )
+
+    def is_collection(self, url: str) -> bool:
+        """Check if a URL names a playlist or channel rather than one video.
+
+        Args:
+            url: YouTube URL
+
+        Returns:
+            True for playlist and channel URLs
+        """
+        return "youtube.com/playlist" in url or _CHANNEL_RE.search(url) is not None
@@ -1,5 +1,5 @@
 """Quality filters for ingestor."""
 
-from .universal_filter import UniversalFilter, FilterResult
+from .universal_filter import UniversalFilter, FilterResult, FilterReport
 
-__all__ = ["UniversalFilter", "FilterResult"]
+__all__ = ["UniversalFilter", "FilterResult", "FilterReport"]
@@ -0,0 +1,98 @@
+"""Persistent per-file metrics cache for the universal filter.
+
+Metrics are stored by content hash, and an index maps each file (relative
+path, size, mtime) to the hash it had when last analyzed. Unchanged files are
+therefore evaluated against new thresholds without being read again.
+
+Layout (one JSON file per filtered directory)::
+
+    {
+      "files":   {"page/index.md": {"size": 1234, "mtime_ns": ..., "hash": "ab12..."}},
+      "metrics": {"ab12...": {"line_count": 42, "word_count": 512, ...}}
+    }
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ..core.cache import content_hash
+
+
+class MetricsCache:
+    """On-disk cache of document metrics for one directory."""
+
+    def __init__(self, cache_dir: str | Path, directory: Path):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cache files in
+            directory: Directory being filtered (selects the cache file)
+        """
+        self.directory = directory.resolve()
+        self.path = Path(cache_dir) / f"{content_hash(str(self.directory))[:16]}.json"
+        self._files: dict[str, dict[str, Any]] = {}
+        self._metrics: dict[str, dict[str, Any]] = {}
+        self._seen: set[str] = set()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._files = dict(data.get("files", {}))
+            self._metrics = dict(data.get("metrics", {}))
+        except (OSError, ValueError, AttributeError):
+            self._files, self._metrics = {}, {}
+
+    def _key(self, path: Path) -> str:
+        return os.path.relpath(path.resolve(), self.directory)
+
+    def lookup(self, path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+        """Return cached metrics if the file is unchanged since it was analyzed.
+
+        Args:
+            path: File being filtered
+            stat: Current ``os.stat`` result of the file
+
+        Returns:
+            Metrics dict, or None if the file is new or modified
+        """
+        key = self._key(path)
+        self._seen.add(key)
+        entry = self._files.get(key)
+        if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+            digest = entry.get("hash")
+            if isinstance(digest, str):
+                return self._metrics.get(digest)
+        return None
+
+    def store(self, path: Path, size: int, mtime_ns: int, digest: str, metrics: dict[str, Any]) -> None:
+        """Record freshly computed metrics for a file.
+
+        Args:
+            path: File that was analyzed
+            size: File size at analysis time
+            mtime_ns: Modification time at analysis time
+            digest: Content hash of the file
+            metrics: Computed metrics
+        """
+        key = self._key(path)
+        self._seen.add(key)
+        self._files[key] = {"size": size, "mtime_ns": mtime_ns, "hash": digest}
+        self._metrics[digest] = metrics
+
+    def save(self) -> None:
+        """Write the cache, dropping files that no longer exist."""
+        files = {k: v for k, v in self._files.items() if k in self._seen}
+        hashes = {v["hash"] for v in files.values()}
+        data = {
+            "files": files,
+            "metrics": {h: m for h, m in self._metrics.items() if h in hashes},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.path)
@@ -9,11 +9,98 @@ TIER 3: Structure analysis (TOC detection) - OPTIONAL
 Universal across all websites/topics/languages.
 """
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 from dataclasses import dataclass
 
+from ..core.cache import content_hash
+from .metrics_cache import MetricsCache
+
+# Precompiled patterns shared by the analysis passes
+LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+IMAGE_RE = re.compile(r'!\[([^\]]*)\]\([^\)]+\)')
+LINK_TARGET_RE = re.compile(r'\]\([^\)]+\)')
+NON_PARAGRAPH_RE = re.compile(r'^\s*[-*+#]')
+LIST_LINE_RE = re.compile(r'^\s*[-*+]\s+')
+
+# Below this many files to analyze, a process pool costs more than it saves
+MIN_PARALLEL_FILES = 64
+
+
+def compute_metrics(content: str) -> Dict[str, Any]:
+    """
+    Compute every metric the filter tiers need, in one place.
+
+    Metrics do not depend on thresholds, so they can be cached and
+    re-evaluated when thresholds change.
+
+    Args:
+        content: Markdown content
+
+    Returns:
+        Dict with TIER 2 metrics (line/word/link counts, link ratio) and
+        TIER 3 structure metrics (link line %, link word %, paragraphs, list %)
+    """
+    lines = [l for l in content.split('\n') if l.strip()]
+    total_lines = len(lines)
+
+    # TIER 2: replace [text](url) with text, then drop images
+    text_only = LINK_RE.sub(r'\1', content)
+    text_only = IMAGE_RE.sub('', text_only)
+    word_count = len(text_only.split())
+    link_count = len(LINK_TARGET_RE.findall(content))
+
+    # TIER 3: structure
+    lines_with_links = sum(1 for l in lines if '](' in l)
+    link_text = ' '.join(LINK_RE.findall(content))
+    link_words = len(link_text.split())
+    content_words = len(LINK_RE.sub('', content).split())
+
+    paragraph_count = 0
+    in_paragraph = False
+    list_lines = 0
+    for line in lines:
+        if LIST_LINE_RE.match(line):
+            list_lines += 1
+        if NON_PARAGRAPH_RE.match(line) or '|' in line:
+            in_paragraph = False
+        elif not in_paragraph:
+            paragraph_count += 1
+            in_paragraph = True
+
+    return {
+        "line_count": total_lines,
+        "word_count": word_count,
+        "link_count": link_count,
+        "link_ratio": link_count / max(word_count, 1),
+        "lines_with_links_pct": lines_with_links / total_lines if total_lines else 0.0,
+        "link_words_pct": link_words / max(link_words + content_words, 1),
+        "paragraph_count": paragraph_count,
+        "list_lines_pct": list_lines / total_lines if total_lines else 0.0,
+    }
+
+
+def _analyze_path(path: str) -> Tuple[str, int, int, str, Dict[str, Any] | None, str | None]:
+    """
+    Read and analyze one file (runs in a worker process).
+
+    Returns:
+        (path, size, mtime_ns, content_hash, metrics, error)
+    """
+    try:
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+    except Exception as e:
+        return path, 0, 0, "", None, str(e)
+
+    # Match read_text(errors='ignore'), including universal newlines
+    content = data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+    return path, stat.st_size, stat.st_mtime_ns, content_hash(data), compute_metrics(content), None
+
 
 @dataclass
 class FilterResult:
@@ -104,11 +191,13 @@ class UniversalFilter:
 
     def __init__(
         self,
-        min_lines: int = None,
-        min_words: int = None,
-        max_link_ratio: float = None,
-        dense_content_words: int = None,
+        min_lines: int | None = None,
+        min_words: int | None = None,
+        max_link_ratio: float | None = None,
+        dense_content_words: int | None = None,
         detect_toc: bool = False,
+        workers: int | None = None,
+        cache_dir: Path | None = None,
     ):
         """
         Initialize filter with configurable thresholds.
@@ -119,12 +208,23 @@ class UniversalFilter:
             max_link_ratio: Maximum link ratio (default: 0.6)
             dense_content_words: Word count to bypass line check (default: 300)
             detect_toc: Enable TIER 3 TOC detection (default: False)
+            workers: Processes used to analyze files (default: CPU count)
+            cache_dir: Directory for the per-file metrics cache (default: no cache)
         """
         self.min_lines = min_lines if min_lines is not None else self.MIN_LINES
         self.min_words = min_words if min_words is not None else self.MIN_WORDS
         self.max_link_ratio = max_link_ratio if max_link_ratio is not None else self.MAX_LINK_RATIO
         self.dense_content_words = dense_content_words if dense_content_words is not None else self.DENSE_CONTENT_WORDS
         self.detect_toc = detect_toc
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.cache_dir = cache_dir
+        self._filename_res = [
+            (pattern, re.compile(pattern, re.IGNORECASE)) for pattern in self.REMOVE_FILENAME_PATTERNS
+        ]
+
+        # Counters for the last directory run
+        self.cache_hits = 0
+        self.analyzed = 0
 
     def check_filename_patterns(self, filename: str) -> Tuple[bool, str]:
         """
@@ -138,8 +238,8 @@ class UniversalFilter:
         """
         filename_lower = filename.lower()
 
-        for pattern in self.REMOVE_FILENAME_PATTERNS:
-            if re.search(pattern, filename_lower, re.IGNORECASE):
+        for pattern, regex in self._filename_res:
+            if regex.search(filename_lower):
                 return (False, f"Filename pattern: {pattern}")
 
         return (True, "Filename OK")
@@ -154,27 +254,13 @@ class UniversalFilter:
         Returns:
             (line_count, word_count, link_count, link_ratio)
         """
-        # Count non-empty lines
-        lines = [l for l in content.split('\n') if l.strip()]
-        line_count = len(lines)
-
-        # Strip markdown links for word counting
-        # Replace [text](url) with text
-        text_only = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', content)
-        # Remove images
-        text_only = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', '', text_only)
-
-        words = text_only.split()
-        word_count = len(words)
-
-        # Count links
-        link_matches = re.findall(r'\]\([^\)]+\)', content)
-        link_count = len(link_matches)
-
-        # Calculate link ratio
-        link_ratio = link_count / max(word_count, 1)
-
-        return line_count, word_count, link_count, link_ratio
+        metrics = compute_metrics(content)
+        return (
+            metrics["line_count"],
+            metrics["word_count"],
+            metrics["link_count"],
+            metrics["link_ratio"],
+        )
 
     def check_content_quality(
         self,
@@ -234,45 +320,28 @@ class UniversalFilter:
         if not self.detect_toc:
             return (True, "TOC detection disabled")
 
-        lines = content.split('\n')
-        lines = [l for l in lines if l.strip()]
-        total_lines = len(lines)
+        return self.check_toc_metrics(compute_metrics(content))
+
+    def check_toc_metrics(self, metrics: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Apply the TIER 3 TOC heuristics to precomputed structure metrics.
+
+        Args:
+            metrics: Metrics from compute_metrics()
+
+        Returns:
+            (should_keep, reason) - False if should be removed as TOC
+        """
+        if not self.detect_toc:
+            return (True, "TOC detection disabled")
 
-        if total_lines == 0:
+        if metrics["line_count"] == 0:
             return (True, "Empty file")
 
-        # Count lines with links
-        lines_with_links = len([l for l in lines if '](' in l])
-        lines_with_links_pct = lines_with_links / total_lines
-
-        # Count link words vs content words
-        links = re.findall(r'\[([^\]]+)\]\([^\)]+\)', content)
-        link_text = ' '.join([match for match in links])
-        link_words = len(link_text.split())
-
-        content_no_links = re.sub(r'\[([^\]]+)\]\([^\)]+\)', '', content)
-        content_words = len(content_no_links.split())
-
-        total_words = link_words + content_words
-        link_words_pct = link_words / max(total_words, 1)
-
-        # Count paragraphs (substantial text blocks, not lists/headers)
-        paragraph_count = 0
-        in_paragraph = False
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                in_paragraph = False
-            elif re.match(r'^\s*[-*+#]', line) or '|' in line:
-                in_paragraph = False
-            else:
-                if not in_paragraph:
-                    paragraph_count += 1
-                    in_paragraph = True
-
-        # Count list lines
-        list_lines = len([l for l in lines if re.match(r'^\s*[-*+]\s+', l)])
-        list_lines_pct = list_lines / total_lines
+        lines_with_links_pct = metrics["lines_with_links_pct"]
+        link_words_pct = metrics["link_words_pct"]
+        paragraph_count = metrics["paragraph_count"]
+        list_lines_pct = metrics["list_lines_pct"]
 
         # Apply heuristics
 
@@ -327,9 +396,26 @@ class UniversalFilter:
                 reason=f"[ERROR] Cannot read file: {e}",
             )
 
-        # TIER 2: Analyze content
-        line_count, word_count, link_count, link_ratio = self.analyze_content(content)
+        return self.evaluate(filepath, compute_metrics(content))
+
+    def evaluate(self, filepath: Path, metrics: Dict[str, Any]) -> FilterResult:
+        """
+        Apply TIER 2 and TIER 3 thresholds to precomputed metrics.
+
+        Args:
+            filepath: Path the metrics belong to
+            metrics: Metrics from compute_metrics()
+
+        Returns:
+            FilterResult with decision and metrics
+        """
+        filename = filepath.name
+        line_count = metrics["line_count"]
+        word_count = metrics["word_count"]
+        link_count = metrics["link_count"]
+        link_ratio = metrics["link_ratio"]
 
+        # TIER 2: Content quality
         keep2, reason2 = self.check_content_quality(line_count, word_count, link_ratio)
         if not keep2:
             return FilterResult(
@@ -344,7 +430,7 @@ class UniversalFilter:
             )
 
         # TIER 3: Check TOC structure (if enabled)
-        keep3, reason3 = self.check_toc_structure(content)
+        keep3, reason3 = self.check_toc_metrics(metrics)
         if not keep3:
             return FilterResult(
                 filepath=str(filepath),
@@ -369,6 +455,83 @@ class UniversalFilter:
             link_ratio=link_ratio,
         )
 
+    def iter_directory(
+        self,
+        directory: Path,
+        pattern: str = "*.md",
+    ) -> Iterator[FilterResult]:
+        """
+        Filter all markdown files in a directory, yielding results as they are ready.
+
+        Files whose metrics are cached (same path, size and mtime) are
+        evaluated without being read; the rest are read and analyzed in a
+        process pool. Only thresholds are applied in this process, so
+        changing them never requires re-reading unchanged files.
+
+        Args:
+            directory: Directory to scan
+            pattern: File pattern (default: *.md)
+
+        Yields:
+            FilterResult for every matching file
+        """
+        cache = MetricsCache(self.cache_dir, directory) if self.cache_dir else None
+        self.cache_hits = 0
+        self.analyzed = 0
+        pending: List[Path] = []
+
+        try:
+            for filepath in directory.rglob(pattern):
+                if not filepath.is_file():
+                    continue
+
+                # TIER 1 needs no content
+                keep1, reason1 = self.check_filename_patterns(filepath.name)
+                if not keep1:
+                    yield FilterResult(
+                        filepath=str(filepath),
+                        filename=filepath.name,
+                        keep=False,
+                        reason=f"[TIER1] {reason1}",
+                    )
+                    continue
+
+                metrics = cache.lookup(filepath, filepath.stat()) if cache else None
+                if metrics is not None:
+                    self.cache_hits += 1
+                    yield self.evaluate(filepath, metrics)
+                else:
+                    pending.append(filepath)
+
+            for path, size, mtime_ns, digest, metrics, error in self._analyze(pending):
+                filepath = Path(path)
+                self.analyzed += 1
+                if error is not None:
+                    yield FilterResult(
+                        filepath=path,
+                        filename=filepath.name,
+                        keep=False,
+                        reason=f"[ERROR] Cannot read file: {error}",
+                    )
+                    continue
+                if cache:
+                    cache.store(filepath, size, mtime_ns, digest, metrics)
+                yield self.evaluate(filepath, metrics)
+        finally:
+            if cache:
+                cache.save()
+
+    def _analyze(self, paths: List[Path]) -> Iterable[tuple]:
+        """Analyze files in order, in a process pool when there are enough of them."""
+        names = [str(p) for p in paths]
+        if self.workers <= 1 or len(names) < MIN_PARALLEL_FILES:
+            yield from map(_analyze_path, names)
+            return
+
+        chunksize = max(1, min(256, len(names) // (self.workers * 4)))
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            yield from pool.map(_analyze_path, names, chunksize=chunksize)
+
     def filter_directory(
         self,
         directory: Path,
@@ -384,14 +547,7 @@ class UniversalFilter:
         Returns:
             Dict mapping filepath to FilterResult
         """
-        results = {}
-
-        for filepath in directory.rglob(pattern):
-            if filepath.is_file():
-                result = self.filter_file(filepath)
-                results[str(filepath)] = result
-
-        return results
+        return {result.filepath: result for result in self.iter_directory(directory, pattern)}
 
     def generate_report(self, results: Dict[str, FilterResult]) -> str:
         """
@@ -403,31 +559,75 @@ class UniversalFilter:
         Returns:
             Formatted report string
         """
-        total = len(results)
-        kept = sum(1 for r in results.values() if r.keep)
-        removed = total - kept
+        report = FilterReport()
+        for result in results.values():
+            report.add(result)
+        return report.render()
+
+
+class FilterReport:
+    """Filter report aggregated incrementally, one result at a time."""
+
+    def __init__(self):
+        self.total = 0
+        self.kept = 0
+        self.reason_counts: Dict[str, int] = {}
 
+        # Sums over results that have metrics
+        self._with_metrics = 0
+        self._lines = 0
+        self._words = 0
+        self._links = 0
+        self._link_ratio = 0.0
+
+    @property
+    def removed(self) -> int:
+        """Number of files marked for removal."""
+        return self.total - self.kept
+
+    def add(self, result: FilterResult) -> None:
+        """
+        Account for one filter result.
+
+        Args:
+            result: Result to add
+        """
+        self.total += 1
+        if result.keep:
+            self.kept += 1
+        else:
+            # Extract the tier and basic reason
+            reason = result.reason.split(':')[0] if ':' in result.reason else result.reason
+            self.reason_counts[reason] = self.reason_counts.get(reason, 0) + 1
+
+        if result.line_count > 0:
+            self._with_metrics += 1
+            self._lines += result.line_count
+            self._words += result.word_count
+            self._links += result.link_count
+            self._link_ratio += result.link_ratio
+
+    def render(self) -> str:
+        """
+        Render the report.
+
+        Returns:
+            Formatted report string
+        """
+        total = max(self.total, 1)
         lines = [
             "=" * 80,
             "Universal Filter Report - Basic Quality Check",
             "=" * 80,
-            f"Total files: {total}",
-            f"Kept: {kept} ({kept/total*100:.1f}%)",
-            f"Removed: {removed} ({removed/total*100:.1f}%)",
+            f"Total files: {self.total}",
+            f"Kept: {self.kept} ({self.kept/total*100:.1f}%)",
+            f"Removed: {self.removed} ({self.removed/total*100:.1f}%)",
             "",
             "Removal breakdown by reason:",
             "-" * 80,
         ]
 
-        # Count reasons
-        reason_counts: Dict[str, int] = {}
-        for result in results.values():
-            if not result.keep:
-                # Extract the tier and basic reason
-                reason = result.reason.split(':')[0] if ':' in result.reason else result.reason
-                reason_counts[reason] = reason_counts.get(reason, 0) + 1
-
-        for reason, count in sorted(reason_counts.items(), key=lambda x: x[1], reverse=True):
+        for reason, count in sorted(self.reason_counts.items(), key=lambda x: x[1], reverse=True):
             lines.append(f"  {reason}: {count} files")
 
         # Statistics
@@ -437,20 +637,13 @@ class UniversalFilter:
             "-" * 80,
         ])
 
-        all_results = list(results.values())
-        results_with_metrics = [r for r in all_results if r.line_count > 0]
-
-        if results_with_metrics:
-            avg_lines = sum(r.line_count for r in results_with_metrics) / len(results_with_metrics)
-            avg_words = sum(r.word_count for r in results_with_metrics) / len(results_with_metrics)
-            avg_links = sum(r.link_count for r in results_with_metrics) / len(results_with_metrics)
-            avg_link_ratio = sum(r.link_ratio for r in results_with_metrics) / len(results_with_metrics)
-
+        if self._with_metrics:
+            n = self._with_metrics
             lines.extend([
-                f"  Average lines: {avg_lines:.1f}",
-                f"  Average words: {avg_words:.1f}",
-                f"  Average links: {avg_links:.1f}",
-                f"  Average link ratio: {avg_link_ratio:.1%}",
+                f"  Average lines: {self._lines / n:.1f}",
+                f"  Average words: {self._words / n:.1f}",
+                f"  Average links: {self._links / n:.1f}",
+                f"  Average link ratio: {self._link_ratio / n:.1%}",
             ])
 
         lines.append("=" * 80)
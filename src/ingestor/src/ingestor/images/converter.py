@@ -7,6 +7,39 @@ from PIL.Image import Image as PILImage
 
 from ..types import ExtractedImage
 
+# Leading bytes identifying each format
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpeg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"BM", "bmp"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+)
+
+
+def sniff_format(data: bytes) -> str | None:
+    """Identify an image format from its leading bytes.
+
+    Args:
+        data: Encoded image bytes
+
+    Returns:
+        Normalized format name (``jpeg``, not ``jpg``), or None if unknown
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    for signature, fmt in _SIGNATURES:
+        if data.startswith(signature):
+            return fmt
+    return None
+
+
+def convert_image(target_format: str, image: ExtractedImage) -> ExtractedImage:
+    """Convert one image (a picklable entry point for process pools)."""
+    return ImageConverter(target_format).convert(image)
+
 
 class ImageConverter:
     """Convert images to a target format (default: PNG).
@@ -52,6 +85,10 @@ class ImageConverter:
         if source_format == self.target_format:
             return image
 
+        # Mislabeled but already encoded as the target: relabel, don't re-encode
+        if sniff_format(image.data) == self.target_format:
+            return self._relabel(image, image.data)
+
         # Load image
         img: PILImage = Image.open(BytesIO(image.data))
 
@@ -90,14 +127,17 @@ class ImageConverter:
 
         img.save(output, format=pil_format, **save_kwargs)
 
-        # Create new filename with correct extension
+        return self._relabel(image, output.getvalue())
+
+    def _relabel(self, image: ExtractedImage, data: bytes) -> ExtractedImage:
+        """Return the image with new data under the target format and extension."""
         ext = "jpg" if self.target_format == "jpeg" else self.target_format
         base_name = image.filename.rsplit(".", 1)[0] if "." in image.filename else image.filename
         new_filename = f"{base_name}.{ext}"
 
         return ExtractedImage(
             filename=new_filename,
-            data=output.getvalue(),
+            data=data,
             format=self.target_format,
             page=image.page,
             caption=image.caption,
@@ -128,4 +168,4 @@ class ImageConverter:
         source_format = image.format.lower()
         if source_format == "jpg":
             source_format = "jpeg"
-        return source_format != self.target_format
+        return source_format not in (self.target_format, "svg")
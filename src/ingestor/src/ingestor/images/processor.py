@@ -1,10 +1,18 @@
 """Unified image processing pipeline."""
 
+import asyncio
+import contextlib
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from ..types import ExtractedImage, IngestConfig
-from .converter import ImageConverter
+from .converter import ImageConverter, convert_image
+
+# Fewer conversions than this run in a thread (not worth waking the pool)
+MIN_PARALLEL_IMAGES = 4
 
 
 class ImageProcessor:
@@ -14,6 +22,11 @@ class ImageProcessor:
     - Format conversion (to PNG by default)
     - Naming standardization
     - Optional VLM description generation
+
+    Conversion (decode and re-encode) is CPU-bound, so it never runs on the
+    event loop: small batches go to a thread, larger ones to a process pool
+    of ``config.image_workers`` processes. Images already in the target
+    format are not converted at all.
     """
 
     def __init__(self, config: IngestConfig | None = None):
@@ -32,6 +45,22 @@ class ImageProcessor:
 
         # VLM describer (lazy loaded)
         self._vlm_describer: Any = None
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the conversion process pool."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.config.image_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the conversion worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
 
     @property
     def vlm_describer(self) -> Any:
@@ -39,9 +68,12 @@ class ImageProcessor:
         if self._vlm_describer is None and self.config.describe_images:
             try:
                 from ..ai.ollama.vlm import VLMDescriber
+                from ..core.cache import default_cache_dir
                 self._vlm_describer = VLMDescriber(
                     host=self.config.ollama_host,
                     model=self.config.vlm_model,
+                    concurrency=self.config.vlm_concurrency,
+                    cache_dir=default_cache_dir("vlm") if self.config.vlm_cache else None,
                 )
             except ImportError:
                 pass
@@ -51,49 +83,68 @@ class ImageProcessor:
         self,
         images: list[ExtractedImage],
         source_name: str = "document",
+        timings: dict[str, float] | None = None,
     ) -> list[ExtractedImage]:
         """Process a list of images through the pipeline.
 
         Args:
             images: Images to process
             source_name: Name of the source document (for naming)
+            timings: If given, filled with the seconds spent converting
+                (``convert``) and describing (``describe``) images
 
         Returns:
             Processed images
         """
-        processed = []
-
-        for i, image in enumerate(images, 1):
-            # Standardize filename
-            processed_image = self._standardize_filename(image, source_name, i)
-
-            # Convert format if needed
-            if self.converter is not None:
-                processed_image = self.converter.convert(processed_image)
-
-            # Generate VLM description if enabled
-            if self.config.describe_images and self.vlm_describer is not None:
-                try:
-                    description = await self.vlm_describer.describe(
-                        processed_image,
-                        context=processed_image.context or "",
-                    )
-                    processed_image = ExtractedImage(
-                        filename=processed_image.filename,
-                        data=processed_image.data,
-                        format=processed_image.format,
-                        page=processed_image.page,
-                        caption=processed_image.caption,
-                        context=processed_image.context,
-                        description=description,
-                    )
-                except Exception:
-                    pass  # Skip VLM if it fails
-
-            processed.append(processed_image)
+        # Standardize filenames
+        processed = [
+            self._standardize_filename(image, source_name, i)
+            for i, image in enumerate(images, 1)
+        ]
+
+        # Convert formats if needed
+        start = time.perf_counter()
+        if self.converter is not None:
+            processed = await self._convert(self.converter, processed)
+        if timings is not None:
+            timings["convert"] = time.perf_counter() - start
+
+        # Generate VLM descriptions if enabled (concurrent, deduplicated)
+        if self.config.describe_images and self.vlm_describer is not None:
+            start = time.perf_counter()
+            with contextlib.suppress(Exception):  # Skip VLM if it fails
+                await self.vlm_describer.describe_batch(processed)
+            if timings is not None:
+                timings["describe"] = time.perf_counter() - start
 
         return processed
 
+    async def _convert(
+        self,
+        converter: ImageConverter,
+        images: list[ExtractedImage],
+    ) -> list[ExtractedImage]:
+        """Convert the images that need it, off the event loop."""
+        pending = [i for i, image in enumerate(images) if converter.should_convert(image)]
+        if not pending:
+            return images
+
+        converted = list(images)
+        if len(pending) < MIN_PARALLEL_IMAGES or self.config.image_workers <= 1:
+            results = await asyncio.to_thread(
+                converter.convert_all, [images[i] for i in pending]
+            )
+        else:
+            loop = asyncio.get_running_loop()
+            pool = self._get_pool()
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, convert_image, converter.target_format, images[i])
+                for i in pending
+            ))
+        for i, image in zip(pending, results, strict=True):
+            converted[i] = image
+        return converted
+
     def _standardize_filename(
         self,
         image: ExtractedImage,
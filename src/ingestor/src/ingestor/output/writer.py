@@ -1,14 +1,33 @@
 """Output writer for extraction results."""
 
+import asyncio
 import json
 import re
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from pathlib import Path
+from typing import TypeVar
 
 import aiofiles
 
 from ..images.processor import ImageProcessor
 from ..types import ExtractionResult, IngestConfig
 
+# Files written at once
+WRITE_CONCURRENCY = 16
+
+T = TypeVar("T")
+
+
+async def _aiter(items: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """Iterate a sync or async iterable (streams read from disk are async)."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
 
 class OutputWriter:
     """Write extraction results to disk.
@@ -21,6 +40,9 @@ class OutputWriter:
     │   │   ├── document_name_img_001.png
     │   │   └── ...
     │   └── metadata.json (optional)
+
+    Images and markdown are written concurrently, and the time spent in
+    each stage is recorded in ``result.timings`` (and ``metadata.json``).
     """
 
     def __init__(self, config: IngestConfig | None = None):
@@ -32,6 +54,10 @@ class OutputWriter:
         self.config = config or IngestConfig()
         self.image_processor = ImageProcessor(config)
 
+    def close(self) -> None:
+        """Shut down the image conversion worker processes."""
+        self.image_processor.close()
+
     async def write(self, result: ExtractionResult) -> Path:
         """Write an extraction result to disk.
 
@@ -41,33 +67,19 @@ class OutputWriter:
         Returns:
             Path to the output directory
         """
-        # Determine output directory name
-        if result.source:
-            name = self._clean_name(result.source)
-        elif result.title:
-            name = self._clean_name(result.title)
-        else:
-            name = "output"
-
+        name = self._output_name(result)
         output_dir = self.config.output_dir / name
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Process and write images
+        # Process images
         original_images = result.images.copy() if result.images else []
         if result.has_images:
-            img_dir = output_dir / "img"
-            img_dir.mkdir(exist_ok=True)
-
             processed_images = await self.image_processor.process(
                 result.images,
                 source_name=name,
+                timings=result.timings,
             )
 
-            for image in processed_images:
-                img_path = img_dir / image.filename
-                async with aiofiles.open(img_path, "wb") as f:
-                    await f.write(image.data)
-
             # Update result with processed images for metadata
             result.images = processed_images
 
@@ -76,23 +88,32 @@ class OutputWriter:
                 result.markdown, original_images, processed_images
             )
 
-        # Write markdown
-        md_path = output_dir / f"{name}.md"
-        async with aiofiles.open(md_path, "w", encoding="utf-8") as f:
-            await f.write(result.markdown)
+        # Write images and markdown concurrently
+        start = time.perf_counter()
+        slots = asyncio.Semaphore(WRITE_CONCURRENCY)
+        writes = [self._write_file(output_dir / f"{name}.md", result.markdown, slots)]
+        if result.has_images:
+            img_dir = output_dir / "img"
+            img_dir.mkdir(exist_ok=True)
+            writes.extend(
+                self._write_file(img_dir / image.filename, image.data, slots)
+                for image in result.images
+            )
+        await asyncio.gather(*writes)
 
         # Write source files if present (for code chunking by processor)
         if result.source_files:
             source_dir = output_dir / "source"
             source_dir.mkdir(exist_ok=True)
 
-            for source_file in result.source_files:
+            async for source_file in _aiter(result.source_files):
                 # Create subdirectories as needed
                 file_path = source_dir / source_file.path
                 file_path.parent.mkdir(parents=True, exist_ok=True)
 
                 async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
                     await f.write(source_file.content)
+        result.timings["write"] = time.perf_counter() - start
 
         # Write metadata if enabled
         if self.config.generate_metadata:
@@ -100,6 +121,36 @@ class OutputWriter:
 
         return output_dir
 
+    async def _write_file(self, path: Path, data: str | bytes, slots: asyncio.Semaphore) -> None:
+        """Write one file, bounded by the shared write slots."""
+        async with slots:
+            if isinstance(data, bytes):
+                async with aiofiles.open(path, "wb") as f:
+                    await f.write(data)
+            else:
+                async with aiofiles.open(path, "w", encoding="utf-8") as f:
+                    await f.write(data)
+
+    def markdown_path(self, result: ExtractionResult) -> Path:
+        """Return the path the markdown for a result is (or would be) written to.
+
+        Args:
+            result: Extraction result
+
+        Returns:
+            Path to the markdown file inside the result's output directory
+        """
+        name = self._output_name(result)
+        return self.config.output_dir / name / f"{name}.md"
+
+    def _output_name(self, result: ExtractionResult) -> str:
+        """Determine the output directory name for a result."""
+        if result.source:
+            return self._clean_name(result.source)
+        if result.title:
+            return self._clean_name(result.title)
+        return "output"
+
     async def _write_metadata(self, result: ExtractionResult, path: Path) -> None:
         """Write metadata JSON file.
 
@@ -126,6 +177,10 @@ class OutputWriter:
             ],
             **result.metadata,
         }
+        if result.timings:
+            metadata["timings"] = {
+                stage: round(seconds, 3) for stage, seconds in result.timings.items()
+            }
 
         async with aiofiles.open(path, "w", encoding="utf-8") as f:
             await f.write(json.dumps(metadata, indent=2, ensure_ascii=False))
@@ -189,7 +244,7 @@ class OutputWriter:
 
         # Build mapping from old filename to new filename
         filename_map = {}
-        for orig, proc in zip(original_images, processed_images):
+        for orig, proc in zip(original_images, processed_images, strict=True):
             if orig.filename != proc.filename:
                 filename_map[orig.filename] = proc.filename
 
@@ -1,5 +1,6 @@
 """Core types for the ingestor package."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -85,7 +86,11 @@ class ExtractionResult:
     images: list[ExtractedImage] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
     charset: str | None = None  # Detected charset for text files
-    source_files: list[SourceFile] = field(default_factory=list)  # Source code files for RAG
+    # Source code files for RAG: a list, or a lazy iterable that reads files
+    # as it is consumed (see extractors.git.files.SourceFileStream)
+    source_files: Iterable[SourceFile] = field(default_factory=list)
+    # Seconds spent per pipeline stage (extract, convert, describe, write)
+    timings: dict[str, float] = field(default_factory=dict)
 
     @property
     def has_images(self) -> bool:
@@ -120,10 +125,28 @@ class IngestConfig:
     # YouTube options
     youtube_captions: str = "auto"  # auto or manual
     youtube_playlist: bool = False
+    youtube_concurrency: int = 4  # Videos processed at once for playlists/channels
+    youtube_cache: bool = True  # Cache metadata and transcripts by video ID
 
     # Audio options
     whisper_model: str = "turbo"
+    whisper_backend: str = "whisper"  # whisper or faster-whisper (CPU)
+    whisper_workers: int = 1  # Transcription worker processes
 
     # VLM options
     ollama_host: str = "http://localhost:11434"
     vlm_model: str = "llava:7b"
+    vlm_concurrency: int = 4  # Concurrent VLM requests per document
+    vlm_cache: bool = True  # Cache descriptions by image content hash
+
+    # Image options
+    image_workers: int = 4  # Processes converting images (1 = convert in a thread)
+
+    # Git options
+    clone_concurrency: int = 4  # Concurrent clones for repository lists
+    process_concurrency: int | None = None  # Repositories processed at once (None: CPU count, up to 4)
+
+    # Table options (CSV, XLSX)
+    table_mode: str = "auto"  # auto, full or summary
+    table_max_rows: int = 10_000  # Rows rendered verbatim (0 = no limit)
+    table_max_cols: int = 50  # Columns rendered (0 = no limit)
@@ -1,6 +1,8 @@
 """Integration tests for archive extraction."""
 
+import io
 import json
+import tarfile
 import zipfile
 
 import pytest
@@ -37,7 +39,9 @@ class TestZipExtraction:
         """Test supports .zip files."""
         assert extractor.supports("archive.zip")
         assert extractor.supports("/path/to/archive.zip")
-        assert not extractor.supports("archive.tar.gz")
+        assert extractor.supports("archive.tar.gz")
+        assert extractor.supports("archive.tgz")
+        assert not extractor.supports("archive.rar")
 
     @pytest.mark.asyncio
     async def test_extract_zip(self, extractor, sample_zip_with_content):
@@ -106,3 +110,102 @@ class TestZipWithImages:
 
         # Should have extracted images
         assert len(result.images) >= 1 or result.metadata.get("image_count", 0) >= 1
+
+
+class TestStreamingArchives:
+    """Tests for streaming TAR extraction, member skipping and safety limits."""
+
+    @pytest.fixture
+    def registry(self):
+        return create_default_registry()
+
+    @pytest.fixture
+    def sample_tar_gz(self, tmp_path):
+        """Create a gzipped TAR with text, JSON and an unsupported binary member."""
+        tar_path = tmp_path / "bundle.tar.gz"
+        members = {
+            "docs/readme.txt": b"Tarball readme content.",
+            "data.json": json.dumps({"key": "value"}).encode(),
+            "blob.bin": bytes(range(256)) * 16,
+        }
+        with tarfile.open(tar_path, "w:gz") as tf:
+            for name, data in members.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(data)
+                tf.addfile(info, io.BytesIO(data))
+        return tar_path
+
+    @pytest.mark.asyncio
+    async def test_tar_gz_extraction(self, registry, sample_tar_gz):
+        """Test gzipped TAR members are extracted in archive order."""
+        from ingestor.extractors.archive import ZipExtractor
+
+        result = await ZipExtractor(registry=registry).extract(sample_tar_gz)
+
+        assert result.metadata["archive_format"] == "tar"
+        assert result.metadata["file_count"] == 3
+        assert result.metadata["processed_count"] == 2
+        assert "Tarball readme content" in result.markdown
+        assert result.markdown.index("docs/readme.txt") < result.markdown.index("data.json")
+
+    @pytest.mark.asyncio
+    async def test_unsupported_members_skipped(self, registry, sample_tar_gz):
+        """Test members without an extractor are skipped, not extracted."""
+        from ingestor.extractors.archive import ZipExtractor
+
+        result = await ZipExtractor(registry=registry).extract(sample_tar_gz)
+
+        assert result.metadata["skipped_count"] == 1
+        assert "blob.bin" not in result.markdown
+        assert result.metadata["bytes_extracted"] < 256 * 16
+
+    @pytest.mark.asyncio
+    async def test_compression_ratio_limit(self, registry, tmp_path):
+        """Test highly compressed members are skipped as potential bombs."""
+        from ingestor.extractors.archive import ArchiveLimits, ZipExtractor
+
+        zip_path = tmp_path / "bomb.zip"
+        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("zeros.txt", "0" * 1_000_000)
+            zf.writestr("ok.txt", "Regular content.")
+
+        extractor = ZipExtractor(registry=registry, limits=ArchiveLimits(max_compression_ratio=50))
+        result = await extractor.extract(zip_path)
+
+        assert result.metadata["processed_count"] == 1
+        assert result.metadata["skipped_count"] == 1
+        assert "Regular content" in result.markdown
+
+    @pytest.mark.asyncio
+    async def test_total_size_limit_stops_extraction(self, registry, tmp_path):
+        """Test reading stops once the uncompressed budget is used up."""
+        from ingestor.extractors.archive import ArchiveLimits, ZipExtractor
+
+        zip_path = tmp_path / "large.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for i in range(5):
+                zf.writestr(f"part{i}.txt", f"Part {i} " + "x" * 1000)
+
+        limits = ArchiveLimits(max_total_size=2500)
+        result = await ZipExtractor(registry=registry, limits=limits).extract(zip_path)
+
+        assert result.metadata["processed_count"] == 2
+        assert "limit_exceeded" in result.metadata
+        assert result.metadata["bytes_extracted"] <= 2500
+
+    @pytest.mark.asyncio
+    async def test_member_count_limit(self, registry, tmp_path):
+        """Test archives with too many members are cut off."""
+        from ingestor.extractors.archive import ArchiveLimits, ZipExtractor
+
+        zip_path = tmp_path / "many.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for i in range(10):
+                zf.writestr(f"f{i}.txt", f"File {i}")
+
+        result = await ZipExtractor(
+            registry=registry, limits=ArchiveLimits(max_members=3)
+        ).extract(zip_path)
+
+        assert result.metadata["file_count"] == 3
+        assert "limit_exceeded" in result.metadata
@@ -0,0 +1,114 @@
+"""Unit tests for chunked audio transcription helpers - no Whisper required."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ingestor.extractors.audio import AudioExtractor  # noqa: E402
+from ingestor.extractors.audio.transcription import (  # noqa: E402
+    SAMPLE_RATE,
+    create_pool,
+    merge_transcripts,
+    split_on_silence,
+)
+
+
+def _tone(seconds: float) -> "np.ndarray":
+    """Generate a 440 Hz tone."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> "np.ndarray":
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+class TestSplitOnSilence:
+    """Tests for VAD-based chunking."""
+
+    def test_short_audio_single_chunk(self):
+        """Test audio shorter than a chunk is not split."""
+        samples = _tone(5)
+        chunks = split_on_silence(samples, chunk_seconds=10)
+
+        assert len(chunks) == 1
+        assert chunks[0].start == 0.0
+        assert len(chunks[0].samples) == len(samples)
+
+    def test_cuts_inside_silence(self):
+        """Test chunk boundaries are placed in the silent gap."""
+        samples = np.concatenate([_tone(8), _silence(1), _tone(8)])
+        chunks = split_on_silence(samples, chunk_seconds=10, search_seconds=5)
+
+        assert len(chunks) == 2
+        assert 8.0 <= chunks[1].start <= 9.0
+
+    def test_chunks_cover_whole_recording(self):
+        """Test chunks are contiguous and lose no samples."""
+        samples = np.concatenate([_tone(4), _silence(0.5)] * 10)
+        chunks = split_on_silence(samples, chunk_seconds=10, search_seconds=3)
+
+        assert len(chunks) > 1
+        assert sum(len(c.samples) for c in chunks) == len(samples)
+        for previous, current in zip(chunks, chunks[1:]):
+            expected = previous.start + len(previous.samples) / SAMPLE_RATE
+            assert current.start == pytest.approx(expected)
+
+
+class TestMergeTranscripts:
+    """Tests for merging chunk transcriptions."""
+
+    def test_offsets_applied_in_order(self):
+        """Test segment timestamps are shifted by the chunk offset."""
+        results = [
+            (600.0, {"text": " world", "language": "en",
+                     "segments": [{"start": 1.0, "end": 2.0, "text": "world"}]}),
+            (0.0, {"text": "hello ", "language": "en",
+                   "segments": [{"start": 0.5, "end": 1.5, "text": "hello"}]}),
+        ]
+
+        transcript = merge_transcripts(results)
+
+        assert transcript.text == "hello world"
+        assert transcript.language == "en"
+        assert transcript.chunk_count == 2
+        assert [(s["start"], s["end"]) for s in transcript.segments] == [(0.5, 1.5), (601.0, 602.0)]
+
+    def test_majority_language(self):
+        """Test the most common chunk language wins."""
+        results = [
+            (0.0, {"text": "a", "language": "en", "segments": []}),
+            (1.0, {"text": "b", "language": "de", "segments": []}),
+            (2.0, {"text": "c", "language": "en", "segments": []}),
+        ]
+        assert merge_transcripts(results).language == "en"
+
+    def test_empty(self):
+        """Test merging silent chunks."""
+        transcript = merge_transcripts([(0.0, {"text": "", "segments": []})])
+        assert transcript.text == ""
+        assert transcript.language == "unknown"
+
+
+class TestAudioExtractorConfig:
+    """Tests for transcription backend configuration."""
+
+    def test_defaults(self):
+        """Test default backend settings."""
+        extractor = AudioExtractor()
+
+        assert extractor.model_name == "turbo"
+        assert extractor.backend == "whisper"
+        assert extractor.workers == 1
+        assert extractor._pool is None
+
+    def test_unknown_backend_rejected(self):
+        """Test an unknown backend fails when the pool is created."""
+        with pytest.raises(ValueError, match="Unknown transcription backend"):
+            create_pool("nonexistent", "tiny", 1)
+
+    def test_close_without_pool(self):
+        """Test close is safe before any transcription ran."""
+        extractor = AudioExtractor(backend="faster-whisper", workers=2)
+        extractor.close()
+        assert extractor._pool is None
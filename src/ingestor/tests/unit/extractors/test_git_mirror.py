@@ -0,0 +1,195 @@
+"""Unit tests for the mirror clone cache and incremental clone - local repos only."""
+
+import json
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from ingestor.cli import main
+from ingestor.extractors.git.export import CLONE_STATE_FILE, output_names, should_exclude
+from ingestor.extractors.git.mirror import MirrorCache
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, message):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    """Create a local repository acting as the remote."""
+    repo = tmp_path / "upstream"
+    (repo / "pkg").mkdir(parents=True)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.email", "test@test.com")
+    _git(repo, "config", "user.name", "Test User")
+    (repo / "pkg" / "core.py").write_text("VERSION = 1\n")
+    (repo / "pkg" / "legacy.py").write_text("OLD = True\n")
+    (repo / "README.md").write_text("# Upstream\n")
+    (repo / "yarn.lock").write_text("lock\n")
+    _commit(repo, "initial")
+    return repo
+
+
+class TestMirrorCache:
+    """Tests for bare mirrors and git plumbing helpers."""
+
+    def test_mirror_created_then_fetched(self, upstream, tmp_path):
+        """Test the mirror is cloned once and picks up new commits on update."""
+        cache = MirrorCache(tmp_path / "cache")
+        mirror = cache.update(str(upstream))
+        first = cache.resolve(mirror)
+
+        (upstream / "pkg" / "core.py").write_text("VERSION = 2\n")
+        _commit(upstream, "bump")
+
+        assert cache.update(str(upstream)) == mirror
+        second = cache.resolve(mirror)
+        assert second != first
+        assert cache.has_commit(mirror, first)
+
+    def test_diff_name_status(self, upstream, tmp_path):
+        """Test added, modified and deleted files are reported."""
+        cache = MirrorCache(tmp_path / "cache")
+        mirror = cache.update(str(upstream))
+        old = cache.resolve(mirror)
+
+        (upstream / "pkg" / "core.py").write_text("VERSION = 2\n")
+        (upstream / "pkg" / "legacy.py").unlink()
+        (upstream / "pkg" / "new.py").write_text("NEW = 1\n")
+        _commit(upstream, "change")
+        cache.update(str(upstream))
+
+        changes = {c.path: c.status for c in cache.diff(mirror, old, cache.resolve(mirror))}
+        assert changes == {"pkg/core.py": "M", "pkg/legacy.py": "D", "pkg/new.py": "A"}
+
+    def test_export_without_checkout(self, upstream, tmp_path):
+        """Test selected files are written straight from the object database."""
+        cache = MirrorCache(tmp_path / "cache")
+        mirror = cache.update(str(upstream))
+        commit = cache.resolve(mirror)
+
+        assert sorted(cache.list_files(mirror, commit)) == [
+            "README.md", "pkg/core.py", "pkg/legacy.py", "yarn.lock",
+        ]
+        dest = tmp_path / "out"
+        assert cache.export(mirror, commit, ["pkg/core.py"], dest) == 1
+        assert (dest / "pkg" / "core.py").read_text() == "VERSION = 1\n"
+        assert not (dest / "README.md").exists()
+
+    def test_export_failure_reports_git_error(self, upstream, tmp_path):
+        """Test a failing git archive raises with its stderr."""
+        cache = MirrorCache(tmp_path / "cache")
+        mirror = cache.update(str(upstream))
+        commit = cache.resolve(mirror)
+
+        with pytest.raises(RuntimeError, match="Git archive failed: .*missing.py"):
+            cache.export(mirror, commit, ["missing.py"], tmp_path / "out")
+
+
+class TestIncrementalClone:
+    """Tests for `ingestor clone` re-ingesting only changed files."""
+
+    def _clone(self, upstream, tmp_path):
+        result = CliRunner().invoke(
+            main,
+            ["clone", str(upstream), "-o", str(tmp_path / "out"),
+             "--cache-dir", str(tmp_path / "mirrors")],
+        )
+        assert result.exit_code == 0, result.output
+        return result
+
+    def test_exclusion_rules(self):
+        """Test clone output filtering on repository-relative paths."""
+        assert should_exclude("node_modules/pkg/index.js")
+        assert should_exclude("yarn.lock")
+        assert should_exclude("LICENSE")
+        assert not should_exclude("pkg/core.py")
+
+    def test_reingest_applies_changes(self, upstream, tmp_path):
+        """Test a second run rewrites changed files and deletes removed ones."""
+        self._clone(upstream, tmp_path)
+        output = tmp_path / "out" / "upstream"
+        assert (output / "pkg" / "legacy.py").exists()
+        assert not (output / "yarn.lock").exists()
+
+        (upstream / "pkg" / "core.py").write_text("VERSION = 2\n")
+        (upstream / "pkg" / "legacy.py").unlink()
+        _commit(upstream, "change")
+        result = self._clone(upstream, tmp_path)
+
+        assert "Incremental update" in result.output
+        assert (output / "pkg" / "core.py").read_text() == "VERSION = 2\n"
+        assert not (output / "pkg" / "legacy.py").exists()
+
+        state = json.loads((output / CLONE_STATE_FILE).read_text())
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=upstream, capture_output=True, text=True
+        ).stdout.strip()
+        assert state["commit"] == head
+        assert state["previous_commit"] is not None
+
+    def test_up_to_date(self, upstream, tmp_path):
+        """Test nothing is rewritten when the commit has not changed."""
+        self._clone(upstream, tmp_path)
+        result = self._clone(upstream, tmp_path)
+
+        assert "Up to date" in result.output
+
+    def test_repository_list_partial_failure(self, upstream, tmp_path):
+        """Test a .download_git list clones every repository and reports failures."""
+        repos = tmp_path / "repos.download_git"
+        repos.write_text(f"{upstream}\n{tmp_path / 'missing'}\n")
+
+        result = CliRunner().invoke(
+            main,
+            ["clone", str(repos), "-o", str(tmp_path / "out"),
+             "--cache-dir", str(tmp_path / "mirrors"), "--clone-concurrency", "2"],
+        )
+
+        assert result.exit_code == 1
+        assert "FAILED" in result.output
+        assert "Completed:" in result.output
+        assert (tmp_path / "out" / "upstream" / "pkg" / "core.py").exists()
+
+    def test_same_named_repositories_get_separate_folders(self, upstream, tmp_path):
+        """Test repositories sharing a basename do not share an output folder."""
+        other = tmp_path / "other" / "upstream"
+        other.mkdir(parents=True)
+        _git(other, "init", "-q")
+        _git(other, "config", "user.email", "test@test.com")
+        _git(other, "config", "user.name", "Test User")
+        (other / "main.py").write_text("print('other')\n")
+        _commit(other, "initial")
+        repos = tmp_path / "repos.download_git"
+        repos.write_text(f"{upstream}\n{other}\n")
+
+        result = CliRunner().invoke(
+            main,
+            ["clone", str(repos), "-o", str(tmp_path / "out"), "--cache-dir", str(tmp_path / "mirrors"),
+             "--clone-concurrency", "2", "--process-concurrency", "2"],
+        )
+
+        assert result.exit_code == 0, result.output
+        names = output_names([str(upstream), str(other)])
+        assert len(set(names.values())) == 2
+        assert (tmp_path / "out" / names[str(upstream)] / "pkg" / "core.py").exists()
+        assert (tmp_path / "out" / names[str(other)] / "main.py").exists()
+
+    def test_output_names(self):
+        """Test only colliding basenames are qualified by their owner."""
+        names = output_names([
+            "https://github.com/alice/utils",
+            "git@github.com:bob/utils.git",
+            "https://github.com/carol/app",
+        ])
+        assert names == {
+            "https://github.com/alice/utils": "alice_utils",
+            "git@github.com:bob/utils.git": "bob_utils",
+            "https://github.com/carol/app": "app",
+        }
@@ -0,0 +1,187 @@
+"""Unit tests for GitHub directory fetching against a local GitHub-like server."""
+
+import base64
+import http.server
+import io
+import json
+import tarfile
+import threading
+from collections import Counter
+from urllib.parse import unquote, urlparse
+
+import pytest
+
+from ingestor.extractors.git.git_extractor import GitExtractor, GitRepoConfig
+from ingestor.extractors.git.github_fetch import BlobCache, git_blob_sha
+
+FILES = {
+    "README.md": b"# Demo\n",
+    "docs/guide.md": b"# Guide\n",
+    "docs/api/index.md": b"# API\n",
+    "docs/api/schema.json": b'{"type": "object"}\n',
+    "docs/logo.png": b"\x89PNG fake",
+    "docs/node_modules/dep/index.js": b"module.exports = 1;\n",
+    "src/app.py": b"print('hi')\n",
+}
+
+
+def _dirs():
+    dirs = set()
+    for path in FILES:
+        parts = path.split("/")[:-1]
+        dirs.update("/".join(parts[: i + 1]) for i in range(len(parts)))
+    return sorted(dirs)
+
+
+def _tarball():
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+        for name in ["", *_dirs()]:
+            info = tarfile.TarInfo(f"owner-demo-abc123/{name}".rstrip("/"))
+            info.type = tarfile.DIRTYPE
+            tf.addfile(info)
+        for path, data in FILES.items():
+            info = tarfile.TarInfo(f"owner-demo-abc123/{path}")
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def github():
+    """Serve a tiny repository through GitHub-shaped endpoints."""
+    hits: Counter = Counter()
+    tarball = _tarball()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, body, content_type="application/json"):
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = unquote(urlparse(self.path).path)
+            if path.startswith("/api/repos/owner/demo/git/trees/"):
+                hits["tree"] += 1
+                tree = [{"path": d, "type": "tree"} for d in _dirs()]
+                tree += [
+                    {"path": p, "type": "blob", "size": len(d), "sha": git_blob_sha(d)}
+                    for p, d in FILES.items()
+                ]
+                return self._send({"tree": tree, "truncated": False})
+            if path.startswith("/api/repos/owner/demo/tarball/"):
+                hits["tarball"] += 1
+                return self._send(tarball, "application/x-gzip")
+            if path.startswith("/api/repos/owner/demo/contents/"):
+                hits["contents"] += 1
+                rel = path.removeprefix("/api/repos/owner/demo/contents/")
+                if rel in FILES:
+                    return self._send({"content": base64.b64encode(FILES[rel]).decode()})
+                items = [
+                    {"name": p.split("/")[-1], "path": p, "type": "file", "size": len(d)}
+                    for p, d in FILES.items() if p.rsplit("/", 1)[0] == rel
+                ]
+                items += [
+                    {"name": d.split("/")[-1], "path": d, "type": "dir"}
+                    for d in _dirs() if d.rsplit("/", 1)[0] == rel and d != rel
+                ]
+                return self._send(items)
+            if path.startswith("/raw/owner/demo/main/"):
+                hits["raw"] += 1
+                rel = path.removeprefix("/raw/owner/demo/main/")
+                if rel in FILES:
+                    return self._send(FILES[rel], "text/plain")
+            self.send_error(404)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    server.shutdown()
+    server.server_close()
+
+
+def _extractor(base_url, tmp_path, strategy):
+    extractor = GitExtractor(
+        config=GitRepoConfig(github_fetch=strategy, blob_cache_dir=str(tmp_path / "blobs"))
+    )
+    extractor.token = None  # Ignore GITHUB_TOKEN from the environment
+    extractor.GITHUB_API = f"{base_url}/api"
+    extractor.GITHUB_RAW = f"{base_url}/raw"
+    return extractor
+
+
+URL = "https://github.com/owner/demo/tree/main/docs"
+
+
+class TestGitHubDirectoryFetch:
+    """Tests for tree, tarball and contents strategies."""
+
+    @pytest.mark.asyncio
+    async def test_tree_strategy(self, github, tmp_path):
+        """Test one tree call plus raw downloads for the whole subtree."""
+        base_url, hits = github
+        result = await _extractor(base_url, tmp_path, "tree").extract(URL)
+
+        paths = {f.path: f.content for f in result.source_files}
+        assert paths == {
+            "docs/guide.md": "# Guide\n",
+            "docs/api/index.md": "# API\n",
+            "docs/api/schema.json": '{"type": "object"}\n',
+        }
+        assert hits == {"tree": 1, "raw": 3}
+        stats = result.metadata["fetch_stats"]
+        assert stats["api_requests"] == 1
+        assert stats["downloads"] == 3
+        assert "- 📁 api/" in result.markdown
+        assert "- 📄 guide.md (8 bytes)" in result.markdown
+
+    @pytest.mark.asyncio
+    async def test_blob_cache_avoids_downloads(self, github, tmp_path):
+        """Test unchanged blobs are served from the cache on the next fetch."""
+        base_url, hits = github
+        await _extractor(base_url, tmp_path, "tree").extract(URL)
+        result = await _extractor(base_url, tmp_path, "tree").extract(URL)
+
+        assert hits["raw"] == 3
+        assert result.metadata["fetch_stats"]["cache_hits"] == 3
+        assert len(result.source_files) == 3
+
+    @pytest.mark.asyncio
+    async def test_tarball_matches_tree(self, github, tmp_path):
+        """Test the streamed tarball yields the same files and fills the cache."""
+        base_url, hits = github
+        tree = await _extractor(base_url, tmp_path / "a", "tree").extract(URL)
+        tarball = await _extractor(base_url, tmp_path / "b", "tarball").extract(URL)
+
+        assert {f.path for f in tarball.source_files} == {f.path for f in tree.source_files}
+        assert tarball.markdown == tree.markdown
+        assert hits["tarball"] == 1
+        cache = BlobCache(tmp_path / "b" / "blobs")
+        assert cache.get(git_blob_sha(FILES["docs/guide.md"])) == FILES["docs/guide.md"]
+
+    @pytest.mark.asyncio
+    async def test_contents_strategy_costs_one_request_per_file(self, github, tmp_path):
+        """Test the per-file contents API for comparison."""
+        base_url, hits = github
+        result = await _extractor(base_url, tmp_path, "contents").extract(URL)
+
+        assert [f.path for f in result.source_files] == ["docs/guide.md"]
+        assert result.metadata["fetch_stats"]["api_requests"] == hits["contents"] == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_path(self, github, tmp_path):
+        """Test a path absent from the tree is reported as an error."""
+        base_url, _ = github
+        result = await _extractor(base_url, tmp_path, "tree").extract(
+            "https://github.com/owner/demo/tree/main/nope"
+        )
+
+        assert "not found" in result.metadata["error"]
@@ -1,5 +1,8 @@
 """Unit tests for PDF postprocessing modules."""
 
+from pathlib import Path
+
+import pytest
 
 from ingestor.extractors.pdf.postprocess import (
     cleanup_text,
@@ -381,3 +384,37 @@ $$x = y * z$$
         result = process_equations(content)
         # Should add aligned wrapper since \\ before cases is bare
         assert "\\begin{aligned}" in result
+
+
+PAPERS_DIR = Path(__file__).parent.parent.parent / "fixtures" / "papers"
+
+# Images extracted alongside each paper (the goldens embed these)
+PAPER_IMAGES = {
+    "luxio.md": [f"figure{i}.png" for i in range(1, 11)],
+    "labios.md": [f"labios_img_{i:03d}.png" for i in range(1, 12)],
+    "equations.md": ["figure2.png", "fig4.png"],
+}
+
+
+class TestPaperFixtures:
+    """Golden-output and timing checks over real paper markdown."""
+
+    @pytest.mark.parametrize("name", sorted(PAPER_IMAGES))
+    def test_matches_golden(self, name):
+        """Test the pipeline output is byte-identical to the golden file."""
+        content = (PAPERS_DIR / name).read_text(encoding="utf-8")
+        expected = (PAPERS_DIR / f"{name}.expected.md").read_text(encoding="utf-8")
+
+        assert process_markdown(content, PAPER_IMAGES[name]) == expected
+
+    def test_per_pass_timings(self):
+        """Test every pass over the paper set records its time."""
+        timings: dict[str, float] = {}
+        for name, images in sorted(PAPER_IMAGES.items()):
+            content = (PAPERS_DIR / name).read_text(encoding="utf-8")
+            process_markdown(content, images, timings=timings)
+
+        assert set(timings) == {
+            "sections", "citations", "equations", "figures", "bibliography", "cleanup",
+        }
+        assert all(seconds >= 0 for seconds in timings.values())
@@ -0,0 +1,137 @@
+"""Unit tests for streaming table rendering and the CSV/XLSX extractors."""
+
+import pytest
+
+from ingestor.extractors.data.tables import ColumnStats, TableConfig, TableRenderer
+from tests.conftest import requires_pandas
+
+
+def _renderer(rows, **config):
+    renderer = TableRenderer(["id", "name"], TableConfig(**config))
+    renderer.add_rows(rows)
+    return renderer
+
+
+class TestTableRenderer:
+    """Tests for row windows, caps and summary mode."""
+
+    def test_small_table_verbatim(self):
+        """Test a table under the limits renders as one markdown table."""
+        renderer = _renderer([(1, "a|b"), (2, None)])
+
+        assert renderer.render() == (
+            "| id | name |\n| --- | --- |\n| 1 | a\\|b |\n| 2 |  |"
+        )
+        assert renderer.metadata()["table_mode"] == "full"
+        assert not renderer.truncated
+
+    def test_windows_repeat_header(self):
+        """Test rows are split into blocks that each carry the header."""
+        markdown = _renderer([(i, "x") for i in range(5)], window=2).render()
+
+        assert markdown.count("| id | name |") == 3
+        assert markdown.split("\n\n")[1].startswith("| id | name |")
+
+    def test_row_and_column_caps(self):
+        """Test full mode stops at max_rows and max_cols with a note."""
+        renderer = TableRenderer(["a", "b", "c"], TableConfig(mode="full", max_rows=2, max_cols=2))
+        renderer.add_rows([(i, i, i) for i in range(10)])
+        markdown = renderer.render()
+
+        assert "| a | b |" in markdown
+        assert "| 2 | 2 |" not in markdown
+        assert "*Showing first 2 of 10 rows, 2 of 3 columns.*" in markdown
+        assert renderer.truncated
+
+    def test_auto_switches_to_summary(self):
+        """Test auto mode summarizes once the table exceeds max_rows."""
+        renderer = _renderer([(i, f"n{i % 3}") for i in range(1, 101)], max_rows=10)
+        markdown = renderer.render()
+
+        assert renderer.summarized
+        assert "*Summary of 100 rows × 2 columns.*" in markdown
+        assert "| id | integer | 100 | 0 | 100 | 1 | 100 | 50.5 |" in markdown
+        assert "| name | text | 100 | 0 | 3 |  |  |  |" in markdown
+        assert "**Sample rows:**" in markdown
+        assert "| 6 | n0 |" not in markdown  # Only the first sample rows
+
+    def test_column_stats_from_strings(self):
+        """Test types are inferred from string values as read from CSV."""
+        stats = ColumnStats("x")
+        for value in ["1", "2.5", "", "4"]:
+            stats.add(value)
+
+        assert stats.dtype == "float"
+        assert (stats.count, stats.nulls) == (3, 1)
+        assert stats.minimum == 1 and stats.maximum == 4
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            TableConfig(mode="verbatim")
+
+
+@requires_pandas
+class TestStreamingExtractors:
+    """Tests for chunked CSV and read-only XLSX extraction."""
+
+    @pytest.mark.asyncio
+    async def test_csv_chunks_render_consistently(self, tmp_path):
+        """Test values render the same in every chunk (no per-chunk type inference)."""
+        from ingestor.extractors.data import CsvExtractor
+
+        path = tmp_path / "values.csv"
+        path.write_text("id;score\n1;007\n2;\n3;1.50\n4;8\n")
+        result = await CsvExtractor(TableConfig(window=1)).extract(path)
+
+        assert "| 1 | 007 |" in result.markdown
+        assert "| 2 |  |" in result.markdown
+        assert "| 3 | 1.50 |" in result.markdown
+        assert result.metadata["row_count"] == 4
+        assert result.metadata["columns"] == ["id", "score"]
+
+    @pytest.mark.asyncio
+    async def test_large_csv_summary(self, tmp_path):
+        """Test a CSV over the row cap is summarized with full row counts."""
+        from ingestor.extractors.data import CsvExtractor
+
+        path = tmp_path / "large.csv"
+        path.write_text("a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(5000)))
+        result = await CsvExtractor(TableConfig(max_rows=100, window=500)).extract(path)
+
+        assert result.metadata["table_mode"] == "summary"
+        assert result.metadata["row_count"] == 5000
+        assert "| b | integer | 5000 | 0 | 1000+ | 0 | 9998 | 4999 |" in result.markdown
+
+    @pytest.mark.asyncio
+    async def test_xlsx_read_only(self, tmp_path):
+        """Test sheets stream through openpyxl read-only mode."""
+        from openpyxl import Workbook
+
+        from ingestor.extractors.excel import XlsxExtractor
+
+        workbook = Workbook(write_only=True)
+        small = workbook.create_sheet("Small")
+        small.append(["name", None, "qty"])
+        small.append(["bolt", "x", 3])
+        small.append([None, None, None])
+        small.append(["nut", None, 5, "extra"])
+        large = workbook.create_sheet("Large")
+        large.append(["n"])
+        for i in range(300):
+            large.append([i])
+        workbook.create_sheet("Empty")
+        workbook.save(tmp_path / "book.xlsx")
+
+        result = await XlsxExtractor(TableConfig(max_rows=50)).extract(tmp_path / "book.xlsx")
+
+        assert "| name | Unnamed: 1 | qty | Unnamed: 3 |" in result.markdown
+        assert "| bolt | x | 3 |  |" in result.markdown
+        assert "| nut |  | 5 | extra |" in result.markdown
+        assert "## Empty" not in result.markdown
+        tables = result.metadata["sheet_tables"]
+        assert tables["Small"]["row_count"] == 2
+        assert tables["Large"] == {
+            "row_count": 300, "column_count": 1, "table_mode": "summary", "truncated": True,
+        }
+        assert result.metadata["sheets"] == ["Small", "Large", "Empty"]
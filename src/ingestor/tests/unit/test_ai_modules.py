@@ -4,7 +4,11 @@
 import pytest
 
 from ingestor.ai.claude.agent import ClaudeAgent
+from ingestor.ai.claude.cache import CleanupCache
+from ingestor.ai.claude.sections import split_windows
+from ingestor.ai.ollama.cache import DescriptionCache, hamming_distance, perceptual_hash
 from ingestor.ai.ollama.vlm import OllamaVLM
+from ingestor.core.cache import content_hash
 from ingestor.types import ExtractedImage
 
 
@@ -51,6 +55,63 @@ class TestClaudeAgentMethods:
             assert "claude-code-sdk" in str(e).lower() or "not installed" in str(e).lower()
 
 
+class TestClaudeAgentWindows:
+    """Tests for section-aware splitting and the cleaned-window cache."""
+
+    DOCUMENT = (
+        "# Title\n\nIntro paragraph.\n\n"
+        "## Methods\n\n" + "Method text. " * 40 + "\n\n"
+        "```python\n# not a heading\n\nprint('x')\n```\n\n"
+        "## Results\n\n" + "Result text. " * 40 + "\n"
+    )
+
+    def test_windows_reassemble_exactly(self):
+        """Test windows are contiguous slices of the document, one per section."""
+        windows = split_windows(self.DOCUMENT, 600)
+
+        assert len(windows) == 3
+        assert "".join(windows) == self.DOCUMENT
+        assert all(w.startswith("#") for w in windows)
+
+    def test_sections_packed_and_fences_kept_whole(self):
+        """Test small sections share a window and code blocks are not split."""
+        windows = split_windows(self.DOCUMENT, 700)
+
+        assert windows[0].startswith("# Title") and "## Methods" in windows[0]
+        assert any("```python\n# not a heading\n\nprint('x')\n```" in w for w in windows)
+
+    def test_oversized_section_split_between_paragraphs(self):
+        """Test a section over the limit is split at blank lines."""
+        document = "# Only\n\n" + "".join(f"Paragraph {i}.\n\n" for i in range(50))
+        windows = split_windows(document, 100)
+
+        assert "".join(windows) == document
+        assert all(w.endswith("\n\n") for w in windows)
+        assert max(len(w) for w in windows) <= 100
+
+    @pytest.mark.asyncio
+    async def test_cached_windows_skip_sdk(self, tmp_path):
+        """Test a document whose windows are all cached needs no requests."""
+        agent = ClaudeAgent(window_chars=300, cache_dir=tmp_path)
+        for window in split_windows(self.DOCUMENT, 300):
+            key = CleanupCache.key(window, ClaudeAgent.PROMPT_VERSION, agent.system_prompt, "ctx")
+            agent.cache.put(key, window.strip().upper())
+
+        cleaned = await agent.cleanup(self.DOCUMENT, context="ctx")
+
+        assert cleaned.startswith("# TITLE")
+        assert "## RESULTS" in cleaned
+        assert agent.requests == 0
+        assert agent._sdk is None
+
+    def test_cache_key_depends_on_prompt(self):
+        """Test prompt version, system prompt and context all affect the key."""
+        base = CleanupCache.key("text", "1", "system", None)
+        assert base != CleanupCache.key("text", "2", "system", None)
+        assert base != CleanupCache.key("text", "1", "other", None)
+        assert base != CleanupCache.key("text", "1", "system", "ctx")
+
+
 class TestOllamaVLMInit:
     """Tests for OllamaVLM initialization."""
 
@@ -254,6 +315,134 @@ class TestOllamaVLMRealExtraction:
             raise
 
 
+def _png_bytes(size=(100, 100), color="red") -> bytes:
+    """Encode a solid-colour PNG."""
+    from io import BytesIO
+
+    from PIL import Image
+
+    output = BytesIO()
+    Image.new("RGB", size, color=color).save(output, format="PNG")
+    return output.getvalue()
+
+
+class TestOllamaVLMDescriptionCache:
+    """Tests for description caching and batch deduplication."""
+
+    def test_cache_disabled_by_default(self):
+        """Test the description cache is opt-in."""
+        assert OllamaVLM().cache is None
+
+    def test_cache_round_trip(self, tmp_path):
+        """Test descriptions are persisted by key."""
+        cache = DescriptionCache(tmp_path)
+        variant = DescriptionCache.variant("llava", "prompt")
+        key = DescriptionCache.key("imagehash", variant)
+
+        assert cache.get(key) is None
+        cache.put(key, "A red square.", "llava", "imagehash", variant)
+        assert DescriptionCache(tmp_path).get(key) == "A red square."
+
+    def test_variant_depends_on_model_and_prompt(self):
+        """Test model and prompt both affect the cache key."""
+        base = DescriptionCache.variant("llava", "prompt")
+        assert base != DescriptionCache.variant("moondream", "prompt")
+        assert base != DescriptionCache.variant("llava", "other prompt")
+
+    def test_perceptual_hash_near_duplicates(self, tmp_path):
+        """Test resized copies of an image are found as near-duplicates."""
+        from io import BytesIO
+
+        from PIL import Image, ImageDraw
+
+        def diagram(size):
+            img = Image.new("RGB", (200, 200), "white")
+            ImageDraw.Draw(img).rectangle([20, 20, 120, 160], fill="black")
+            output = BytesIO()
+            img.resize(size).save(output, format="PNG")
+            return output.getvalue()
+
+        original = perceptual_hash(diagram((200, 200)))
+        resized = perceptual_hash(diagram((150, 150)))
+        assert original is not None and resized is not None
+        assert hamming_distance(original, resized) <= 4
+
+        cache = DescriptionCache(tmp_path)
+        variant = DescriptionCache.variant("llava", "prompt")
+        key = DescriptionCache.key("a", variant)
+        cache.put(key, "A black box.", "llava", "a", variant, phash=original)
+
+        assert DescriptionCache(tmp_path).find_similar(resized, variant, 4) == "A black box."
+        assert cache.find_similar(resized, "other-variant", 4) is None
+
+    def test_perceptual_hash_invalid_image(self):
+        """Test undecodable data has no perceptual hash."""
+        assert perceptual_hash(b"not an image") is None
+
+    @pytest.mark.asyncio
+    async def test_describe_uses_cache_without_client(self, tmp_path):
+        """Test a cached description is returned without contacting Ollama."""
+        vlm = OllamaVLM(cache_dir=tmp_path)
+        data = _png_bytes()
+        variant = DescriptionCache.variant(vlm.model, OllamaVLM.DEFAULT_PROMPT)
+        key = DescriptionCache.key(content_hash(data), variant)
+        vlm.cache.put(key, "Cached description.", vlm.model, content_hash(data), variant)
+
+        assert await vlm.describe(data) == "Cached description."
+        assert vlm._client is None
+        assert vlm.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_describe_batch_deduplicates(self, tmp_path):
+        """Test identical images in a batch share one cached description."""
+        vlm = OllamaVLM(cache_dir=tmp_path)
+        data = _png_bytes()
+        variant = DescriptionCache.variant(vlm.model, OllamaVLM.DEFAULT_PROMPT)
+        key = DescriptionCache.key(content_hash(data), variant)
+        vlm.cache.put(key, "Logo.", vlm.model, content_hash(data), variant)
+
+        images = [ExtractedImage(filename=f"logo{i}.png", data=data, format="png") for i in range(5)]
+        await vlm.describe_batch(images)
+
+        assert all(image.description == "Logo." for image in images)
+        assert vlm.requests == 0
+        assert vlm.cache_hits == 5
+
+    def test_group_duplicates(self):
+        """Test grouping of exact duplicates."""
+        vlm = OllamaVLM()
+        red, blue = _png_bytes(color="red"), _png_bytes(color="blue")
+        images = [
+            ExtractedImage(filename="a.png", data=red, format="png"),
+            ExtractedImage(filename="b.png", data=blue, format="png"),
+            ExtractedImage(filename="c.png", data=red, format="png"),
+        ]
+
+        groups = vlm._group_duplicates(images)
+
+        assert [[img.filename for img in group] for group in groups] == [["a.png", "c.png"], ["b.png"]]
+
+    def test_large_images_are_downscaled(self):
+        """Test images above max_image_size are shrunk before sending."""
+        import base64
+        from io import BytesIO
+
+        from PIL import Image
+
+        vlm = OllamaVLM(max_image_size=256)
+        encoded = vlm._encode_image(_png_bytes(size=(2000, 1000)))
+
+        with Image.open(BytesIO(base64.b64decode(encoded))) as img:
+            assert img.size == (256, 128)
+
+    def test_small_images_sent_unchanged(self):
+        """Test images within max_image_size are sent as-is."""
+        import base64
+
+        data = _png_bytes(size=(100, 100))
+        assert base64.b64decode(OllamaVLM()._encode_image(data)) == data
+
+
 class TestClaudeAgentRealCleanup:
     """Real cleanup tests (requires Claude SDK)."""
 
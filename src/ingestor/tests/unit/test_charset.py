@@ -1,10 +1,13 @@
 """Real unit tests for Charset detection - no mocking."""
 
+import os
+import time
 from pathlib import Path
 
 import pytest
+from charset_normalizer import from_path
 
-from ingestor.core.charset import CharsetHandler
+from ingestor.core.charset import SAMPLE_BYTES, CharsetHandler
 
 
 class TestCharsetHandler:
@@ -176,3 +179,175 @@ class TestCharsetHandlerEdgeCases:
         text, encoding = handler.read_text(str(test_file))
 
         assert text == "Content"
+
+
+class TestSampledDetection:
+    """Tests for BOM, UTF-8 fast path, sampling and caching."""
+
+    @pytest.fixture
+    def handler(self):
+        # Small samples so modest files exercise the head/middle/tail path
+        return CharsetHandler(sample_bytes=1024, chunk_size=4096)
+
+    @pytest.mark.parametrize(
+        "encoding,expected",
+        [("utf-8-sig", "utf_8_sig"), ("utf-16", "utf_16"), ("utf-32", "utf_32")],
+    )
+    def test_bom(self, handler, tmp_path, encoding, expected):
+        """Test a BOM decides the encoding and is stripped from the text."""
+        test_file = tmp_path / "bom.txt"
+        test_file.write_bytes(("Grüße\n" * 2000).encode(encoding))
+
+        text, detected = handler.read_text(test_file)
+
+        assert detected == expected
+        assert text == "Grüße\n" * 2000
+
+    def test_utf8_character_split_across_samples(self, handler, tmp_path):
+        """Test multi-byte characters cut at sample and chunk edges are not errors."""
+        test_file = tmp_path / "split.txt"
+        content = "日本語のテキスト。" * 5000
+        test_file.write_text(content, encoding="utf-8")
+
+        text, detected = handler.read_text(test_file)
+
+        assert detected == "utf_8"
+        assert text == content
+
+    def test_large_ascii_reported_as_ascii(self, handler, tmp_path):
+        """Test a sampled file that decodes as pure ASCII is reported as such."""
+        test_file = tmp_path / "log.txt"
+        test_file.write_text("INFO request ok\n" * 5000)
+
+        assert handler.read_text(test_file)[1] == "ascii"
+
+    def test_unsampled_bytes_fall_back_to_full_detection(self, handler, tmp_path):
+        """Test a non-UTF-8 byte outside the sampled regions is still handled."""
+        test_file = tmp_path / "mixed.txt"
+        lines = [b"plain line\n"] * 3000
+        lines[800] = "café\n".encode("latin-1")
+        test_file.write_bytes(b"".join(lines))
+
+        text, detected = handler.read_text(test_file)
+
+        assert detected != "utf_8"
+        assert len(text.splitlines()) == 3000
+
+    def test_detection_cached_until_file_changes(self, handler, tmp_path):
+        """Test the encoding is cached per (path, size, mtime)."""
+        test_file = tmp_path / "cached.txt"
+        test_file.write_bytes("naïve\n".encode())
+        assert handler.detect_encoding_from_file(test_file) == "utf_8"
+        assert len(handler._encodings) == 1
+
+        test_file.write_bytes(b"plain text, now longer\n")
+        assert handler.detect_encoding_from_file(test_file) == "ascii"
+        assert len(handler._encodings) == 2
+
+    def test_iter_text_streams_chunks(self, handler, tmp_path):
+        """Test iter_text yields the file in pieces."""
+        test_file = tmp_path / "stream.txt"
+        test_file.write_text("é" * 10000, encoding="utf-8")
+
+        parts = list(handler.iter_text(test_file))
+
+        assert len(parts) > 1
+        assert "".join(parts) == "é" * 10000
+
+
+def _log_lines():
+    """Generated log text (about 7 MB) with a few non-ASCII words."""
+    words = ["request", "café", "naïve", "résumé", "ERROR", "INFO", "payload", "retry"]
+    return "\n".join(
+        " ".join(words[(i * 7 + j) % len(words)] for j in range(10)) for i in range(120_000)
+    )
+
+
+class TestSampledVsFullDetection:
+    """Compare sampled detection with full-file detection (the previous behavior)."""
+
+    def _read(self, path, monkeypatch):
+        """Read a file, counting the bytes the detection stages were given."""
+        import ingestor.core.charset as charset
+
+        handler = CharsetHandler()
+        detected = {"bytes": 0}
+        detect = handler._detect_sample
+
+        def sample_spy(head, *regions, whole=False):
+            detected["bytes"] += sum(len(region) for region in regions)
+            return detect(head, *regions, whole=whole)
+
+        def full_spy(file_path):
+            detected["bytes"] += Path(file_path).stat().st_size
+            return from_path(file_path)
+
+        monkeypatch.setattr(handler, "_detect_sample", sample_spy)
+        monkeypatch.setattr(charset, "from_path", full_spy)
+        text, encoding = handler.read_text(path)
+        return text, encoding, detected["bytes"]
+
+    def test_utf8_log(self, tmp_path, monkeypatch):
+        """Test UTF-8 output matches full detection, detected from the sample."""
+        path = tmp_path / "utf8.log"
+        path.write_text(_log_lines(), encoding="utf-8")
+
+        text, encoding, sampled = self._read(path, monkeypatch)
+
+        assert text == str(from_path(path).best())
+        assert encoding == "utf_8"
+        assert sampled == 3 * SAMPLE_BYTES
+        assert path.stat().st_size > 10 * sampled
+
+    def test_legacy_encoding_log(self, tmp_path, monkeypatch):
+        """Test a single-byte legacy encoding is detected from the sample alone."""
+        path = tmp_path / "cp1252.log"
+        path.write_text(_log_lines(), encoding="cp1252")
+
+        text, encoding, sampled = self._read(path, monkeypatch)
+
+        assert "request" in text
+        assert len(text) == len(_log_lines())
+        assert encoding != "utf_8"
+        # Only the sample was examined, no fallback over the whole file
+        assert sampled == 3 * SAMPLE_BYTES
+        assert path.stat().st_size > 10 * sampled
+
+
+@pytest.mark.slow
+class TestCharsetBenchmark:
+    """Time full-file detection against sampled detection on generated logs."""
+
+    def _compare(self, path):
+        start = time.perf_counter()
+        result = from_path(path).best()
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        text, encoding = CharsetHandler().read_text(path)
+        sampled_time = time.perf_counter() - start
+
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(
+            f"\n{path.name} ({size_mb:.1f} MB): full {full_time:.3f}s "
+            f"({result.encoding if result else None}), sampled {sampled_time:.3f}s ({encoding})"
+        )
+        return result, text
+
+    def test_utf8_log(self, tmp_path):
+        """Benchmark a UTF-8 log."""
+        path = tmp_path / "utf8.log"
+        path.write_text(_log_lines(), encoding="utf-8")
+
+        result, text = self._compare(path)
+
+        assert text == str(result)
+
+    def test_legacy_encoding_log(self, tmp_path):
+        """Benchmark a single-byte legacy encoding log."""
+        path = tmp_path / "cp1252.log"
+        path.write_text(_log_lines(), encoding="cp1252")
+
+        _, text = self._compare(path)
+
+        assert len(text) == len(_log_lines())
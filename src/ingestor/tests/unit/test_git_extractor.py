@@ -1,5 +1,6 @@
 """Real unit tests for Git extractor - no mocking."""
 
+import asyncio
 import subprocess
 
 import pytest
@@ -617,3 +618,213 @@ class TestGitExtractorCheckoutError:
         assert "checkout_process.returncode" in source
         assert "Git checkout failed" in source
         assert "checkout_stderr" in source
+
+
+class TestGitExtractorFileWalking:
+    """Tests for the pruning walker and streamed source files."""
+
+    @pytest.fixture
+    def monorepo(self, tmp_path):
+        """Create a repo tree with excluded directories and mixed files."""
+        repo_dir = tmp_path / "mono"
+        (repo_dir / ".git" / "objects").mkdir(parents=True)
+        (repo_dir / ".git" / "objects" / "blob.py").write_text("never read")
+        (repo_dir / "node_modules" / "dep").mkdir(parents=True)
+        (repo_dir / "node_modules" / "dep" / "index.js").write_text("dependency")
+        (repo_dir / "pkg.egg-info").mkdir()
+        (repo_dir / "pkg.egg-info" / "PKG-INFO.txt").write_text("egg info")
+        (repo_dir / "src" / "app").mkdir(parents=True)
+        (repo_dir / "src" / "app" / "main.py").write_text("def main():\n    pass\n")
+        (repo_dir / "src" / "app" / "bundle.min.js").write_text("minified")
+        (repo_dir / "docs").mkdir()
+        (repo_dir / "docs" / "guide.md").write_text("# Guide\n\nUsage notes.")
+        (repo_dir / "README.md").write_text("# Mono\n")
+        (repo_dir / "yarn.lock").write_text("lock")
+        return repo_dir
+
+    def test_walker_prunes_excluded(self, monorepo):
+        """Test excluded directories and files are never yielded."""
+        from ingestor.extractors.git.files import ExcludeMatcher, walk_files
+
+        matcher = ExcludeMatcher(GitRepoConfig().exclude_patterns)
+        rel_paths = sorted(rel for _, rel in walk_files(monorepo, matcher))
+
+        assert rel_paths == ["README.md", "docs/guide.md", "src/app/main.py"]
+
+    def test_matcher(self):
+        """Test name, directory and glob patterns."""
+        from ingestor.extractors.git.files import ExcludeMatcher
+
+        matcher = ExcludeMatcher({"build/", "*.log", "yarn.lock", "*.egg-info/"})
+
+        assert matcher.excludes_dir(".git")
+        assert matcher.excludes_dir("build")
+        assert matcher.excludes_dir("foo.egg-info")
+        assert not matcher.excludes_dir("src")
+        assert matcher.excludes_file("debug.log", "logs/debug.log")
+        assert matcher.excludes_file("yarn.lock", "yarn.lock")
+        assert not matcher.excludes_file("main.py", "src/main.py")
+
+    @pytest.mark.asyncio
+    async def test_source_files_streamed(self, monorepo, tmp_path):
+        """Test code files are read lazily and written by the output writer."""
+        from ingestor.extractors.git.files import SourceFileStream
+        from ingestor.output.writer import OutputWriter
+        from ingestor.types import IngestConfig
+
+        result = await GitExtractor().extract(str(monorepo))
+
+        assert isinstance(result.source_files, SourceFileStream)
+        assert len(result.source_files) == 1
+        assert "Usage notes." in result.markdown
+        assert "dependency" not in result.markdown
+
+        output_dir = await OutputWriter(IngestConfig(output_dir=tmp_path / "out")).write(result)
+        written = output_dir / "source" / "src" / "app" / "main.py"
+        assert written.read_text() == "def main():\n    pass\n"
+
+    def test_stream_removes_owned_checkout(self, tmp_path):
+        """Test a stream owning a temporary checkout deletes it when consumed."""
+        from ingestor.extractors.git.files import SourceFileStream
+
+        checkout = tmp_path / "checkout"
+        checkout.mkdir()
+        (checkout / "a.py").write_text("a = 1")
+
+        stream = SourceFileStream(checkout, [("a.py", "python", 5)], cleanup=checkout)
+        files = list(stream)
+
+        assert [f.content for f in files] == ["a = 1"]
+        assert not checkout.exists()
+
+    @pytest.mark.asyncio
+    async def test_stream_async_iteration(self, tmp_path):
+        """Test async iteration reads every file and removes the checkout."""
+        from ingestor.extractors.git.files import SourceFileStream
+
+        checkout = tmp_path / "checkout"
+        checkout.mkdir()
+        for name in ("a", "b", "c"):
+            (checkout / f"{name}.py").write_text(f"{name} = 1")
+        entries = [(f"{name}.py", "python", 5) for name in ("a", "b", "c")]
+
+        stream = SourceFileStream(checkout, entries, workers=2, cleanup=checkout)
+        files = [f async for f in stream]
+
+        assert [f.path for f in files] == ["a.py", "b.py", "c.py"]
+        assert not checkout.exists()
+
+
+class TestGitExtractorRepoLists:
+    """Tests for concurrent .download_git processing."""
+
+    @pytest.fixture
+    def remotes(self, tmp_path):
+        """Create three local repositories reachable through file:// URLs."""
+        urls = []
+        for name in ("alpha", "beta", "gamma"):
+            repo_dir = tmp_path / "remotes" / name
+            repo_dir.mkdir(parents=True)
+            subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+            subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=repo_dir, check=True)
+            subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir, check=True)
+            (repo_dir / "README.md").write_text(f"# {name}\n")
+            (repo_dir / f"{name}.py").write_text("x = 1\n")
+            subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
+            subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo_dir, check=True)
+            urls.append(repo_dir.as_uri())
+        return urls
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_reported_per_repo(self, remotes, tmp_path):
+        """Test a failing repository is reported without aborting the others."""
+        missing = (tmp_path / "remotes" / "missing").as_uri()
+        git_file = tmp_path / "repos.download_git"
+        git_file.write_text("\n".join([remotes[0], missing, *remotes[1:]]))
+
+        events = []
+        extractor = GitExtractor(config=GitRepoConfig(clone_concurrency=2, process_concurrency=1))
+        extractor.progress = events.append
+        result = await extractor.extract(str(git_file))
+
+        assert result.metadata["repos_total"] == 4
+        assert result.metadata["repos_failed"] == 1
+        report = result.metadata["repos"]
+        assert [r["url"] for r in report] == [remotes[0], missing, *remotes[1:]]
+        assert [r["status"] for r in report] == ["ok", "failed", "ok", "ok"]
+        assert "## Failed Repositories (1)" in result.markdown
+        assert "# gamma" in result.markdown
+
+        finished = [e for e in events if e.stage in ("done", "failed")]
+        assert len(finished) == 4
+        assert max(e.completed for e in finished) == 4
+        assert any(e.stage == "cloning" for e in events)
+
+    @pytest.mark.asyncio
+    async def test_clone_and_process_limits(self, remotes):
+        """Test clones and processing never exceed their own limits."""
+        in_flight = {"clone": 0, "process": 0}
+        peak = {"clone": 0, "process": 0}
+
+        class TrackingExtractor(GitExtractor):
+            async def _clone_repo(self, url, target_path, progress=None):
+                in_flight["clone"] += 1
+                peak["clone"] = max(peak["clone"], in_flight["clone"])
+                try:
+                    await super()._clone_repo(url, target_path, progress)
+                finally:
+                    in_flight["clone"] -= 1
+
+            async def _extract_from_local_repo(self, repo_path, source, cleanup=None):
+                in_flight["process"] += 1
+                peak["process"] = max(peak["process"], in_flight["process"])
+                try:
+                    return await super()._extract_from_local_repo(repo_path, source, cleanup)
+                finally:
+                    in_flight["process"] -= 1
+
+        extractor = TrackingExtractor(config=GitRepoConfig(clone_concurrency=2, process_concurrency=1))
+        outcomes = []
+        async for outcome in extractor.extract_repos(remotes * 2):
+            outcome.result.source_files.close()
+            outcomes.append(outcome)
+
+        assert len(outcomes) == 6
+        assert all(o.ok for o in outcomes)
+        assert peak["clone"] <= 2
+        assert peak["process"] == 1
+
+    @pytest.mark.asyncio
+    async def test_clone_kept_on_disk_until_streamed(self, remotes):
+        """Test a repository's disk slot is freed only when its clone is removed."""
+        extractor = GitExtractor(config=GitRepoConfig(clone_concurrency=1, process_concurrency=1))
+        outcomes = extractor.extract_repos(remotes)
+
+        first = await anext(outcomes)
+        second = await anext(outcomes)
+        third = asyncio.ensure_future(anext(outcomes))
+        await asyncio.sleep(0.5)
+        assert not third.done()  # Both clones still on disk
+
+        list(first.result.source_files)
+        outcome = await asyncio.wait_for(third, timeout=30)
+
+        assert outcome.ok
+        second.result.source_files.close()
+        outcome.result.source_files.close()
+        await outcomes.aclose()
+
+    @pytest.mark.asyncio
+    async def test_router_yields_each_repo(self, remotes, tmp_path):
+        """Test batch processing yields one result per listed repository."""
+        from ingestor.core import ExtractorRegistry, Router
+
+        folder = tmp_path / "batch"
+        folder.mkdir()
+        (folder / "repos.download_git").write_text("\n".join(remotes))
+        registry = ExtractorRegistry()
+        registry.register(GitExtractor())
+
+        results = [r async for r in Router(registry).process_directory(folder)]
+
+        assert sorted(r.title for r in results) == ["alpha", "beta", "gamma"]
@@ -309,6 +309,77 @@ class TestOutputWriterWithImages:
         assert img_dir.exists()
 
 
+class TestOutputWriterPipeline:
+    """Tests for off-loop image conversion, concurrent writes and stage timings."""
+
+    @staticmethod
+    def _image_bytes(fmt: str, color: str = "red") -> bytes:
+        from io import BytesIO
+
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new("RGB", (20, 20), color=color).save(buffer, format=fmt)
+        return buffer.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_process_pool_conversion(self, tmp_path):
+        """Test a batch of JPEGs is converted in worker processes, in order."""
+        config = IngestConfig(output_dir=tmp_path, image_workers=2, generate_metadata=True)
+        writer = OutputWriter(config)
+        images = [
+            ExtractedImage(filename=f"fig{i}.jpg", data=self._image_bytes("JPEG"), format="jpeg")
+            for i in range(6)
+        ]
+        result = ExtractionResult(
+            markdown="".join(f"![f](./img/fig{i}.jpg)\n" for i in range(6)),
+            source="paper.pdf",
+            media_type=MediaType.PDF,
+            images=images,
+        )
+
+        try:
+            output_dir = await writer.write(result)
+        finally:
+            writer.close()
+
+        written = sorted(p.name for p in (output_dir / "img").iterdir())
+        assert written == [f"paper_pdf_img_{i:03d}.png" for i in range(1, 7)]
+        assert all(p.read_bytes().startswith(b"\x89PNG") for p in (output_dir / "img").iterdir())
+        assert "./img/paper_pdf_img_006.png" in (output_dir / "paper_pdf.md").read_text()
+
+        timings = json.loads((output_dir / "metadata.json").read_text())["timings"]
+        assert set(timings) == {"convert", "write"}
+
+    def test_mislabeled_image_not_reencoded(self):
+        """Test an image already encoded as the target is relabeled, not re-encoded."""
+        from ingestor.images.converter import ImageConverter, sniff_format
+
+        data = self._image_bytes("PNG")
+        image = ExtractedImage(filename="x.jpg", data=data, format="jpeg")
+
+        converted = ImageConverter("png").convert(image)
+
+        assert sniff_format(data) == "png"
+        assert converted.data is data
+        assert (converted.filename, converted.format) == ("x.png", "png")
+
+    @pytest.mark.asyncio
+    async def test_router_records_extract_time(self, tmp_path):
+        """Test the extraction stage is timed alongside the writer's stages."""
+        from ingestor.cli import _create_registry
+        from ingestor.core import Router
+
+        source = tmp_path / "notes.txt"
+        source.write_text("hello")
+        config = IngestConfig(output_dir=tmp_path / "out", generate_metadata=True)
+        result = await Router(_create_registry(config), config).process(source)
+        output_dir = await OutputWriter(config).write(result)
+
+        timings = json.loads((output_dir / "metadata.json").read_text())["timings"]
+        assert set(timings) == {"extract", "write"}
+
+
 class TestOutputWriterSync:
     """Tests for synchronous OutputWriterSync."""
 
@@ -455,3 +455,38 @@ class TestThroughput:
 
         # Should process at least 2000 rows/s
         assert rows_per_sec > 2000, f"Throughput {rows_per_sec:.0f} rows/s is below 2000"
+
+
+# ============================================================================
+# PDF Post-processing Performance Tests
+# ============================================================================
+
+class TestPostprocessPerformance:
+    """Benchmark the markdown post-processing passes over real papers."""
+
+    def test_per_pass_timings(self):
+        """Benchmark every pass over the paper set and report the timings."""
+        from ingestor.extractors.pdf.postprocess import process_markdown
+        from tests.unit.extractors.test_pdf_postprocess import PAPER_IMAGES, PAPERS_DIR
+
+        papers = [
+            ((PAPERS_DIR / name).read_text(encoding="utf-8"), images)
+            for name, images in sorted(PAPER_IMAGES.items())
+        ]
+        size_mb = sum(len(content.encode()) for content, _ in papers) / (1024 * 1024)
+        rounds = 5
+
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for content, images in papers:
+                process_markdown(content, images, timings=timings)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nPost-processing {size_mb * rounds:.2f} MB in {elapsed:.3f}s")
+        for name, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+            print(f"  {name:<13} {seconds * 1000 / rounds:8.2f} ms/round")
+
+        # Should process at least 1 MB/s
+        throughput = size_mb * rounds / elapsed
+        assert throughput > 1, f"Throughput {throughput:.2f} MB/s is below 1 MB/s"
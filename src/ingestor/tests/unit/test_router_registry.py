@@ -72,6 +72,31 @@ class TestExtractorRegistry:
         assert MediaType.TXT in supported
         assert MediaType.JSON in supported
 
+    def test_close_releases_extractor_pools(self):
+        """Test close shuts down extractors that hold worker pools, once each."""
+        from ingestor.extractors.audio.audio_extractor import AudioExtractor
+        from ingestor.extractors.text.txt_extractor import TxtExtractor
+
+        class CountingAudioExtractor(AudioExtractor):
+            closed = 0
+
+            def close(self):
+                type(self).closed += 1
+                super().close()
+
+        audio = CountingAudioExtractor()
+        audio._get_pool()
+        registry = ExtractorRegistry()
+        registry.register(TxtExtractor())
+        registry.register(audio)
+        # Registered under a second type, as the git extractor is
+        registry._extractors[MediaType.UNKNOWN] = audio
+
+        registry.close()
+
+        assert CountingAudioExtractor.closed == 1
+        assert audio._pool is None
+
 
 class TestFileDetector:
     """Tests for FileDetector class."""
@@ -0,0 +1,137 @@
+"""Unit tests for the universal quality filter."""
+
+import os
+
+import pytest
+
+from ingestor.filters import FilterReport, UniversalFilter
+from ingestor.filters.universal_filter import compute_metrics
+
+GOOD_PAGE = "\n".join(f"Line {i} with some real documentation words here." for i in range(40))
+TOC_PAGE = "\n".join(f"- [Section {i}](section{i}.md)" for i in range(60)) + "\n" + "filler " * 120
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Crawl-like output: one folder per page."""
+    pages = {
+        "guide/guide.md": GOOD_PAGE,
+        "stub/stub.md": "Too short.",
+        "toc/toc_page.md": TOC_PAGE,
+        "nav/index.html": "ignored",
+        "search/search.html.md": GOOD_PAGE,
+    }
+    for name, content in pages.items():
+        path = tmp_path / "docs" / name
+        path.parent.mkdir(parents=True)
+        path.write_text(content)
+    return tmp_path / "docs"
+
+
+class TestMetrics:
+    """Tests for threshold-independent metrics."""
+
+    def test_analyze_content_matches_metrics(self):
+        """Test analyze_content is a view of compute_metrics."""
+        content = "Intro [link](http://a) text\n\n![img](b.png) more words"
+        metrics = compute_metrics(content)
+
+        assert UniversalFilter().analyze_content(content) == (
+            metrics["line_count"],
+            metrics["word_count"],
+            metrics["link_count"],
+            metrics["link_ratio"],
+        )
+        assert metrics["link_count"] == 2
+
+    def test_toc_detection_from_metrics(self):
+        """Test TOC heuristics give the same answer from content or metrics."""
+        f = UniversalFilter(detect_toc=True)
+
+        assert f.check_toc_structure(TOC_PAGE)[0] is False
+        assert f.check_toc_metrics(compute_metrics(TOC_PAGE)) == f.check_toc_structure(TOC_PAGE)
+        assert f.check_toc_structure(GOOD_PAGE)[0] is True
+
+
+class TestFilterDirectory:
+    """Tests for parallel, cached directory filtering."""
+
+    def test_filter_directory(self, corpus):
+        """Test decisions across all tiers."""
+        results = UniversalFilter(detect_toc=True, workers=1).filter_directory(corpus)
+        by_name = {r.filename: r for r in results.values()}
+
+        assert set(by_name) == {"guide.md", "stub.md", "toc_page.md", "search.html.md"}
+        assert by_name["guide.md"].keep
+        assert by_name["stub.md"].reason.startswith("[TIER2]")
+        assert by_name["toc_page.md"].reason.startswith("[TIER3]")
+
+    def test_process_pool_matches_serial(self, corpus, monkeypatch):
+        """Test results are identical when analyzed in worker processes."""
+        monkeypatch.setattr("ingestor.filters.universal_filter.MIN_PARALLEL_FILES", 1)
+
+        serial = UniversalFilter(detect_toc=True, workers=1).filter_directory(corpus)
+        parallel = UniversalFilter(detect_toc=True, workers=2).filter_directory(corpus)
+
+        assert serial == parallel
+
+    def test_cache_skips_unchanged_files(self, corpus, tmp_path):
+        """Test a second run evaluates cached metrics without re-reading files."""
+        cache_dir = tmp_path / "cache"
+        first = UniversalFilter(workers=1, cache_dir=cache_dir)
+        first_results = first.filter_directory(corpus)
+        assert first.analyzed == 4
+        assert first.cache_hits == 0
+
+        second = UniversalFilter(workers=1, cache_dir=cache_dir)
+        assert second.filter_directory(corpus) == first_results
+        assert second.analyzed == 0
+        assert second.cache_hits == 4
+
+    def test_threshold_change_uses_cache(self, corpus, tmp_path):
+        """Test new thresholds are applied to cached metrics."""
+        cache_dir = tmp_path / "cache"
+        UniversalFilter(workers=1, cache_dir=cache_dir).filter_directory(corpus)
+
+        strict = UniversalFilter(min_words=10_000, workers=1, cache_dir=cache_dir)
+        results = strict.filter_directory(corpus)
+
+        assert strict.analyzed == 0
+        assert not any(r.keep for r in results.values())
+
+    def test_modified_file_reanalyzed(self, corpus, tmp_path):
+        """Test a changed file is read again."""
+        cache_dir = tmp_path / "cache"
+        UniversalFilter(workers=1, cache_dir=cache_dir).filter_directory(corpus)
+
+        stub = corpus / "stub" / "stub.md"
+        stub.write_text(GOOD_PAGE + "\nExtra line.")
+        stat = stub.stat()
+        os.utime(stub, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        f = UniversalFilter(workers=1, cache_dir=cache_dir)
+        results = f.filter_directory(corpus)
+
+        assert f.analyzed == 1
+        assert results[str(stub)].keep
+
+
+class TestFilterReport:
+    """Tests for the streaming report."""
+
+    def test_streamed_report_matches_generate_report(self, corpus):
+        """Test incremental aggregation renders the same report."""
+        f = UniversalFilter(detect_toc=True, workers=1)
+        results = f.filter_directory(corpus)
+
+        report = FilterReport()
+        for result in f.iter_directory(corpus):
+            report.add(result)
+
+        assert report.total == 4
+        assert report.kept == 2
+        assert report.render() == f.generate_report(results)
+
+    def test_empty_report(self):
+        """Test an empty directory does not divide by zero."""
+        assert "Total files: 0" in FilterReport().render()
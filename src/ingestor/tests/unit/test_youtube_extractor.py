@@ -1,9 +1,12 @@
 """Real unit tests for YouTube extractor - no mocking."""
 
 
+import time
+
 import pytest
 
-from ingestor.extractors.youtube.youtube_extractor import YouTubeExtractor
+from ingestor.extractors.youtube.cache import VideoCache
+from ingestor.extractors.youtube.youtube_extractor import HostPacer, YouTubeExtractor
 from ingestor.types import MediaType
 
 
@@ -323,3 +326,85 @@ class TestYouTubeExtractorEdgeCases:
         # Should recognize as YouTube
         extractor._extract_video_id(url)
         # Implementation may vary
+
+
+class TestVideoCache:
+    """Tests for the per-video metadata/transcript cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test metadata and transcripts are stored per video and variant."""
+        cache = VideoCache(tmp_path)
+        variant = VideoCache.variant("auto", ["en"])
+        cache.put_metadata("dQw4w9WgXcQ", {"video_id": "dQw4w9WgXcQ", "title": "T"})
+        cache.put_transcript("dQw4w9WgXcQ", variant, "hello")
+
+        reopened = VideoCache(tmp_path)
+        assert reopened.get_metadata("dQw4w9WgXcQ")["title"] == "T"
+        assert reopened.get_transcript("dQw4w9WgXcQ", variant) == "hello"
+        assert reopened.get_transcript("dQw4w9WgXcQ", VideoCache.variant("manual", ["en"])) is None
+        assert reopened.has("dQw4w9WgXcQ", variant)
+        assert (reopened.hits, reopened.misses) == (2, 1)
+
+    def test_failures_not_cached(self, tmp_path):
+        """Test errors and empty transcripts are fetched again next time."""
+        cache = VideoCache(tmp_path)
+        cache.put_metadata("abcdefghijk", {"video_id": "abcdefghijk", "error": "timeout"})
+        cache.put_transcript("abcdefghijk", "auto:en", "")
+
+        assert cache.get_metadata("abcdefghijk") is None
+        assert cache.get_transcript("abcdefghijk", "auto:en") is None
+
+
+class TestHostPacer:
+    """Tests for per-host request pacing."""
+
+    @pytest.mark.asyncio
+    async def test_requests_to_one_host_are_spaced(self):
+        """Test consecutive requests to a host wait for the interval."""
+        pacer = HostPacer(0.05)
+        start = time.monotonic()
+        for _ in range(3):
+            await pacer.wait("www.youtube.com")
+        assert time.monotonic() - start >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_independent(self):
+        """Test a different host is not held back."""
+        pacer = HostPacer(1.0)
+        await pacer.wait("a.example")
+        start = time.monotonic()
+        await pacer.wait("b.example")
+        assert time.monotonic() - start < 0.5
+
+
+class TestYouTubeCollections:
+    """Tests for playlist/channel handling and incremental refresh."""
+
+    def test_channel_urls(self):
+        """Test channel URLs are supported and treated as collections."""
+        extractor = YouTubeExtractor()
+        for url in [
+            "https://www.youtube.com/@somechannel",
+            "https://www.youtube.com/channel/UC1234567890",
+            "https://www.youtube.com/c/SomeName/videos",
+        ]:
+            assert extractor.supports(url)
+            assert extractor.is_collection(url)
+        assert extractor.is_collection("https://www.youtube.com/playlist?list=PLtest")
+        assert not extractor.is_collection("https://www.youtube.com/watch?v=abc123&list=PLtest")
+
+    @pytest.mark.asyncio
+    async def test_cached_videos_not_fetched(self, tmp_path):
+        """Test cached videos are served from disk, in order, minus skipped IDs."""
+        extractor = YouTubeExtractor(cache_dir=tmp_path, min_interval=0)
+        variant = VideoCache.variant("auto", ["en"])
+        ids = ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc"]
+        for video_id in ids:
+            extractor.cache.put_metadata(video_id, {"video_id": video_id, "title": video_id.upper()})
+            extractor.cache.put_transcript(video_id, variant, f"said in {video_id}")
+
+        results = await extractor.extract_videos(ids, skip_ids={"bbbbbbbbbbb"})
+
+        assert [r.title for r in results] == ["AAAAAAAAAAA", "CCCCCCCCCCC"]
+        assert "said in ccccccccccc" in results[1].markdown
+        assert extractor.cache.misses == 0
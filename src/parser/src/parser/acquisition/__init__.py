@@ -6,31 +6,45 @@ Based on: https://github.com/paper-acq/paper-retriever
 Key Features:
 - Multi-source PDF retrieval (Unpaywall, arXiv, PMC, S2, etc.)
 - Configurable source priority
-- Rate limiting per source
+- Token-bucket rate limiting per source (bursts, Retry-After)
+- Shared connection pool with per-host limits and optional HTTP/2
+- Persistent SQLite cache of metadata lookups, PDF URLs and misses
 - Detailed logging per paper
-- Batch retrieval with progress tracking
+- Batch retrieval with progress tracking, scheduled per source
+- Bulk metadata pre-resolution via batch APIs (CrossRef, S2, OpenAlex)
 - API clients for various sources
 """
 
+from .bulk import BulkResolver
 from .config import Config
 from .downloader import (
     DownloadConfig,
     DownloadResult,
     PaperDownloader,
 )
+from .http_pool import HttpPool
+from .journal import BatchJournal
 from .logger import RetrievalLogger
-from .rate_limiter import RateLimiter
+from .metadata_cache import MetadataCache
+from .rate_limiter import RateLimiter, TokenBucket
 from .retriever import (
     PaperRetriever,
+    RetrievalJob,
     RetrievalResult,
     RetrievalStatus,
 )
+from .scheduler import SourceScheduler
+from .source_stats import SourceStats
 
 __all__ = [
     # Retriever
     "PaperRetriever",
     "RetrievalResult",
     "RetrievalStatus",
+    "RetrievalJob",
+    "SourceScheduler",
+    "SourceStats",
+    "BatchJournal",
     # Downloader
     "PaperDownloader",
     "DownloadConfig",
@@ -40,4 +54,8 @@ __all__ = [
     # Config
     "Config",
     "RateLimiter",
+    "TokenBucket",
+    "HttpPool",
+    "MetadataCache",
+    "BulkResolver",
 ]
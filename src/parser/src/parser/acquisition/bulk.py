@@ -0,0 +1,144 @@
+"""Bulk metadata resolution through batch APIs.
+
+Resolving a reference list one identifier at a time costs a CrossRef,
+Semantic Scholar or OpenAlex call per paper. All three accept many IDs per
+request, so known DOIs and arXiv IDs are resolved up front in a handful of
+calls:
+
+1. CrossRef ``filter=doi:a,doi:b,...`` (most authoritative for DOIs)
+2. Semantic Scholar ``POST /paper/batch`` for DOIs CrossRef did not
+   answer, and for arXiv IDs
+3. OpenAlex ``filter=doi:a|b|c`` for whatever is still missing
+
+The results warm the per-paper path (the retriever's lookup and the
+metadata cache), which then only queries papers the batch could not resolve.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from .metadata_cache import normalize_doi
+
+_ARXIV_DOI = re.compile(r"^10\.48550/arxiv\.(.+)$", re.IGNORECASE)
+_ARXIV_ID = re.compile(r"^(?:arxiv:)?(\d{4}\.\d{4,5}(?:v\d+)?|[a-z-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)$", re.IGNORECASE)
+
+
+def classify_identifier(identifier: str) -> tuple[str, str] | None:
+    """Classify an identifier for bulk lookup.
+
+    Args:
+        identifier: DOI (bare or as a doi.org URL) or arXiv ID
+
+    Returns:
+        ("doi", doi) or ("arxiv", arxiv_id), or None for anything else
+    """
+    value = identifier.strip()
+    if not value:
+        return None
+    doi = normalize_doi(value)
+    arxiv = _ARXIV_DOI.match(doi)
+    if arxiv:
+        return "arxiv", arxiv.group(1)
+    if doi.startswith("10.") and "/" in doi:
+        return "doi", doi
+    match = _ARXIV_ID.match(value)
+    if match:
+        return "arxiv", match.group(1)
+    return None
+
+
+def is_complete(metadata: dict[str, Any] | None) -> bool:
+    """Whether metadata is good enough to skip the per-paper lookup."""
+    return bool(metadata and metadata.get("title") and metadata.get("year") and metadata.get("authors"))
+
+
+class BulkResolver:
+    """Resolve many DOIs and arXiv IDs with batched API calls.
+
+    Example:
+        >>> resolver = BulkResolver(crossref, semantic_scholar, openalex)
+        >>> found = await resolver.resolve(["10.1038/nature12373", "arXiv:1706.03762"])
+        >>> print(resolver.summary())
+    """
+
+    def __init__(
+        self,
+        crossref: Any | None = None,
+        semantic_scholar: Any | None = None,
+        openalex: Any | None = None,
+    ):
+        """Initialize the resolver.
+
+        Args:
+            crossref: CrossRefClient (skipped if None)
+            semantic_scholar: SemanticScholarClient (skipped if None)
+            openalex: OpenAlexClient (skipped if None)
+        """
+        self.crossref = crossref
+        self.semantic_scholar = semantic_scholar
+        self.openalex = openalex
+        self.requested = 0
+        self.resolved = 0
+        self.calls = 0
+
+    async def resolve(self, identifiers: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Resolve identifiers in bulk.
+
+        Args:
+            identifiers: DOIs and arXiv IDs (others are ignored)
+
+        Returns:
+            Dict mapping each input identifier that resolved to complete
+            metadata (title, year and authors)
+        """
+        dois: dict[str, list[str]] = {}
+        arxiv_ids: dict[str, list[str]] = {}
+        for identifier in dict.fromkeys(identifiers):
+            kind = classify_identifier(identifier)
+            if kind:
+                (dois if kind[0] == "doi" else arxiv_ids).setdefault(kind[1], []).append(identifier)
+        self.requested += len(dois) + len(arxiv_ids)
+
+        found: dict[str, dict[str, Any]] = {}  # DOI / arXiv ID -> metadata
+
+        def missing_dois() -> list[str]:
+            return [doi for doi in dois if doi not in found]
+
+        if self.crossref and dois:
+            self._count(dois, self.crossref)
+            for doi, metadata in (await self.crossref.get_papers_metadata(list(dois))).items():
+                if doi in dois and is_complete(metadata):
+                    found[doi] = metadata
+
+        if self.semantic_scholar and (missing_dois() or arxiv_ids):
+            ids = [f"DOI:{doi}" for doi in missing_dois()] + [f"ARXIV:{arxiv_id}" for arxiv_id in arxiv_ids]
+            self._count(ids, self.semantic_scholar)
+            for paper_id, metadata in (await self.semantic_scholar.get_papers_metadata(ids)).items():
+                if is_complete(metadata):
+                    found[paper_id.split(":", 1)[1]] = metadata
+
+        if self.openalex and missing_dois():
+            remaining = missing_dois()
+            self._count(remaining, self.openalex)
+            for doi, metadata in (await self.openalex.get_papers_metadata(remaining)).items():
+                if doi in dois and is_complete(metadata):
+                    found[doi] = metadata
+
+        results: dict[str, dict[str, Any]] = {}
+        for key, metadata in found.items():
+            for identifier in dois.get(key, []) + arxiv_ids.get(key, []):
+                results[identifier] = metadata
+        self.resolved += len(found)
+        return results
+
+    def _count(self, ids: Iterable[Any], client: Any) -> None:
+        """Count the batched calls a lookup will make."""
+        batch = getattr(client, "BATCH_SIZE", 1)
+        self.calls += -(-len(list(ids)) // batch)
+
+    def summary(self) -> str:
+        """One-line summary for logs and batch reports."""
+        return f"{self.resolved}/{self.requested} identifiers in {self.calls} batched calls"
@@ -13,9 +13,12 @@ import asyncio
 import re
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
+from ..http_pool import pooled_client
+
+if TYPE_CHECKING:
+    from ..http_pool import HttpPool
 
 
 class ACLAnthologyClient:
@@ -41,6 +44,7 @@ class ACLAnthologyClient:
         enabled: bool = True,
         timeout: float = 30.0,
         rate_limit: float = 1.0,
+        http: HttpPool | None = None,
     ):
         """Initialize the ACL Anthology client.
 
@@ -48,10 +52,12 @@ class ACLAnthologyClient:
             enabled: Whether the client is enabled
             timeout: Request timeout in seconds
             rate_limit: Seconds between requests
+            http: Shared connection pool (a client per request if None)
         """
         self.enabled = enabled
         self.timeout = timeout
         self.rate_limit = rate_limit
+        self.http = http
         self._last_request: float = 0.0
 
     async def _rate_limit_wait(self) -> None:
@@ -148,7 +154,8 @@ class ACLAnthologyClient:
         }
 
         try:
-            async with httpx.AsyncClient(
+            async with pooled_client(
+                self.http,
                 timeout=self.timeout,
                 follow_redirects=True,
             ) as client:
@@ -205,7 +212,8 @@ class ACLAnthologyClient:
         search_url = f"{self.BASE_URL}/search/"
 
         try:
-            async with httpx.AsyncClient(
+            async with pooled_client(
+                self.http,
                 timeout=self.timeout,
                 follow_redirects=True,
             ) as client:
@@ -7,8 +7,6 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-import httpx
-
 from .base import BaseClient, RateLimiter
 
 
@@ -78,7 +76,7 @@ class ArxivClient(BaseClient):
             "max_results": 1,
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client(timeout=self.timeout) as client:
             try:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
@@ -216,7 +214,7 @@ class ArxivClient(BaseClient):
             "sortOrder": "descending",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client(timeout=self.timeout) as client:
             try:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
@@ -310,7 +308,7 @@ class ArxivClient(BaseClient):
 
         await self.rate_limiter.wait()
 
-        async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+        async with self._client(timeout=60, follow_redirects=True) as client:
             try:
                 response = await client.get(pdf_url)
                 response.raise_for_status()
@@ -2,43 +2,24 @@
 
 from __future__ import annotations
 
-import asyncio
-import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any
+from contextlib import AbstractAsyncContextManager
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from ..http_pool import pooled_client
+from ..rate_limiter import TokenBucket, parse_retry_after
 
-@dataclass
-class RateLimiter:
-    """Simple rate limiter for API calls.
+if TYPE_CHECKING:
+    from ..http_pool import HttpPool
 
-    Args:
-        calls_per_second: Maximum calls per second (can be fractional)
-        min_delay: Minimum delay between calls in seconds
-    """
+# Clients take a per-source token bucket; the retriever hands them the
+# bucket it uses for the same source, so each source is limited once.
+RateLimiter = TokenBucket
 
-    calls_per_second: float = 1.0
-    min_delay: float = 0.1
-    _last_call: float = field(default=0.0, repr=False)
-
-    async def wait(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        if self.calls_per_second <= 0:
-            return
-
-        delay = 1.0 / self.calls_per_second
-        delay = max(delay, self.min_delay)
-
-        now = time.monotonic()
-        elapsed = now - self._last_call
-
-        if elapsed < delay:
-            await asyncio.sleep(delay - elapsed)
-
-        self._last_call = time.monotonic()
+# Longest Retry-After honored by retrying; longer ones fail the request
+MAX_RETRY_AFTER = 30.0
 
 
 class BaseClient(ABC):
@@ -50,6 +31,8 @@ class BaseClient(ABC):
         timeout: float = 30.0,
         rate_limiter: RateLimiter | None = None,
         user_agent: str | None = None,
+        http: HttpPool | None = None,
+        max_retries: int = 1,
     ):
         """Initialize the client.
 
@@ -58,10 +41,14 @@ class BaseClient(ABC):
             timeout: Request timeout in seconds
             rate_limiter: Rate limiter instance
             user_agent: Custom user agent string
+            http: Shared connection pool (a client per request if None)
+            max_retries: Retries after a 429 response
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.rate_limiter = rate_limiter or RateLimiter()
+        self.http = http
+        self.max_retries = max_retries
         self._headers: dict[str, str] = {
             "User-Agent": user_agent or "parser/1.0 (https://github.com/parser)",
         }
@@ -75,6 +62,14 @@ class BaseClient(ABC):
         """Set a custom header."""
         self._headers[key] = value
 
+    def _client(self, **kwargs: Any) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Get an HTTP client: the shared pool's, or a one-off one.
+
+        Args:
+            **kwargs: ``httpx.AsyncClient`` arguments for a one-off client
+        """
+        return pooled_client(self.http, **kwargs)
+
     async def _request(
         self,
         method: str,
@@ -85,6 +80,10 @@ class BaseClient(ABC):
     ) -> dict[str, Any] | None:
         """Make an HTTP request with rate limiting.
 
+        A 429 response (or a 503 with ``Retry-After``) throttles this
+        client's rate limiter, so every caller sharing it backs off, and
+        the request is retried once the delay has passed.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (relative to base_url)
@@ -95,33 +94,45 @@ class BaseClient(ABC):
         Returns:
             JSON response or None if request failed
         """
-        await self.rate_limiter.wait()
-
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json,
-                    headers=self.headers,
-                    **kwargs,
-                )
-
-                if response.status_code == 404:
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.wait()
+
+            async with self._client(timeout=self.timeout) as client:
+                try:
+                    response = await client.request(
+                        method,
+                        url,
+                        params=params,
+                        json=json,
+                        headers=self.headers,
+                        timeout=self.timeout,
+                        **kwargs,
+                    )
+
+                    if response.status_code == 404:
+                        return None
+
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if response.status_code == 429 or (response.status_code == 503 and retry_after is not None):
+                        if retry_after is None:
+                            retry_after = max(2 * self.rate_limiter.interval, 1.0)
+                        self.rate_limiter.throttle(retry_after)
+                        if attempt < self.max_retries and retry_after <= MAX_RETRY_AFTER:
+                            continue
+                        return None
+
+                    response.raise_for_status()
+                    return response.json()
+
+                except httpx.HTTPStatusError:
                     return None
-
-                response.raise_for_status()
-                return response.json()
-
-            except httpx.HTTPStatusError:
-                return None
-            except httpx.TimeoutException:
-                return None
-            except Exception:
-                return None
+                except httpx.TimeoutException:
+                    return None
+                except Exception:
+                    return None
+        return None
 
     async def get(
         self,
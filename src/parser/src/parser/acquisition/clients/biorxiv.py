@@ -8,8 +8,6 @@ import time
 from pathlib import Path
 from typing import Any
 
-import httpx
-
 from .base import BaseClient, RateLimiter
 
 
@@ -54,7 +52,7 @@ class BioRxivClient(BaseClient):
         if not doi.startswith("10.1101"):
             return None
 
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._client(timeout=30) as client:
             for server, api in [
                 ("biorxiv", self.BIORXIV_API),
                 ("medrxiv", self.MEDRXIV_API),
@@ -111,7 +109,7 @@ class BioRxivClient(BaseClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+            async with self._client(timeout=60, follow_redirects=True) as client:
                 response = await client.get(pdf_url, headers=headers)
 
                 if response.status_code == 200:
@@ -268,7 +266,7 @@ class BioRxivClient(BaseClient):
         url = f"{base_url}/{server}/{start_date}/{end_date}/{cursor}/json"
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with self._client(timeout=30) as client:
                 response = await client.get(url)
                 response.raise_for_status()
                 return response.json()
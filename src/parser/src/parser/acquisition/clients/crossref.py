@@ -15,6 +15,9 @@ class CrossRefClient(BaseClient):
 
     BASE_URL = "https://api.crossref.org"
 
+    # DOIs per filtered query (keeps the URL well under server limits)
+    BATCH_SIZE = 20
+
     def __init__(self, email: str | None = None):
         """Initialize the CrossRef client.
 
@@ -55,8 +58,33 @@ class CrossRefClient(BaseClient):
         if not data or "message" not in data:
             return None
 
-        msg = data["message"]
+        return self._parse_work(data["message"])
+
+    async def get_papers_metadata(self, dois: list[str]) -> dict[str, dict[str, Any]]:
+        """Get metadata for many DOIs with filtered multi-DOI queries.
+
+        Args:
+            dois: DOIs to look up
+
+        Returns:
+            Dict mapping lowercased DOI to metadata, for the DOIs found
+        """
+        results: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(dois), self.BATCH_SIZE):
+            chunk = dois[start:start + self.BATCH_SIZE]
+            data = await self.get(
+                "works",
+                params={"filter": ",".join(f"doi:{doi}" for doi in chunk), "rows": len(chunk)},
+            )
+            if not data or "message" not in data:
+                continue
+            for item in data["message"].get("items", []):
+                if item.get("DOI"):
+                    results[item["DOI"].lower()] = self._parse_work(item)
+        return results
 
+    def _parse_work(self, msg: dict[str, Any]) -> dict[str, Any]:
+        """Normalize a CrossRef work record."""
         # Extract authors
         authors = []
         for author in msg.get("author", []):
@@ -186,7 +214,6 @@ class CrossRefClient(BaseClient):
         """
         await self.rate_limiter.wait()
 
-        import httpx
 
         # Clean DOI
         if doi.startswith("https://doi.org/"):
@@ -196,7 +223,7 @@ class CrossRefClient(BaseClient):
 
         url = f"https://doi.org/{doi}"
 
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+        async with self._client(timeout=30, follow_redirects=True) as client:
             try:
                 response = await client.get(
                     url,
@@ -14,9 +14,12 @@ import asyncio
 import contextlib
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import httpx
+from ..http_pool import pooled_client
+
+if TYPE_CHECKING:
+    from ..http_pool import HttpPool
 
 
 class FrontiersClient:
@@ -40,6 +43,7 @@ class FrontiersClient:
         enabled: bool = True,
         timeout: float = 60.0,
         use_selenium: bool = True,
+        http: HttpPool | None = None,
     ):
         """Initialize the Frontiers client.
 
@@ -47,10 +51,12 @@ class FrontiersClient:
             enabled: Whether the client is enabled
             timeout: Request timeout in seconds
             use_selenium: Whether to use Selenium for bot protection bypass
+            http: Shared connection pool (a client per request if None)
         """
         self.enabled = enabled
         self.timeout = timeout
         self.use_selenium = use_selenium
+        self.http = http
 
     def is_frontiers_doi(self, doi: str) -> bool:
         """Check if a DOI is from Frontiers.
@@ -124,7 +130,8 @@ class FrontiersClient:
         }
 
         try:
-            async with httpx.AsyncClient(
+            async with pooled_client(
+                self.http,
                 timeout=self.timeout,
                 follow_redirects=True,
             ) as client:
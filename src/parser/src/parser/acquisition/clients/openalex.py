@@ -15,6 +15,9 @@ class OpenAlexClient(BaseClient):
 
     BASE_URL = "https://api.openalex.org"
 
+    # DOIs per ``filter=doi:a|b|c`` query (the API's OR-filter limit)
+    BATCH_SIZE = 50
+
     def __init__(self, email: str | None = None):
         """Initialize the OpenAlex client.
 
@@ -66,6 +69,35 @@ class OpenAlexClient(BaseClient):
         if not data:
             return None
 
+        return self._parse_work(data)
+
+    async def get_papers_metadata(self, dois: list[str]) -> dict[str, dict[str, Any]]:
+        """Get metadata for many DOIs with ``filter=doi:a|b|c`` queries.
+
+        Args:
+            dois: DOIs to look up
+
+        Returns:
+            Dict mapping lowercased DOI to metadata, for the DOIs found
+        """
+        results: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(dois), self.BATCH_SIZE):
+            chunk = dois[start:start + self.BATCH_SIZE]
+            params = self._add_email_param({
+                "filter": "doi:" + "|".join(chunk),
+                "per_page": self.BATCH_SIZE,
+            })
+            data = await self.get("works", params=params)
+            if not data or "results" not in data:
+                continue
+            for work in data["results"]:
+                metadata = self._parse_work(work)
+                if metadata["doi"]:
+                    results[metadata["doi"].lower()] = metadata
+        return results
+
+    def _parse_work(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Normalize an OpenAlex work record."""
         # Extract authors
         authors = []
         for authorship in data.get("authorships", []):
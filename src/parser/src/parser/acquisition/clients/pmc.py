@@ -5,8 +5,6 @@ from __future__ import annotations
 import xml.etree.ElementTree as ET
 from typing import Any
 
-import httpx
-
 from .base import BaseClient, RateLimiter
 
 
@@ -108,7 +106,7 @@ class PMCClient(BaseClient):
         params: dict[str, Any] = {"id": pmcid, "format": "pdf"}
 
         try:
-            async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            async with self._client(timeout=30, follow_redirects=True) as client:
                 response = await client.get(self.OA_URL, params=params)
                 response.raise_for_status()
 
@@ -131,7 +129,7 @@ class PMCClient(BaseClient):
 
         # Try OA API without format to get tar.gz (will be handled by download method)
         try:
-            async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            async with self._client(timeout=30, follow_redirects=True) as client:
                 response = await client.get(self.OA_URL, params={"id": pmcid})
                 response.raise_for_status()
                 root = ET.fromstring(response.text)
@@ -174,7 +172,7 @@ class PMCClient(BaseClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+            async with self._client(timeout=60, follow_redirects=True) as client:
                 response = await client.get(url, headers=headers)
                 response.raise_for_status()
                 content = response.content
@@ -230,7 +228,7 @@ class PMCClient(BaseClient):
             params["email"] = self.email
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with self._client(timeout=30) as client:
                 # First search for IDs
                 search_url = f"{self.EUTILS_BASE}/esearch.fcgi"
                 response = await client.get(search_url, params=params)
@@ -290,7 +288,7 @@ class PMCClient(BaseClient):
             params["api_key"] = self.api_key
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
+            async with self._client(timeout=30) as client:
                 url = f"{self.EUTILS_BASE}/esummary.fcgi"
                 response = await client.get(url, params=params)
                 response.raise_for_status()
@@ -31,6 +31,9 @@ class SemanticScholarClient(BaseClient):
         "publicationTypes",
     ]
 
+    # IDs per ``POST /paper/batch`` request (API maximum)
+    BATCH_SIZE = 500
+
     AUTHOR_FIELDS = [
         "authorId",
         "name",
@@ -112,7 +115,35 @@ class SemanticScholarClient(BaseClient):
         if not data:
             return None
 
-        # Normalize to common format
+        return self._parse_paper(data)
+
+    async def get_papers_metadata(self, identifiers: list[str]) -> dict[str, dict[str, Any]]:
+        """Get metadata for many papers with ``POST /paper/batch``.
+
+        Args:
+            identifiers: DOIs, arXiv IDs, ... (as for get_paper_metadata)
+
+        Returns:
+            Dict mapping each identifier found to its metadata
+        """
+        results: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(identifiers), self.BATCH_SIZE):
+            chunk = identifiers[start:start + self.BATCH_SIZE]
+            data = await self.post(
+                "paper/batch",
+                json={"ids": [self._format_paper_id(identifier) for identifier in chunk]},
+                params={"fields": ",".join(self.PAPER_FIELDS)},
+            )
+            if not isinstance(data, list):
+                continue
+            # Results come back in request order, None for unknown IDs
+            for identifier, paper in zip(chunk, data, strict=False):
+                if paper:
+                    results[identifier] = self._parse_paper(paper)
+        return results
+
+    def _parse_paper(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Normalize a Semantic Scholar paper record."""
         # Extract PDF URL - try openAccessPdf first, then arXiv fallback
         pdf_url = data.get("openAccessPdf", {}).get("url") if data.get("openAccessPdf") else None
 
@@ -25,6 +25,8 @@ class Config:
     download: dict[str, Any] = field(default_factory=dict)
     rate_limits: dict[str, Any] = field(default_factory=dict)
     batch: dict[str, Any] = field(default_factory=dict)
+    cache: dict[str, Any] = field(default_factory=dict)
+    source_stats: dict[str, Any] = field(default_factory=dict)
     logging: dict[str, Any] = field(default_factory=dict)
 
     @classmethod
@@ -111,6 +113,16 @@ class Config:
             "max_title_length": 50,
             "create_subfolders": False,
             "skip_existing": True,
+            # Shared connection pool (http2: None = when h2 is installed)
+            "max_connections": 100,
+            "max_connections_per_host": 8,
+            "http2": None,
+            # Try this many sources at once (0/1 = one by one)
+            "race_sources": 0,
+            "race_strict_priority": False,
+            # Streamed PDF downloads: size cap and Range resumes per download
+            "max_pdf_mb": 100,
+            "resume_attempts": 2,
         }
         download: dict[str, Any] = data.get("download", {})
         for key, value in default_download.items():
@@ -131,6 +143,11 @@ class Config:
                 "scihub": 5.0,
                 "libgen": 3.0,
             },
+            # Calls allowed back to back before per-source spacing applies
+            "per_source_burst": {
+                "unpaywall": 5,
+                "openalex": 5,
+            },
         }
         rate_limits: dict[str, Any] = data.get("rate_limits", {})
         for key, value in default_rate_limits.items():
@@ -143,13 +160,46 @@ class Config:
             "retry_failed": True,
             "max_retries": 2,
             "save_progress": True,
-            "progress_file": ".retrieval_progress.json",
+            "progress_file": ".retrieval_progress.json",  # Legacy, read on resume
+            "journal_file": ".retrieval_journal.jsonl",
+            "per_source_workers": 4,
+            # Resolve known DOIs / arXiv IDs with batch APIs before the run
+            "prefetch_metadata": True,
         }
         batch: dict[str, Any] = data.get("batch", {})
         for key, value in default_batch.items():
             if key not in batch:
                 batch[key] = value
 
+        # Default metadata cache configuration (TTLs in days per entry kind)
+        default_cache: dict[str, Any] = {
+            "enabled": True,
+            "path": str(Path.home() / ".cache" / "parser" / "metadata.sqlite"),
+            "ttl_days": {
+                "title": 90,
+                "metadata": 90,
+                "pdf_url": 30,
+                "negative": 7,
+            },
+        }
+        cache: dict[str, Any] = data.get("cache", {})
+        for key, value in default_cache.items():
+            if key not in cache:
+                cache[key] = value
+
+        # Default adaptive source ordering (see SourceStats)
+        default_source_stats: dict[str, Any] = {
+            "enabled": False,
+            "path": str(Path.home() / ".cache" / "parser" / "source_stats.sqlite"),
+            "exploration": 0.1,
+            "skip_after": 0,
+            "max_age_days": 90,
+        }
+        source_stats: dict[str, Any] = data.get("source_stats", {})
+        for key, value in default_source_stats.items():
+            if key not in source_stats:
+                source_stats[key] = value
+
         # Default institutional configuration
         default_institutional: dict[str, Any] = {
             "enabled": False,
@@ -185,6 +235,8 @@ class Config:
             download=download,
             rate_limits=rate_limits,
             batch=batch,
+            cache=cache,
+            source_stats=source_stats,
             logging=logging_config,
         )
 
@@ -230,5 +282,7 @@ class Config:
             "download": self.download,
             "rate_limits": self.rate_limits,
             "batch": self.batch,
+            "cache": self.cache,
+            "source_stats": self.source_stats,
             "logging": self.logging,
         }
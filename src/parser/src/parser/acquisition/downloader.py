@@ -132,6 +132,14 @@ class PaperDownloader:
             )
         except Exception as e:
             return DownloadResult(success=False, identifier=source_str, error=str(e))
+        finally:
+            # Each call may run on its own event loop (asyncio.run per call)
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the retriever's pooled HTTP connections."""
+        if self._retriever is not None:
+            await self._retriever.aclose()
 
     def _generate_bibtex(self, metadata: dict[str, Any], output_dir: Path) -> Path | None:
         """Generate BibTeX file from metadata."""
@@ -0,0 +1,249 @@
+"""Shared HTTP connection pool for acquisition clients.
+
+Every API client and PDF download used to open its own ``httpx.AsyncClient``,
+paying DNS, TCP and TLS setup on every call. ``HttpPool`` holds a single
+client per retriever so connections to CrossRef, Semantic Scholar, OpenAlex,
+Unpaywall, arXiv, ... are kept alive and reused (over HTTP/2 where the
+server supports it and ``h2`` is installed).
+
+Connections are limited per host as well as in total, so one slow publisher
+cannot take every connection. New connections are counted through httpcore's
+trace hooks, which makes connection reuse visible in :class:`PoolStats`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class HostStats:
+    """Request and connection counts for one host."""
+
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served over an already open connection."""
+        return max(0, self.requests - self.connections)
+
+
+@dataclass
+class PoolStats:
+    """Connection reuse statistics for a pool."""
+
+    hosts: dict[str, HostStats] = field(default_factory=dict)
+
+    def host(self, name: str) -> HostStats:
+        """Get (or create) the stats for a host."""
+        if name not in self.hosts:
+            self.hosts[name] = HostStats()
+        return self.hosts[name]
+
+    @property
+    def requests(self) -> int:
+        """Total requests sent."""
+        return sum(h.requests for h in self.hosts.values())
+
+    @property
+    def connections(self) -> int:
+        """Total connections opened."""
+        return sum(h.connections for h in self.hosts.values())
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of requests that reused an open connection."""
+        requests = self.requests
+        return (requests - self.connections) / requests if requests else 0.0
+
+    def summary(self) -> str:
+        """One-line summary for logs and batch reports."""
+        return (
+            f"{self.requests} requests over {self.connections} connections "
+            f"({self.reuse_rate:.0%} reused, {len(self.hosts)} hosts)"
+        )
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its host slot when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Any):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport that bounds concurrent requests per host and counts connections."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int, stats: PoolStats):
+        self._transport = transport
+        self._max_per_host = max(1, max_per_host)
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        stats = self._stats.host(host)
+        slot = self._slots.setdefault(host, asyncio.Semaphore(self._max_per_host))
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                stats.connections += 1
+
+        request.extensions = {**request.extensions, "trace": trace}
+
+        await slot.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        stats.requests += 1
+        if response.is_closed:
+            # Body already read (e.g. by a mock transport)
+            slot.release()
+        elif isinstance(response.stream, httpx.AsyncByteStream):
+            response.stream = _ReleasingStream(response.stream, slot.release)
+        else:
+            slot.release()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@asynccontextmanager
+async def pooled_client(pool: HttpPool | None, **kwargs: Any) -> AsyncIterator[httpx.AsyncClient]:
+    """Get an HTTP client: the pool's shared one, or a one-off client.
+
+    Lets clients work both inside a retriever (pooled) and standalone.
+
+    Args:
+        pool: Shared pool, or None
+        **kwargs: ``httpx.AsyncClient`` arguments for a one-off client
+    """
+    if pool is not None:
+        yield pool.client
+    else:
+        async with httpx.AsyncClient(**kwargs) as client:
+            yield client
+
+
+class HttpPool:
+    """A pooled ``httpx.AsyncClient`` shared by all acquisition clients.
+
+    Example:
+        >>> pool = HttpPool()
+        >>> response = await pool.get("https://api.crossref.org/works/10.1234/x")
+        >>> await pool.aclose()
+        >>> print(pool.stats.summary())
+    """
+
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        max_connections: int = 100,
+        max_per_host: int = 8,
+        http2: bool | None = None,
+        follow_redirects: bool = True,
+    ):
+        """Initialize the pool.
+
+        Args:
+            timeout: Default request timeout in seconds
+            max_connections: Maximum open connections in total
+            max_per_host: Maximum concurrent requests to one host
+            http2: Negotiate HTTP/2 (default: when ``h2`` is installed)
+            follow_redirects: Follow redirects by default
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.http2 = _http2_available() if http2 is None else http2
+        self.follow_redirects = follow_redirects
+        self.stats = PoolStats()
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client (created on first use).
+
+        Connections belong to the event loop they were opened on, so the
+        client is rebuilt when used from another loop (e.g. a second
+        ``asyncio.run``) rather than reusing connections of a closed loop.
+        """
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._client is not None and loop is not None and self._loop is not None and loop is not self._loop:
+            # The old loop may be closed; its connections cannot be closed cleanly
+            self._client = None
+        if self._client is None or self._client.is_closed:
+            self._loop = loop
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            transport = httpx.AsyncHTTPTransport(limits=limits, http2=self.http2)
+            self._client = httpx.AsyncClient(
+                transport=_HostLimitedTransport(transport, self.max_per_host, self.stats),
+                timeout=self.timeout,
+                follow_redirects=self.follow_redirects,
+            )
+        return self._client
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request and read the whole response."""
+        return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request."""
+        return await self.client.get(url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """Send a request and stream the response body."""
+        async with self.client.stream(method, url, **kwargs) as response:
+            yield response
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        if self._client is not None:
+            if self._loop is None or self._loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> HttpPool:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
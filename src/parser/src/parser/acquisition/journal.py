@@ -0,0 +1,207 @@
+"""Append-only journal of batch retrieval outcomes.
+
+``retrieve_batch`` used to rewrite ``.retrieval_progress.json`` with the
+whole ``completed`` set after every paper (quadratic I/O over a batch, and
+racy under concurrency) and recorded nothing about failures. The journal
+appends one JSON line per finished paper instead:
+
+    {"key": "10.1234/x", "status": "success", "source": "arxiv",
+     "pdf_path": "...", "elapsed": 4.2, "error": null, "sha256": "...", ...}
+
+Lines are flushed as they are written and fsynced in batches. The latest
+line per key wins, so resuming, ``--retry-failed`` (re-run only papers whose
+last outcome was a failure) and summaries only read the journal, never the
+PDFs. A legacy progress file is read as a list of completed keys.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .retriever import RetrievalResult
+
+DONE_STATUSES = frozenset({"success", "skipped"})
+FAILED_STATUSES = frozenset({"not_found", "error", "failed"})
+
+
+@dataclass
+class JournalEntry:
+    """Outcome of one paper in a batch."""
+
+    key: str
+    status: str
+    source: str | None = None
+    pdf_path: str | None = None
+    doi: str | None = None
+    title: str | None = None
+    elapsed: float | None = None
+    error: str | None = None
+    sha256: str | None = None
+    time: float = 0.0
+
+    @property
+    def done(self) -> bool:
+        """Whether the paper needs no further attempts."""
+        return self.status in DONE_STATUSES
+
+    @property
+    def failed(self) -> bool:
+        """Whether the last attempt failed."""
+        return self.status in FAILED_STATUSES
+
+
+class BatchJournal:
+    """JSONL journal of per-paper outcomes for resumable batches.
+
+    Example:
+        >>> journal = BatchJournal(Path("papers/.retrieval_journal.jsonl"))
+        >>> if not journal.is_done("10.1234/x"):
+        ...     journal.record("10.1234/x", result)
+        >>> journal.close()
+        >>> print(journal.summary_text())
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        legacy_progress: Path | None = None,
+        sync_every: int = 20,
+        sync_interval: float = 2.0,
+    ):
+        """Open (or create) a journal and load its entries.
+
+        Args:
+            path: JSONL journal file
+            legacy_progress: Old ``{"completed": [...]}`` progress file to
+                import as completed keys, if present
+            sync_every: fsync after this many records ...
+            sync_interval: ... or this many seconds since the last fsync
+        """
+        self.path = Path(path)
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self.entries: dict[str, JournalEntry] = {}
+        self._file: Any = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        if legacy_progress and legacy_progress.exists():
+            try:
+                completed = json.loads(legacy_progress.read_text()).get("completed", [])
+            except (OSError, ValueError, AttributeError):
+                completed = []
+            for key in completed:
+                self.entries[key] = JournalEntry(key=key, status="success")
+        self._load()
+
+    def _load(self) -> None:
+        """Replay the journal; later lines override earlier ones."""
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    entry = JournalEntry(**data)
+                except (ValueError, TypeError):
+                    continue  # Torn last line after a crash
+                self.entries[entry.key] = entry
+
+    def is_done(self, key: str | None) -> bool:
+        """Whether a paper finished in an earlier run."""
+        entry = self.entries.get(key) if key else None
+        return bool(entry and entry.done)
+
+    def is_failed(self, key: str | None) -> bool:
+        """Whether a paper's last recorded attempt failed."""
+        entry = self.entries.get(key) if key else None
+        return bool(entry and entry.failed)
+
+    def record(self, key: str, result: RetrievalResult) -> JournalEntry:
+        """Append the outcome of a paper.
+
+        Args:
+            key: Paper identifier
+            result: Its retrieval result
+
+        Returns:
+            The recorded entry
+        """
+        entry = JournalEntry(
+            key=key,
+            status=result.status.value,
+            source=result.source,
+            pdf_path=result.pdf_path,
+            doi=result.doi,
+            title=result.title or None,
+            elapsed=round(result.elapsed, 3) if result.elapsed is not None else None,
+            error=result.error,
+            sha256=result.sha256,
+            time=round(time.time(), 3),
+        )
+        self.entries[key] = entry
+
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._file.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+        return entry
+
+    def sync(self) -> None:
+        """fsync written entries to disk."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate the latest outcome of every paper.
+
+        Returns:
+            Dict with 'total', 'by_status', 'by_source', 'failures'
+            (error/reason counts) and 'elapsed' (summed seconds)
+        """
+        entries = list(self.entries.values())
+        return {
+            "total": len(entries),
+            "by_status": dict(Counter(e.status for e in entries).most_common()),
+            "by_source": dict(Counter(e.source for e in entries if e.done and e.source).most_common()),
+            "failures": dict(Counter(e.error or e.status for e in entries if e.failed).most_common()),
+            "elapsed": round(sum(e.elapsed or 0.0 for e in entries), 3),
+        }
+
+    def summary_text(self) -> str:
+        """Human-readable summary."""
+        summary = self.summary()
+        lines = [f"{summary['total']} papers ({summary['elapsed']:.1f}s spent)"]
+        lines += [f"  {status}: {count}" for status, count in summary["by_status"].items()]
+        if summary["by_source"]:
+            lines.append("Sources: " + ", ".join(f"{s} {n}" for s, n in summary["by_source"].items()))
+        if summary["failures"]:
+            lines.append("Failures:")
+            lines += [f"  {reason}: {count}" for reason, count in summary["failures"].items()]
+        return "\n".join(lines)
+
+    def __enter__(self) -> BatchJournal:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -131,6 +131,22 @@ class RetrievalLogger:
         if self.console_enabled:
             print(msg)
 
+    def race_result(self, winner: str, elapsed: float, saved: float, cancelled: list[str]) -> None:
+        """Log the outcome of racing several sources.
+
+        Args:
+            winner: Source whose PDF was kept
+            elapsed: Seconds the race took
+            saved: Estimated seconds saved over trying sources one by one
+            cancelled: Sources cancelled before they finished
+        """
+        msg = f"Race won by {winner} in {elapsed:.1f}s (saved ~{saved:.1f}s)"
+        self._log_to_file(f"\n{msg}")
+        if cancelled:
+            self._log_to_file(f"  Cancelled: {', '.join(cancelled)}")
+        if self.console_enabled:
+            self._safe_print(f"  {msg}")
+
     def detail(self, message: str) -> None:
         """Log a detail message (file only, not console)."""
         self._log_to_file(f"  {message}")
@@ -0,0 +1,287 @@
+"""Persistent cache of metadata lookups.
+
+Resolving a paper costs several API calls (Semantic Scholar and CrossRef
+title search, CrossRef/S2/OpenAlex DOI lookup), and every run used to repeat
+them for every paper. ``MetadataCache`` keeps the answers in a small SQLite
+database shared by :class:`PaperRetriever`, :func:`doi2bib.get_metadata` and
+:class:`doi2bib.CitationVerifier`:
+
+- ``title``: normalized title -> DOI (or a recorded miss)
+- ``metadata``: DOI -> metadata dict
+- ``pdf_url``: DOI -> PDF URLs that downloaded successfully, with their source
+- ``negative``: (source, DOI) pairs where the source had no PDF
+- ``bibtex`` / ``search``: BibTeX records and CrossRef title searches made
+  by the citation verifier
+
+Each kind has its own TTL, so misses are retried much sooner than hits go
+stale. Hits and misses are counted per kind in :class:`CacheStats`.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+DEFAULT_PATH = Path.home() / ".cache" / "parser" / "metadata.sqlite"
+
+DAY = 86400.0
+
+# Seconds an entry of each kind stays valid
+DEFAULT_TTLS = {
+    "title": 90 * DAY,
+    "metadata": 90 * DAY,
+    "pdf_url": 30 * DAY,
+    "negative": 7 * DAY,
+    "bibtex": 90 * DAY,
+    "search": 30 * DAY,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+)
+"""
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title into a cache key (case, punctuation, spacing)."""
+    return " ".join(re.sub(r"[^\w\s]", " ", title.lower()).split())
+
+
+def normalize_doi(doi: str) -> str:
+    """Normalize a DOI into a cache key."""
+    doi = doi.strip().lower()
+    for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+    return doi
+
+
+@dataclass
+class KindStats:
+    """Hit and miss counts for one kind of entry."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class CacheStats:
+    """Hit rates for a cache, per kind of entry."""
+
+    kinds: dict[str, KindStats] = field(default_factory=dict)
+
+    def kind(self, name: str) -> KindStats:
+        """Get (or create) the stats for a kind."""
+        if name not in self.kinds:
+            self.kinds[name] = KindStats()
+        return self.kinds[name]
+
+    @property
+    def hits(self) -> int:
+        """Total lookups answered from the cache."""
+        return sum(k.hits for k in self.kinds.values())
+
+    @property
+    def lookups(self) -> int:
+        """Total lookups."""
+        return sum(k.hits + k.misses for k in self.kinds.values())
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of all lookups answered from the cache."""
+        lookups = self.lookups
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """One-line summary for logs and batch reports."""
+        parts = ", ".join(
+            f"{name} {stats.hits}/{stats.hits + stats.misses}"
+            for name, stats in self.kinds.items()
+            if stats.hits + stats.misses
+        )
+        return f"{self.hit_rate:.0%} hit rate ({parts})" if parts else "no lookups"
+
+
+class MetadataCache:
+    """SQLite-backed cache of titles, metadata, PDF URLs and known misses.
+
+    Calls are synchronous: lookups are local and take microseconds, so they
+    run inline on the event loop. The database uses WAL mode, so several
+    processes can share one cache file.
+
+    Example:
+        >>> cache = MetadataCache("~/.cache/parser/metadata.sqlite")
+        >>> cache.put_metadata("10.1234/x", {"title": "A paper", "year": 2020})
+        >>> cache.get_metadata("10.1234/x")["year"]
+        2020
+        >>> print(cache.stats.summary())
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_PATH, ttls: dict[str, float] | None = None):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file (created if missing), or ":memory:"
+            ttls: Seconds each kind stays valid (see DEFAULT_TTLS)
+        """
+        self.path = Path(path).expanduser() if str(path) != ":memory:" else path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> MetadataCache | None:
+        """Create the cache described by a ``cache`` config section.
+
+        Args:
+            config: Dict with 'enabled', 'path' and 'ttl_days' (per kind)
+
+        Returns:
+            The cache, or None if disabled or the database cannot be opened
+        """
+        config = config or {}
+        if not config.get("enabled", False):
+            return None
+        ttls = {kind: days * DAY for kind, days in (config.get("ttl_days") or {}).items()}
+        try:
+            return cls(config.get("path") or DEFAULT_PATH, ttls)
+        except (OSError, sqlite3.Error):
+            return None
+
+    # ------------------------------------------------------------------
+    # Generic entries
+    # ------------------------------------------------------------------
+
+    def get(self, kind: str, key: str) -> Any | None:
+        """Look up an entry.
+
+        Args:
+            kind: Entry kind ("title", "metadata", "pdf_url", "negative")
+            key: Entry key
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM entries WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        stats = self.stats.kind(kind)
+        if row is None or row[1] < time.time():
+            stats.misses += 1
+            return None
+        stats.hits += 1
+        return json.loads(row[0])
+
+    def contains(self, kind: str, key: str) -> bool:
+        """Check for a live entry without counting a lookup."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM entries WHERE kind = ? AND key = ? AND expires >= ?", (kind, key, time.time())
+            ).fetchone()
+        return row is not None
+
+    def put(self, kind: str, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store an entry.
+
+        Args:
+            kind: Entry kind
+            key: Entry key
+            value: JSON-serializable value
+            ttl: Seconds until expiry (default: the kind's TTL)
+        """
+        expires = time.time() + (self.ttls.get(kind, DEFAULT_TTLS["metadata"]) if ttl is None else ttl)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (kind, key, value, expires) VALUES (?, ?, ?, ?)",
+                (kind, key, json.dumps(value, default=str), expires),
+            )
+
+    def purge(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            return self._db.execute("DELETE FROM entries WHERE expires < ?", (time.time(),)).rowcount
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    # ------------------------------------------------------------------
+    # Typed helpers
+    # ------------------------------------------------------------------
+
+    def get_title(self, title: str) -> dict[str, Any] | None:
+        """Look up the DOI a title resolved to.
+
+        Returns:
+            ``{"doi": ...}`` (``doi`` is None for a recorded miss), or None
+        """
+        return self.get("title", normalize_title(title))
+
+    def put_title(self, title: str, doi: str | None) -> None:
+        """Record the DOI a title resolved to (None: the title was not found)."""
+        self.put("title", normalize_title(title), {"doi": doi}, None if doi else self.ttls["negative"])
+
+    def get_metadata(self, doi: str) -> dict[str, Any] | None:
+        """Look up metadata for a DOI."""
+        return self.get("metadata", normalize_doi(doi))
+
+    def contains_metadata(self, doi: str) -> bool:
+        """Check for live metadata for a DOI without counting a lookup."""
+        return self.contains("metadata", normalize_doi(doi))
+
+    def put_metadata(self, doi: str, metadata: dict[str, Any]) -> None:
+        """Store metadata for a DOI."""
+        self.put("metadata", normalize_doi(doi), metadata)
+
+    def get_pdf_urls(self, doi: str) -> list[dict[str, str]]:
+        """PDF URLs that downloaded before, as ``{"source", "url"}`` dicts."""
+        return self.get("pdf_url", normalize_doi(doi)) or []
+
+    def add_pdf_url(self, doi: str, source: str, url: str) -> None:
+        """Remember a PDF URL that downloaded successfully (most recent first)."""
+        key = normalize_doi(doi)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires FROM entries WHERE kind = 'pdf_url' AND key = ?", (key,)
+            ).fetchone()
+        known = json.loads(row[0]) if row and row[1] >= time.time() else []
+        urls = [{"source": source, "url": url}] + [entry for entry in known if entry.get("url") != url]
+        self.put("pdf_url", key, urls[:5])
+
+    def is_missing(self, source: str, doi: str) -> bool:
+        """Check whether a source recently had no PDF for a DOI."""
+        return self.get("negative", f"{source}:{normalize_doi(doi)}") is not None
+
+    def put_missing(self, source: str, doi: str) -> None:
+        """Record that a source has no PDF for a DOI."""
+        self.put("negative", f"{source}:{normalize_doi(doi)}", True)
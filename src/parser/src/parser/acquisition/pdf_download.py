@@ -0,0 +1,172 @@
+"""Streaming PDF downloads.
+
+Downloads used to buffer the whole response in memory before checking it
+was a PDF, so a misrouted HTML page or a 300 MB supplement was held in RAM
+in full. :func:`stream_pdf` instead streams to a partial file next to the
+target:
+
+- The first bytes are sniffed for the ``%PDF`` header, and anything else is
+  abandoned before the rest of the body is read.
+- Downloads over ``max_bytes`` (by ``Content-Length`` or by count) are
+  abandoned.
+- An interrupted transfer is resumed with an HTTP ``Range`` request, within
+  the same call or, if the connection keeps failing, on a later run. The
+  partial file is named after the URL, so only the same URL is resumed.
+- The partial file is renamed into place only once complete, and the
+  SHA-256 of the content is returned for the record.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from .http_pool import HttpPool
+
+# Bytes searched for the header (the PDF spec tolerates leading junk)
+SNIFF_BYTES = 1024
+
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class PdfDownload:
+    """A completed PDF download."""
+
+    path: Path
+    url: str
+    size: int
+    sha256: str
+    resumed: bool = False
+
+
+def partial_path(output_path: Path, url: str) -> Path:
+    """Partial file for downloading a URL to a path."""
+    tag = hashlib.sha1(url.encode()).hexdigest()[:8]
+    return output_path.with_name(f"{output_path.name}.{tag}.download")
+
+
+def looks_like_pdf(head: bytes) -> bool:
+    """Check the first bytes of a file for the PDF header."""
+    return b"%PDF" in head[:SNIFF_BYTES]
+
+
+def _hash_file(path: Path) -> tuple[hashlib._Hash, bytes]:
+    """SHA-256 state and first bytes of an existing partial file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        head = f.read(SNIFF_BYTES)
+        digest.update(head)
+        for block in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest, head
+
+
+async def stream_pdf(
+    http: HttpPool,
+    url: str,
+    output_path: Path,
+    headers: Mapping[str, str] | None = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    max_resumes: int = 2,
+    timeout: float = 60.0,
+) -> PdfDownload | None:
+    """Download a PDF by streaming it to disk.
+
+    Args:
+        http: Connection pool to download with
+        url: PDF URL
+        output_path: Where to save the PDF
+        headers: Extra request headers
+        max_bytes: Largest download accepted
+        max_resumes: Range requests after an interrupted transfer
+        timeout: Request timeout in seconds
+
+    Returns:
+        The download, or None if the URL did not yield a PDF within limits
+    """
+    part = partial_path(output_path, url)
+    part.parent.mkdir(parents=True, exist_ok=True)
+    resumed = False
+
+    for attempt in range(max_resumes + 1):
+        offset = part.stat().st_size if part.exists() else 0
+        request_headers = dict(headers or {})
+        if offset:
+            request_headers["Range"] = f"bytes={offset}-"
+            # Ranges of compressed bodies are not byte offsets into the file
+            request_headers["Accept-Encoding"] = "identity"
+
+        try:
+            async with http.stream("GET", url, headers=request_headers, timeout=timeout) as response:
+                if response.status_code == 416 and offset:
+                    # Partial file no longer matches the resource; start over
+                    part.unlink(missing_ok=True)
+                    continue
+                response.raise_for_status()
+
+                if response.status_code == 206 and offset:
+                    digest, head = _hash_file(part)
+                    size, mode, resumed = offset, "ab", True
+                else:
+                    digest, head = hashlib.sha256(), b""
+                    size, mode = 0, "wb"
+
+                length = response.headers.get("content-length")
+                if length and length.isdigit() and size + int(length) > max_bytes:
+                    break
+
+                sniffed = looks_like_pdf(head)
+                pending = bytearray()
+                with open(part, mode) as f:
+                    async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > max_bytes:
+                            break
+                        digest.update(chunk)
+                        if sniffed:
+                            f.write(chunk)
+                            continue
+                        # Hold back the first bytes until the header is found
+                        pending += chunk
+                        if len(pending) >= SNIFF_BYTES:
+                            if not looks_like_pdf(bytes(pending)):
+                                break
+                            sniffed = True
+                            f.write(pending)
+                    else:
+                        if not sniffed and looks_like_pdf(bytes(pending)):
+                            sniffed = True
+                            f.write(pending)
+                if size > max_bytes or not sniffed:
+                    break
+
+            os.replace(part, output_path)
+            return PdfDownload(output_path, url, size, digest.hexdigest(), resumed)
+
+        except httpx.TransportError:
+            # Connection dropped or timed out: resume from what was written
+            if attempt < max_resumes and part.exists() and part.stat().st_size:
+                continue
+            if part.exists() and part.stat().st_size:
+                return None  # Keep the partial file for a later run
+            break
+        except (httpx.HTTPError, OSError):
+            break
+        except asyncio.CancelledError:
+            # e.g. a source that lost a race
+            part.unlink(missing_ok=True)
+            raise
+
+    part.unlink(missing_ok=True)
+    return None
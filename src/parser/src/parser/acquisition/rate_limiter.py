@@ -1,38 +1,208 @@
-"""Rate limiting utilities for API calls."""
+"""Rate limiting utilities for API calls.
+
+Each source has its own token bucket. A call reserves the next free slot in
+its bucket synchronously and then sleeps outside of any lock, so a long
+Sci-Hub delay never holds up OpenAlex or Unpaywall calls, and concurrent
+callers of one source are spaced out instead of serialized behind a mutex.
+
+Buckets allow short bursts (``per_source_burst`` in the config) and can be
+throttled at runtime when a server answers 429 or sends ``Retry-After``.
+Wait times are recorded per source in :class:`BucketStats`.
+"""
 
 import asyncio
 import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+DEFAULT_DELAYS = {
+    "crossref": 0.5,
+    "unpaywall": 0.1,
+    "arxiv": 3.0,
+    "pmc": 0.34,
+    "semantic_scholar": 3.0,
+    "openalex": 0.1,
+    "biorxiv": 1.0,
+    "scihub": 5.0,
+    "libgen": 3.0,
+}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header into seconds.
+
+    Args:
+        value: Header value (delay in seconds or an HTTP date)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+@dataclass
+class BucketStats:
+    """Wait-time metrics for one source."""
+
+    calls: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+
+    def record(self, waited: float) -> None:
+        """Record one call and how long it waited."""
+        self.calls += 1
+        if waited > 0:
+            self.waits += 1
+            self.wait_time += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    @property
+    def mean_wait(self) -> float:
+        """Average wait per call in seconds."""
+        return self.wait_time / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "calls": self.calls,
+            "waits": self.waits,
+            "wait_time": round(self.wait_time, 3),
+            "max_wait": round(self.max_wait, 3),
+            "mean_wait": round(self.mean_wait, 3),
+            "throttled": self.throttled,
+        }
+
+
+class TokenBucket:
+    """Token bucket for one source.
+
+    Implemented as a virtual schedule: each call reserves the next slot and
+    the schedule advances by one interval, with up to ``burst`` calls
+    allowed ahead of it. Reserving never awaits, so no lock is needed.
+
+    Args:
+        calls_per_second: Sustained rate (0 or less disables limiting)
+        min_delay: Minimum interval between calls in seconds
+        burst: Calls allowed back to back before spacing kicks in
+    """
+
+    def __init__(self, calls_per_second: float = 1.0, min_delay: float = 0.1, burst: int = 1):
+        self.calls_per_second = calls_per_second
+        self.min_delay = min_delay
+        self.burst = max(1, burst)
+        self.stats = BucketStats()
+        self._next = 0.0  # Theoretical time of the next call at the sustained rate
+        self._blocked_until = 0.0
+
+    @classmethod
+    def from_delay(cls, delay: float, burst: int = 1) -> "TokenBucket":
+        """Create a bucket from a delay between calls in seconds."""
+        return cls(calls_per_second=1.0 / delay if delay > 0 else 0.0, min_delay=max(delay, 0.0), burst=burst)
+
+    @property
+    def interval(self) -> float:
+        """Seconds between calls at the sustained rate."""
+        if self.calls_per_second <= 0:
+            return 0.0
+        return max(1.0 / self.calls_per_second, self.min_delay)
+
+    def reserve(self) -> float:
+        """Reserve the next slot.
+
+        Returns:
+            Seconds to wait before making the call
+        """
+        now = time.monotonic()
+        interval = self.interval
+        allowed = max(now, self._blocked_until)
+        if interval > 0:
+            allowed = max(allowed, self._next - (self.burst - 1) * interval)
+            self._next = max(self._next, allowed) + interval
+        return allowed - now
+
+    def throttle(self, delay: float) -> None:
+        """Hold back all calls for ``delay`` seconds (e.g. after a 429)."""
+        self.stats.throttled += 1
+        until = time.monotonic() + max(0.0, delay)
+        self._blocked_until = max(self._blocked_until, until)
+        self._next = max(self._next, until)
+
+    async def wait(self) -> None:
+        """Wait if necessary to respect the rate limit."""
+        waited = 0.0
+        delay = self.reserve()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+            # A throttle may have arrived while sleeping
+            delay = self._blocked_until - time.monotonic()
+        self.stats.record(waited)
+
+    def wait_sync(self) -> None:
+        """Synchronous version of :meth:`wait`."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        self.stats.record(max(delay, 0.0))
+
 
 class RateLimiter:
-    """Global rate limiter for API calls across all sources.
+    """Rate limiter for API calls across all sources.
 
-    Ensures we don't exceed rate limits for any API by tracking
-    the last call time per source and waiting if needed.
+    Holds one :class:`TokenBucket` per source, built from the
+    ``per_source_delays`` config. Clients given a bucket from
+    :meth:`bucket` share it with the retriever, so each source is
+    limited exactly once.
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the rate limiter.
 
         Args:
-            config: Rate limit configuration with 'per_source_delays' and 'global_delay'.
+            config: Rate limit configuration with 'per_source_delays',
+                'per_source_burst' and 'global_delay'.
         """
         config = config or {}
-        self.delays = config.get("per_source_delays", {
-            "crossref": 0.5,
-            "unpaywall": 0.1,
-            "arxiv": 3.0,
-            "pmc": 0.34,
-            "semantic_scholar": 3.0,
-            "openalex": 0.1,
-            "biorxiv": 1.0,
-            "scihub": 5.0,
-            "libgen": 3.0,
-        })
+        self.delays = dict(config.get("per_source_delays", DEFAULT_DELAYS))
+        self.bursts: dict[str, int] = dict(config.get("per_source_burst", {}))
         self.global_delay = config.get("global_delay", 1.0)
-        self.last_call: dict[str, float] = {}
-        self._lock = asyncio.Lock()
+        self.buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, source: str, default: TokenBucket | None = None) -> TokenBucket:
+        """Get the bucket for a source, creating it on first use.
+
+        Args:
+            source: The source identifier.
+            default: Bucket to adopt if the source has no configured delay.
+
+        Returns:
+            The source's bucket.
+        """
+        if source not in self.buckets:
+            if source not in self.delays and default is not None:
+                self.buckets[source] = default
+            else:
+                self.buckets[source] = TokenBucket.from_delay(
+                    self.get_delay(source), burst=self.bursts.get(source, 1)
+                )
+        return self.buckets[source]
 
     async def wait(self, source: str) -> None:
         """Wait appropriate time before next call to a source.
@@ -40,15 +210,7 @@ class RateLimiter:
         Args:
             source: The source identifier to rate limit.
         """
-        async with self._lock:
-            delay = self.delays.get(source, self.global_delay)
-            last = self.last_call.get(source, 0)
-            elapsed = time.time() - last
-
-            if elapsed < delay:
-                await asyncio.sleep(delay - elapsed)
-
-            self.last_call[source] = time.time()
+        await self.bucket(source).wait()
 
     def wait_sync(self, source: str) -> None:
         """Synchronous version of wait.
@@ -56,14 +218,16 @@ class RateLimiter:
         Args:
             source: The source identifier to rate limit.
         """
-        delay = self.delays.get(source, self.global_delay)
-        last = self.last_call.get(source, 0)
-        elapsed = time.time() - last
+        self.bucket(source).wait_sync()
 
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
+    def throttle(self, source: str, delay: float) -> None:
+        """Hold back calls to a source, e.g. after a 429 response.
 
-        self.last_call[source] = time.time()
+        Args:
+            source: The source identifier.
+            delay: Seconds to hold back.
+        """
+        self.bucket(source).throttle(delay)
 
     def get_delay(self, source: str) -> float:
         """Get the delay for a specific source.
@@ -84,3 +248,30 @@ class RateLimiter:
             delay: The delay in seconds.
         """
         self.delays[source] = delay
+        if source in self.buckets:
+            bucket = self.buckets[source]
+            bucket.calls_per_second = 1.0 / delay if delay > 0 else 0.0
+            bucket.min_delay = max(delay, 0.0)
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Per-source wait-time metrics.
+
+        Returns:
+            Dict mapping source to its :meth:`BucketStats.to_dict`.
+        """
+        return {source: bucket.stats.to_dict() for source, bucket in self.buckets.items() if bucket.stats.calls}
+
+    def summary(self) -> str:
+        """One-line summary of the sources that waited the longest."""
+        waited = sorted(
+            ((s, b.stats) for s, b in self.buckets.items() if b.stats.wait_time > 0),
+            key=lambda item: item[1].wait_time,
+            reverse=True,
+        )
+        if not waited:
+            return "no waits"
+        return ", ".join(
+            f"{source} {stats.wait_time:.1f}s over {stats.calls} calls"
+            + (f" ({stats.throttled} throttled)" if stats.throttled else "")
+            for source, stats in waited
+        )
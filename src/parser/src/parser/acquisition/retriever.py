@@ -6,18 +6,44 @@ Tries multiple sources in priority order to find and download PDFs.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import os
 import re
+import time
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import httpx
-
+from .bulk import BulkResolver, classify_identifier
 from .config import Config
+from .http_pool import HttpPool
 from .logger import RetrievalLogger
+from .metadata_cache import MetadataCache
+from .pdf_download import DEFAULT_MAX_BYTES, PdfDownload, stream_pdf
 from .rate_limiter import RateLimiter
+from .source_stats import SourceStats
+from .title_match import TitleMatcher, normalize, titles_match
+
+# Reasons that mean a source has no PDF for a DOI (rather than a transient
+# failure); these are remembered in the metadata cache
+DEFINITIVE_MISSES = frozenset({
+    "no OA version found",
+    "not found on arXiv",
+    "no PMC ID for this DOI",
+    "no open access PDF",
+    "work not found",
+    "no OA URL",
+})
+
+
+def _is_pdf(path: Path) -> bool:
+    """Check that a downloaded file is a PDF."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(1024).lstrip().startswith(b"%PDF")
+    except OSError:
+        return False
 
 
 class RetrievalStatus(Enum):
@@ -40,6 +66,21 @@ class RetrievalResult:
     error: str | None = None
     metadata: dict[str, Any] | None = None
     attempts: list[dict[str, Any]] | None = None  # History of attempted sources
+    race: dict[str, Any] | None = None  # Winner and timings when sources were raced
+    sha256: str | None = None  # Checksum of the downloaded PDF
+    elapsed: float | None = None  # Seconds spent on the paper in a batch
+
+
+@dataclass
+class RetrievalJob:
+    """A paper with resolved metadata, waiting to be tried against sources."""
+    doi: str | None
+    title: str
+    metadata: dict[str, Any] | None
+    output_path: Path
+    logger: RetrievalLogger
+    sources: list[str]  # Candidate sources in priority order
+    attempted: int = 0
 
 
 class PaperRetriever:
@@ -62,8 +103,27 @@ class PaperRetriever:
         """
         self.config = config or Config.load()
         self.rate_limiter = RateLimiter(self.config.rate_limits)
+        self.http = HttpPool(
+            max_connections=self.config.download.get("max_connections", 100),
+            max_per_host=self.config.download.get("max_connections_per_host", 8),
+            http2=self.config.download.get("http2"),
+        )
+        self.cache = MetadataCache.from_config(self.config.cache)
+        self.source_stats = SourceStats.from_config(self.config.source_stats)
+        self._downloads: dict[Path, PdfDownload] = {}  # Output path -> how it was downloaded
+        self._prefetched: dict[tuple[str, str], dict[str, Any]] = {}  # From prefetch_metadata
         self.clients = self._init_clients()
 
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections."""
+        await self.http.aclose()
+
+    async def __aenter__(self) -> PaperRetriever:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
     def _init_clients(self) -> dict[str, Any]:
         """Initialize all API clients with config-based rate limits."""
         from .clients import (
@@ -77,10 +137,6 @@ class PaperRetriever:
             SemanticScholarClient,
             UnpaywallClient,
         )
-        from .clients.base import RateLimiter as ClientRateLimiter
-
-        # Get rate limits from config
-        per_source_delays = self.config.rate_limits.get("per_source_delays", {})
 
         clients: dict[str, Any] = {
             "arxiv": ArxivClient(),
@@ -98,21 +154,17 @@ class PaperRetriever:
             "frontiers": FrontiersClient(use_selenium=True),
         }
 
-        # Apply config rate limits to clients
-        for name, client in clients.items():
-            if hasattr(client, 'rate_limiter') and name in per_source_delays:
-                delay = per_source_delays[name]
-                # Convert delay (seconds) to calls_per_second
-                calls_per_second = 1.0 / delay if delay > 0 else 10.0
-                client.rate_limiter = ClientRateLimiter(calls_per_second=calls_per_second)
-
         # Unpaywall requires email
         if self.config.email:
             clients["unpaywall"] = UnpaywallClient(email=self.config.email)
-            if "unpaywall" in per_source_delays:
-                delay = per_source_delays["unpaywall"]
-                calls_per_second = 1.0 / delay if delay > 0 else 10.0
-                clients["unpaywall"].rate_limiter = ClientRateLimiter(calls_per_second=calls_per_second)
+
+        # Share one connection pool, and one token bucket per source between
+        # the clients and the retriever (configured delays take precedence
+        # over the client defaults)
+        for name, client in clients.items():
+            client.http = self.http
+            if hasattr(client, "rate_limiter"):
+                client.rate_limiter = self.rate_limiter.bucket(name, default=client.rate_limiter)
 
         # Initialize institutional client if configured
         inst_config = self.config.institutional
@@ -139,7 +191,7 @@ class PaperRetriever:
             if self.config.is_source_enabled("scihub"):
                 from .clients import ScihubClient
                 unofficial_config.get("scihub", {})
-                scihub_delay = per_source_delays.get("scihub", 5.0)
+                scihub_delay = self.rate_limiter.delays.get("scihub", 5.0)
                 clients["scihub"] = ScihubClient(
                     enabled=True,
                     timeout=60.0,
@@ -150,7 +202,7 @@ class PaperRetriever:
             if self.config.is_source_enabled("libgen"):
                 from .clients import LibGenClient
                 unofficial_config.get("libgen", {})
-                libgen_delay = per_source_delays.get("libgen", 3.0)
+                libgen_delay = self.rate_limiter.delays.get("libgen", 3.0)
                 clients["libgen"] = LibGenClient(
                     enabled=True,
                     timeout=60.0,
@@ -168,6 +220,8 @@ class PaperRetriever:
         pdf_url: str | None = None,
         output_dir: Path | None = None,
         verbose: bool = True,
+        race: int | None = None,
+        strict_priority: bool | None = None,
     ) -> RetrievalResult:
         """Retrieve PDF for a paper.
 
@@ -178,10 +232,58 @@ class PaperRetriever:
             pdf_url: Direct PDF URL (tried first if provided)
             output_dir: Override output directory
             verbose: Show progress in console
+            race: Try this many sources at a time, concurrently (uses
+                config ``download.race_sources`` if None; 0 or 1 = one by one)
+            strict_priority: When racing, only accept a source's PDF once
+                every higher-priority source in the race has failed (uses
+                config ``download.race_strict_priority`` if None)
 
         Returns:
             RetrievalResult with status and file path
         """
+        job = await self._prepare(doi, title, arxiv_id, pdf_url, output_dir, verbose)
+        if isinstance(job, RetrievalResult):
+            return job
+
+        if race is None:
+            race = self.config.download.get("race_sources", 0)
+        if strict_priority is None:
+            strict_priority = self.config.download.get("race_strict_priority", False)
+
+        if race and race > 1:
+            # Race sources in priority order, ``race`` at a time
+            for start in range(0, len(job.sources), race):
+                group = job.sources[start:start + race]
+                if len(group) > 1:
+                    result = await self._race(job, group, strict_priority)
+                else:
+                    result = await self._attempt(job, group[0])
+                if result:
+                    return result
+            return self._not_found(job)
+
+        # Try sources in priority order
+        for source_name in job.sources:
+            result = await self._attempt(job, source_name)
+            if result:
+                return result
+        return self._not_found(job)
+
+    async def _prepare(
+        self,
+        doi: str | None,
+        title: str | None,
+        arxiv_id: str | None,
+        pdf_url: str | None,
+        output_dir: Path | None,
+        verbose: bool,
+    ) -> RetrievalJob | RetrievalResult:
+        """Resolve metadata and handle everything before the source walk.
+
+        Returns:
+            A job ready to try sources, or the final result if the paper
+            was skipped, already downloaded, or fetched from its direct URL
+        """
         if not doi and not title and not arxiv_id and not pdf_url:
             return RetrievalResult(
                 doi=None,
@@ -245,6 +347,7 @@ class PaperRetriever:
         if resolved_pdf_url:
             logger.detail(f"Trying direct PDF URL: {resolved_pdf_url[:80]}...")
             if await self._download_pdf(resolved_pdf_url, output_path):
+                download = self._downloads.pop(output_path, None)
                 logger.final_result(True, "direct_url", str(output_path))
                 return RetrievalResult(
                     doi=resolved_doi,
@@ -253,52 +356,238 @@ class PaperRetriever:
                     source="direct_url",
                     pdf_path=str(output_path),
                     metadata=metadata,
+                    sha256=download.sha256 if download else None,
                 )
             else:
                 logger.detail("Direct PDF URL download failed, trying other sources...")
 
-        # Try sources in priority order
-        sources = self.config.get_sorted_sources()
-        total_sources = sum(1 for s in sources if self.config.is_source_enabled(s))
+        # Try URLs that downloaded in an earlier run before asking any source
+        if self.cache and resolved_doi:
+            for known in self.cache.get_pdf_urls(resolved_doi):
+                logger.detail(f"Trying known PDF URL from {known['source']}: {known['url'][:80]}...")
+                if await self._download_pdf(known["url"], output_path):
+                    download = self._downloads.pop(output_path, None)
+                    logger.final_result(True, known["source"], str(output_path))
+                    return RetrievalResult(
+                        doi=resolved_doi,
+                        title=resolved_title or title or "",
+                        status=RetrievalStatus.SUCCESS,
+                        source=known["source"],
+                        pdf_path=str(output_path),
+                        metadata=metadata,
+                        sha256=download.sha256 if download else None,
+                    )
 
-        source_index = 0
-        for source_name in sources:
-            if not self.config.is_source_enabled(source_name):
-                continue
+        return RetrievalJob(
+            doi=resolved_doi,
+            title=resolved_title or title or "",
+            metadata=metadata,
+            output_path=output_path,
+            logger=logger,
+            sources=self._candidate_sources(resolved_doi, metadata),
+        )
+
+    def _candidate_sources(self, doi: str | None = None, metadata: dict[str, Any] | None = None) -> list[str]:
+        """Enabled sources in priority order.
 
+        With a paper's DOI or metadata and source stats enabled, the order
+        is adapted to how sources fared for its DOI prefix and venue (see
+        :class:`SourceStats`).
+        """
+        sources = [
+            source
+            for source in self.config.get_sorted_sources()
+            if self.config.is_source_enabled(source)
             # Skip unofficial sources if not enabled
-            if source_name in ("scihub", "libgen") and not self.config.is_unofficial_enabled():
-                continue
+            and not (source in ("scihub", "libgen") and not self.config.is_unofficial_enabled())
+        ]
+        if self.source_stats and (doi or metadata):
+            sources = self.source_stats.order(sources, doi, metadata)
+        return sources
 
-            source_index += 1
-            logger.source_start(source_index, total_sources, source_name)
+    async def _attempt(self, job: RetrievalJob, source_name: str) -> RetrievalResult | None:
+        """Try one source for a job.
 
+        Returns:
+            The successful result, or None if the source did not have the PDF
+        """
+        job.attempted += 1
+        index, total = job.attempted, len(job.sources)
+        job.logger.source_start(index, total, source_name)
+
+        if self._known_miss(job, source_name):
+            job.logger.source_result(index, total, source_name, False, "no PDF (cached)")
+            return None
+
+        # API clients wait on the shared bucket per request; others
+        # that do not pace themselves wait here once per attempt
+        client = self.clients.get(source_name)
+        if not hasattr(client, "rate_limiter") and not hasattr(client, "rate_limit"):
             await self.rate_limiter.wait(source_name)
 
-            result, reason = await self._try_source(
-                source_name,
-                resolved_doi,
-                resolved_title or title or "",
-                metadata or {},
-                output_path,
-                logger,
-            )
+        started = time.monotonic()
+        result, reason = await self._try_source(
+            source_name,
+            job.doi,
+            job.title,
+            job.metadata or {},
+            job.output_path,
+            job.logger,
+        )
+        self._remember(job, source_name, job.output_path, result, reason, time.monotonic() - started)
+
+        if result and result.status == RetrievalStatus.SUCCESS:
+            job.logger.source_result(index, total, source_name, True, reason, result.pdf_path)
+            job.logger.final_result(True, source_name, result.pdf_path)
+            result.metadata = job.metadata
+            return result
+        job.logger.source_result(index, total, source_name, False, reason)
+        return None
+
+    async def _race(self, job: RetrievalJob, sources: list[str], strict_priority: bool) -> RetrievalResult | None:
+        """Try several sources at once and keep the first valid PDF.
+
+        Each source downloads to its own part file; the winner's is moved
+        into place and the other attempts are cancelled. Sources still wait
+        on their own rate limits.
+
+        Args:
+            job: Job to retrieve
+            sources: Sources to race, in priority order
+            strict_priority: Only accept a PDF once every higher-priority
+                source in the race has failed
 
+        Returns:
+            The winning result (with ``race`` filled in), or None
+        """
+        started = time.monotonic()
+        parts = {source: job.output_path.with_suffix(f".{source}.part") for source in sources}
+        durations: dict[str, float] = {}
+        outcomes: dict[str, tuple[RetrievalResult | None, str]] = {}
+
+        async def run(source: str) -> tuple[RetrievalResult | None, str]:
+            if self._known_miss(job, source):
+                return None, "no PDF (cached)"
+            client = self.clients.get(source)
+            if not hasattr(client, "rate_limiter") and not hasattr(client, "rate_limit"):
+                await self.rate_limiter.wait(source)
+            begun = time.monotonic()
+            try:
+                result, reason = await self._try_source(
+                    source, job.doi, job.title, job.metadata or {}, parts[source], job.logger
+                )
+            finally:
+                durations[source] = time.monotonic() - started
+            self._remember(job, source, parts[source], result, reason, time.monotonic() - begun)
             if result and result.status == RetrievalStatus.SUCCESS:
-                logger.source_result(source_index, total_sources, source_name, True, reason, result.pdf_path)
-                logger.final_result(True, source_name, result.pdf_path)
-                result.metadata = metadata
-                return result
-            else:
-                logger.source_result(source_index, total_sources, source_name, False, reason)
+                if _is_pdf(Path(result.pdf_path or parts[source])):
+                    return result, reason
+                return None, "downloaded file is not a PDF"
+            return None, reason
+
+        def pick() -> str | None:
+            for source in sources:
+                if source not in outcomes:
+                    if strict_priority:
+                        return None  # A higher-priority source may still win
+                    continue
+                if outcomes[source][0]:
+                    return source
+            return None
+
+        tasks = {source: asyncio.create_task(run(source)) for source in sources}
+        winner = None
+        try:
+            pending = set(tasks.values())
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for source, task in tasks.items():
+                    if task in done:
+                        try:
+                            outcomes[source] = task.result()
+                        except Exception as e:
+                            job.logger.error(source, str(e))
+                            outcomes[source] = (None, f"error: {e}")
+                        result, reason = outcomes[source]
+                        job.attempted += 1
+                        job.logger.source_start(job.attempted, len(job.sources), source)
+                        job.logger.source_result(
+                            job.attempted, len(job.sources), source, result is not None, reason,
+                            result.pdf_path if result else None,
+                        )
+                winner = pick()
+        finally:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for source, part in parts.items():
+                if source != winner:
+                    with contextlib.suppress(OSError):
+                        part.unlink(missing_ok=True)
+
+        cancelled = [source for source in sources if source not in outcomes]
+        if winner is None:
+            return None
+
+        result = outcomes[winner][0]
+        assert result is not None  # pick() only returns sources with a result
+        if parts[winner].exists():
+            os.replace(parts[winner], job.output_path)
+            result.pdf_path = str(job.output_path)
+
+        # Trying sources one by one would have cost every higher-priority
+        # attempt before the winner, plus the winner's own
+        elapsed = time.monotonic() - started
+        sequential = sum(durations.get(source, elapsed) for source in sources[:sources.index(winner) + 1])
+        result.race = {
+            "winner": winner,
+            "sources": sources,
+            "elapsed": round(elapsed, 3),
+            "time_saved": round(max(0.0, sequential - elapsed), 3),
+            "cancelled": cancelled,
+        }
+        result.metadata = job.metadata
+        job.logger.race_result(winner, elapsed, result.race["time_saved"], cancelled)
+        job.logger.final_result(True, winner, result.pdf_path)
+        return result
 
-        logger.final_result(False)
+    def _known_miss(self, job: RetrievalJob, source: str) -> bool:
+        """Check whether the cache says a source has no PDF for the job."""
+        return bool(self.cache and job.doi and self.cache.is_missing(source, job.doi))
+
+    def _remember(
+        self,
+        job: RetrievalJob,
+        source: str,
+        path: Path,
+        result: RetrievalResult | None,
+        reason: str,
+        seconds: float | None = None,
+    ) -> None:
+        """Record the outcome of an attempt (checksum, source stats, metadata cache)."""
+        download = self._downloads.pop(path, None)
+        if result and download:
+            result.sha256 = download.sha256
+        if self.source_stats and seconds is not None:
+            success = bool(result and result.status == RetrievalStatus.SUCCESS)
+            self.source_stats.record(job.doi, job.metadata, source, success, seconds)
+        if not self.cache or not job.doi:
+            return
+        if result and result.status == RetrievalStatus.SUCCESS:
+            if download:
+                self.cache.add_pdf_url(job.doi, source, download.url)
+        elif reason in DEFINITIVE_MISSES:
+            self.cache.put_missing(source, job.doi)
+
+    def _not_found(self, job: RetrievalJob) -> RetrievalResult:
+        """Finish a job that no source could satisfy."""
+        job.logger.final_result(False)
         return RetrievalResult(
-            doi=resolved_doi,
-            title=resolved_title or title or "",
+            doi=job.doi,
+            title=job.title,
             status=RetrievalStatus.NOT_FOUND,
             error="PDF not found in any source",
-            metadata=metadata,
+            metadata=job.metadata,
         )
 
     async def _resolve_metadata(
@@ -307,6 +596,115 @@ class PaperRetriever:
         title: str | None = None,
         arxiv_id: str | None = None,
         pdf_url: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Resolve metadata, answering from the metadata cache when possible.
+
+        Titles map to a DOI and DOIs to metadata, so a paper resolved in an
+        earlier run (or cited again under a slightly different title
+        spelling) costs no API calls. See :meth:`_lookup_metadata`.
+        """
+        identifier = doi or (f"arXiv:{arxiv_id}" if arxiv_id else None)
+        kind = classify_identifier(identifier) if identifier else None
+        prefetched = self._prefetched.get(kind) if kind else None
+        if prefetched:
+            metadata = dict(prefetched)
+            if pdf_url or "pdf_url" not in metadata:
+                metadata["pdf_url"] = pdf_url
+            return metadata
+
+        if not self.cache:
+            return await self._lookup_metadata(doi, title, arxiv_id, pdf_url)
+
+        key = doi
+        if title and not doi:
+            entry = self.cache.get_title(title)
+            if entry is not None:
+                key = entry.get("doi")
+                if key is None and not arxiv_id and not pdf_url:
+                    # Looked up recently and not found anywhere
+                    return {"doi": None, "title": title, "arxiv_id": None, "pdf_url": None}
+        if not key and arxiv_id:
+            key = f"10.48550/arXiv.{arxiv_id.split('v')[0]}"
+        if key:
+            cached = self.cache.get_metadata(key)
+            if cached:
+                metadata = dict(cached)
+                if pdf_url or "pdf_url" not in metadata:
+                    metadata["pdf_url"] = pdf_url
+                return metadata
+
+        looked_up = await self._lookup_metadata(doi, title, arxiv_id, pdf_url)
+        if not looked_up:
+            return looked_up
+        resolved = bool(looked_up.get("year") or looked_up.get("authors"))
+        found_doi = looked_up.get("doi") if resolved else None
+        if title:
+            self.cache.put_title(title, found_doi)
+        if found_doi:
+            stored = dict(looked_up)
+            if stored.get("pdf_url") == pdf_url:
+                # Keep only URLs derived during lookup (e.g. arXiv), not the caller's
+                stored.pop("pdf_url", None)
+            self.cache.put_metadata(found_doi, stored)
+        return looked_up
+
+    async def prefetch_metadata(self, papers: list[dict[str, Any]]) -> BulkResolver:
+        """Resolve the DOIs and arXiv IDs of a batch with batched API calls.
+
+        Papers resolved here skip the per-paper metadata lookup in
+        :meth:`_resolve_metadata`; results are also written to the metadata
+        cache. Papers already cached are not requested again.
+
+        Args:
+            papers: Paper dicts as for retrieve_batch
+
+        Returns:
+            The resolver, for its summary
+        """
+        resolver = BulkResolver(
+            self.clients.get("crossref"),
+            self.clients.get("semantic_scholar"),
+            self.clients.get("openalex"),
+        )
+        identifiers: list[str] = []
+        for paper in papers:
+            identifier = paper.get("doi") or (f"arXiv:{paper['arxiv_id']}" if paper.get("arxiv_id") else None)
+            kind = classify_identifier(identifier) if identifier else None
+            if identifier is None or kind is None or kind in self._prefetched:
+                continue
+            cache_key = kind[1] if kind[0] == "doi" else f"10.48550/arXiv.{kind[1].split('v')[0]}"
+            if self.cache and self.cache.contains_metadata(cache_key):
+                continue
+            identifiers.append(identifier)
+        if not identifiers:
+            return resolver
+
+        for identifier, metadata in (await resolver.resolve(identifiers)).items():
+            kind = classify_identifier(identifier)
+            if kind is None:
+                continue
+            entry = {key: value for key, value in metadata.items() if key != "pdf_url"}
+            cache_keys: set[str] = {entry["doi"]} if entry.get("doi") else set()
+            if kind[0] == "arxiv":
+                # Match the per-paper arXiv lookup, which downloads from arXiv
+                entry.setdefault("arxiv_id", kind[1])
+                entry["pdf_url"] = f"https://arxiv.org/pdf/{kind[1]}.pdf"
+                cache_keys.add(f"10.48550/arXiv.{kind[1].split('v')[0]}")
+            elif not entry.get("doi"):
+                entry["doi"] = kind[1]
+                cache_keys.add(kind[1])
+            self._prefetched[kind] = entry
+            if self.cache:
+                for cache_key in cache_keys:
+                    self.cache.put_metadata(cache_key, entry)
+        return resolver
+
+    async def _lookup_metadata(
+        self,
+        doi: str | None = None,
+        title: str | None = None,
+        arxiv_id: str | None = None,
+        pdf_url: str | None = None,
     ) -> dict[str, Any] | None:
         """Resolve full metadata from title, DOI, arXiv ID, or PDF URL.
 
@@ -345,14 +743,16 @@ class PaperRetriever:
         # PHASE 1: TITLE SEARCH (Universal - finds DOI for any paper)
         # ============================================================
         if title:
+            matcher = TitleMatcher(title)
+
             # 1a. Try Semantic Scholar title search FIRST (better coverage, less rate limited)
             s2 = self.clients.get("semantic_scholar")
             if s2:
                 try:
-                    await self.rate_limiter.wait("semantic_scholar")
-                    results = await s2.search(title, limit=5)
-                    for result in results:
-                        if result and result.get("year") and self._titles_match(title, result.get("title", ""), threshold=0.7):
+                    results = [r for r in await s2.search(title, limit=5) if r]
+                    matches = matcher.match_all([r.get("title", "") for r in results], threshold=0.7)
+                    for result, matched in zip(results, matches, strict=True):
+                        if matched and result.get("year"):
                             found_doi = result.get("doi")
                             found_arxiv = result.get("arxiv_id")
                             return {
@@ -371,17 +771,19 @@ class PaperRetriever:
             crossref = self.clients.get("crossref")
             if crossref:
                 try:
-                    await self.rate_limiter.wait("crossref")
-                    results = await crossref.search(title, limit=5)
-                    for result in results:
+                    results = [r for r in await crossref.search(title, limit=5) if r]
+                    matches = matcher.match_all([r.get("title", "") for r in results], threshold=0.7)
+                    for result, matched in zip(results, matches, strict=True):
+                        # Check title similarity
+                        if not matched:
+                            continue
                         result_doi = result.get("doi")
                         # Validate DOI is not a book chapter or review
                         if result_doi:
                             classification = classify_doi(result_doi)
                             if classification.get("type") in ("review", "book_chapter"):
                                 continue  # Skip this result
-                        # Check title similarity
-                        if result and result.get("year") and result.get("authors") and self._titles_match(title, result.get("title", ""), threshold=0.7):
+                        if result.get("year") and result.get("authors"):
                             result["pdf_url"] = pdf_url  # Preserve original PDF URL
                             return result
                 except Exception:
@@ -395,7 +797,6 @@ class PaperRetriever:
             crossref = self.clients.get("crossref")
             if crossref:
                 try:
-                    await self.rate_limiter.wait("crossref")
                     metadata = await crossref.get_paper_metadata(doi)
                     if metadata and metadata.get("year") and metadata.get("authors"):
                         metadata["pdf_url"] = pdf_url
@@ -407,7 +808,6 @@ class PaperRetriever:
             s2 = self.clients.get("semantic_scholar")
             if s2:
                 try:
-                    await self.rate_limiter.wait("semantic_scholar")
                     result = await s2.get_paper_metadata(f"DOI:{doi}")
                     if result and result.get("year") and result.get("authors"):
                         return {
@@ -426,7 +826,6 @@ class PaperRetriever:
             openalex = self.clients.get("openalex")
             if openalex:
                 try:
-                    await self.rate_limiter.wait("openalex")
                     result = await openalex.get_paper_metadata(doi)
                     if result:
                         authorships = result.get("authorships", [])
@@ -458,7 +857,6 @@ class PaperRetriever:
             s2 = self.clients.get("semantic_scholar")
             if s2:
                 try:
-                    await self.rate_limiter.wait("semantic_scholar")
                     result = await s2.get_paper_metadata(f"ARXIV:{arxiv_id}")
                     if result and result.get("year") and result.get("authors"):
                         return {
@@ -477,7 +875,6 @@ class PaperRetriever:
             arxiv_client = self.clients.get("arxiv")
             if arxiv_client:
                 try:
-                    await self.rate_limiter.wait("arxiv")
                     # Search by arXiv ID directly
                     results = await arxiv_client.search(arxiv_id, limit=1)
                     for result in results:
@@ -503,12 +900,12 @@ class PaperRetriever:
             arxiv_client = self.clients.get("arxiv")
             if arxiv_client:
                 try:
-                    await self.rate_limiter.wait("arxiv")
                     quoted_title = f'"{title}"'
                     results = await arxiv_client.search(quoted_title, limit=5)
-                    for result in results:
+                    matches = TitleMatcher(title).match_all([r.get("title", "") for r in results], threshold=0.7)
+                    for result, matched in zip(results, matches, strict=True):
                         found_title = result.get("title", "")
-                        if result.get("arxiv_id") and self._titles_match(title, found_title, threshold=0.7):
+                        if matched and result.get("arxiv_id"):
                             found_arxiv_id = result["arxiv_id"]
                             return {
                                 "doi": f"10.48550/arXiv.{found_arxiv_id.split('v')[0]}",
@@ -714,6 +1111,7 @@ class PaperRetriever:
         if arxiv_id:
             pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
             logger.detail(f"Trying arXiv ID {arxiv_id}: {pdf_url}")
+            await client.rate_limiter.wait()
             if await self._download_pdf(pdf_url, output_path):
                 return RetrievalResult(
                     doi=doi, title=title, status=RetrievalStatus.SUCCESS,
@@ -728,10 +1126,11 @@ class PaperRetriever:
             # Use quoted search for better exact matching
             quoted_title = f'"{title}"'
             results = await client.search(quoted_title, limit=5)
-            for metadata in results:
+            matches = TitleMatcher(title).match_all([m.get("title", "") for m in results], threshold=0.7)
+            for metadata, matched in zip(results, matches, strict=True):
                 found_arxiv_id = metadata.get("arxiv_id")
                 found_title = metadata.get("title", "")
-                if found_arxiv_id and self._titles_match(title, found_title, threshold=0.7):
+                if matched and found_arxiv_id:
                     pdf_url = f"https://arxiv.org/pdf/{found_arxiv_id}.pdf"
                     logger.detail(f"Title match found ('{found_title[:40]}...'), PDF: {pdf_url}")
                     if await self._download_pdf(pdf_url, output_path):
@@ -818,12 +1217,13 @@ class PaperRetriever:
         if not result or not result.get("pdf_url"):
             logger.detail(f"Searching by title: {title[:50]}...")
             results = await client.search(title, limit=5)
-            for r in results:
+            matches = TitleMatcher(title).match_all([r.get("title", "") for r in results])
+            for r, matched in zip(results, matches, strict=True):
                 found_doi = r.get("doi")
                 found_title = r.get("title", "")
 
                 # Validate title match
-                if not self._titles_match(title, found_title):
+                if not matched:
                     continue
 
                 # Validate DOI if present
@@ -890,12 +1290,13 @@ class PaperRetriever:
         if not result:
             logger.detail(f"Searching by title: {title[:50]}...")
             results = await client.search(title, limit=5)
-            for r in results:
+            matches = TitleMatcher(title).match_all([r.get("title", "") for r in results])
+            for r, matched in zip(results, matches, strict=True):
                 found_title = r.get("title", "")
                 found_doi = r.get("doi")
 
                 # Validate title match
-                if not self._titles_match(title, found_title):
+                if not matched:
                     continue
 
                 # Validate DOI if present
@@ -948,36 +1349,34 @@ class PaperRetriever:
 
         # For other landing pages, try to parse HTML for PDF links
         try:
-            import httpx
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as http_client:
-                response = await http_client.get(url)
-                if response.status_code == 200:
-                    html = response.text
-                    # Look for common PDF link patterns
-                    import re
-
-                    # Pattern 1: Direct PDF link in href
-                    pdf_link_patterns = [
-                        r'href=["\']([^"\']+\.pdf)["\']',
-                        r'href=["\']([^"\']+/download[^"\']*)["\']',
-                        r'href=["\']([^"\']+/pdf[^"\']*)["\']',
-                    ]
-
-                    for pattern in pdf_link_patterns:
-                        matches = re.findall(pattern, html, re.IGNORECASE)
-                        if matches:
-                            pdf_path = matches[0]
-                            # Make absolute URL if relative
-                            if pdf_path.startswith('/'):
-                                from urllib.parse import urlparse
-                                parsed = urlparse(url)
-                                pdf_url = f"{parsed.scheme}://{parsed.netloc}{pdf_path}"
-                            elif not pdf_path.startswith('http'):
-                                pdf_url = url.rsplit('/', 1)[0] + '/' + pdf_path
-                            else:
-                                pdf_url = pdf_path
-                            logger.detail(f"Extracted PDF URL from landing page: {pdf_url}")
-                            return pdf_url
+            response = await self.http.get(url, timeout=30.0)
+            if response.status_code == 200:
+                html = response.text
+                # Look for common PDF link patterns
+                import re
+
+                # Pattern 1: Direct PDF link in href
+                pdf_link_patterns = [
+                    r'href=["\']([^"\']+\.pdf)["\']',
+                    r'href=["\']([^"\']+/download[^"\']*)["\']',
+                    r'href=["\']([^"\']+/pdf[^"\']*)["\']',
+                ]
+
+                for pattern in pdf_link_patterns:
+                    matches = re.findall(pattern, html, re.IGNORECASE)
+                    if matches:
+                        pdf_path = matches[0]
+                        # Make absolute URL if relative
+                        if pdf_path.startswith('/'):
+                            from urllib.parse import urlparse
+                            parsed = urlparse(url)
+                            pdf_url = f"{parsed.scheme}://{parsed.netloc}{pdf_path}"
+                        elif not pdf_path.startswith('http'):
+                            pdf_url = url.rsplit('/', 1)[0] + '/' + pdf_path
+                        else:
+                            pdf_url = pdf_path
+                        logger.detail(f"Extracted PDF URL from landing page: {pdf_url}")
+                        return pdf_url
         except Exception as e:
             logger.detail(f"Could not extract PDF from landing page: {e}")
 
@@ -1075,101 +1474,25 @@ class PaperRetriever:
 
     @staticmethod
     def _normalize_title(title: str) -> str:
-        """Normalize a title for comparison.
-        
-        Removes:
-        - Punctuation and special characters
-        - Extra whitespace
-        - Common stopwords that don't affect meaning
-        - Converts to lowercase
-        """
-        # Convert to lowercase
-        normalized = title.lower()
-        
-        # Remove common subtitle separators and trailing content if very long
-        # But keep the main title intact
-        if ":" in normalized and len(normalized) > 100:
-            # Only split on first colon if title is very long (likely has subtitle)
-            parts = normalized.split(":", 1)
-            if len(parts[0]) > 30:  # Main title is substantial
-                normalized = parts[0]
-        
-        # Remove special characters but keep spaces
-        normalized = re.sub(r"[^\w\s]", " ", normalized)
-        
-        # Remove extra whitespace
-        normalized = " ".join(normalized.split())
-        
-        # Remove common academic stopwords that don't help matching
-        stopwords = {"a", "an", "the", "and", "or", "of", "to", "in", "for", "on", "at", "from", "with", "by"}
-        words = normalized.split()
-        # Only remove stopwords if they're not significant (title has enough other words)
-        if len(words) > 5:
-            words = [w for w in words if w not in stopwords or len(w) > 3]
-        
-        return " ".join(words)
+        """Normalize a title for comparison (memoized, see :func:`.title_match.normalize`)."""
+        return normalize(title)
 
     def _titles_match(self, title1: str, title2: str, threshold: float = 0.6) -> bool:
         """Check if two titles are similar enough.
 
-        Uses multiple methods:
+        Uses multiple methods (see :mod:`.title_match`):
         1. Exact normalized match
         2. Substring match: If one title contains the other (for truncated titles)
            Only matches if shorter is at least 50% of longer length
-        3. Word overlap: Jaccard similarity of words
-        4. Fuzzy string matching: Character-level similarity
+        3. Word overlap: word subset, then Jaccard similarity of words
+        4. Character-level Levenshtein similarity, bounded before it is computed
 
         Args:
             title1: First title (usually the query)
             title2: Second title (usually the found result)
             threshold: Minimum similarity score (0.0 to 1.0), default 0.6
         """
-        if not title1 or not title2:
-            return False
-            
-        norm1 = self._normalize_title(title1)
-        norm2 = self._normalize_title(title2)
-
-        # Exact match after normalization
-        if norm1 == norm2:
-            return True
-
-        # Check for substring match (handles truncated titles)
-        # Only allow if shorter title is at least 50% of the longer title length
-        # This prevents very short titles from matching long titles
-        if norm1 in norm2 or norm2 in norm1:
-            shorter_len = min(len(norm1), len(norm2))
-            longer_len = max(len(norm1), len(norm2))
-            if shorter_len >= longer_len * 0.5:
-                return True
-
-        words1 = set(norm1.split())
-        words2 = set(norm2.split())
-
-        if not words1 or not words2:
-            return False
-
-        # Check if all words from the shorter title are in the longer title
-        # This handles cases like partial titles
-        shorter, longer = (words1, words2) if len(words1) <= len(words2) else (words2, words1)
-        if shorter.issubset(longer) and len(shorter) >= len(longer) * 0.5:
-            return True
-
-        # Jaccard similarity (word-level)
-        common = len(words1 & words2)
-        total = len(words1 | words2)
-        jaccard = common / total if total > 0 else 0.0
-        
-        if jaccard >= threshold:
-            return True
-        
-        # Fuzzy string matching (character-level) as final fallback
-        # Uses Python's difflib for sequence matching
-        from difflib import SequenceMatcher
-        ratio = SequenceMatcher(None, norm1, norm2).ratio()
-        
-        # Use a slightly lower threshold for fuzzy matching since it's more strict
-        return ratio >= (threshold * 0.9)
+        return titles_match(title1, title2, threshold)
 
     def _validate_found_doi(self, expected_title: str, found_doi: str, found_title: str = "", found_abstract: str = "") -> tuple[bool, str | None]:
         """Validate that a DOI found during search is appropriate.
@@ -1206,7 +1529,7 @@ class PaperRetriever:
         return True, None
 
     async def _download_pdf(self, url: str, output_path: Path) -> bool:
-        """Download PDF from URL."""
+        """Download PDF from URL (streamed, size-capped and resumable)."""
         # Use browser-like headers to avoid blocks
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -1217,24 +1540,19 @@ class PaperRetriever:
             "Referer": url.split("/content/")[0] + "/" if "/content/" in url else url,
         }
 
-        try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=60) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-
-                content = response.content
-                content_type = response.headers.get("content-type", "")
-
-                # Verify it's a PDF
-                if "pdf" not in content_type.lower() and not content.startswith(b"%PDF"):
-                    return False
-
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                output_path.write_bytes(content)
-                return True
-
-        except Exception:
+        max_mb = self.config.download.get("max_pdf_mb")
+        download = await stream_pdf(
+            self.http,
+            url,
+            output_path,
+            headers=headers,
+            max_bytes=int(max_mb * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES,
+            max_resumes=self.config.download.get("resume_attempts", 2),
+        )
+        if download is None:
             return False
+        self._downloads[output_path] = download
+        return True
 
     async def retrieve_batch(
         self,
@@ -1243,6 +1561,7 @@ class PaperRetriever:
         verbose: bool = True,
         save_progress: bool = True,
         max_concurrent: int = 1,
+        retry_failed: bool = False,
     ) -> list[RetrievalResult]:
         """Retrieve PDFs for multiple papers.
 
@@ -1254,8 +1573,13 @@ class PaperRetriever:
                    - pdf_url: Direct PDF URL (optional, tried first if provided)
             output_dir: Override output directory
             verbose: Show progress
-            save_progress: Save progress to file for resume
-            max_concurrent: Maximum concurrent downloads (default 1 for rate limiting)
+            save_progress: Record outcomes in the batch journal (see
+                :class:`BatchJournal`) and skip papers it lists as done
+            max_concurrent: Papers in flight at once. Above 1, attempts are
+                scheduled per source (see :class:`SourceScheduler`) instead
+                of walking papers one after another
+            retry_failed: Only run papers whose last journaled attempt
+                failed (not found or error); everything else is skipped
 
         Returns:
             List of RetrievalResult objects
@@ -1263,80 +1587,130 @@ class PaperRetriever:
         out_dir = Path(output_dir) if output_dir else Path(self.config.download.get("output_dir", "./downloads"))
         out_dir.mkdir(parents=True, exist_ok=True)
 
-        progress_file = out_dir / self.config.batch.get("progress_file", ".retrieval_progress.json")
-        completed: set[str] = set()
+        journal = None
+        if save_progress:
+            from .journal import BatchJournal
 
-        # Load existing progress
-        if save_progress and progress_file.exists():
-            try:
-                with open(progress_file) as f:
-                    progress_data = json.load(f)
-                    completed = set(progress_data.get("completed", []))
-                if verbose:
-                    print(f"Resuming from {len(completed)} completed papers")
-            except Exception:
-                pass
+            journal = BatchJournal(
+                out_dir / self.config.batch.get("journal_file", ".retrieval_journal.jsonl"),
+                legacy_progress=out_dir / self.config.batch.get("progress_file", ".retrieval_progress.json"),
+            )
+            if verbose and journal.entries:
+                done = sum(entry.done for entry in journal.entries.values())
+                print(f"Resuming from {done} completed papers ({len(journal.entries)} in journal)")
 
-        results = []
+        results: list[RetrievalResult] = []
         total = len(papers)
 
-        # Use semaphore for concurrency control
-        semaphore = asyncio.Semaphore(max_concurrent)
+        def identify(paper: dict[str, Any]) -> str | None:
+            return paper.get("doi") or paper.get("title") or paper.get("arxiv_id") or paper.get("pdf_url")
+
+        def skip_reason(paper: dict[str, Any]) -> str | None:
+            """Why a paper needs no attempt in this run, if it doesn't."""
+            if journal is None:
+                return None
+            identifier = identify(paper)
+            if journal.is_done(identifier):
+                return "already done"
+            if retry_failed and not journal.is_failed(identifier):
+                return "no failed attempt"
+            if not self.config.batch.get("retry_failed", True) and journal.is_failed(identifier):
+                return "failed before"
+            return None
+
+        def skipped(idx: int, paper: dict[str, Any]) -> RetrievalResult | None:
+            """Result for a paper that needs no attempt in this run, if any."""
+            reason = skip_reason(paper)
+            if reason is None:
+                return None
+            if verbose:
+                print(f"[{idx}/{total}] Skipping ({reason}): {(identify(paper) or '')[:50]}")
+            return RetrievalResult(
+                doi=paper.get("doi"), title=paper.get("title") or "",
+                status=RetrievalStatus.SKIPPED,
+                pdf_path=None,
+            )
 
-        async def retrieve_one(idx: int, paper: dict) -> tuple[int, RetrievalResult]:
-            async with semaphore:
-                doi = paper.get("doi")
-                title = paper.get("title", "")
-                arxiv_id = paper.get("arxiv_id")
-                pdf_url = paper.get("pdf_url")
-                identifier = doi or title or arxiv_id or pdf_url
+        def record(paper: dict[str, Any], result: RetrievalResult) -> None:
+            """Append a finished paper to the journal."""
+            identifier = identify(paper)
+            if journal is not None and identifier:
+                with contextlib.suppress(OSError):
+                    journal.record(identifier, result)
 
-                # Skip if already completed
-                if identifier in completed:
-                    if verbose:
-                        print(f"[{idx}/{total}] Skipping (already done): {identifier[:50]}")
-                    return idx, RetrievalResult(
-                        doi=doi, title=title or "",
-                        status=RetrievalStatus.SKIPPED,
-                        pdf_path=None,
-                    )
-
-                if verbose:
-                    print(f"\n[{idx}/{total}] Processing: {(identifier or '')[:60]}...")
+        scheduler = None
+        prefetch = None
+        try:
+            if self.config.batch.get("prefetch_metadata", False):
+                # Resolve known DOIs / arXiv IDs in a few batched calls
+                todo = [paper for paper in papers if skip_reason(paper) is None]
+                prefetch = await self.prefetch_metadata(todo)
+                if verbose and prefetch.requested:
+                    print(f"Pre-resolved {prefetch.summary()}")
+
+            if max_concurrent > 1:
+                # Interleave (paper, source) attempts across sources
+                from .scheduler import SourceScheduler
+
+                by_index: dict[int, RetrievalResult] = {}
+                pending: list[tuple[int, dict[str, Any]]] = []
+                for i, paper in enumerate(papers, 1):
+                    result = skipped(i, paper)
+                    if result:
+                        by_index[i] = result
+                    else:
+                        pending.append((i, paper))
 
-                result = await self.retrieve(
-                    doi=doi,
-                    title=title,
-                    arxiv_id=arxiv_id,
-                    pdf_url=pdf_url,
-                    output_dir=out_dir,
-                    verbose=verbose,
+                def on_result(idx: int, result: RetrievalResult) -> None:
+                    paper = papers[idx - 1]
+                    record(paper, result)
+                    if verbose:
+                        mark = "✓" if result.status == RetrievalStatus.SUCCESS else "⊘" if result.status == RetrievalStatus.SKIPPED else "✗"
+                        outcome = result.source or result.error or result.status.value
+                        print(f"[{idx}/{total}] {mark} {(identify(paper) or '')[:60]} ({outcome})")
+
+                scheduler = SourceScheduler(
+                    self,
+                    max_preparing=max_concurrent,
+                    workers_per_source=self.config.batch.get("per_source_workers", 4),
                 )
-
-                # Save progress
-                if save_progress and result.status in (RetrievalStatus.SUCCESS, RetrievalStatus.SKIPPED) and identifier:
-                    completed.add(identifier)
-                    try:
-                        with open(progress_file, "w") as f:
-                            json.dump({"completed": list(completed)}, f)
-                    except Exception:
-                        pass
-
-                return idx, result
-
-        if max_concurrent > 1:
-            # Concurrent execution
-            tasks = [retrieve_one(i, paper) for i, paper in enumerate(papers, 1)]
-            task_results = await asyncio.gather(*tasks)
-            # Sort by original index
-            task_results.sort(key=lambda x: x[0])
-            results = [r for _, r in task_results]
-        else:
-            # Sequential execution (original behavior)
-            for i, paper in enumerate(papers, 1):
-                _, result = await retrieve_one(i, paper)
-                results.append(result)
-                # Rate limit between papers
-                await asyncio.sleep(self.config.rate_limits.get("global_delay", 1.0))
+                by_index.update(await scheduler.run(pending, out_dir, on_result))
+                results = [by_index[i] for i in range(1, total + 1)]
+            else:
+                # Sequential execution (original behavior)
+                for i, paper in enumerate(papers, 1):
+                    result = skipped(i, paper)
+                    if result is None:
+                        if verbose:
+                            print(f"\n[{i}/{total}] Processing: {(identify(paper) or '')[:60]}...")
+                        started = time.monotonic()
+                        result = await self.retrieve(
+                            doi=paper.get("doi"),
+                            title=paper.get("title", ""),
+                            arxiv_id=paper.get("arxiv_id"),
+                            pdf_url=paper.get("pdf_url"),
+                            output_dir=out_dir,
+                            verbose=verbose,
+                        )
+                        result.elapsed = time.monotonic() - started
+                        record(paper, result)
+                    results.append(result)
+                    # Rate limit between papers
+                    await asyncio.sleep(self.config.rate_limits.get("global_delay", 1.0))
+        finally:
+            if journal is not None:
+                journal.close()
+            await self.aclose()
+
+        if verbose and scheduler and scheduler.attempts:
+            print(f"\nSources (found/tried): {scheduler.summary()}")
+        if verbose and self.http.stats.requests:
+            print(f"\nHTTP: {self.http.stats.summary()}")
+        if verbose and self.rate_limiter.metrics():
+            print(f"Rate limit waits: {self.rate_limiter.summary()}")
+        if verbose and self.cache and self.cache.stats.lookups:
+            print(f"Metadata cache: {self.cache.stats.summary()}")
+        if verbose and self.source_stats and (self.source_stats.reordered or self.source_stats.skipped):
+            print(f"Adaptive source order: {self.source_stats.summary()}")
 
         return results
@@ -0,0 +1,170 @@
+"""Source-aware scheduling for batch retrieval.
+
+Running whole papers concurrently makes every paper walk the sources in the
+same priority order, so they pile up behind whichever source is slowest
+(arXiv allows one call every 3 s). The scheduler instead treats each
+(paper, source) attempt as a job:
+
+- Each source has its own queue and a few workers. Workers wait on the
+  source's token bucket, so the source is kept busy up to its rate limit
+  but never beyond it.
+- A paper is in at most one source queue at a time and moves to its next
+  source when an attempt fails, so per-paper priority order is kept.
+- While one paper waits its turn on arXiv, others progress on Unpaywall,
+  OpenAlex, ... and batch throughput approaches the sum of the sources'
+  budgets rather than the budget of the slowest one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .retriever import PaperRetriever, RetrievalJob, RetrievalResult
+
+
+class SourceScheduler:
+    """Interleave papers across sources for :meth:`PaperRetriever.retrieve_batch`.
+
+    Example:
+        >>> scheduler = SourceScheduler(retriever, max_preparing=3)
+        >>> results = await scheduler.run(list(enumerate(papers, 1)), Path("./papers"))
+    """
+
+    def __init__(
+        self,
+        retriever: PaperRetriever,
+        max_preparing: int = 3,
+        workers_per_source: int = 4,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            retriever: Retriever whose sources and clients to use
+            max_preparing: Papers resolving metadata at the same time
+            workers_per_source: Attempts in flight per source (the source's
+                rate limit still applies across them)
+        """
+        self.retriever = retriever
+        self.max_preparing = max(1, max_preparing)
+        self.workers_per_source = max(1, workers_per_source)
+        self.attempts: Counter[str] = Counter()
+        self.successes: Counter[str] = Counter()
+
+    async def run(
+        self,
+        papers: list[tuple[int, dict[str, Any]]],
+        output_dir: Path,
+        on_result: Callable[[int, RetrievalResult], None] | None = None,
+    ) -> dict[int, RetrievalResult]:
+        """Retrieve a batch of papers.
+
+        Args:
+            papers: (index, paper) pairs; paper dicts as for retrieve_batch
+            output_dir: Directory to save PDFs to
+            on_result: Called with (index, result) as each paper finishes
+
+        Returns:
+            Dict mapping index to result
+        """
+        from .retriever import RetrievalResult, RetrievalStatus  # noqa: F811
+
+        results: dict[int, RetrievalResult] = {}
+        if not papers:
+            return results
+
+        sources = self.retriever._candidate_sources()
+        queues: dict[str, asyncio.Queue[tuple[int, RetrievalJob]]] = {
+            source: asyncio.Queue() for source in sources
+        }
+        remaining = len(papers)
+        done = asyncio.Event()
+        preparing = asyncio.Semaphore(self.max_preparing)
+        started: dict[int, float] = {}
+
+        def finish(idx: int, result: RetrievalResult) -> None:
+            nonlocal remaining
+            if idx in started:
+                result.elapsed = time.monotonic() - started[idx]
+            results[idx] = result
+            if on_result:
+                on_result(idx, result)
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+
+        def route(idx: int, job: RetrievalJob) -> None:
+            """Queue a job at its next source, or finish it."""
+            while job.attempted < len(job.sources):
+                source = job.sources[job.attempted]
+                if source in queues:
+                    queues[source].put_nowait((idx, job))
+                    return
+                job.attempted += 1
+            finish(idx, self.retriever._not_found(job))
+
+        async def prepare(idx: int, paper: dict[str, Any]) -> None:
+            async with preparing:
+                started[idx] = time.monotonic()
+                try:
+                    job = await self.retriever._prepare(
+                        paper.get("doi"),
+                        paper.get("title"),
+                        paper.get("arxiv_id"),
+                        paper.get("pdf_url"),
+                        output_dir,
+                        verbose=False,
+                    )
+                except Exception as e:
+                    job = RetrievalResult(
+                        doi=paper.get("doi"),
+                        title=paper.get("title") or "",
+                        status=RetrievalStatus.ERROR,
+                        error=str(e),
+                    )
+            if isinstance(job, RetrievalResult):
+                finish(idx, job)
+            else:
+                route(idx, job)
+
+        async def worker(source: str) -> None:
+            queue = queues[source]
+            while True:
+                idx, job = await queue.get()
+                self.attempts[source] += 1
+                try:
+                    result = await self.retriever._attempt(job, source)
+                except Exception as e:
+                    job.logger.error(source, str(e))
+                    result = None
+                if result:
+                    self.successes[source] += 1
+                    finish(idx, result)
+                else:
+                    route(idx, job)
+
+        workers = [
+            asyncio.create_task(worker(source))
+            for source in sources
+            for _ in range(self.workers_per_source)
+        ]
+        preparers = [asyncio.create_task(prepare(idx, paper)) for idx, paper in papers]
+        try:
+            await done.wait()
+        finally:
+            for task in workers + preparers:
+                task.cancel()
+            await asyncio.gather(*workers, *preparers, return_exceptions=True)
+        return results
+
+    def summary(self) -> str:
+        """One-line summary of attempts and successes per source."""
+        return ", ".join(
+            f"{source} {self.successes[source]}/{count}"
+            for source, count in self.attempts.most_common()
+        )
@@ -0,0 +1,274 @@
+"""Source ordering learned from past outcomes.
+
+The static priority in the config is a poor fit for many papers: for IEEE
+DOIs (``10.1109``) most open-access sources never have the PDF, while for
+arXiv DOIs (``10.48550``) arXiv always does. ``SourceStats`` records, in a
+small SQLite database, how often each source succeeded and how long its
+attempts took, keyed by DOI prefix (which identifies the publisher) and by
+venue. For a new paper:
+
+- Sources are ordered by estimated successes per second of attempt time,
+  ``p / t``, which minimizes the expected time to the first PDF when
+  sources are tried one by one. Estimates are smoothed towards a prior, so
+  sources with little history stay near their static position (ties keep
+  the static order).
+- Sources only move within their tier: those in :data:`LAST_RESORT`
+  (institutional proxy, web search and gray-area sources) stay behind the
+  official open-access ones whatever their record.
+- Optionally, sources that failed every one of at least ``skip_after``
+  attempts for the paper's keys are dropped.
+- With probability ``exploration`` the static order is used unchanged, so
+  sources that were skipped or demoted get tried again and stale stats are
+  refreshed. Rows older than ``max_age_days`` are ignored.
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .metadata_cache import DAY, normalize_doi, normalize_title
+
+DEFAULT_PATH = Path.home() / ".cache" / "parser" / "source_stats.sqlite"
+
+# Never promoted ahead of the official sources
+LAST_RESORT = frozenset({"institutional", "web_search", "scihub", "libgen"})
+
+# Smoothing: a source without history counts as PRIOR_WEIGHT attempts with
+# PRIOR_RATE successes, each taking PRIOR_SECONDS
+PRIOR_WEIGHT = 4.0
+PRIOR_RATE = 0.5
+PRIOR_SECONDS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outcomes (
+    key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    successes INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (key, source)
+)
+"""
+
+
+def stats_keys(doi: str | None, metadata: dict[str, Any] | None) -> list[str]:
+    """Keys a paper's outcomes are recorded under.
+
+    Args:
+        doi: Paper DOI
+        metadata: Resolved metadata (for the venue)
+
+    Returns:
+        ``prefix:<DOI prefix>`` and ``venue:<normalized venue>``, when known
+    """
+    keys = []
+    if doi:
+        prefix = normalize_doi(doi).split("/", 1)[0]
+        if prefix.startswith("10."):
+            keys.append(f"prefix:{prefix}")
+    venue = (metadata or {}).get("venue")
+    if isinstance(venue, str) and venue.strip():
+        keys.append(f"venue:{normalize_title(venue)}")
+    return keys
+
+
+@dataclass
+class SourceEstimate:
+    """Pooled history of one source for a paper's keys."""
+
+    attempts: int = 0
+    successes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        """Smoothed probability that an attempt finds the PDF."""
+        return (self.successes + PRIOR_RATE * PRIOR_WEIGHT) / (self.attempts + PRIOR_WEIGHT)
+
+    @property
+    def mean_seconds(self) -> float:
+        """Smoothed duration of an attempt."""
+        return (self.seconds + PRIOR_SECONDS * PRIOR_WEIGHT) / (self.attempts + PRIOR_WEIGHT)
+
+    @property
+    def score(self) -> float:
+        """Expected successes per second of attempt time."""
+        return self.success_rate / max(self.mean_seconds, 0.01)
+
+
+class SourceStats:
+    """Per-source outcome stats by DOI prefix and venue, and source ordering.
+
+    Example:
+        >>> stats = SourceStats("~/.cache/parser/source_stats.sqlite")
+        >>> stats.record("10.1109/x", {"venue": "CVPR"}, "arxiv", success=False, seconds=2.0)
+        >>> stats.order(["unpaywall", "arxiv", "openalex"], "10.1109/y", {"venue": "CVPR"})
+        ['unpaywall', 'openalex', 'arxiv']
+        >>> print(stats.summary())
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_PATH,
+        exploration: float = 0.1,
+        skip_after: int = 0,
+        max_age_days: float = 90,
+        rng: random.Random | None = None,
+    ):
+        """Initialize the stats store.
+
+        Args:
+            path: SQLite database file (created if missing), or ":memory:"
+            exploration: Probability of keeping the static order for a paper
+            skip_after: Drop sources that failed at least this many attempts
+                without a success for the paper's keys (0: never drop)
+            max_age_days: Ignore stats not updated for this long
+            rng: Random source for exploration (for tests)
+        """
+        self.path = Path(path).expanduser() if str(path) != ":memory:" else path
+        self.exploration = exploration
+        self.skip_after = skip_after
+        self.max_age = max_age_days * DAY
+        self.rng = rng or random.Random()
+        self.reordered = 0
+        self.explored = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any] | None) -> SourceStats | None:
+        """Create the store described by a ``source_stats`` config section.
+
+        Args:
+            config: Dict with 'enabled', 'path', 'exploration', 'skip_after'
+                and 'max_age_days'
+
+        Returns:
+            The store, or None if disabled or the database cannot be opened
+        """
+        config = config or {}
+        if not config.get("enabled", False):
+            return None
+        try:
+            return cls(
+                config.get("path") or DEFAULT_PATH,
+                exploration=config.get("exploration", 0.1),
+                skip_after=config.get("skip_after", 0),
+                max_age_days=config.get("max_age_days", 90),
+            )
+        except (OSError, sqlite3.Error):
+            return None
+
+    def record(
+        self,
+        doi: str | None,
+        metadata: dict[str, Any] | None,
+        source: str,
+        success: bool,
+        seconds: float,
+    ) -> None:
+        """Record the outcome of an attempt.
+
+        Args:
+            doi: Paper DOI
+            metadata: Resolved metadata (for the venue)
+            source: Source tried
+            success: Whether it returned the PDF
+            seconds: How long the attempt took
+        """
+        now = time.time()
+        with self._lock:
+            for key in stats_keys(doi, metadata):
+                self._db.execute(
+                    "INSERT INTO outcomes (key, source, attempts, successes, seconds, updated) "
+                    "VALUES (?, ?, 1, ?, ?, ?) "
+                    "ON CONFLICT (key, source) DO UPDATE SET "
+                    "attempts = attempts + 1, successes = successes + excluded.successes, "
+                    "seconds = seconds + excluded.seconds, updated = excluded.updated",
+                    (key, source, int(success), seconds, now),
+                )
+
+    def estimates(self, doi: str | None, metadata: dict[str, Any] | None) -> dict[str, SourceEstimate]:
+        """Pooled history per source over a paper's keys.
+
+        Returns:
+            Dict mapping source to its estimate (sources without history
+            are absent)
+        """
+        keys = stats_keys(doi, metadata)
+        if not keys:
+            return {}
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT source, attempts, successes, seconds FROM outcomes "
+                f"WHERE key IN ({', '.join('?' * len(keys))}) AND updated >= ?",
+                (*keys, time.time() - self.max_age),
+            ).fetchall()
+        estimates: dict[str, SourceEstimate] = {}
+        for source, attempts, successes, seconds in rows:
+            estimate = estimates.setdefault(source, SourceEstimate())
+            estimate.attempts += attempts
+            estimate.successes += successes
+            estimate.seconds += seconds
+        return estimates
+
+    def order(self, sources: list[str], doi: str | None, metadata: dict[str, Any] | None) -> list[str]:
+        """Order (and optionally prune) sources for a paper.
+
+        Args:
+            sources: Candidate sources in static priority order
+            doi: Paper DOI
+            metadata: Resolved metadata
+
+        Returns:
+            Sources to try, in order
+        """
+        if self.exploration and self.rng.random() < self.exploration:
+            self.explored += 1
+            return list(sources)
+        estimates = self.estimates(doi, metadata)
+        if not estimates:
+            return list(sources)
+
+        kept = [
+            source for source in sources
+            if not (
+                self.skip_after
+                and source in estimates
+                and estimates[source].successes == 0
+                and estimates[source].attempts >= self.skip_after
+            )
+        ]
+        self.skipped += len(sources) - len(kept)
+        default = SourceEstimate()
+        # Reorder within each tier only; sorted() is stable, so ties keep
+        # the static order
+        ordered = sorted(
+            kept, key=lambda source: (source in LAST_RESORT, -estimates.get(source, default).score)
+        )
+        if ordered != sources:
+            self.reordered += 1
+        return ordered
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def summary(self) -> str:
+        """One-line summary for logs and batch reports."""
+        return f"{self.reordered} papers reordered, {self.skipped} attempts skipped, {self.explored} explored"
@@ -0,0 +1,219 @@
+"""Fast title comparison for search results.
+
+Every candidate of every title search is compared with the query title.
+Comparisons used to re-run the normalization regexes on both titles each
+time and fall back to ``difflib.SequenceMatcher``, which is quadratic in the
+title length. Here:
+
+- Normalized titles and their word sets are memoized, so a query is
+  normalized once per process however many candidates it meets.
+- The cheap token-set tests (exact, truncation, word subset, Jaccard) run
+  first and decide most pairs.
+- The character-level fallback is a Levenshtein similarity computed with a
+  bit-parallel algorithm, after two upper bounds (length and character
+  counts) have had a chance to reject the pair without it. It is stricter
+  than ``SequenceMatcher.ratio``, which let through titles such as "Fully
+  Convolutional Networks for Semantic Segmentation" for "U-Net:
+  Convolutional Networks for Biomedical Image Segmentation".
+- :class:`TitleMatcher` prepares the query once (words, character bit masks)
+  and scores all candidates of a search response against it.
+
+``tests/fixtures/title_pairs.json`` holds labeled title pairs that the
+decisions are checked against.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+# Dropped from titles with more than five words
+STOPWORDS = frozenset({"a", "an", "the", "and", "or", "of", "to", "in", "for", "on", "at", "by"})
+
+# The character-level fallback uses a slightly lower threshold, since it is
+# stricter than word overlap
+FUZZY_FACTOR = 0.9
+
+
+@lru_cache(maxsize=8192)
+def normalize(title: str) -> str:
+    """Normalize a title for comparison.
+
+    Lowercases, drops the subtitle of very long titles, replaces punctuation
+    with spaces, collapses whitespace and, for titles of more than five
+    words, removes short stopwords.
+    """
+    normalized = title.lower()
+
+    # Only split on the first colon if the title is very long (likely has a
+    # subtitle) and the main title is substantial
+    if ":" in normalized and len(normalized) > 100:
+        main = normalized.split(":", 1)[0]
+        if len(main) > 30:
+            normalized = main
+
+    words = _NON_WORD.sub(" ", normalized).split()
+    if len(words) > 5:
+        words = [w for w in words if w not in STOPWORDS]
+    return " ".join(words)
+
+
+@lru_cache(maxsize=8192)
+def _words(normalized: str) -> frozenset[str]:
+    return frozenset(normalized.split())
+
+
+def _char_masks(text: str) -> dict[str, int]:
+    """Bit mask of the positions of each character in a string."""
+    masks: dict[str, int] = {}
+    for i, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _levenshtein(masks: dict[str, int], length: int, other: str) -> int:
+    """Levenshtein distance, bit-parallel (Myers/Hyyrö).
+
+    One pass over ``other`` with a few integer operations per character,
+    instead of a table of ``length * len(other)`` cells.
+
+    Args:
+        masks: Character masks of the first string (see _char_masks)
+        length: Length of the first string
+        other: Second string
+    """
+    if not length:
+        return len(other)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    pv, mv, distance = full, 0, length
+    for char in other:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & full) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        if ph & last:
+            distance += 1
+        elif mh & last:
+            distance -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    return distance
+
+
+def _token_set_match(norm1: str, norm2: str, words1: frozenset[str], words2: frozenset[str], threshold: float) -> bool:
+    """Exact, truncation, word subset and Jaccard tests."""
+    if norm1 == norm2:
+        return True
+
+    # Truncated titles, as long as the shorter is at least half the longer
+    if (norm1 in norm2 or norm2 in norm1) and min(len(norm1), len(norm2)) >= max(len(norm1), len(norm2)) * 0.5:
+        return True
+
+    if not words1 or not words2:
+        return False
+
+    # Partial titles: every word of the shorter appears in the longer
+    shorter, longer = (words1, words2) if len(words1) <= len(words2) else (words2, words1)
+    if shorter <= longer and len(shorter) >= len(longer) * 0.5:
+        return True
+
+    return len(words1 & words2) / len(words1 | words2) >= threshold
+
+
+class TitleMatcher:
+    """A query title prepared for comparison with many candidates.
+
+    Example:
+        >>> matcher = TitleMatcher("Attention Is All You Need")
+        >>> matcher.matches("Attention is all you need.", threshold=0.7)
+        True
+        >>> matcher.match_all([r["title"] for r in results], threshold=0.7)
+        [True, False, False]
+    """
+
+    def __init__(self, query: str):
+        """Prepare a query title.
+
+        Args:
+            query: Title being searched for
+        """
+        self.query = query
+        self.norm = normalize(query) if query else ""
+        self.words = _words(self.norm)
+        self._masks: dict[str, int] | None = None
+        self._counts: Counter[str] | None = None
+
+    def similarity(self, candidate: str, cutoff: float = 0.0) -> float:
+        """Character-level similarity with a candidate.
+
+        ``1 - levenshtein / max(len1, len2)``: 1.0 for identical titles.
+
+        Args:
+            candidate: Candidate title (normalized)
+            cutoff: Scores below this may be returned as 0.0 without being
+                computed
+
+        Returns:
+            Similarity between 0.0 and 1.0
+        """
+        longest = max(len(self.norm), len(candidate))
+        if not longest:
+            return 1.0
+        # The distance is at least the length difference ...
+        if min(len(self.norm), len(candidate)) / longest < cutoff:
+            return 0.0
+        # ... and at least the characters of the longer title left unmatched
+        if self._counts is None:
+            self._counts = Counter(self.norm)
+        shared = sum((self._counts & Counter(candidate)).values())
+        if shared / longest < cutoff:
+            return 0.0
+        if self._masks is None:
+            self._masks = _char_masks(self.norm)
+        return 1 - _levenshtein(self._masks, len(self.norm), candidate) / longest
+
+    def matches(self, candidate: str, threshold: float = 0.6) -> bool:
+        """Check whether a candidate title is the query's paper.
+
+        Args:
+            candidate: Title of a search result
+            threshold: Minimum similarity (0.0 to 1.0)
+        """
+        if not self.query or not candidate:
+            return False
+        norm = normalize(candidate)
+        if _token_set_match(self.norm, norm, self.words, _words(norm), threshold):
+            return True
+        cutoff = threshold * FUZZY_FACTOR
+        return self.similarity(norm, cutoff) >= cutoff
+
+    def match_all(self, candidates: Iterable[str], threshold: float = 0.6) -> list[bool]:
+        """Check all candidates of a search response against the query.
+
+        Args:
+            candidates: Titles of the search results, in order
+            threshold: Minimum similarity (0.0 to 1.0)
+
+        Returns:
+            One decision per candidate
+        """
+        return [self.matches(candidate, threshold) for candidate in candidates]
+
+
+def titles_match(title1: str, title2: str, threshold: float = 0.6) -> bool:
+    """Check whether two titles are similar enough to be the same paper.
+
+    Args:
+        title1: First title (usually the query)
+        title2: Second title (usually the found result)
+        threshold: Minimum similarity (0.0 to 1.0)
+    """
+    return TitleMatcher(title1).matches(title2, threshold)
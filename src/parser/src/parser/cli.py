@@ -54,6 +54,8 @@ def cli(ctx: click.Context, config_path: str | None) -> None:
 @click.option("-e", "--email", envvar="PAPER_EMAIL", help="Email for API access")
 @click.option("--s2-key", envvar="S2_API_KEY", help="Semantic Scholar API key")
 @click.option("--skip-existing/--no-skip-existing", default=None, help="Skip if PDF exists (uses config if not set)")
+@click.option("--race", default=None, type=int, help="Try this many sources at once, keep the first PDF (uses config if not set)")
+@click.option("--strict-priority", is_flag=True, default=None, help="When racing, prefer higher-priority sources' PDFs")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
 @click.pass_context
 def retrieve_paper(
@@ -65,6 +67,8 @@ def retrieve_paper(
     email: str | None,
     s2_key: str | None,
     skip_existing: bool | None,
+    race: int | None,
+    strict_priority: bool | None,
     verbose: bool,
 ):
     """Retrieve a single paper PDF.
@@ -102,6 +106,10 @@ def retrieve_paper(
         config.api_keys["semantic_scholar"] = s2_key
     if skip_existing is not None:
         config.download["skip_existing"] = skip_existing
+    if race is not None:
+        config.download["race_sources"] = race
+    if strict_priority:
+        config.download["race_strict_priority"] = True
 
     # Use config output_dir as default
     output_dir = Path(output) if output else config.get_output_dir()
@@ -146,16 +154,23 @@ def retrieve_paper(
         click.echo(f"Retrieving: {final_identifier}")
         click.echo(f"Output: {output_dir}")
 
-    result = asyncio.run(retriever.retrieve(
-        doi=doi,
-        title=title,
-        output_dir=output_dir,
-        verbose=verbose,
-    ))
+    async def run_retrieve():
+        async with retriever:
+            return await retriever.retrieve(
+                doi=doi,
+                title=title,
+                output_dir=output_dir,
+                verbose=verbose,
+            )
+
+    result = asyncio.run(run_retrieve())
 
     if result.status == RetrievalStatus.SUCCESS:
         click.echo(click.style("✓ Downloaded: ", fg="green") + str(result.pdf_path))
         click.echo(f"  Source: {result.source}")
+        if result.race:
+            click.echo(f"  Race: {result.race['winner']} won in {result.race['elapsed']:.1f}s "
+                       f"(saved ~{result.race['time_saved']:.1f}s)")
         if result.metadata and result.metadata.get("title"):
             click.echo(f"  Title: {_safe_str(result.metadata['title'])}")
     elif result.status == RetrievalStatus.SKIPPED:
@@ -172,6 +187,7 @@ def retrieve_paper(
 @click.option("--email", envvar="PAPER_EMAIL", help="Email for API access")
 @click.option("--s2-key", envvar="S2_API_KEY", help="Semantic Scholar API key")
 @click.option("-n", "--concurrent", default=None, help="Max concurrent downloads (uses config if not set)", type=int)
+@click.option("--retry-failed", is_flag=True, help="Only re-run papers that failed in an earlier run")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
 @click.pass_context
 def batch(
@@ -181,15 +197,20 @@ def batch(
     email: str | None,
     s2_key: str | None,
     concurrent: int | None,
+    retry_failed: bool,
     verbose: bool,
 ):
     """Batch download papers with multi-source fallback.
 
     Input formats: JSON array, CSV (with doi/title columns), or text (one ID per line)
 
+    Outcomes are journaled in the output directory, so a rerun skips papers
+    already downloaded (see 'parser batch-status').
+
     Examples:
         parser batch papers.json -o ./papers
         parser batch dois.txt -o ./papers --concurrent 3
+        parser batch dois.txt -o ./papers --retry-failed
     """
     from .acquisition.config import Config
     from .acquisition.retriever import PaperRetriever, RetrievalStatus
@@ -277,6 +298,7 @@ def batch(
             output_dir=output_dir,
             verbose=verbose,
             max_concurrent=max_concurrent,
+            retry_failed=retry_failed,
         )
 
     results = asyncio.run(run())
@@ -303,6 +325,35 @@ def batch(
             click.echo(f"  - {identifier}")
 
 
+@cli.command("batch-status")
+@click.argument("output_dir", required=False)
+@click.pass_context
+def batch_status(ctx: click.Context, output_dir: str | None) -> None:
+    """Summarize the batch journal in an output directory.
+
+    Reads only the journal, not the downloaded PDFs.
+
+    Examples:
+        parser batch-status ./papers
+    """
+    from .acquisition.config import Config
+    from .acquisition.journal import BatchJournal
+
+    config = Config.load(ctx.obj.get("config_path"))
+    out_dir = Path(output_dir) if output_dir else config.get_output_dir()
+    journal_path = out_dir / config.batch.get("journal_file", ".retrieval_journal.jsonl")
+    if not journal_path.exists():
+        click.echo(click.style(f"No batch journal in {out_dir}", fg="yellow"))
+        return
+
+    journal = BatchJournal(journal_path)
+    click.echo(journal.summary_text())
+    failed = [entry for entry in journal.entries.values() if entry.failed]
+    if failed:
+        click.echo()
+        click.echo(f"Retry with: parser batch <input> -o {out_dir} --retry-failed")
+
+
 @cli.command()
 @click.pass_context
 def sources(ctx: click.Context) -> None:
@@ -433,7 +484,7 @@ batch:
   max_concurrent: 3
   retry_failed: true
   max_retries: 2
-  progress_file: ".retrieval_progress.json"
+  journal_file: ".retrieval_journal.jsonl"
 '''
 
     config_path.write_text(default_config)
@@ -625,7 +676,9 @@ def config_pull(ctx: click.Context, gist_id: str | None) -> None:
 @click.option("--format", "output_format", type=click.Choice(["bibtex", "json", "markdown"]), default="bibtex", help="Output format")
 @click.option("--email", envvar="PAPER_EMAIL", help="Email for API access")
 @click.option("--s2-key", envvar="S2_API_KEY", help="Semantic Scholar API key")
+@click.pass_context
 def doi2bib(
+    ctx: click.Context,
     identifier: str | None,
     input_file: str | None,
     output_file: str | None,
@@ -651,12 +704,17 @@ def doi2bib(
         parser doi2bib -i dois.txt -o references.bib
         parser doi2bib -i batch.json -o references.bib
     """
+    from .acquisition.config import Config
+    from .acquisition.metadata_cache import MetadataCache
     from .doi2bib.metadata import get_metadata as fetch_metadata
+    from .doi2bib.metadata import prefetch_metadata
     from .doi2bib.resolver import resolve_identifier
 
+    cache = MetadataCache.from_config(Config.load(ctx.obj.get("config_path")).cache)
+
     async def get_metadata(ident_str: str):
         ident = resolve_identifier(ident_str)
-        return await fetch_metadata(ident, email=email, s2_api_key=s2_key)
+        return await fetch_metadata(ident, email=email, s2_api_key=s2_key, cache=cache)
 
     def format_result(result) -> str:
         if output_format == "bibtex":
@@ -705,11 +763,15 @@ def doi2bib(
             sys.exit(1)
 
         click.echo(f"Processing {len(identifiers)} identifiers...", err=True)
+        # Resolve DOIs / arXiv IDs in bulk; the rest are looked up one by one
+        prefetched = asyncio.run(prefetch_metadata(identifiers, email=email, s2_api_key=s2_key, cache=cache))
+        if prefetched:
+            click.echo(f"Resolved {len(prefetched)} identifiers via batch APIs", err=True)
         results = []
         failed = []
         for ident in identifiers:
             click.echo(f"  {ident}...", err=True)
-            result = asyncio.run(get_metadata(ident))
+            result = prefetched.get(ident) or asyncio.run(get_metadata(ident))
             if result:
                 results.append(format_result(result))
             else:
@@ -757,7 +819,9 @@ def doi2bib(
 @click.option("--manual", "manual_path", type=click.Path(exists=True), help="Manual.bib with pre-verified entries")
 @click.option("--dry-run", is_flag=True, help="Don't write files, just show what would happen")
 @click.option("-v", "--verbose", is_flag=True, help="Verbose output")
+@click.pass_context
 def verify(
+    ctx: click.Context,
     input_path: str,
     output: str | None,
     email: str | None,
@@ -780,6 +844,8 @@ def verify(
         parser verify refs.bib --skip-keys-file skip.txt
         parser verify refs.bib --manual manual.bib --dry-run
     """
+    from .acquisition.config import Config
+    from .acquisition.metadata_cache import MetadataCache
     from .doi2bib.verifier import CitationVerifier
 
     input_p = Path(input_path)
@@ -797,7 +863,8 @@ def verify(
                 skip_set.add(line)
     manual_p = Path(manual_path) if manual_path else None
 
-    verifier = CitationVerifier(email=email)
+    cache = MetadataCache.from_config(Config.load(ctx.obj.get("config_path")).cache)
+    verifier = CitationVerifier(email=email, cache=cache)
 
     if input_p.is_dir():
         # Directory mode
@@ -852,6 +919,8 @@ def verify(
     click.echo()
     click.echo(f"Total verified: {stats.total_verified}")
     click.echo(f"Total failed: {stats.failed}")
+    if verbose and cache and cache.stats.lookups:
+        click.echo(f"Metadata cache: {cache.stats.summary()}")
 
     if not dry_run:
         click.echo()
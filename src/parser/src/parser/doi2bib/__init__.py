@@ -11,12 +11,14 @@ Key Features:
 - Detailed reports (verified.bib, failed.bib, report.md)
 - DOI/arXiv identifier resolution
 - Metadata retrieval from CrossRef, Semantic Scholar, OpenAlex
+- Bulk metadata resolution for DOI lists via batch APIs
 """
 
 from .metadata import (
     Author,
     PaperMetadata,
     get_metadata,
+    prefetch_metadata,
 )
 from .resolver import (
     IdentifierType,
@@ -46,4 +48,5 @@ __all__ = [
     "PaperMetadata",
     "Author",
     "get_metadata",
+    "prefetch_metadata",
 ]
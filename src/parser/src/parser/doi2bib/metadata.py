@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .resolver import IdentifierType, PaperIdentifier
 
+if TYPE_CHECKING:
+    from ..acquisition.metadata_cache import MetadataCache
+
 
 @dataclass
 class Author:
@@ -378,6 +381,7 @@ async def get_metadata(
     identifier: PaperIdentifier,
     email: str | None = None,
     s2_api_key: str | None = None,
+    cache: MetadataCache | None = None,
 ) -> PaperMetadata | None:
     """Get paper metadata from available sources.
 
@@ -391,10 +395,106 @@ async def get_metadata(
         identifier: Resolved paper identifier
         email: Email for API access (CrossRef, Unpaywall, OpenAlex)
         s2_api_key: Semantic Scholar API key
+        cache: Metadata cache to answer from and fill (shared with
+            PaperRetriever and CitationVerifier)
 
     Returns:
         PaperMetadata or None
     """
+    if cache is None:
+        metadata = await _fetch_metadata(identifier, email, s2_api_key)
+        return PaperMetadata.from_dict(metadata) if metadata else None
+
+    key = _cache_key(identifier)
+    if identifier.type == IdentifierType.TITLE:
+        entry = cache.get_title(identifier.value)
+        if entry is not None:
+            if entry.get("doi") is None:
+                return None
+            key = entry["doi"]
+    if key:
+        cached = cache.get_metadata(key)
+        if cached:
+            return PaperMetadata.from_dict(cached)
+
+    metadata = await _fetch_metadata(identifier, email, s2_api_key)
+    found_doi = (metadata or {}).get("doi") or key
+    if identifier.type == IdentifierType.TITLE:
+        cache.put_title(identifier.value, found_doi if metadata else None)
+    if metadata:
+        dois: set[str] = {doi for doi in (found_doi, key) if doi}
+        for doi in dois:
+            cache.put_metadata(doi, metadata)
+    return PaperMetadata.from_dict(metadata) if metadata else None
+
+
+async def prefetch_metadata(
+    identifiers: list[str],
+    email: str | None = None,
+    s2_api_key: str | None = None,
+    cache: MetadataCache | None = None,
+) -> dict[str, PaperMetadata]:
+    """Resolve many DOIs / arXiv IDs with batched API calls.
+
+    Uses the same sources as get_metadata (CrossRef and OpenAlex only with
+    an email), a batch of identifiers per request. Results are written to
+    the cache, so get_metadata answers them without further calls.
+
+    Args:
+        identifiers: Identifier strings (DOIs and arXiv IDs are resolved)
+        email: Email for API access (CrossRef, OpenAlex)
+        s2_api_key: Semantic Scholar API key
+        cache: Metadata cache to skip known entries and to fill
+
+    Returns:
+        Dict mapping each resolved input identifier to its metadata
+    """
+    from ..acquisition.bulk import BulkResolver, classify_identifier
+    from ..acquisition.clients import CrossRefClient, OpenAlexClient, SemanticScholarClient
+
+    def cache_key(kind: tuple[str, str]) -> str:
+        return kind[1] if kind[0] == "doi" else f"10.48550/arXiv.{kind[1].split('v')[0]}"
+
+    todo = []
+    for identifier in identifiers:
+        kind = classify_identifier(identifier)
+        if kind and not (cache and cache.contains_metadata(cache_key(kind))):
+            todo.append(identifier)
+    if not todo:
+        return {}
+
+    resolver = BulkResolver(
+        CrossRefClient(email=email) if email else None,
+        SemanticScholarClient(api_key=s2_api_key),
+        OpenAlexClient(email=email) if email else None,
+    )
+    results: dict[str, PaperMetadata] = {}
+    for identifier, metadata in (await resolver.resolve(todo)).items():
+        kind = classify_identifier(identifier)
+        if cache and kind:
+            found_doi = metadata.get("doi")
+            for doi in {found_doi, cache_key(kind)} if found_doi else {cache_key(kind)}:
+                cache.put_metadata(doi, metadata)
+        results[identifier] = PaperMetadata.from_dict(metadata)
+    return results
+
+
+def _cache_key(identifier: PaperIdentifier) -> str | None:
+    """DOI that metadata for an identifier is cached under, if known up front."""
+    if identifier.type == IdentifierType.ARXIV:
+        arxiv_id = identifier.arxiv_id or identifier.value
+        return f"10.48550/arXiv.{arxiv_id.split('v')[0]}"
+    if identifier.type == IdentifierType.DOI:
+        return identifier.doi or identifier.value
+    return None
+
+
+async def _fetch_metadata(
+    identifier: PaperIdentifier,
+    email: str | None,
+    s2_api_key: str | None,
+) -> dict[str, Any] | None:
+    """Query the metadata sources for an identifier (see get_metadata)."""
     from ..acquisition.clients import (
         ArxivClient,
         CrossRefClient,
@@ -461,7 +561,4 @@ async def get_metadata(
             elif top_result.get("doi"):
                 metadata = await s2.get_paper_metadata(top_result["doi"])
 
-    if not metadata:
-        return None
-
-    return PaperMetadata.from_dict(metadata)
+    return metadata
@@ -22,6 +22,10 @@ import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..acquisition.metadata_cache import MetadataCache
 
 # Website URL patterns (no DOI expected)
 WEBSITE_PATTERNS = [
@@ -259,15 +263,19 @@ class CitationVerifier:
         self,
         email: str | None = None,
         rate_limit: float = 0.5,
+        cache: MetadataCache | None = None,
     ):
         """Initialize verifier.
 
         Args:
             email: Email for API access
             rate_limit: Seconds between API requests
+            cache: Metadata cache for DOI/arXiv BibTeX and title searches
+                (shared with PaperRetriever)
         """
         self.email = email
         self.rate_limit = rate_limit
+        self.cache = cache
         self._last_request = 0.0
 
     async def _rate_limit_wait(self):
@@ -289,6 +297,11 @@ class CitationVerifier:
         Returns:
             Tuple of (bibtex, title)
         """
+        if self.cache:
+            cached = self.cache.get("bibtex", f"doi:{doi.strip().lower()}")
+            if cached:
+                return cached["bibtex"], cached["title"]
+
         await self._rate_limit_wait()
 
         try:
@@ -310,6 +323,8 @@ class CitationVerifier:
             title_match = re.search(r"title\s*=\s*\{([^}]+)\}", bibtex, re.IGNORECASE)
             title = title_match.group(1).strip() if title_match else None
 
+            if self.cache:
+                self.cache.put("bibtex", f"doi:{doi.strip().lower()}", {"bibtex": bibtex, "title": title})
             return bibtex, title
 
         except Exception:
@@ -329,11 +344,16 @@ class CitationVerifier:
         Returns:
             Tuple of (bibtex, title)
         """
-        await self._rate_limit_wait()
-
         # Clean arxiv ID
         arxiv_id = arxiv_id.replace("arXiv:", "").replace("arxiv:", "").strip()
 
+        if self.cache:
+            cached = self.cache.get("bibtex", f"arxiv:{arxiv_id}")
+            if cached:
+                return replace_key(cached["bibtex"], key), cached["title"]
+
+        await self._rate_limit_wait()
+
         url = f"https://export.arxiv.org/api/query?id_list={arxiv_id}"
         headers = {"User-Agent": "ingestor/1.0"}
 
@@ -385,6 +405,8 @@ class CitationVerifier:
   primaryClass={{{cat_term}}},
   url={{https://arxiv.org/abs/{arxiv_id}}}
 }}"""
+            if self.cache:
+                self.cache.put("bibtex", f"arxiv:{arxiv_id}", {"bibtex": bibtex, "title": title_text})
             return bibtex, title_text
 
         except Exception:
@@ -404,12 +426,18 @@ class CitationVerifier:
         Returns:
             List of results with 'doi' and 'title' keys
         """
-        await self._rate_limit_wait()
-
         query = re.sub(r"[{}\\]", "", title or "")
         if not query:
             return []
 
+        cache_key = f"{query}\0{author}"
+        if self.cache:
+            cached = self.cache.get("search", cache_key)
+            if cached is not None:
+                return cached
+
+        await self._rate_limit_wait()
+
         params = {"query.bibliographic": query, "rows": "5"}
         if author:
             first_author = author.split(" and ")[0].split(",")[0].strip()
@@ -423,7 +451,7 @@ class CitationVerifier:
             with urllib.request.urlopen(req, timeout=10) as response:
                 data = json.loads(response.read().decode())
 
-            return [
+            results = [
                 {
                     "doi": item.get("DOI", ""),
                     "title": (item.get("title") or [""])[0],
@@ -433,6 +461,10 @@ class CitationVerifier:
         except Exception:
             return []
 
+        if self.cache:
+            self.cache.put("search", cache_key, results)
+        return results
+
     async def verify_entry(
         self,
         entry: BibEntry,
@@ -520,11 +552,26 @@ class CitationVerifier:
                     message=f"arXiv DOI: {arxiv_doi}",
                 )
 
+        # DOI this title resolved to before (here or in the retriever)
+        if self.cache and title:
+            known = self.cache.get_title(title)
+            if known and known.get("doi") and known["doi"] != doi:
+                bibtex, actual_title = await self.get_bibtex_from_doi(known["doi"])
+                if bibtex and titles_match(title, actual_title or ""):
+                    return VerificationResult(
+                        key=key,
+                        status="searched",
+                        bibtex=replace_key(bibtex, key),
+                        message=f"Found: {known['doi']}",
+                    )
+
         # Search CrossRef
         for result in await self.search_crossref(title or "", author or ""):
             if titles_match(title or "", result["title"]):
                 bibtex, actual_title = await self.get_bibtex_from_doi(result["doi"])
                 if bibtex and titles_match(title or "", actual_title or ""):
+                    if self.cache and title:
+                        self.cache.put_title(title, result["doi"])
                     return VerificationResult(
                         key=key,
                         status="searched",
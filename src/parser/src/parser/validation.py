@@ -404,6 +404,12 @@ CONFUSING_TERMS = {
     },
 }
 
+# Compiled once; the mismatch check runs for every candidate of every search
+_AI_TITLE_PATTERNS = {
+    term: [re.compile(pattern, re.IGNORECASE) for pattern in contexts.get("ai_title_patterns", [])]
+    for term, contexts in CONFUSING_TERMS.items()
+}
+
 
 def detect_title_context_mismatch(expected_title: str, actual_title: str, actual_abstract: str | None = None) -> tuple[bool, str | None]:
     """Detect if a retrieved paper title suggests a context mismatch.
@@ -420,15 +426,17 @@ def detect_title_context_mismatch(expected_title: str, actual_title: str, actual
         Tuple of (is_mismatch, reason)
     """
     expected_lower = expected_title.lower()
+    terms = [term for term in CONFUSING_TERMS if term in expected_lower]
+    if not terms:
+        return False, None
+
     actual_lower = actual_title.lower()
     abstract_lower = (actual_abstract or "").lower()
 
     combined_actual = f"{actual_lower} {abstract_lower}"
 
-    for term, contexts in CONFUSING_TERMS.items():
-        # Check if the confusing term appears in expected title
-        if term not in expected_lower:
-            continue
+    for term in terms:
+        contexts = CONFUSING_TERMS[term]
 
         # Check if actual paper has false positive indicators
         false_indicators = contexts.get("false_context", [])
@@ -442,9 +450,9 @@ def detect_title_context_mismatch(expected_title: str, actual_title: str, actual
             return True, f"Title mismatch: '{actual_title}' appears to be about {term} (the animal/entity), not {term.upper()} (the AI model). Found {false_score} non-AI indicators: {[ind for ind in false_indicators if ind in combined_actual]}"
 
         # Check if expected has AI patterns but actual doesn't match
-        ai_patterns = contexts.get("ai_title_patterns", [])
-        expected_is_ai = any(re.search(pat, expected_lower, re.IGNORECASE) for pat in ai_patterns)
-        actual_is_ai = any(re.search(pat, actual_lower, re.IGNORECASE) for pat in ai_patterns)
+        ai_patterns = _AI_TITLE_PATTERNS[term]
+        expected_is_ai = any(pat.search(expected_lower) for pat in ai_patterns)
+        actual_is_ai = any(pat.search(actual_lower) for pat in ai_patterns)
 
         if expected_is_ai and not actual_is_ai and false_score > 0:
             return True, f"Title mismatch: Expected AI paper matching '{expected_title}', but found '{actual_title}' which appears unrelated."
@@ -0,0 +1,825 @@
+"""Unit tests for the acquisition module."""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from parser.acquisition.bulk import BulkResolver, classify_identifier
+from parser.acquisition.clients import CrossRefClient, SemanticScholarClient
+from parser.acquisition.config import Config
+from parser.acquisition.http_pool import HttpPool, PoolStats, _HostLimitedTransport
+from parser.acquisition.journal import BatchJournal
+from parser.acquisition.metadata_cache import MetadataCache
+from parser.acquisition.pdf_download import PdfDownload, partial_path, stream_pdf
+from parser.acquisition.rate_limiter import RateLimiter, TokenBucket, parse_retry_after
+from parser.acquisition.retriever import PaperRetriever, RetrievalResult, RetrievalStatus
+from parser.acquisition.source_stats import SourceStats, stats_keys
+from parser.acquisition.title_match import (
+    TitleMatcher,
+    _char_masks,
+    _levenshtein,
+    normalize,
+    titles_match,
+)
+
+PDF_BODY = b"%PDF-1.7\n" + bytes(range(256)) * 800
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    throttled: set[str] = set()
+    interrupted: set[str] = set()
+
+    def _send_pdf(self) -> None:
+        body, status = PDF_BODY, 200
+        match = re.match(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        if match:
+            body, status = PDF_BODY[int(match.group(1)):], 206
+        self.send_response(status)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.path.startswith("/flaky") and self.path not in self.interrupted:
+            # Drop the connection halfway through the first transfer
+            self.interrupted.add(self.path)
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        if self.path.startswith(("/pdf", "/flaky")):
+            self._send_pdf()
+            return
+        if self.path.startswith("/html"):
+            body = b"<html>" + b" " * 5000 + b"</html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path.startswith("/limited") and self.path not in self.throttled:
+            # Answer 429 the first time each /limited path is requested
+            self.throttled.add(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "0.2")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    """A keep-alive HTTP server on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@dataclass
+class StubbedRetriever:
+    """A retriever with stubbed metadata lookups and sources, and what they saw."""
+
+    retriever: PaperRetriever
+    sources: dict[str, tuple[bool, float]]  # Source -> (has the PDF, seconds to answer)
+    tried: list[tuple[str, str]] = field(default_factory=list)  # (source, DOI), as started
+    finished: list[str] = field(default_factory=list)  # Sources that answered, in order
+    lookups: list[str] = field(default_factory=list)  # Titles or DOIs looked up
+
+    def sources_tried(self, doi: str | None = None) -> list[str]:
+        """Sources started, for one paper or all of them."""
+        return [source for source, tried_doi in self.tried if doi is None or tried_doi == doi]
+
+
+@pytest.fixture
+def stub_retriever(monkeypatch: pytest.MonkeyPatch) -> Callable[..., StubbedRetriever]:
+    """Factory for retrievers whose lookups and sources are stubbed.
+
+    Sources are enabled in the given order and map to whether they have the
+    PDF, or to ``(has the PDF, seconds to answer)``. Found PDFs are written
+    as ``%PDF-1.7 <source>``; misses are definitive (cached when enabled).
+    Other keyword arguments are ``Config`` fields.
+    """
+
+    def make(
+        sources: dict[str, bool | tuple[bool, float]],
+        source_delays: dict[str, float] | None = None,
+        **config,
+    ) -> StubbedRetriever:
+        retriever = PaperRetriever(Config(
+            sources={name: {"enabled": True, "priority": i} for i, name in enumerate(sources, 1)},
+            rate_limits={"global_delay": 0, "per_source_delays": source_delays or {}},
+            **config,
+        ))
+        stub = StubbedRetriever(retriever, {
+            name: (spec, 0.0) if isinstance(spec, bool) else spec for name, spec in sources.items()
+        })
+
+        async def lookup_metadata(doi, title, arxiv_id, pdf_url):
+            stub.lookups.append(title or doi)
+            return {
+                "doi": doi or "10.1/x", "title": title or "A Paper", "year": 2020,
+                "authors": ["Ada Lovelace"], "pdf_url": pdf_url,
+            }
+
+        async def try_source(source, doi, title, metadata, output_path, logger):
+            await retriever.rate_limiter.wait(source)
+            stub.tried.append((source, doi))
+            found, delay = stub.sources[source]
+            await asyncio.sleep(delay)
+            stub.finished.append(source)
+            if not found:
+                return None, "no OA version found"
+            output_path.write_bytes(b"%PDF-1.7 " + source.encode())
+            retriever._downloads[output_path] = PdfDownload(
+                output_path, f"https://example.org/{source}.pdf", 8, "abc"
+            )
+            return RetrievalResult(
+                doi=doi, title=title, status=RetrievalStatus.SUCCESS,
+                source=source, pdf_path=str(output_path),
+            ), "downloaded"
+
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup_metadata)
+        monkeypatch.setattr(retriever, "_try_source", try_source)
+        return stub
+
+    return make
+
+
+class TestHttpPool:
+    """Test the shared connection pool."""
+
+    async def test_reuses_connections(self, local_server: str) -> None:
+        """Sequential requests to one host share a connection."""
+        async with HttpPool(http2=False) as pool:
+            for i in range(5):
+                response = await pool.get(f"{local_server}/{i}")
+                assert response.json() == {"ok": True}
+
+        assert pool.stats.requests == 5
+        assert pool.stats.connections == 1
+        assert pool.stats.reuse_rate == pytest.approx(0.8)
+        assert "5 requests over 1 connections" in pool.stats.summary()
+
+    async def test_reopens_after_close(self, local_server: str) -> None:
+        """A closed pool opens a new client on next use."""
+        pool = HttpPool(http2=False)
+        await pool.get(local_server)
+        await pool.aclose()
+        response = await pool.get(local_server)
+        assert response.status_code == 200
+        await pool.aclose()
+        assert pool.stats.connections == 2
+
+    def test_rebuilds_client_on_new_event_loop(self, local_server: str) -> None:
+        """A pool left open is still usable from a later asyncio.run."""
+        pool = HttpPool(http2=False)
+        for _ in range(2):
+            response = asyncio.run(pool.get(local_server))
+            assert response.status_code == 200
+        assert pool.stats.connections == 2
+
+    async def test_limits_requests_per_host(self) -> None:
+        """No more than max_per_host requests run against one host."""
+        active: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, text="ok")
+
+        transport = _HostLimitedTransport(httpx.MockTransport(handler), 2, PoolStats())
+        async with httpx.AsyncClient(transport=transport) as client:
+            await asyncio.gather(
+                *(client.get(f"https://{host}/{i}") for host in ("a.org", "b.org") for i in range(6))
+            )
+
+        assert peak == {"a.org": 2, "b.org": 2}
+
+    async def test_client_uses_pool(self, local_server: str) -> None:
+        """API clients send requests through an injected pool."""
+        client = CrossRefClient()
+        client.base_url = local_server
+        client.rate_limiter.calls_per_second = 0
+        client.http = HttpPool(http2=False)
+
+        assert await client.get("/works/a") == {"ok": True}
+        assert await client.get("/works/b") == {"ok": True}
+        await client.http.aclose()
+        assert client.http.stats.connections == 1
+
+
+class TestTokenBucket:
+    """Test the per-source token bucket."""
+
+    def test_burst_then_spacing(self) -> None:
+        """Calls within the burst go straight through, then get spaced."""
+        bucket = TokenBucket(calls_per_second=10, min_delay=0, burst=3)
+        waits = [bucket.reserve() for _ in range(5)]
+        assert waits[:3] == pytest.approx([0, 0, 0], abs=0.01)
+        assert waits[3] == pytest.approx(0.1, abs=0.01)
+        assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_unlimited(self) -> None:
+        """A rate of 0 disables limiting."""
+        bucket = TokenBucket(calls_per_second=0)
+        assert all(bucket.reserve() == 0 for _ in range(10))
+
+    async def test_throttle_holds_back_calls(self) -> None:
+        """Calls after a throttle wait for it to pass."""
+        bucket = TokenBucket(calls_per_second=0)
+        bucket.throttle(0.1)
+        start = time.monotonic()
+        await bucket.wait()
+        assert time.monotonic() - start >= 0.09
+        assert bucket.stats.throttled == 1
+        assert bucket.stats.waits == 1
+
+    def test_parse_retry_after(self) -> None:
+        """Retry-After is read as seconds or an HTTP date."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestRateLimiter:
+    """Test the per-source rate limiter."""
+
+    async def test_sources_do_not_block_each_other(self) -> None:
+        """A slow source does not delay calls to a fast one."""
+        limiter = RateLimiter({"per_source_delays": {"scihub": 1.0, "openalex": 0.0}})
+        await limiter.wait("scihub")
+
+        async def timed(source: str) -> float:
+            start = time.monotonic()
+            await limiter.wait(source)
+            return time.monotonic() - start
+
+        slow = asyncio.create_task(timed("scihub"))
+        await asyncio.sleep(0)
+        assert await timed("openalex") < 0.05
+        slow.cancel()
+
+    def test_metrics(self) -> None:
+        """Waits are recorded per source."""
+        limiter = RateLimiter({"per_source_delays": {"arxiv": 0.05}})
+        for _ in range(3):
+            limiter.wait_sync("arxiv")
+        metrics = limiter.metrics()
+        assert metrics["arxiv"]["calls"] == 3
+        assert metrics["arxiv"]["waits"] == 2
+        assert "arxiv" in limiter.summary()
+
+    async def test_client_retries_after_429(self, local_server: str) -> None:
+        """A 429 throttles the source and the request is retried."""
+        client = CrossRefClient()
+        client.base_url = local_server
+        client.rate_limiter = TokenBucket(calls_per_second=0)
+
+        assert await client.get("/limited/a") == {"ok": True}
+        assert client.rate_limiter.stats.throttled == 1
+        assert client.rate_limiter.stats.wait_time >= 0.15
+
+
+class TestPaperRetrieverSharing:
+    """Test resources the retriever shares with its clients."""
+
+    def test_clients_share_pool(self) -> None:
+        """Every API client gets the retriever's pool."""
+        retriever = PaperRetriever(Config(email="test@example.com"))
+        for name in ("crossref", "semantic_scholar", "openalex", "arxiv", "unpaywall", "acl_anthology"):
+            assert retriever.clients[name].http is retriever.http
+
+    def test_clients_share_buckets(self) -> None:
+        """Clients and the retriever draw from the same bucket per source."""
+        retriever = PaperRetriever(Config(email="test@example.com"))
+        for name in ("crossref", "semantic_scholar", "openalex", "arxiv", "unpaywall"):
+            assert retriever.clients[name].rate_limiter is retriever.rate_limiter.bucket(name)
+
+    async def test_batch_closes_pool(self, tmp_path) -> None:
+        """retrieve_batch closes pooled connections when done."""
+        retriever = PaperRetriever(Config(rate_limits={"global_delay": 0}))
+        client = retriever.http.client
+        await retriever.retrieve_batch([], output_dir=tmp_path, verbose=False)
+        assert client.is_closed
+
+
+class TestSourceScheduler:
+    """Test source-aware batch scheduling."""
+
+    @pytest.fixture
+    def stub(self, stub_retriever: Callable[..., StubbedRetriever]) -> StubbedRetriever:
+        """Retriever with a slow arXiv that never has the PDF and a fast OpenAlex."""
+        return stub_retriever({"arxiv": False, "openalex": True}, source_delays={"arxiv": 0.05})
+
+    async def test_batch_interleaves_sources(self, stub: StubbedRetriever, tmp_path) -> None:
+        """Papers move on to OpenAlex while others still wait on arXiv."""
+        papers = [{"doi": f"10.1/{i}"} for i in range(5)]
+        results = await stub.retriever.retrieve_batch(
+            papers, output_dir=tmp_path, verbose=False, save_progress=False, max_concurrent=5
+        )
+
+        assert [r.doi for r in results] == [p["doi"] for p in papers]
+        assert all(r.status == RetrievalStatus.SUCCESS and r.source == "openalex" for r in results)
+
+        # Priority order is kept per paper
+        for paper in papers:
+            assert stub.sources_tried(paper["doi"]) == ["arxiv", "openalex"]
+
+        # ... but the first OpenAlex success comes before arXiv is done
+        sources = stub.sources_tried()
+        assert sources.index("openalex") < len(sources) - 1 - sources[::-1].index("arxiv")
+
+    async def test_batch_skips_completed(self, stub: StubbedRetriever, tmp_path) -> None:
+        """Papers in the progress file are not scheduled again."""
+        papers = [{"doi": "10.1/a"}, {"doi": "10.1/b"}]
+        (tmp_path / ".retrieval_progress.json").write_text('{"completed": ["10.1/a"]}')
+        results = await stub.retriever.retrieve_batch(papers, output_dir=tmp_path, verbose=False, max_concurrent=2)
+
+        assert [r.status for r in results] == [RetrievalStatus.SKIPPED, RetrievalStatus.SUCCESS]
+        assert {doi for _, doi in stub.tried} == {"10.1/b"}
+
+    async def test_batch_retry_failed(self, stub: StubbedRetriever, tmp_path) -> None:
+        """--retry-failed runs only papers whose last journaled attempt failed."""
+        with BatchJournal(tmp_path / ".retrieval_journal.jsonl") as journal:
+            journal.record("10.1/a", RetrievalResult(doi="10.1/a", title="", status=RetrievalStatus.SUCCESS))
+            journal.record("10.1/b", RetrievalResult(doi="10.1/b", title="", status=RetrievalStatus.NOT_FOUND))
+        papers = [{"doi": "10.1/a"}, {"doi": "10.1/b"}, {"doi": "10.1/c"}]
+        results = await stub.retriever.retrieve_batch(
+            papers, output_dir=tmp_path, verbose=False, max_concurrent=2, retry_failed=True
+        )
+
+        assert [r.status for r in results] == [
+            RetrievalStatus.SKIPPED, RetrievalStatus.SUCCESS, RetrievalStatus.SKIPPED,
+        ]
+        assert {doi for _, doi in stub.tried} == {"10.1/b"}
+        entry = BatchJournal(tmp_path / ".retrieval_journal.jsonl").entries["10.1/b"]
+        assert entry.status == "success" and entry.source == "openalex"
+        assert entry.elapsed is not None
+
+
+class TestSourceRace:
+    """Test racing sources within one retrieval."""
+
+    async def test_first_valid_pdf_wins(self, stub_retriever: Callable[..., StubbedRetriever], tmp_path) -> None:
+        """The fastest source with a PDF wins and the rest are cancelled."""
+        stub = stub_retriever({"unpaywall": (False, 0.3), "arxiv": (True, 0.3), "openalex": (True, 0.01)})
+        result = await stub.retriever.retrieve(doi="10.1/x", output_dir=tmp_path, verbose=False, race=3)
+
+        assert result.status == RetrievalStatus.SUCCESS
+        assert result.source == "openalex"
+        assert result.race["winner"] == "openalex"
+        assert set(result.race["cancelled"]) == {"unpaywall", "arxiv"}
+        assert stub.finished == ["openalex"]
+        assert Path(result.pdf_path).read_bytes() == b"%PDF-1.7 openalex"
+        assert not list(tmp_path.glob("*.part"))
+
+    async def test_strict_priority(self, stub_retriever: Callable[..., StubbedRetriever], tmp_path) -> None:
+        """With strict priority, a higher-priority PDF beats a faster one."""
+        stub = stub_retriever({"unpaywall": (False, 0.1), "arxiv": (True, 0.2), "openalex": (True, 0.01)})
+        result = await stub.retriever.retrieve(
+            doi="10.1/x", output_dir=tmp_path, verbose=False, race=3, strict_priority=True
+        )
+
+        assert result.source == "arxiv"
+        assert Path(result.pdf_path).read_bytes() == b"%PDF-1.7 arxiv"
+        # Unpaywall then arXiv one by one would have taken ~0.3s
+        assert result.race["time_saved"] >= 0.05
+
+    async def test_invalid_pdf_is_rejected(self, stub_retriever: Callable[..., StubbedRetriever], tmp_path, monkeypatch) -> None:
+        """A download that is not a PDF does not win the race."""
+        stub = stub_retriever({"unpaywall": (True, 0.01), "arxiv": (True, 0.1), "openalex": (False, 0.3)})
+        original = stub.retriever._try_source
+
+        async def html_from_unpaywall(source, doi, title, metadata, output_path, logger):
+            result, reason = await original(source, doi, title, metadata, output_path, logger)
+            if source == "unpaywall":
+                output_path.write_bytes(b"<html>login</html>")
+            return result, reason
+
+        monkeypatch.setattr(stub.retriever, "_try_source", html_from_unpaywall)
+        result = await stub.retriever.retrieve(doi="10.1/x", output_dir=tmp_path, verbose=False, race=3)
+        assert result.source == "arxiv"
+
+
+class TestMetadataCache:
+    """Test the persistent metadata cache."""
+
+    def test_round_trip_and_stats(self, tmp_path) -> None:
+        """Entries survive reopening and lookups are counted."""
+        path = tmp_path / "cache.sqlite"
+        cache = MetadataCache(path)
+        cache.put_title("Attention Is All You Need", "10.1/attn")
+        cache.put_metadata("10.1/ATTN", {"title": "Attention Is All You Need", "year": 2017})
+        cache.close()
+
+        cache = MetadataCache(path)
+        assert cache.get_title("attention is all you need.") == {"doi": "10.1/attn"}
+        assert cache.get_metadata("https://doi.org/10.1/attn")["year"] == 2017
+        assert cache.get_metadata("10.1/other") is None
+        assert cache.stats.hits == 2
+        assert cache.stats.lookups == 3
+
+    def test_contains_metadata_normalizes(self) -> None:
+        """Mixed-case arXiv DOIs are found without counting a lookup."""
+        cache = MetadataCache(":memory:")
+        cache.put_metadata("10.48550/arXiv.1706.03762", {"title": "Attention Is All You Need"})
+        assert cache.contains_metadata("10.48550/arXiv.1706.03762")
+        assert not cache.contains_metadata("10.48550/arXiv.1706.99999")
+        assert cache.stats.lookups == 0
+
+    def test_entries_expire(self, tmp_path) -> None:
+        """Expired entries are misses and are purged."""
+        cache = MetadataCache(tmp_path / "cache.sqlite", ttls={"negative": -1})
+        cache.put_missing("arxiv", "10.1/x")
+        assert not cache.is_missing("arxiv", "10.1/x")
+        assert cache.purge() == 1
+
+    def test_disabled_by_default(self) -> None:
+        """A bare Config does not open a cache."""
+        assert MetadataCache.from_config(Config().cache) is None
+        assert PaperRetriever(Config()).cache is None
+
+
+class TestRetrieverCache:
+    """Test the retriever's use of the metadata cache."""
+
+    @pytest.fixture
+    def stub(self, tmp_path, stub_retriever: Callable[..., StubbedRetriever]) -> StubbedRetriever:
+        """Retriever with a cache, stubbed lookups and an arXiv that never has the PDF."""
+        return stub_retriever(
+            {"arxiv": False, "openalex": True},
+            cache={"enabled": True, "path": str(tmp_path / "cache.sqlite")},
+        )
+
+    async def test_title_resolution_is_cached(self, stub: StubbedRetriever) -> None:
+        """A title resolved once is answered from the cache."""
+        first = await stub.retriever._resolve_metadata(title="A Paper")
+        second = await stub.retriever._resolve_metadata(title="a paper")
+        assert stub.lookups == ["A Paper"]
+        assert second["doi"] == first["doi"] == "10.1/x"
+        assert second["year"] == 2020
+
+    async def test_misses_and_pdf_urls_are_remembered(self, stub: StubbedRetriever, tmp_path, monkeypatch) -> None:
+        """Known misses are skipped and known PDF URLs are tried first."""
+        result = await stub.retriever.retrieve(doi="10.1/x", output_dir=tmp_path, verbose=False)
+        assert result.source == "openalex"
+        assert stub.sources_tried() == ["arxiv", "openalex"]
+        assert stub.retriever.cache.is_missing("arxiv", "10.1/x")
+        assert stub.retriever.cache.get_pdf_urls("10.1/x") == [{"source": "openalex", "url": "https://example.org/openalex.pdf"}]
+
+        # Next run: the known URL is downloaded without asking any source
+        downloaded = []
+
+        async def download_pdf(url, output_path):
+            downloaded.append(url)
+            output_path.write_bytes(b"%PDF-1.7")
+            return True
+
+        monkeypatch.setattr(stub.retriever, "_download_pdf", download_pdf)
+        Path(result.pdf_path).unlink()
+        stub.tried.clear()
+        result = await stub.retriever.retrieve(doi="10.1/x", output_dir=tmp_path, verbose=False)
+        assert result.source == "openalex"
+        assert downloaded == ["https://example.org/openalex.pdf"]
+        assert stub.tried == []
+        assert stub.lookups == ["10.1/x"]
+
+
+def _paper(doi: str, title: str = "A Paper") -> dict:
+    return {"doi": doi, "title": title, "year": 2020, "authors": [{"name": "Ada Lovelace"}]}
+
+
+class _BatchClient:
+    """Stub client answering get_papers_metadata from a dict."""
+
+    BATCH_SIZE = 2
+
+    def __init__(self, known: dict[str, dict]):
+        self.known = known
+        self.requests: list[list[str]] = []
+
+    async def get_papers_metadata(self, ids: list[str]) -> dict[str, dict]:
+        self.requests.append(list(ids))
+        return {i: self.known[i] for i in ids if i in self.known}
+
+
+class TestBulkResolver:
+    """Test bulk metadata resolution."""
+
+    def test_classify_identifier(self) -> None:
+        """DOIs and arXiv IDs are recognized; other strings are not."""
+        assert classify_identifier("https://doi.org/10.1/ABC") == ("doi", "10.1/abc")
+        assert classify_identifier("10.48550/arXiv.1706.03762") == ("arxiv", "1706.03762")
+        assert classify_identifier("arXiv:1706.03762v2") == ("arxiv", "1706.03762v2")
+        assert classify_identifier("Attention is all you need") is None
+
+    async def test_falls_back_across_sources(self) -> None:
+        """Each source only gets what earlier sources could not resolve."""
+        crossref = _BatchClient({"10.1/a": _paper("10.1/a"), "10.1/b": {"doi": "10.1/b", "title": "No authors"}})
+        s2 = _BatchClient({"DOI:10.1/b": _paper("10.1/b"), "ARXIV:1706.03762": _paper(None, "Attention")})
+        openalex = _BatchClient({"10.1/c": _paper("10.1/c")})
+        resolver = BulkResolver(crossref, s2, openalex)
+
+        found = await resolver.resolve(["10.1/a", "10.1/B", "10.1/c", "10.1/d", "arXiv:1706.03762", "a title"])
+
+        assert set(found) == {"10.1/a", "10.1/B", "10.1/c", "arXiv:1706.03762"}
+        assert crossref.requests == [["10.1/a", "10.1/b", "10.1/c", "10.1/d"]]
+        assert s2.requests == [["DOI:10.1/b", "DOI:10.1/c", "DOI:10.1/d", "ARXIV:1706.03762"]]
+        assert openalex.requests == [["10.1/c", "10.1/d"]]
+        assert resolver.summary() == "4/5 identifiers in 5 batched calls"
+
+    async def test_client_batch_requests(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Clients send one request per chunk and map results back to IDs."""
+        crossref = CrossRefClient()
+        crossref.BATCH_SIZE = 2
+        params_sent = []
+
+        async def get(endpoint, params=None, **kwargs):
+            params_sent.append(params["filter"])
+            dois = [f.split(":", 1)[1] for f in params["filter"].split(",")]
+            return {"message": {"items": [{"DOI": doi.upper(), "title": ["T"]} for doi in dois]}}
+
+        monkeypatch.setattr(crossref, "get", get)
+        found = await crossref.get_papers_metadata(["10.1/a", "10.1/b", "10.1/c"])
+        assert params_sent == ["doi:10.1/a,doi:10.1/b", "doi:10.1/c"]
+        assert set(found) == {"10.1/a", "10.1/b", "10.1/c"}
+
+        s2 = SemanticScholarClient()
+
+        async def post(endpoint, json=None, **kwargs):
+            assert endpoint == "paper/batch"
+            assert json == {"ids": ["DOI:10.1/a", "ARXIV:1706.03762"]}
+            return [None, {"title": "Attention", "externalIds": {"ArXiv": "1706.03762"}}]
+
+        monkeypatch.setattr(s2, "post", post)
+        found = await s2.get_papers_metadata(["10.1/a", "arXiv:1706.03762"])
+        assert list(found) == ["arXiv:1706.03762"]
+        assert found["arXiv:1706.03762"]["pdf_url"] == "https://arxiv.org/pdf/1706.03762.pdf"
+
+    async def test_retriever_uses_prefetched_metadata(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Prefetched papers skip the per-paper lookup."""
+        retriever = PaperRetriever(Config(rate_limits={"global_delay": 0}))
+        retriever.clients["crossref"] = _BatchClient({"10.1/a": _paper("10.1/a")})
+        retriever.clients["semantic_scholar"] = _BatchClient({})
+        retriever.clients["openalex"] = _BatchClient({})
+        lookups = []
+
+        async def lookup_metadata(doi, title, arxiv_id, pdf_url):
+            lookups.append(doi)
+            return {"doi": doi, "title": title, "arxiv_id": arxiv_id, "pdf_url": pdf_url}
+
+        monkeypatch.setattr(retriever, "_lookup_metadata", lookup_metadata)
+        resolver = await retriever.prefetch_metadata([{"doi": "10.1/a"}, {"doi": "10.1/b"}])
+        assert resolver.resolved == 1
+
+        metadata = await retriever._resolve_metadata(doi="10.1/A")
+        assert metadata["year"] == 2020 and metadata["pdf_url"] is None
+        await retriever._resolve_metadata(doi="10.1/b")
+        assert lookups == ["10.1/b"]
+
+
+class TestStreamPdf:
+    """Test streamed PDF downloads."""
+
+    async def test_download(self, local_server: str, tmp_path) -> None:
+        """The PDF is written in full and its checksum recorded."""
+        async with HttpPool() as pool:
+            download = await stream_pdf(pool, f"{local_server}/pdf/1", tmp_path / "a.pdf")
+        assert download.size == len(PDF_BODY)
+        assert download.sha256 == hashlib.sha256(PDF_BODY).hexdigest()
+        assert (tmp_path / "a.pdf").read_bytes() == PDF_BODY
+        assert list(tmp_path.iterdir()) == [tmp_path / "a.pdf"]
+
+    async def test_rejects_non_pdf_and_oversize(self, local_server: str, tmp_path) -> None:
+        """HTML labelled as PDF and downloads over the cap leave nothing behind."""
+        async with HttpPool() as pool:
+            assert await stream_pdf(pool, f"{local_server}/html", tmp_path / "a.pdf") is None
+            assert await stream_pdf(pool, f"{local_server}/pdf/2", tmp_path / "b.pdf", max_bytes=1000) is None
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_resumes_interrupted_transfer(self, local_server: str, tmp_path) -> None:
+        """A dropped connection is resumed with a Range request."""
+        async with HttpPool() as pool:
+            download = await stream_pdf(pool, f"{local_server}/flaky/1", tmp_path / "a.pdf")
+        assert download.resumed
+        assert download.sha256 == hashlib.sha256(PDF_BODY).hexdigest()
+        assert (tmp_path / "a.pdf").read_bytes() == PDF_BODY
+
+    async def test_resumes_partial_file_from_earlier_run(self, local_server: str, tmp_path) -> None:
+        """A partial file left for the same URL is continued, not restarted."""
+        url = f"{local_server}/pdf/3"
+        partial_path(tmp_path / "a.pdf", url).write_bytes(PDF_BODY[:5000])
+        async with HttpPool() as pool:
+            download = await stream_pdf(pool, url, tmp_path / "a.pdf")
+        assert download.resumed
+        assert (tmp_path / "a.pdf").read_bytes() == PDF_BODY
+
+
+class TestBatchJournal:
+    """Test the append-only batch journal."""
+
+    def test_latest_entry_wins(self, tmp_path) -> None:
+        """Replaying the journal keeps each paper's last outcome."""
+        path = tmp_path / "journal.jsonl"
+        with BatchJournal(path, sync_every=1) as journal:
+            journal.record("10.1/a", RetrievalResult(
+                doi="10.1/a", title="", status=RetrievalStatus.NOT_FOUND, error="No PDF found",
+            ))
+            journal.record("10.1/b", RetrievalResult(
+                doi="10.1/b", title="", status=RetrievalStatus.ERROR, error="timeout",
+            ))
+            journal.record("10.1/a", RetrievalResult(
+                doi="10.1/a", title="", status=RetrievalStatus.SUCCESS, source="arxiv", elapsed=1.5,
+            ))
+        with open(path, "a") as f:
+            f.write('{"key": "10.1/c", "sta')  # Torn write from a crash
+
+        journal = BatchJournal(path)
+        assert len(path.read_text().splitlines()) == 4
+        assert journal.is_done("10.1/a") and not journal.is_failed("10.1/a")
+        assert journal.is_failed("10.1/b")
+        assert "10.1/c" not in journal.entries
+
+        summary = journal.summary()
+        assert summary["total"] == 2
+        assert summary["by_status"] == {"success": 1, "error": 1}
+        assert summary["by_source"] == {"arxiv": 1}
+        assert summary["failures"] == {"timeout": 1}
+        assert summary["elapsed"] == 1.5
+
+    def test_legacy_progress_file(self, tmp_path) -> None:
+        """Completed keys from the old progress file count as done."""
+        legacy = tmp_path / ".retrieval_progress.json"
+        legacy.write_text('{"completed": ["10.1/a"]}')
+        journal = BatchJournal(tmp_path / "journal.jsonl", legacy_progress=legacy)
+
+        assert journal.is_done("10.1/a")
+        assert not journal.is_done("10.1/b")
+
+
+def _legacy_titles_match(title1: str, title2: str, threshold: float = 0.6) -> bool:
+    """The difflib-based matcher title_match replaced, as a baseline."""
+    norm1, norm2 = normalize.__wrapped__(title1), normalize.__wrapped__(title2)  # Without the memo
+    if norm1 == norm2:
+        return True
+    if (norm1 in norm2 or norm2 in norm1) and min(len(norm1), len(norm2)) >= max(len(norm1), len(norm2)) * 0.5:
+        return True
+    words1, words2 = set(norm1.split()), set(norm2.split())
+    shorter, longer = (words1, words2) if len(words1) <= len(words2) else (words2, words1)
+    if shorter <= longer and len(shorter) >= len(longer) * 0.5:
+        return True
+    if len(words1 & words2) / len(words1 | words2) >= threshold:
+        return True
+    return SequenceMatcher(None, norm1, norm2).ratio() >= threshold * 0.9
+
+
+class TestTitleMatch:
+    """Test title matching against labeled title pairs."""
+
+    @pytest.fixture
+    def title_pairs(self, fixtures_dir: Path) -> list[dict]:
+        return json.loads((fixtures_dir / "title_pairs.json").read_text())
+
+    def test_levenshtein(self) -> None:
+        """The bit-parallel distance agrees with the textbook table."""
+        def reference(a: str, b: str) -> int:
+            previous = list(range(len(b) + 1))
+            for i, ca in enumerate(a, 1):
+                current = [i]
+                for j, cb in enumerate(b, 1):
+                    current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+                previous = current
+            return previous[-1]
+
+        rng = random.Random(0)
+        for _ in range(500):
+            a = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 90)))
+            b = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 90)))
+            assert _levenshtein(_char_masks(a), len(a), b) == reference(a, b)
+
+    def test_labeled_pairs(self, title_pairs: list[dict]) -> None:
+        """False positives and negatives against the same-paper labels, new and legacy."""
+        def errors(match) -> tuple[int, int]:
+            false_positives = false_negatives = 0
+            for pair in title_pairs:
+                decision = match(pair["query"], pair["candidate"], pair["threshold"])
+                false_positives += decision and not pair["match"]
+                false_negatives += pair["match"] and not decision
+            return false_positives, false_negatives
+
+        # Titles extending the query ("...: A Survey") still pass the threshold
+        assert errors(titles_match) == (10, 0)
+        assert errors(_legacy_titles_match) == (16, 0)
+
+    def test_match_all(self) -> None:
+        """All candidates of a response are decided in order."""
+        matcher = TitleMatcher("Deep Residual Learning for Image Recognition")
+        assert matcher.match_all([
+            "Identity Mappings in Deep Residual Networks",
+            "Deep residual learning for image recognition.",
+            "",
+        ], threshold=0.7) == [False, True, False]
+
+    @pytest.mark.slow
+    def test_benchmark(self, title_pairs: list[dict]) -> None:
+        """Report the time of both matchers over the labeled pairs."""
+        def run(match) -> float:
+            started = time.perf_counter()
+            for _ in range(50):
+                for pair in title_pairs:
+                    match(pair["query"], pair["candidate"], pair["threshold"])
+            return time.perf_counter() - started
+
+        legacy, new = run(_legacy_titles_match), run(titles_match)
+        print(f"\n{len(title_pairs)} pairs x 50: difflib {legacy * 1000:.0f} ms, title_match {new * 1000:.0f} ms")
+
+
+class TestSourceStats:
+    """Test source ordering from past outcomes."""
+
+    SOURCES = ["unpaywall", "arxiv", "openalex"]
+
+    @pytest.fixture
+    def stats(self) -> SourceStats:
+        stats = SourceStats(":memory:", exploration=0.0)
+        for i in range(5):
+            stats.record(f"10.1109/{i}", {"venue": "CVPR"}, "unpaywall", success=False, seconds=1.0)
+            stats.record(f"10.1109/{i}", {"venue": "CVPR"}, "openalex", success=True, seconds=2.0)
+        return stats
+
+    def test_keys(self) -> None:
+        """Outcomes are keyed by DOI prefix and normalized venue."""
+        assert stats_keys("https://doi.org/10.1109/X.1", {"venue": "IEEE  Trans. PAMI"}) == [
+            "prefix:10.1109", "venue:ieee trans pami",
+        ]
+        assert stats_keys(None, {}) == []
+
+    def test_reorders_by_history(self, stats: SourceStats) -> None:
+        """Sources that succeed for a prefix move ahead; unknown keys keep the static order."""
+        assert stats.order(self.SOURCES, "10.1109/new", None) == ["openalex", "arxiv", "unpaywall"]
+        assert stats.order(self.SOURCES, None, {"venue": "cvpr"})[0] == "openalex"
+        assert stats.order(self.SOURCES, "10.1145/x", {"venue": "KDD"}) == self.SOURCES
+        assert stats.reordered == 2
+
+    def test_skip_and_explore(self, stats: SourceStats) -> None:
+        """Sources that always failed can be dropped; exploration keeps the static order."""
+        stats.skip_after = 5
+        assert stats.order(self.SOURCES, "10.1109/new", None) == ["openalex", "arxiv"]
+        assert stats.skipped == 1
+
+        stats.exploration = 1.0
+        assert stats.order(self.SOURCES, "10.1109/new", None) == self.SOURCES
+        assert stats.explored == 1
+
+    def test_last_resort_sources_stay_last(self) -> None:
+        """Gray-area sources are never promoted ahead of official ones."""
+        stats = SourceStats(":memory:", exploration=0.0)
+        for i in range(3):
+            stats.record(f"10.1109/{i}", None, "scihub", success=True, seconds=1.0)
+            stats.record(f"10.1109/{i}", None, "unpaywall", success=False, seconds=1.0)
+        order = stats.order(["unpaywall", "arxiv", "openalex", "scihub", "libgen"], "10.1109/new", None)
+        assert order == ["arxiv", "openalex", "unpaywall", "scihub", "libgen"]
+
+    async def test_retriever_learns_order(self, tmp_path, stub_retriever: Callable[..., StubbedRetriever]) -> None:
+        """After arXiv misses a prefix, the next paper from it tries OpenAlex first."""
+        stub = stub_retriever(
+            {"arxiv": False, "openalex": True},
+            source_stats={"enabled": True, "path": str(tmp_path / "stats.sqlite"), "exploration": 0},
+        )
+        retriever = stub.retriever
+
+        await retriever.retrieve(doi="10.1109/a", output_dir=tmp_path, verbose=False)
+        await retriever.retrieve(doi="10.1109/b", output_dir=tmp_path, verbose=False)
+        assert stub.tried == [("arxiv", "10.1109/a"), ("openalex", "10.1109/a"), ("openalex", "10.1109/b")]
@@ -1,7 +1,7 @@
 """Unit tests for DOI to BibTeX module."""
 
-
-from parser.doi2bib.metadata import Author, PaperMetadata
+from parser.acquisition.metadata_cache import MetadataCache
+from parser.doi2bib.metadata import Author, PaperMetadata, get_metadata
 from parser.doi2bib.resolver import (
     IdentifierType,
     PaperIdentifier,
@@ -144,3 +144,18 @@ class TestPaperMetadata:
         assert metadata.arxiv_id is None
         assert metadata.abstract is None
         assert metadata.year is None
+
+
+class TestGetMetadataCache:
+    """Test get_metadata with a metadata cache."""
+
+    async def test_answers_from_cache(self, tmp_path) -> None:
+        """Cached DOIs and titles need no API calls."""
+        cache = MetadataCache(tmp_path / "cache.sqlite")
+        cache.put_metadata("10.1/x", {"doi": "10.1/x", "title": "A Paper", "year": 2020})
+        cache.put_title("A Paper", "10.1/x")
+
+        by_doi = await get_metadata(PaperIdentifier("10.1/x", IdentifierType.DOI, "10.1/x"), cache=cache)
+        by_title = await get_metadata(PaperIdentifier("A Paper", IdentifierType.TITLE, "A Paper"), cache=cache)
+        assert by_doi.year == by_title.year == 2020
+        assert cache.stats.kind("metadata").hits == 2
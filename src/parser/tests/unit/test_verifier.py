@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from parser.acquisition.metadata_cache import MetadataCache
 from parser.doi2bib.verifier import (
     BibEntry,
     CitationVerifier,
@@ -152,3 +153,13 @@ class TestCitationVerifier:
     def test_verifier_instantiation(self, verifier: CitationVerifier) -> None:
         """Test verifier can be instantiated."""
         assert verifier is not None
+
+    async def test_cached_bibtex(self, tmp_path: Path) -> None:
+        """BibTeX fetched once is served from the metadata cache."""
+        cache = MetadataCache(tmp_path / "cache.sqlite")
+        cache.put("bibtex", "arxiv:1706.03762", {"bibtex": "@misc{old,\n  title={Attention}\n}", "title": "Attention"})
+        verifier = CitationVerifier(cache=cache)
+
+        bibtex, title = await verifier.get_bibtex_from_arxiv("arXiv:1706.03762", "vaswani2017")
+        assert bibtex.startswith("@misc{vaswani2017,")
+        assert title == "Attention"